@@ -14,8 +14,19 @@ trigger and the thing it protects are gated on the same condition.
 per event and read-once per run, which is what a line-oriented log is for; `runs.jsonl`
 and `alerts.jsonl` in the same directory are the precedent. An append is a single
 syscall, so a crash mid-run loses at most the line being written rather than
-invalidating the file — and nothing rewrites what is already there, so cost does not
-grow with the log.
+invalidating the file — and appends never rewrite what is already there.
+
+**Compacted into a per-pair snapshot.** Every run asks "which pairs are closed", and
+answering that from the raw log costs a `json.loads` per attempt ever made — a cost
+that grows with every season of live ticks while the answer only changes at the
+margin. So the log is periodically folded into `activity_fetch_ledger.parquet`, one
+row per pair (attempt count, whether it ever settled, last outcome/detail), and only
+the short JSONL tail since then is replayed on read. Compaction first renames the live
+log to a numbered segment, then writes the snapshot (atomically) stamped with that
+segment's generation, then deletes the segment: a crash between any two steps leaves
+either segments newer than the snapshot, which readers replay, or segments the
+snapshot already absorbed, which its generation says to ignore. Nothing is counted
+twice and nothing is lost.
 
 Outcome is recorded, not just the attempt. `_fetch_player` has three results and only
 two are distinguishable without this: an empty `Activity` payload returned None exactly
@@ -25,14 +36,23 @@ again, banking a permanent hole in the data this exists to keep current.
 
 from __future__ import annotations
 
+import contextlib
+import fcntl
 import json
 import logging
+import os
 from datetime import UTC, datetime
 from pathlib import Path
 
+import polars as pl
+
+from mvp.common.base_job import BaseJob
+
 logger = logging.getLogger(__name__)
 
 LEDGER_NAME = "activity_fetch_log.jsonl"
+SNAPSHOT_NAME = "activity_fetch_ledger.parquet"
+LOCK_NAME = "activity_fetch_log.lock"
 
 OK = "ok"
 EMPTY = "empty"
@@ -48,18 +68,84 @@ SETTLED = frozenset({OK})
 # many attempts the pair is treated as exhausted and stops being retried.
 MAX_ATTEMPTS = 3
 
+# Tail size that triggers a fold into the snapshot. A few thousand attempts: small
+# enough that replaying it is negligible, large enough that most ticks only append.
+COMPACT_AFTER_BYTES = 512 * 1024
+
+_GENERATION_KEY = "generation"
+
+STATE_SCHEMA = {
+    "player_id": pl.String,
+    "match_uid": pl.String,
+    "attempts": pl.Int64,
+    "settled": pl.Boolean,
+    "last_outcome": pl.String,
+    "last_detail": pl.String,
+    "last_requested_at": pl.String,
+}
+
 
 def ledger_path(data_root: Path) -> Path:
     return data_root / "pipeline" / LEDGER_NAME
 
 
-def iter_records(data_root: Path):
-    """Yield each recorded attempt. Unparseable lines are skipped, not raised.
+def snapshot_path(data_root: Path) -> Path:
+    return data_root / "pipeline" / SNAPSHOT_NAME
 
-    A torn final line is the expected residue of a crash mid-append; refusing to read
-    the whole log because of it would turn a recoverable state into an outage.
+
+def _segment_path(data_root: Path, generation: int) -> Path:
+    return data_root / "pipeline" / f"{Path(LEDGER_NAME).stem}.{generation:06d}.jsonl"
+
+
+@contextlib.contextmanager
+def _locked(data_root: Path, *, exclusive: bool = False):
+    """Serialise compaction against appends and reads from concurrent ticks.
+
+    Nothing else serialises ticks, and an append landing in a segment after the
+    compactor has read it would be deleted with that segment. flock is released by
+    the kernel if the holder dies, so a crash cannot wedge the ledger.
     """
-    path = ledger_path(data_root)
+    path = data_root / "pipeline" / LOCK_NAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a") as fh:
+        fcntl.flock(fh, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+def _read_snapshot(data_root: Path) -> tuple[pl.DataFrame, int]:
+    """The compacted per-pair state and the last segment generation it absorbed."""
+    path = snapshot_path(data_root)
+    meta = BaseJob.read_parquet_metadata(path)
+    if _GENERATION_KEY not in meta:
+        return pl.DataFrame(schema=STATE_SCHEMA), 0
+    return pl.read_parquet(path), int(meta[_GENERATION_KEY])
+
+
+def _segments(data_root: Path) -> list[tuple[int, Path]]:
+    """Every rotated tail segment on disk as (generation, path), oldest first."""
+    stem = Path(LEDGER_NAME).stem
+    found = []
+    for path in (data_root / "pipeline").glob(f"{stem}.*.jsonl"):
+        suffix = path.name[len(stem) + 1:-len(".jsonl")]
+        if suffix.isdigit():
+            found.append((int(suffix), path))
+    return sorted(found)
+
+
+def _pending_segments(data_root: Path, generation: int) -> list[tuple[int, Path]]:
+    """Segments not yet absorbed by a snapshot at `generation`, oldest first."""
+    return [(g, p) for g, p in _segments(data_root) if g > generation]
+
+
+def _tail_paths(data_root: Path, generation: int) -> list[Path]:
+    paths = [p for _, p in _pending_segments(data_root, generation)]
+    return [*paths, ledger_path(data_root)]
+
+
+def _iter_file(path: Path):
     if not path.exists():
         return
     with path.open("r", encoding="utf-8") as fh:
@@ -73,32 +159,140 @@ def iter_records(data_root: Path):
                 logger.warning("Skipping malformed ledger line %d in %s", n, path)
 
 
+def iter_records(data_root: Path):
+    """Yield each attempt not yet compacted into the snapshot, oldest first.
+
+    Unparseable lines are skipped, not raised. A torn final line is the expected
+    residue of a crash mid-append; refusing to read the whole log because of it would
+    turn a recoverable state into an outage.
+    """
+    _, generation = _read_snapshot(data_root)
+    for path in _tail_paths(data_root, generation):
+        yield from _iter_file(path)
+
+
+def _fold(state: pl.DataFrame, records: list[dict]) -> pl.DataFrame:
+    """Apply tail attempts, in order, to the per-pair state."""
+    if not records:
+        return state
+    tail = pl.DataFrame(
+        [
+            {
+                "player_id": r["player_id"],
+                "match_uid": r["match_uid"],
+                "attempts": 1,
+                "settled": r.get("outcome") in SETTLED,
+                "last_outcome": r.get("outcome"),
+                "last_detail": r.get("detail"),
+                "last_requested_at": r.get("requested_at"),
+            }
+            for r in records
+        ],
+        schema=STATE_SCHEMA,
+    )
+    return (
+        pl.concat([state, tail])
+        .group_by("player_id", "match_uid", maintain_order=True)
+        .agg(
+            pl.col("attempts").sum(),
+            pl.col("settled").any(),
+            pl.col("last_outcome").last(),
+            pl.col("last_detail").last(),
+            pl.col("last_requested_at").last(),
+        )
+    )
+
+
+def pair_state(data_root: Path) -> pl.DataFrame:
+    """One row per (player_id, match_uid) ever attempted: snapshot plus tail replay."""
+    with _locked(data_root):
+        state, generation = _read_snapshot(data_root)
+        records = [
+            r for path in _tail_paths(data_root, generation) for r in _iter_file(path)
+        ]
+    return _fold(state, records)
+
+
+def compact(data_root: Path) -> bool:
+    """Fold the tail into the snapshot. Returns False if there was nothing to fold.
+
+    Safe to interrupt at any point — see the module docstring for why each
+    intermediate state reads back the same.
+    """
+    with _locked(data_root, exclusive=True):
+        state, generation = _read_snapshot(data_root)
+        # Left behind by a crash after the snapshot that absorbed them was written.
+        for g, path in _segments(data_root):
+            if g <= generation:
+                path.unlink(missing_ok=True)
+        pending = _pending_segments(data_root, generation)
+        live = ledger_path(data_root)
+        if live.exists() and live.stat().st_size > 0:
+            new_gen = max([generation, *(g for g, _ in pending)]) + 1
+            segment = _segment_path(data_root, new_gen)
+            os.replace(live, segment)
+            pending.append((new_gen, segment))
+        if not pending:
+            return False
+
+        records = [r for _, path in pending for r in _iter_file(path)]
+        folded = _fold(state, records)
+        target = snapshot_path(data_root)
+        tmp = target.with_suffix(target.suffix + ".tmp")
+        folded.write_parquet(tmp, metadata={_GENERATION_KEY: str(pending[-1][0])})
+        os.replace(tmp, target)
+        for _, path in pending:
+            path.unlink(missing_ok=True)
+    logger.info(
+        "Compacted %d ledger attempts into %d pairs", len(records), folded.height,
+    )
+    return True
+
+
+def _tail_bytes(data_root: Path) -> int:
+    _, generation = _read_snapshot(data_root)
+    return sum(
+        p.stat().st_size for p in _tail_paths(data_root, generation) if p.exists()
+    )
+
+
+def closed_frame(
+    data_root: Path, max_attempts: int = MAX_ATTEMPTS
+) -> pl.DataFrame:
+    """`closed_pairs` as a (player_id, match_uid) frame, for anti-joins.
+
+    This is the once-per-run read, so it is also where an oversized tail gets
+    compacted.
+    """
+    if _tail_bytes(data_root) > COMPACT_AFTER_BYTES:
+        compact(data_root)
+    return (
+        pair_state(data_root)
+        .filter(pl.col("settled") | (pl.col("attempts") >= max_attempts))
+        .select("player_id", "match_uid")
+    )
+
+
 def closed_pairs(
     data_root: Path, max_attempts: int = MAX_ATTEMPTS
 ) -> set[tuple[str, str]]:
     """Pairs that should no longer be fetched: succeeded, or tried too many times.
 
     Exhaustion is not success. It exists only so an unsettleable pair cannot hold the
-    head of the queue indefinitely; the ledger keeps every attempt, so which pairs gave
-    up and why stays inspectable.
+    head of the queue indefinitely; attempt counts and the last outcome survive
+    compaction, so which pairs gave up and why stays inspectable.
     """
-    attempts: dict[tuple[str, str], int] = {}
-    done: set[tuple[str, str]] = set()
-    for r in iter_records(data_root):
-        key = (r["player_id"], r["match_uid"])
-        attempts[key] = attempts.get(key, 0) + 1
-        if r.get("outcome") in SETTLED:
-            done.add(key)
-    return done | {k for k, n in attempts.items() if n >= max_attempts}
+    return set(closed_frame(data_root, max_attempts).iter_rows())
 
 
 def settled_pairs(data_root: Path) -> set[tuple[str, str]]:
     """(player_id, match_uid) pairs already fetched successfully."""
-    return {
-        (r["player_id"], r["match_uid"])
-        for r in iter_records(data_root)
-        if r.get("outcome") in SETTLED
-    }
+    return set(
+        pair_state(data_root)
+        .filter(pl.col("settled"))
+        .select("player_id", "match_uid")
+        .iter_rows()
+    )
 
 
 def record(
@@ -129,5 +323,5 @@ def record(
         }) + "\n"
         for uid in match_uids
     )
-    with path.open("a", encoding="utf-8") as fh:
+    with _locked(data_root), path.open("a", encoding="utf-8") as fh:
         fh.write(lines)
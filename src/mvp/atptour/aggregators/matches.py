@@ -8,6 +8,7 @@ from pathlib import Path
 import polars as pl
 
 from mvp.atptour.ratings import compute_all_ratings
+from mvp.atptour.transformers.rankings import load_rankings
 from mvp.common.base_job import BaseJob
 
 logger = logging.getLogger(__name__)
@@ -86,15 +87,22 @@ def map_activity_to_matches_schema(df: pl.DataFrame) -> pl.DataFrame:
     )
 
 
-def join_rankings(matches: pl.DataFrame, rankings: pl.DataFrame) -> pl.DataFrame:
+def join_rankings(
+    matches: pl.DataFrame, rankings: pl.DataFrame, *, presorted: bool = False
+) -> pl.DataFrame:
     """Join rankings data for both player and opponent using as-of join.
 
     For each match, finds the most recent rankings snapshot on or before
-    tournament_start_date for both player_id and opp_id.
+    tournament_start_date for both player_id and opp_id. ``presorted`` marks
+    rankings already ordered by ranking_date within each player_id (the
+    load_rankings layout), which the by-player as-of join needs, so the
+    full-table sort is skipped.
     """
     rnk = rankings.select([
         "player_id", "ranking_date", "rank", "points", "tournaments_played",
-    ]).sort("ranking_date")
+    ])
+    if not presorted:
+        rnk = rnk.sort("ranking_date")
 
     # Player rankings
     player_rnk = rnk.rename({
@@ -771,7 +779,7 @@ class MatchesAggregator(BaseJob):
         # Step 6: Rankings enrichment
         rankings = self._load_rankings()
         if rankings is not None:
-            combined = join_rankings(combined, rankings)
+            combined = join_rankings(combined, rankings, presorted=True)
             del rankings
             logger.info("Rankings joined")
 
@@ -976,17 +984,8 @@ class MatchesAggregator(BaseJob):
         return map_activity_to_matches_schema(gap)
 
     def _load_rankings(self) -> pl.DataFrame | None:
-        """Load consolidated rankings parquet."""
-        path = (
-            self.data_root
-            / "stage"
-            / "atptour"
-            / "rankings"
-            / "rankings_singles.parquet"
-        )
-        if not path.exists():
-            return None
-        return pl.read_parquet(path)
+        """Load consolidated rankings, sorted by ranking_date within player."""
+        return load_rankings(self.data_root / "stage" / "atptour" / "rankings")
 
     def _load_bio(self) -> pl.DataFrame | None:
         """Load all player bio parquets into one DataFrame."""
@@ -1,5 +1,7 @@
 """Per-tournament cross-dataset aggregation into player-match rows."""
 
+import hashlib
+import json
 import logging
 from pathlib import Path
 
@@ -141,6 +143,25 @@ _RALLY_ANALYSIS_FIELDS = [
     "unclassified_won", "unclassified_err",
 ]
 
+# Bump whenever aggregate() logic changes: it is part of the input
+# fingerprint, so every tournament's matches.parquet rebuilds on the next run.
+AGGREGATOR_VERSION = 1
+
+# Staged per-tournament parquets aggregate() reads.
+_STAGED_INPUTS = (
+    "results.parquet",
+    "match_stats.parquet",
+    "schedule.parquet",
+    "overview.parquet",
+    "match_beats.parquet",
+    "stroke_analysis.parquet",
+    "rally_analysis.parquet",
+    "stats_plus.parquet",
+)
+
+# Output parquet metadata key holding the inputs' fingerprint.
+_FINGERPRINT_KEY = "input_fingerprint"
+
 MATCHES_SCHEMA: dict[str, pl.DataType] = {
     # Join keys
     "match_uid": pl.String,
@@ -1171,8 +1192,56 @@ class TournamentMatchesAggregator(BaseJob):
                     actual_type,
                 )
 
-    def run(self) -> Path | None:
-        """Aggregate and write to parquet."""
+    def input_fingerprint(self) -> str:
+        """Hash of everything aggregate() output depends on.
+
+        Covers each staged input's name, mtime, size and stored schema hash,
+        the output schema and AGGREGATOR_VERSION. Absent inputs hash as absent.
+        """
+        parts: list = [
+            AGGREGATOR_VERSION,
+            [(col, str(dtype)) for col, dtype in MATCHES_SCHEMA.items()],
+        ]
+        for filename in _STAGED_INPUTS:
+            path = self.build_path("stage", self._tournament_rel_path, filename)
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                parts.append([filename, None])
+                continue
+            meta = self.read_parquet_metadata(path)
+            parts.append([
+                filename,
+                st.st_mtime_ns,
+                st.st_size,
+                meta.get("pydantic_schema_hash", meta.get("schema_hash")),
+            ])
+        return hashlib.sha256(json.dumps(parts).encode()).hexdigest()[:16]
+
+    def run(self, *, force: bool = False) -> Path | None:
+        """Aggregate and write to parquet.
+
+        Skipped when the existing output was built from the same inputs
+        (see input_fingerprint); ``force`` rebuilds regardless.
+        """
+        out_path = self.build_path(
+            "aggregate", self._tournament_rel_path, "matches.parquet"
+        )
+        # Taken before aggregate() reads the inputs, so a restage that lands
+        # mid-run leaves a mismatching fingerprint and rebuilds next time.
+        fingerprint = self.input_fingerprint()
+        if (
+            not force
+            and self.read_parquet_metadata(out_path).get(_FINGERPRINT_KEY)
+            == fingerprint
+        ):
+            logger.info(
+                "Inputs unchanged for %s/%s/%d, skipping aggregation",
+                self.circuit.value,
+                self.tid,
+                self.year,
+            )
+            return out_path
         df = self.aggregate()
         if df.is_empty():
             logger.info(
@@ -1183,7 +1252,6 @@ class TournamentMatchesAggregator(BaseJob):
             )
             return None
         self._validate_schema(df)
-        out_path = self.build_path(
-            "aggregate", self._tournament_rel_path, "matches.parquet"
+        return self.save_parquet(
+            df, out_path, extra_metadata={_FINGERPRINT_KEY: fingerprint}
         )
-        return self.save_parquet(df, out_path)
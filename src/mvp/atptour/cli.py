@@ -13,7 +13,9 @@ from mvp.atptour.pipeline import (
     run_player_data,
     run_rankings,
 )
+from mvp.common.base_job import get_data_root
 from mvp.common.enums import Circuit
+from mvp.common.raw_archive import pack_tree
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +45,11 @@ def parse_args(args: list[str] | None = None) -> argparse.Namespace:
     backfill_parser.add_argument("--year", type=int, required=True, metavar="YEAR")
     backfill_parser.add_argument("--tid", nargs="+", type=str, metavar="TID")
     backfill_parser.add_argument("--circuit", choices=["tour", "chal"])
+    backfill_parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Processes for staging/aggregating tournaments (default: one per "
+             "core; 1 keeps everything in-process)",
+    )
 
     # aggregate-points
     subparsers.add_parser(
@@ -50,6 +57,13 @@ def parse_args(args: list[str] | None = None) -> argparse.Namespace:
         help="Aggregate match_beats point-level data with reconstructed score state",
     )
 
+    # archive-raw
+    subparsers.add_parser(
+        "archive-raw",
+        help="Pack loose raw JSON/HTML into per-directory archives "
+             "(see MVP_RAW_ARCHIVE)",
+    )
+
     parsed = parser.parse_args(args)
 
     if parsed.command == "backfill":
@@ -72,6 +86,8 @@ def main() -> None:
         cmd_backfill(args)
     elif args.command == "aggregate-points":
         cmd_aggregate_points()
+    elif args.command == "archive-raw":
+        cmd_archive_raw()
 
 
 def _resolve_backfill_tournaments(
@@ -107,6 +123,13 @@ def cmd_aggregate_points() -> None:
     logger.info("Points aggregation complete: %d rows", len(result))
 
 
+def cmd_archive_raw() -> None:
+    """Pack the loose raw atptour tree into per-directory archives."""
+    root = get_data_root() / "raw" / "atptour"
+    packed = pack_tree(root)
+    logger.info("Packed %d raw files under %s", packed, root)
+
+
 def cmd_backfill(args) -> None:
     """Historical backfill: extract, stage, per-tournament aggregate."""
     run_rankings(start_year=args.year - 1)
@@ -118,7 +141,9 @@ def cmd_backfill(args) -> None:
     )
     logger.info("Backfilling %d tournaments for %d", len(tournaments), args.year)
 
-    failed = _process_tournaments(tournaments, data_root=None, refresh=False)
+    failed = _process_tournaments(
+        tournaments, data_root=None, refresh=False, workers=args.workers
+    )
 
     run_tids = {(tid, yr) for tid, yr, _, _ in tournaments}
     player_result = run_player_data(run_tids=run_tids, live=False)
@@ -45,7 +45,7 @@ class OverviewExtractor(BaseExtractor):
                     f"tournaments/{circuit_val}/{tournament_id}/{year}",
                     "overview.json",
                 )
-                if cached.exists():
+                if self.raw_exists(cached):
                     data = self.read_json(cached)
                     return Tournament.from_overview_data(
                         data=data,
@@ -79,6 +79,7 @@ class OverviewExtractor(BaseExtractor):
         )
 
         path = self.build_path("raw", tournament.path, "overview.json")
-        self.save_json(data, path)
+        if not self.is_json_unchanged(path, data):
+            self.save_json(data, path)
 
         return tournament
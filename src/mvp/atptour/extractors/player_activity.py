@@ -18,7 +18,6 @@ file is missing a player's other matches — which is the whole of ITF recency.
 import logging
 import time
 from datetime import datetime
-from pathlib import Path
 
 import polars as pl
 
@@ -46,9 +45,9 @@ MAX_FETCHES_PER_RUN = 40
 MAX_SECONDS_PER_RUN = 240
 
 
-def _is_fresh(path: Path, max_age: float = ACTIVITY_MAX_AGE_SECONDS) -> bool:
-    """Return True if the file was modified within max_age seconds."""
-    return (time.time() - path.stat().st_mtime) < max_age
+def _is_fresh(mtime: float, max_age: float = ACTIVITY_MAX_AGE_SECONDS) -> bool:
+    """Return True if a file with this mtime was modified within max_age seconds."""
+    return (time.time() - mtime) < max_age
 
 
 class PlayerActivityExtractor(BaseExtractor):
@@ -80,13 +79,8 @@ class PlayerActivityExtractor(BaseExtractor):
             logger.info("Activity: no scheduled pairs")
             return [], set()
 
-        closed = activity_ledger.closed_pairs(root)
-        open_pairs = pairs.filter(
-            ~pl.struct("player_id", "match_uid").map_elements(
-                lambda s: (s["player_id"], s["match_uid"]) in closed,
-                return_dtype=pl.Boolean,
-            )
-        )
+        closed = activity_ledger.closed_frame(root)
+        open_pairs = pairs.join(closed, on=["player_id", "match_uid"], how="anti")
         if open_pairs.is_empty():
             logger.info("Activity: %d pairs scheduled, all already fetched",
                         pairs.height)
@@ -165,7 +159,7 @@ class PlayerActivityExtractor(BaseExtractor):
             data = self.read_json(path)
             for tid, year in tournaments:
                 if not activity_covers_tournament(data, year, tid):
-                    if _is_fresh(path):
+                    if _is_fresh(self.raw_mtime(path)):
                         skipped_fresh += 1
                     else:
                         to_fetch.append(pid)
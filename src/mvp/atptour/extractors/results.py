@@ -20,32 +20,46 @@ class ResultsExtractor(BaseExtractor):
             cloudflare_browser_fetch=True,
         )
 
-    def run(self, tournament: Tournament, refresh: bool = True) -> None:
+    def run(self, tournament: Tournament, refresh: bool = True) -> bool:
+        """Fetch both draws. Returns whether either page was (re)written.
+
+        A refetched page whose content is unchanged is not rewritten, so its mtime
+        (and everything staged from it) stays put between live ticks.
+        """
         logger.info("Fetching results for %s", tournament.logging_id)
-        self._fetch_singles(tournament, refresh)
-        self._fetch_doubles(tournament, refresh)
-        logger.info("Saved results for %s", tournament.logging_id)
+        singles = self._fetch_singles(tournament, refresh)
+        doubles = self._fetch_doubles(tournament, refresh)
+        changed = singles is not None or doubles is not None
+        if changed:
+            logger.info("Saved results for %s", tournament.logging_id)
+        else:
+            logger.info("Results unchanged for %s", tournament.logging_id)
+        return changed
 
     def _fetch_singles(self, tournament: Tournament, refresh: bool) -> Path | None:
         target = self.build_path("raw", tournament.path, "results_singles.html")
-        if not refresh and target.exists():
+        if not refresh and self.raw_exists(target):
             logger.info(
                 "Skipping singles results for %s (exists)", tournament.logging_id
             )
             return None
         url = self._results_url(tournament)
         html = self.fetch_html(url)
+        if self.is_html_unchanged(target, html):
+            return None
         return self.save_html(html, target)
 
     def _fetch_doubles(self, tournament: Tournament, refresh: bool) -> Path | None:
         target = self.build_path("raw", tournament.path, "results_doubles.html")
-        if not refresh and target.exists():
+        if not refresh and self.raw_exists(target):
             logger.info(
                 "Skipping doubles results for %s (exists)", tournament.logging_id
             )
             return None
         url = f"{self._results_url(tournament)}?matchType=doubles"
         html = self.fetch_html(url)
+        if self.is_html_unchanged(target, html):
+            return None
         return self.save_html(html, target)
 
     def _results_url(self, tournament: Tournament) -> str:
@@ -73,6 +73,19 @@ class ScheduleExtractor(BaseExtractor):
             filename,
             version="datetime",
         )
+        # Snapshots are timestamped, so an unchanged page would otherwise mint a
+        # new file -- and a restage -- every tick. The latest snapshot for the
+        # same day already says everything this one would.
+        prefix = filename.removesuffix(".html")
+        previous = [
+            p for p in self.list_files(target.parent, f"{prefix}_*.html")
+            if p.stem.removeprefix(f"{prefix}_")[:1].isdigit()
+        ]
+        if previous and self.is_html_unchanged(previous[-1], html):
+            logger.info(
+                "Schedule unchanged for %s (%s)", tournament.logging_id, filename
+            )
+            return previous[-1]
         path = self.save_html(html, target)
         logger.info("Saved schedule for %s", tournament.logging_id)
         return path
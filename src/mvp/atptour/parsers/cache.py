@@ -0,0 +1,152 @@
+"""Persistent cache of parsed page output, keyed by the raw page's content.
+
+A restage re-reads every raw page, but most restages are driven by a change to
+record building or the schema, not to parsing; the parse itself is then pure
+repeated work. Parsed output is stored under ``(parser, version, source,
+sha256(page))`` so an unchanged page is parsed once, ever, per parser code.
+
+``source`` hashes the source of the module that defines the parse function,
+together with the shared lxml helpers, so editing a parser invalidates its
+entries even when nobody bumps its version. Parse functions therefore live in
+this package, apart from the transformers that call them: a change to record
+building or staging leaves the key alone. Each parser module's
+``PARSER_VERSION`` covers what the source hash cannot see (a change in some
+other module the parser calls into, mappings say) and is bumped by hand for
+it. Entries for a parser's superseded code are deleted the first time
+a process uses the cache for that parser, so the file does not grow with every
+parser revision. The parsed output is pickled (it holds dates); the file is
+derived data beside the stage tree and safe to delete.
+"""
+
+import functools
+import hashlib
+import inspect
+import logging
+import pickle
+import sqlite3
+import sys
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypeVar
+
+from mvp.atptour.parsers import lxml_utils
+
+logger = logging.getLogger(__name__)
+
+# Under stage/<domain>/, beside the trees it is derived from.
+PARSE_CACHE_FILENAME = "_parse_cache.sqlite"
+
+T = TypeVar("T")
+
+# (cache path, parser) pairs whose superseded entries this process has pruned.
+_PRUNED: set[tuple[Path, str]] = set()
+_PRUNED_LOCK = threading.Lock()
+
+
+@functools.cache
+def _module_source_hash(module_name: str) -> str:
+    h = hashlib.sha256()
+    for module in (sys.modules[module_name], lxml_utils):
+        try:
+            h.update(inspect.getsource(module).encode("utf-8"))
+        except (OSError, TypeError):
+            # No source on disk (frozen build): the version alone keys it.
+            h.update(module.__name__.encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def source_hash(fn: Callable) -> str:
+    """Hash of the source behind parse function `fn` (its module + lxml_utils)."""
+    return _module_source_hash(fn.__module__)
+
+
+class ParseCache:
+    """sqlite-backed ``(parser, version, source, content hash) -> output`` store.
+
+    A connection per lookup: transformers run on tournament threads and, in the
+    pooled backfill, in several processes at once, and sqlite's own locking is
+    what keeps those writers apart. Best-effort throughout -- a cache failure
+    logs and falls through to parsing, never fails the stage.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS parses ("
+            " parser TEXT NOT NULL, version INTEGER NOT NULL, source TEXT NOT NULL,"
+            " digest TEXT NOT NULL, output BLOB NOT NULL,"
+            " PRIMARY KEY (parser, version, source, digest))"
+        )
+        return conn
+
+    def _prune(
+        self, conn: sqlite3.Connection, parser: str, version: int, source: str,
+    ) -> None:
+        """Drop `parser`'s entries from other versions or source, once per process."""
+        marker = (self.path, parser)
+        with _PRUNED_LOCK:
+            if marker in _PRUNED:
+                return
+            _PRUNED.add(marker)
+        with conn:
+            # `parsed` predates the source column; its rows can never be served.
+            conn.execute("DROP TABLE IF EXISTS parsed")
+            deleted = conn.execute(
+                "DELETE FROM parses WHERE parser = ?"
+                " AND (version != ? OR source != ?)",
+                (parser, version, source),
+            ).rowcount
+        if deleted:
+            logger.info(
+                "Parse cache: dropped %d superseded %s entries", deleted, parser
+            )
+            try:
+                conn.execute("VACUUM")
+            except sqlite3.Error as e:  # another process holds the file
+                logger.debug("Parse cache vacuum skipped (%s): %s", self.path, e)
+
+    def parse(
+        self, parser: str, version: int, html: str, fn: Callable[[str], T],
+    ) -> T:
+        """``fn(html)``, served from the cache when this page was parsed before."""
+        digest = hashlib.sha256(html.encode("utf-8")).hexdigest()
+        key = (parser, version, source_hash(fn), digest)
+        try:
+            conn = self._connect()
+            try:
+                self._prune(conn, *key[:3])
+                row = conn.execute(
+                    "SELECT output FROM parses WHERE parser = ? AND version = ? "
+                    "AND source = ? AND digest = ?", key,
+                ).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning("Parse cache read failed (%s): %s", self.path, e)
+            row = None
+        if row is not None:
+            self.hits += 1
+            return pickle.loads(row[0])
+
+        self.misses += 1
+        output = fn(html)
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO parses VALUES (?, ?, ?, ?, ?)",
+                        (*key, pickle.dumps(output)),
+                    )
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning("Parse cache write failed (%s): %s", self.path, e)
+        return output
@@ -0,0 +1,60 @@
+"""Bare-lxml equivalents of the BeautifulSoup idioms the ATP page parsers use.
+
+The parsers were written against BeautifulSoup's lxml builder, which builds its
+tree from the same libxml2 HTML parser and then wraps every node in Python. Going
+to lxml directly with precompiled XPath skips that wrapping, which was most of the
+parse time. What these helpers pin is the bs4 behaviour the parsers depend on:
+class matching by token, and ``get_text`` ignoring comments and script, style and
+template content.
+"""
+
+from lxml import etree
+
+NO_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+
+def parse_html(html: str) -> etree._Element | None:
+    """Parse a page into an lxml tree. None for an empty document.
+
+    Parsed from UTF-8 bytes: lxml refuses a str that carries an XML encoding
+    declaration, which bs4 silently accepted. A parser per call, because lxml
+    parsers are not safe to share across the tournament threads.
+    """
+    return etree.HTML(html.encode("utf-8"), etree.HTMLParser(encoding="utf-8"))
+
+
+def has_class(name: str) -> str:
+    """XPath predicate: `name` is one of the element's class tokens (bs4 ``class_``)."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def first(nodes: list) -> etree._Element | None:
+    """The first XPath hit, or None (bs4 ``find``/``select_one``)."""
+    return nodes[0] if nodes else None
+
+
+def _strings(el: etree._Element):
+    if el.text:
+        yield el.text
+    for child in el:
+        # Comments and processing instructions have a non-str tag; their own text
+        # is skipped, but the tail is the parent's text and still counts.
+        if isinstance(child.tag, str) and child.tag not in NO_TEXT_TAGS:
+            yield from _strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def text(el: etree._Element) -> str:
+    """bs4 ``get_text(strip=True)``: each string stripped, then concatenated."""
+    return "".join(s.strip() for s in _strings(el))
+
+
+def raw_text(el: etree._Element) -> str:
+    """bs4 ``get_text()``: every string, whitespace kept."""
+    return "".join(_strings(el))
+
+
+def spaced_text(el: etree._Element) -> str:
+    """bs4 ``get_text(separator=" ", strip=True)``: stripped strings, space-joined."""
+    return " ".join(s for s in (s.strip() for s in _strings(el)) if s)
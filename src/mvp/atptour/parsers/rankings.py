@@ -0,0 +1,93 @@
+"""Scan rankings HTML from atptour.com into per-player field dicts.
+
+Standalone parser with no schema or BaseJob dependencies, like parsers.results:
+the rankings transformer adds the ranking date and provenance and validates.
+"""
+
+from lxml import etree
+
+from mvp.atptour.parsers.lxml_utils import first, has_class, parse_html, text
+
+PARSER_VERSION = 1
+
+
+def _dash_to_none(text: str) -> int | None:
+    """Parse an integer from text, treating '-' as None."""
+    text = text.strip()
+    if text == "-":
+        return None
+    return int(text.replace(",", ""))
+
+
+_DESKTOP_TABLE = etree.XPath(
+    f".//table[{has_class('mega-table')} and {has_class('desktop-table')}"
+    f" and {has_class('non-live')}]"
+)
+_BODY_ROWS = etree.XPath(".//tbody//tr")
+
+
+def _td(name: str) -> etree.XPath:
+    return etree.XPath(f".//td[{has_class(name)}]")
+
+
+_RANK_TD = _td("rank")
+_PLAYER_TD = _td("player")
+_AGE_TD = _td("age")
+_POINTS_TD = _td("points")
+_POINTS_MOVE_TD = _td("pointsMove")
+_TOURNS_TD = _td("tourns")
+_DROP_TD = _td("drop")
+_BEST_TD = _td("best")
+_NAME_LINK = etree.XPath(f".//li[{has_class('name')}]//a")
+_FLAG_USE = etree.XPath(".//svg//use")
+_RANK_LI = etree.XPath(f".//li[{has_class('rank')}]")
+_RANK_UP = etree.XPath(f".//span[{has_class('rank-up')}]")
+_RANK_DOWN = etree.XPath(f".//span[{has_class('rank-down')}]")
+
+
+def scan_rankings_page(html: str) -> list[dict] | None:
+    """Scan one rankings page into per-player field dicts.
+
+    Depends on the page alone (the ranking date and provenance are added by the
+    caller), so the result can be cached by content hash. None when the page has
+    no desktop table.
+    """
+    root = parse_html(html)
+    table = first(_DESKTOP_TABLE(root)) if root is not None else None
+    if table is None:
+        return None
+
+    rows = []
+    for tr in _BODY_ROWS(table):
+        rank_td = first(_RANK_TD(tr))
+        if rank_td is None:
+            continue
+
+        player_cell = _PLAYER_TD(tr)[0]
+        link = _NAME_LINK(player_cell)[0]
+        flag_href = _FLAG_USE(player_cell)[0].get("href")
+
+        rank_li = _RANK_LI(player_cell)[0]
+        rank_up = first(_RANK_UP(rank_li))
+        rank_down = first(_RANK_DOWN(rank_li))
+        if rank_up is not None:
+            rank_move = int(text(rank_up))
+        elif rank_down is not None:
+            rank_move = -int(text(rank_down))
+        else:
+            rank_move = None
+
+        rows.append({
+            "rank": int(text(rank_td).rstrip("T")),
+            "player_id": link.get("href").split("/")[-2],
+            "player_name": text(link),
+            "nationality": flag_href.split("#flag-")[-1],
+            "age": int(text(_AGE_TD(tr)[0])),
+            "points": int(text(_POINTS_TD(tr)[0]).replace(",", "")),
+            "rank_move": rank_move,
+            "points_move": _dash_to_none(text(_POINTS_MOVE_TD(tr)[0])),
+            "tournaments_played": int(text(_TOURNS_TD(tr)[0])),
+            "points_dropping": _dash_to_none(text(_DROP_TD(tr)[0])),
+            "next_best": _dash_to_none(text(_BEST_TD(tr)[0])),
+        })
+    return rows
@@ -1,17 +1,22 @@
 """Parse results HTML from atptour.com into raw match dicts.
 
 Standalone parser with no schema or BaseJob dependencies. Returns lists of
-plain dicts; schema validation is the transformer's responsibility.
+plain dicts; schema validation is the transformer's responsibility. Built on
+bare lxml with precompiled XPath (see lxml_utils for the bs4 semantics kept).
 """
 
 import logging
 import re
 from datetime import date
 
-from bs4 import BeautifulSoup
+from lxml import etree
+
+from mvp.atptour.parsers.lxml_utils import first, has_class, parse_html, text
 
 logger = logging.getLogger(__name__)
 
+PARSER_VERSION = 1
+
 _DAY_SUFFIX_RE = re.compile(r"\s+Day\s+\d+$", re.IGNORECASE)
 
 _MONTH_MAP = {
@@ -30,6 +35,36 @@ _DATE_RANGE_CROSS_MONTH_RE = re.compile(
 )
 
 
+
+
+def _divs(name: str) -> etree.XPath:
+    return etree.XPath(f".//div[{has_class(name)}]")
+
+
+_MATCH_DIVS = _divs("match")
+_MATCH_HEADER = _divs("match-header")
+_MATCH_FOOTER = _divs("match-footer")
+_MATCH_NOTES = _divs("match-notes")
+_MATCH_CTA = _divs("match-cta")
+_STATS_ITEMS = _divs("stats-item")
+_DATE_LOCATIONS = _divs("date-location")
+_PLAYER_INFO = _divs("player-info")
+_NAME = _divs("name")
+_NAMES = _divs("names")
+_PROFILES = _divs("profiles")
+_COUNTRIES = _divs("countries")
+_COUNTRY = _divs("country")
+_WINNER = _divs("winner")
+_SCORES = _divs("scores")
+_SCORE_ITEMS = _divs("score-item")
+_PLAYER_IMAGES = etree.XPath(f".//img[{has_class('player-image')}]")
+_STRONG = etree.XPath(".//strong")
+_SPANS = etree.XPath(".//span")
+_LINKS = etree.XPath(".//a")
+_HREF_LINKS = etree.XPath(".//a[@href]")
+_USE = etree.XPath(".//use")
+
+
 class ResultsParser:
     """Parse results HTML (singles and doubles) from atptour.com."""
 
@@ -42,25 +77,27 @@ class ResultsParser:
         opp_country, player_scores, opp_scores, player_tiebreaks,
         opp_tiebreaks, result_type, tournament_start_date, tournament_end_date.
         """
-        soup = BeautifulSoup(html, "lxml")
-        start_date, end_date = self._parse_tournament_dates(soup)
+        root = parse_html(html)
+        if root is None:
+            return []
+        start_date, end_date = self._parse_tournament_dates(root)
         matches = []
 
-        for match_div in soup.find_all("div", class_="match"):
-            header = match_div.find("div", class_="match-header")
-            if not header:
+        for match_div in _MATCH_DIVS(root):
+            header = first(_MATCH_HEADER(match_div))
+            if header is None:
                 logger.warning("Skipping match div: missing match-header")
                 continue
 
-            strong = header.find("strong")
-            if not strong:
+            strong = first(_STRONG(header))
+            if strong is None:
                 logger.warning("Skipping match div: missing strong tag in header")
                 continue
 
             round_text = self._parse_round_text(strong)
             duration_text = self._parse_duration_text(header)
 
-            stats_items = match_div.find_all("div", class_="stats-item")
+            stats_items = _STATS_ITEMS(match_div)
             if len(stats_items) < 2:
                 logger.warning(
                     "Skipping match div: fewer than 2 stats-items (round=%s)",
@@ -88,8 +125,8 @@ class ResultsParser:
                 player_scores, player_raw_tb, opp_scores, opp_raw_tb
             )
 
-            footer = match_div.find("div", class_="match-footer")
-            match_id = self._parse_match_id(footer) if footer else None
+            footer = first(_MATCH_FOOTER(match_div))
+            match_id = self._parse_match_id(footer) if footer is not None else None
 
             match_notes = self._parse_match_notes(match_div)
             result_type = self._derive_result_type(
@@ -129,25 +166,27 @@ class ResultsParser:
         partner_id, partner_name, partner_country, opp_partner_id,
         opp_partner_name, opp_partner_country.
         """
-        soup = BeautifulSoup(html, "lxml")
-        start_date, end_date = self._parse_tournament_dates(soup)
+        root = parse_html(html)
+        if root is None:
+            return []
+        start_date, end_date = self._parse_tournament_dates(root)
         matches = []
 
-        for match_div in soup.find_all("div", class_="match"):
-            header = match_div.find("div", class_="match-header")
-            if not header:
+        for match_div in _MATCH_DIVS(root):
+            header = first(_MATCH_HEADER(match_div))
+            if header is None:
                 logger.warning("Skipping match div: missing match-header")
                 continue
 
-            strong = header.find("strong")
-            if not strong:
+            strong = first(_STRONG(header))
+            if strong is None:
                 logger.warning("Skipping match div: missing strong tag in header")
                 continue
 
             round_text = self._parse_round_text(strong)
             duration_text = self._parse_duration_text(header)
 
-            stats_items = match_div.find_all("div", class_="stats-item")
+            stats_items = _STATS_ITEMS(match_div)
             if len(stats_items) < 2:
                 logger.warning(
                     "Skipping match div: fewer than 2 stats-items (round=%s)",
@@ -175,8 +214,8 @@ class ResultsParser:
                 player_scores, player_raw_tb, opp_scores, opp_raw_tb
             )
 
-            footer = match_div.find("div", class_="match-footer")
-            match_id = self._parse_match_id(footer) if footer else None
+            footer = first(_MATCH_FOOTER(match_div))
+            match_id = self._parse_match_id(footer) if footer is not None else None
 
             match_notes = self._parse_match_notes(match_div)
             result_type = self._derive_result_type(
@@ -216,7 +255,7 @@ class ResultsParser:
         return matches
 
     def _parse_tournament_dates(
-        self, soup: BeautifulSoup
+        self, root: etree._Element
     ) -> tuple[date | None, date | None]:
         """Extract tournament start and end dates from date-location div.
 
@@ -230,12 +269,12 @@ class ResultsParser:
         Note: Some pages have template placeholders ({{tournament.FormattedDate}})
         in the first date-location div; we skip those and look for real data.
         """
-        for date_loc in soup.find_all("div", class_="date-location"):
-            spans = date_loc.find_all("span")
+        for date_loc in _DATE_LOCATIONS(root):
+            spans = _SPANS(date_loc)
             if len(spans) < 2:
                 continue
 
-            date_text = spans[1].get_text(strip=True)
+            date_text = text(spans[1])
             if not date_text or "{{" in date_text:
                 continue
 
@@ -295,10 +334,9 @@ class ResultsParser:
 
         Strips " - Venue" suffixes, trailing dashes, and "Day N" suffixes.
         """
-        text = strong_tag.get_text(strip=True)
-        text = text.split(" - ")[0].strip().rstrip("-").strip()
-        text = _DAY_SUFFIX_RE.sub("", text)
-        return text
+        round_text = text(strong_tag)
+        round_text = round_text.split(" - ")[0].strip().rstrip("-").strip()
+        return _DAY_SUFFIX_RE.sub("", round_text)
 
     @staticmethod
     def _parse_player(stats_item_div) -> dict | None:
@@ -307,33 +345,33 @@ class ResultsParser:
         Returns None if the player has no ATP profile link (e.g., WTA
         players in mixed-team events like the United Cup).
         """
-        player_info = stats_item_div.find("div", class_="player-info")
+        player_info = first(_PLAYER_INFO(stats_item_div))
         if player_info is None:
             return None
 
-        name_div = player_info.find("div", class_="name")
+        name_div = first(_NAME(player_info))
         if name_div is None:
             return None
-        a_tag = name_div.find("a")
+        a_tag = first(_LINKS(name_div))
         if a_tag is None:
             return None
-        name = a_tag.get_text(strip=True)
+        name = text(a_tag)
 
-        img = player_info.find("img", class_="player-image")
-        alt = img["alt"]
+        img = _PLAYER_IMAGES(player_info)[0]
+        alt = img.attrib["alt"]
         player_id = alt.replace("Player-Photo-", "")
 
-        seed_span = name_div.find("span")
-        seed_entry = seed_span.get_text(strip=True) if seed_span else ""
+        seed_span = first(_SPANS(name_div))
+        seed_entry = text(seed_span) if seed_span is not None else ""
 
         country = ""
-        use_tag = player_info.find("use")
-        if use_tag:
+        use_tag = first(_USE(player_info))
+        if use_tag is not None:
             href = use_tag.get("href", "")
             if "#flag-" in href:
                 country = href.split("#flag-")[1]
 
-        is_winner = player_info.find("div", class_="winner") is not None
+        is_winner = bool(_WINNER(player_info))
 
         return {
             "id": player_id,
@@ -350,33 +388,33 @@ class ResultsParser:
         Returns None if no profiles div, fewer than 2 player images,
         or fewer than 2 player links.
         """
-        player_info = stats_item_div.find("div", class_="player-info")
+        player_info = first(_PLAYER_INFO(stats_item_div))
         if player_info is None:
             return None
 
-        profiles = player_info.find("div", class_="profiles")
+        profiles = first(_PROFILES(player_info))
         if profiles is None:
             return None
 
-        imgs = profiles.find_all("img", class_="player-image")
+        imgs = _PLAYER_IMAGES(profiles)
         if len(imgs) < 2:
             return None
-        ids = [img["alt"].replace("Player-Photo-", "") for img in imgs[:2]]
+        ids = [img.attrib["alt"].replace("Player-Photo-", "") for img in imgs[:2]]
 
-        names_div = player_info.find("div", class_="names")
+        names_div = first(_NAMES(player_info))
         if names_div is None:
             return None
-        a_tags = names_div.find_all("a")
+        a_tags = _LINKS(names_div)
         if len(a_tags) < 2:
             return None
-        names = [a.get_text(strip=True) for a in a_tags[:2]]
+        names = [text(a) for a in a_tags[:2]]
 
         countries = []
-        countries_div = player_info.find("div", class_="countries")
-        if countries_div:
-            for country_div in countries_div.find_all("div", class_="country"):
-                use_tag = country_div.find("use")
-                if use_tag:
+        countries_div = first(_COUNTRIES(player_info))
+        if countries_div is not None:
+            for country_div in _COUNTRY(countries_div):
+                use_tag = first(_USE(country_div))
+                if use_tag is not None:
                     href = use_tag.get("href", "")
                     if "#flag-" in href:
                         countries.append(href.split("#flag-")[1])
@@ -387,13 +425,13 @@ class ResultsParser:
         while len(countries) < 2:
             countries.append("")
 
-        name_divs = names_div.find_all("div", class_="name")
+        name_divs = _NAME(names_div)
         seed_entry = ""
         if name_divs:
-            seed_span = name_divs[0].find("span")
-            seed_entry = seed_span.get_text(strip=True) if seed_span else ""
+            seed_span = first(_SPANS(name_divs[0]))
+            seed_entry = text(seed_span) if seed_span is not None else ""
 
-        is_winner = player_info.find("div", class_="winner") is not None
+        is_winner = bool(_WINNER(player_info))
 
         return {
             "players": [
@@ -412,21 +450,21 @@ class ResultsParser:
         - One span: (games, None)
         - Two spans: (games, tiebreak_points)
         """
-        scores_div = stats_item_div.find("div", class_="scores")
-        if not scores_div:
+        scores_div = first(_SCORES(stats_item_div))
+        if scores_div is None:
             return [], []
 
-        score_items = scores_div.find_all("div", class_="score-item")
+        score_items = _SCORE_ITEMS(scores_div)
         games = []
         tiebreaks = []
 
         for item in score_items:
-            spans = item.find_all("span")
+            spans = _SPANS(item)
             if not spans:
                 continue
-            games.append(int(spans[0].get_text(strip=True)))
+            games.append(int(text(spans[0])))
             if len(spans) >= 2:
-                tiebreaks.append(int(spans[1].get_text(strip=True)))
+                tiebreaks.append(int(text(spans[1])))
             else:
                 tiebreaks.append(None)
 
@@ -476,11 +514,11 @@ class ResultsParser:
     @staticmethod
     def _parse_match_id(footer_div) -> str | None:
         """Extract match ID from the footer's stats link."""
-        cta = footer_div.find("div", class_="match-cta")
-        if not cta:
+        cta = first(_MATCH_CTA(footer_div))
+        if cta is None:
             return None
-        for a_tag in cta.find_all("a", href=True):
-            href = a_tag["href"]
+        for a_tag in _HREF_LINKS(cta):
+            href = a_tag.attrib["href"]
             if "match-stats" in href or "stats-centre" in href:
                 return href.rstrip("/").split("/")[-1]
         return None
@@ -488,18 +526,18 @@ class ResultsParser:
     @staticmethod
     def _parse_duration_text(header_div) -> str | None:
         """Extract duration text from the second span in the match header."""
-        spans = header_div.find_all("span")
+        spans = _SPANS(header_div)
         if len(spans) >= 2:
-            text = spans[1].get_text(strip=True)
-            return text if text else None
+            duration = text(spans[1])
+            return duration if duration else None
         return None
 
     @staticmethod
     def _parse_match_notes(match_div) -> str:
         """Extract text from the match-notes div, if present."""
-        notes_div = match_div.find("div", class_="match-notes")
-        if notes_div:
-            return notes_div.get_text(strip=True)
+        notes_div = first(_MATCH_NOTES(match_div))
+        if notes_div is not None:
+            return text(notes_div)
         return ""
 
     @staticmethod
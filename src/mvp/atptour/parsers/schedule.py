@@ -0,0 +1,304 @@
+"""Scan schedule HTML from atptour.com into ``(schedule_day, match dicts)``.
+
+Standalone parser with no schema or BaseJob dependencies, like parsers.results:
+the schedule transformer adds tournament, snapshot and provenance fields and
+validates each row as a ScheduleRecord.
+"""
+
+import re
+from datetime import date, datetime, timedelta
+
+from lxml import etree
+
+from mvp.atptour.mappings import parse_seed_entry
+from mvp.atptour.parsers.lxml_utils import (
+    NO_TEXT_TAGS,
+    first,
+    has_class,
+    parse_html,
+    raw_text,
+    spaced_text,
+    text,
+)
+from mvp.common.enums import DrawType
+
+PARSER_VERSION = 1
+
+_MATCH_DURATION_ESTIMATE = timedelta(minutes=90)
+
+
+def _divs(name: str, prefix: str = ".//") -> etree.XPath:
+    return etree.XPath(f"{prefix}div[{has_class(name)}]")
+
+
+_DAY_HEADING = etree.XPath(f".//h4[{has_class('day')}]")
+_SPAN = etree.XPath(".//span")
+_CONTENT_GROUPS = _divs("content-group")
+_SCHEDULE_DIVS = etree.XPath(f".//div[{has_class('schedule')} and @data-matchdate]")
+_SCHEDULE_HEADER = _divs("schedule-header")
+_LOCATION_STRONG = etree.XPath(
+    f".//div[{has_class('schedule-location-timestamp')}]//strong"
+)
+_ROUND_DIV = etree.XPath(
+    f".//div[{has_class('schedule-header')}]//div[{has_class('schedule-type')}]"
+)
+_SCHEDULE_CONTENT = _divs("schedule-content")
+_POSSIBLE_PLAYERS = _divs("possible-players-container")
+_PLAYER_DIV = _divs("player")
+_OPPONENT_DIV = _divs("opponent")
+_STATUS_DIV = _divs("status")
+_SCORE_SPAN = etree.XPath(f".//span[{has_class('schedule-cta-score')}]")
+_NAMES_DIV = _divs("names")
+_NAME_LINKS = etree.XPath(f".//div[{has_class('name')}]//a")
+_COUNTRIES_DIV = _divs("countries")
+_SVG_USE = etree.XPath(".//svg//use")
+_PLAYERS_RANK_SPAN = etree.XPath(
+    f".//div[{has_class('players')}]//div[{has_class('rank')}]//span"
+)
+_RANK_SPAN = etree.XPath(f".//div[{has_class('rank')}]//span")
+_NAME_DIV = _divs("name")
+_LINK = etree.XPath(".//a")
+
+
+def _score_strings(el: etree._Element):
+    """Strings of a score span with each ``<sup>`` rendered as ``(text)``."""
+    if el.text:
+        yield el.text
+    for child in el:
+        if child.tag == "sup":
+            yield f"({raw_text(child)})"
+        elif isinstance(child.tag, str) and child.tag not in NO_TEXT_TAGS:
+            yield from _score_strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def _normalize_score(score_span: etree._Element | None) -> str | None:
+    """Convert HTML score to normalized string.
+
+    '76<sup>6</sup> 61' becomes '76(6) 61'.
+    All-ndash or empty text returns None.
+    """
+    if score_span is None:
+        return None
+
+    text = "".join(_score_strings(score_span))
+    # Normalize whitespace: collapse runs of whitespace to single space, strip edges
+    text = re.sub(r"\s+", " ", text).strip()
+    if not text:
+        return None
+
+    # Check if all characters are ndash
+    if all(c == "\u2013" for c in text):
+        return None
+
+    return text
+
+
+def _flag_country(use: etree._Element | None) -> str:
+    flag_href = use.attrib["href"] if use is not None else ""
+    return flag_href.split("#flag-")[-1] if "#flag-" in flag_href else ""
+
+
+def _extract_player_info(
+    div: etree._Element,
+) -> tuple[str, str, str, str | None, bool, str | None]:
+    """Extract player ID, name, country, seed/entry, doubles flag, and partner ID.
+
+    Returns (player_id, display_name, country_code, seed_entry, is_doubles, partner_id).
+    For singles, partner_id is None.
+    For doubles: display_name joins both players with ' / '; player_id is the first
+    pair member, partner_id is the second.
+    """
+    # Check for doubles structure (multiple names in a "names" div)
+    names_div = first(_NAMES_DIV(div))
+    if names_div is not None:
+        # Doubles
+        names = []
+        ids: list[str] = []
+        for link in _NAME_LINKS(names_div):
+            names.append(spaced_text(link))
+            parts = link.get("href", "").strip("/").split("/")
+            ids.append(parts[-2] if len(parts) >= 2 else "")
+        display_name = " / ".join(names)
+        first_id = ids[0] if ids else ""
+        partner_id = ids[1] if len(ids) >= 2 else None
+
+        # Country: first flag in countries div
+        countries_div = first(_COUNTRIES_DIV(div))
+        flag_scope = countries_div if countries_div is not None else div
+        country = _flag_country(first(_SVG_USE(flag_scope)))
+
+        # Seed/entry from rank span (in "players" div)
+        rank_span = first(_PLAYERS_RANK_SPAN(div))
+        seed_entry = text(rank_span) if rank_span is not None else ""
+        seed_entry = seed_entry if seed_entry else None
+
+        return first_id, display_name, country, seed_entry, True, partner_id
+
+    # Singles
+    name_div = first(_NAME_DIV(div))
+    link = first(_LINK(name_div)) if name_div is not None else None
+    if link is not None:
+        name_text = spaced_text(link)
+        parts = link.get("href", "").strip("/").split("/")
+        player_id = parts[-2] if len(parts) >= 2 else ""
+    else:
+        name_text = ""
+        player_id = ""
+
+    # Country from flag svg
+    country = _flag_country(first(_SVG_USE(div)))
+
+    # Seed/entry
+    rank_span = first(_RANK_SPAN(div))
+    seed_entry = text(rank_span) if rank_span is not None else ""
+    seed_entry = seed_entry if seed_entry else None
+
+    return player_id, name_text, country, seed_entry, False, None
+
+
+def scan_schedule_html(html: str) -> tuple[int | None, list[dict]]:
+    """Parse one schedule page into ``(schedule_day, match dicts)``.
+
+    Pure in the page content -- no tournament, snapshot or provenance fields --
+    so the result can be cached by content hash. Each dict holds the remaining
+    ScheduleRecord fields.
+    """
+    root = parse_html(html)
+    if root is None:
+        return None, []
+    rows: list[dict] = []
+
+    # Extract tournament schedule day number from "<h4 class="day">...(Day N)</h4>"
+    schedule_day: int | None = None
+    day_heading = first(_DAY_HEADING(root))
+    if day_heading is not None:
+        day_span = first(_SPAN(day_heading))
+        if day_span is not None:
+            day_match = re.search(r"Day\s+(\d+)", raw_text(day_span))
+            if day_match:
+                schedule_day = int(day_match.group(1))
+
+    for group in _CONTENT_GROUPS(root):
+        court_name = None
+        court_match_num = 0
+        anchor_time: datetime | None = None
+        anchor_position: int = 0
+
+        for match_div in _SCHEDULE_DIVS(group):
+            court_match_num += 1
+
+            match_date_str = match_div.attrib["data-matchdate"]
+            match_date = date.fromisoformat(match_date_str)
+
+            datetime_str = match_div.get("data-datetime", "").strip()
+            if datetime_str:
+                scheduled_datetime = datetime.strptime(
+                    datetime_str, "%Y-%m-%d %H:%M:%S"
+                )
+            else:
+                scheduled_datetime = None
+
+            time_suffix = match_div.get("data-suffix", "").strip()
+            display_time = match_div.get("data-displaytime", "").strip()
+
+            # Court name: extract from <strong> if present, otherwise propagate
+            header = first(_SCHEDULE_HEADER(match_div))
+            if header is not None:
+                strong = first(_LOCATION_STRONG(header))
+                if strong is not None:
+                    extracted = text(strong) or None
+                    if extracted:
+                        court_name = extracted
+
+            # Time anchor and estimation
+            if datetime_str:
+                is_time_estimated = False
+                if time_suffix in ("Starts At", "Not Before"):
+                    anchor_time = scheduled_datetime
+                    anchor_position = court_match_num
+            elif time_suffix == "Followed By" and anchor_time is not None:
+                offset = (court_match_num - anchor_position) * _MATCH_DURATION_ESTIMATE
+                scheduled_datetime = anchor_time + offset
+                is_time_estimated = True
+            else:
+                is_time_estimated = True
+
+            # Round
+            round_div = first(_ROUND_DIV(match_div))
+            round_str = text(round_div) if round_div is not None else ""
+
+            # Players
+            content = first(_SCHEDULE_CONTENT(match_div))
+            if content is None:
+                continue
+
+            # Skip matches where opponent is not yet determined
+            # (e.g., "M. Landaluce Or J. Pinnington Jones" from an unfinished prior round)
+            if _POSSIBLE_PLAYERS(content):
+                continue
+
+            player_div = first(_PLAYER_DIV(content))
+            opponent_div = first(_OPPONENT_DIV(content))
+            if player_div is None or opponent_div is None:
+                continue
+
+            p1_id, p1_name, p1_country, p1_seed_entry, p1_is_dbl, p1_partner_id = (
+                _extract_player_info(player_div)
+            )
+            p2_id, p2_name, p2_country, p2_seed_entry, p2_is_dbl, p2_partner_id = (
+                _extract_player_info(opponent_div)
+            )
+
+            # Skip matches without ATP profile links (e.g., WTA players)
+            if not p1_id or not p2_id:
+                continue
+
+            is_doubles = p1_is_dbl or p2_is_dbl
+            draw_type = DrawType.doubles if is_doubles else DrawType.singles
+
+            # Skip doubles matches where we couldn't extract both partner IDs:
+            # the resulting match_uid would only have 2 IDs and wouldn't join
+            # against the 4-ID uids built from results/match_stats.
+            if is_doubles and (p1_partner_id is None or p2_partner_id is None):
+                continue
+
+            status_div = first(_STATUS_DIV(content))
+            status = text(status_div) if status_div is not None else None
+            if status == "":
+                status = None
+
+            score = _normalize_score(first(_SCORE_SPAN(content)))
+
+            p1_seed, p1_entry = parse_seed_entry(p1_seed_entry)
+            p2_seed, p2_entry = parse_seed_entry(p2_seed_entry)
+            rows.append(
+                {
+                    "draw_type": draw_type,
+                    "match_date": match_date,
+                    "scheduled_datetime": scheduled_datetime,
+                    "time_suffix": time_suffix,
+                    "display_time": display_time,
+                    "court_name": court_name,
+                    "court_match_num": court_match_num,
+                    "is_time_estimated": is_time_estimated,
+                    "round": round_str,
+                    "p1_id": p1_id,
+                    "p1_name": p1_name,
+                    "p1_country": p1_country,
+                    "p1_seed": p1_seed,
+                    "p1_entry": p1_entry,
+                    "p1_partner_id": p1_partner_id,
+                    "p2_id": p2_id,
+                    "p2_name": p2_name,
+                    "p2_country": p2_country,
+                    "p2_seed": p2_seed,
+                    "p2_entry": p2_entry,
+                    "p2_partner_id": p2_partner_id,
+                    "status": status,
+                    "score": score,
+                }
+            )
+
+    return schedule_day, rows
@@ -1,8 +1,11 @@
 """ATP Tour data pipeline — extraction, transformation, and orchestration."""
 
 import logging
+import multiprocessing
+import os
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -25,6 +28,7 @@ from mvp.atptour.pipeline_utils import (
     get_scheduled_pairs,
 )
 from mvp.atptour.schemas.stats_plus import SCHEMA_HASH as _STATS_PLUS_SCHEMA_HASH
+from mvp.atptour.tournament import Tournament
 from mvp.atptour.transformers.match_beats import MatchBeatsTransformer
 from mvp.atptour.transformers.match_stats import MatchStatsTransformer
 from mvp.atptour.transformers.overview import OverviewTransformer
@@ -139,14 +143,13 @@ def _feed_stage_is_stale(
     raw_dir = transformer.build_path("raw", path, feed)
     if not raw_dir.exists():
         return False
-    raw_files = list(raw_dir.glob("*.json"))
-    if not raw_files:
+    raw_mtimes = transformer.raw_mtimes(raw_dir, "*.json")
+    if not raw_mtimes:
         return False
     output_path = transformer.build_path("stage", path, f"{feed}.parquet")
     if not output_path.exists():
         return True
-    output_mtime = output_path.stat().st_mtime
-    if any(f.stat().st_mtime > output_mtime for f in raw_files):
+    if max(raw_mtimes.values()) > output_path.stat().st_mtime:
         return True
     if schema_hash is not None and not transformer.is_schema_current(
         output_path, schema_hash
@@ -155,6 +158,142 @@ def _feed_stage_is_stale(
     return False
 
 
+def _extract_tournament(
+    tid: str,
+    year: int,
+    is_archive: bool,
+    circuit: Circuit | None,
+    *,
+    data_root: Path | None,
+    refresh: bool,
+) -> tuple[Tournament, int]:
+    """Network-bound half: fetch every raw page and feed for one tournament.
+
+    The overview, schedule and results pages are staged here as they land, not
+    in the staging half: the match stats and match-centre extractors take their
+    match IDs from the staged results.parquet, so it has to be current before
+    they run. These three are one small page each; the per-match feeds are the
+    parsing worth moving off the fetch threads.
+
+    Returns ``(tournament, new_stats)`` -- the count gates the stats transform.
+    """
+    tournament = OverviewExtractor(data_root=data_root).run(
+        tournament_id=tid,
+        year=year,
+        is_archive=is_archive,
+        refresh=refresh,
+        circuit=circuit,
+    )
+    logging_id = tournament.logging_id
+    logger.info("Processing %s", logging_id)
+
+    # Extractors leave unchanged pages untouched, so the raw-vs-stage gates
+    # below keep a quiet tick from restaging -- and, with the staged inputs
+    # unmoved, the aggregator's fingerprint skips too.
+    overview_tx = OverviewTransformer(tournament, data_root=data_root)
+    if refresh or overview_tx.is_stale():
+        overview_tx.run()
+    ScheduleExtractor(data_root=data_root).run(tournament)
+    ScheduleTransformer(tournament, data_root=data_root).run()
+
+    results_refresh = True  # Always refresh results
+    stats_refresh = refresh  # Only refresh stats when explicitly requested
+
+    ResultsExtractor(data_root=data_root).run(tournament, refresh=results_refresh)
+    results_tx = ResultsTransformer(tournament, data_root=data_root)
+    if refresh or results_tx.is_stale():
+        results_tx.run()
+    else:
+        logger.info("%s: results unchanged, skipping transform", logging_id)
+
+    new_stats = MatchStatsExtractor(data_root=data_root).run(
+        tournament, refresh=stats_refresh
+    )
+    MatchCentreExtractor(
+        data_root=data_root,
+        data_types=[
+            DataType.MATCH_BEATS,
+            DataType.STROKE_ANALYSIS,
+            DataType.RALLY_ANALYSIS,
+            DataType.STATS_PLUS,
+            DataType.COURT_VISION,
+            DataType.BELOW_COURT,
+        ],
+    ).run(tournament, refresh=stats_refresh)
+    return tournament, new_stats
+
+
+def _transform_tournament(
+    tournament: Tournament,
+    *,
+    data_root: Path | None,
+    refresh: bool,
+    new_stats: int,
+) -> None:
+    """CPU-bound half: stage the per-match feeds and aggregate. No network access."""
+    logging_id = tournament.logging_id
+
+    if new_stats > 0:
+        MatchStatsTransformer(tournament, data_root=data_root).run()
+    else:
+        logger.info(
+            "%s: no new match stats, skipping transform",
+            logging_id,
+        )
+
+    # Stage each match-centre feed whose raw is unstaged or newer than its
+    # stage — gated on raw-vs-stage state, not the extract count, so
+    # already-landed raw still stages (see _feed_stage_is_stale). The list
+    # is built here (not module-level) so the class names resolve at call
+    # time and stay patchable in tests.
+    match_centre_transformers = [
+        (MatchBeatsTransformer, "match_beats", None),
+        (StrokeAnalysisTransformer, "stroke_analysis", None),
+        (RallyAnalysisTransformer, "rally_analysis", None),
+        (StatsPlusTransformer, "stats_plus", _STATS_PLUS_SCHEMA_HASH),
+    ]
+    for transformer_cls, feed, schema_hash in match_centre_transformers:
+        transformer = transformer_cls(tournament, data_root=data_root)
+        if _feed_stage_is_stale(transformer, feed, schema_hash):
+            transformer.run()
+
+    TournamentMatchesAggregator(
+        circuit=tournament.circuit,
+        tid=tournament.tournament_id,
+        year=tournament.year,
+        data_root=data_root,
+    ).run(force=refresh)
+
+
+@contextmanager
+def _buffered_logs(thread_filter: _WorkerThreadFilter):
+    """Capture this thread's log records and keep them off the console."""
+    thread_id = threading.current_thread().ident
+    thread_filter.register(thread_id)
+    buffer = _BufferHandler(thread_id)
+    logging.getLogger().addHandler(buffer)
+    try:
+        yield buffer
+    finally:
+        logging.getLogger().removeHandler(buffer)
+        thread_filter.unregister(thread_id)
+
+
+def _replay(
+    logging_id: str,
+    failed: bool,
+    records: list[logging.LogRecord],
+    replay_lock: threading.Lock,
+) -> None:
+    """Print the progress line and surface only WARNING+ records."""
+    with replay_lock:
+        print(f"  {'FAILED' if failed else 'Completed'} {logging_id}")
+        for record in records:
+            if record.levelno >= logging.WARNING:
+                for handler in logging.getLogger().handlers:
+                    handler.emit(record)
+
+
 def _process_single_tournament(
     tid: str,
     year: int,
@@ -174,100 +313,159 @@ def _process_single_tournament(
 
     Returns ``(tid, year, error_str)`` on failure, ``None`` on success.
     """
-    thread_id = threading.current_thread().ident
-    thread_filter.register(thread_id)
-    buffer = _BufferHandler(thread_id)
-    logging.getLogger().addHandler(buffer)
-
     logging_id = f"{tid} ({year})"
     error_result = None
 
-    try:
-        tournament = OverviewExtractor(data_root=data_root).run(
-            tournament_id=tid,
-            year=year,
-            is_archive=is_archive,
-            refresh=refresh,
-            circuit=circuit,
-        )
-        logging_id = tournament.logging_id
-        logger.info("Processing %s", logging_id)
+    with _buffered_logs(thread_filter) as buffer:
+        try:
+            tournament, new_stats = _extract_tournament(
+                tid, year, is_archive, circuit, data_root=data_root, refresh=refresh
+            )
+            logging_id = tournament.logging_id
+            _transform_tournament(
+                tournament, data_root=data_root, refresh=refresh, new_stats=new_stats
+            )
+        except Exception as e:
+            logger.exception("Failed processing tournament %s (%d)", tid, year)
+            error_result = (tid, year, str(e))
+    _replay(logging_id, error_result is not None, buffer.records, replay_lock)
+    return error_result
 
-        OverviewTransformer(tournament, data_root=data_root).run()
-        ScheduleExtractor(data_root=data_root).run(tournament)
-        ScheduleTransformer(tournament, data_root=data_root).run()
 
-        results_refresh = True  # Always refresh results
-        stats_refresh = refresh  # Only refresh stats when explicitly requested
+def _extract_buffered(
+    tid: str,
+    year: int,
+    is_archive: bool,
+    circuit: Circuit | None,
+    *,
+    data_root: Path | None,
+    refresh: bool,
+    thread_filter: _WorkerThreadFilter,
+) -> tuple[Tournament | None, int, str | None, list[logging.LogRecord]]:
+    """`_extract_tournament` on a fetch thread, logs buffered for later replay.
 
-        ResultsExtractor(data_root=data_root).run(
-            tournament, refresh=results_refresh
-        )
-        ResultsTransformer(tournament, data_root=data_root).run()
-        new_stats = MatchStatsExtractor(data_root=data_root).run(
-            tournament, refresh=stats_refresh
-        )
-        if new_stats > 0:
-            MatchStatsTransformer(tournament, data_root=data_root).run()
-        else:
-            logger.info(
-                "%s: no new match stats, skipping transform",
-                logging_id,
+    Returns ``(tournament, new_stats, error, records)``; tournament is None on
+    failure.
+    """
+    with _buffered_logs(thread_filter) as buffer:
+        try:
+            tournament, new_stats = _extract_tournament(
+                tid, year, is_archive, circuit, data_root=data_root, refresh=refresh
             )
+            return tournament, new_stats, None, buffer.records
+        except Exception as e:
+            logger.exception("Failed extracting tournament %s (%d)", tid, year)
+            return None, 0, str(e), buffer.records
+
 
-        MatchCentreExtractor(
-            data_root=data_root,
-            data_types=[
-                DataType.MATCH_BEATS,
-                DataType.STROKE_ANALYSIS,
-                DataType.RALLY_ANALYSIS,
-                DataType.STATS_PLUS,
-                DataType.COURT_VISION,
-                DataType.BELOW_COURT,
-            ],
-        ).run(tournament, refresh=stats_refresh)
-        # Stage each match-centre feed whose raw is unstaged or newer than its
-        # stage — gated on raw-vs-stage state, not the extract count, so
-        # already-landed raw still stages (see _feed_stage_is_stale). The list
-        # is built here (not module-level) so the class names resolve at call
-        # time and stay patchable in tests.
-        match_centre_transformers = [
-            (MatchBeatsTransformer, "match_beats", None),
-            (StrokeAnalysisTransformer, "stroke_analysis", None),
-            (RallyAnalysisTransformer, "rally_analysis", None),
-            (StatsPlusTransformer, "stats_plus", _STATS_PLUS_SCHEMA_HASH),
-        ]
-        for transformer_cls, feed, schema_hash in match_centre_transformers:
-            transformer = transformer_cls(tournament, data_root=data_root)
-            if _feed_stage_is_stale(transformer, feed, schema_hash):
-                transformer.run()
-
-        TournamentMatchesAggregator(
-            circuit=tournament.circuit,
-            tid=tournament.tournament_id,
-            year=tournament.year,
-            data_root=data_root,
-        ).run()
-
-        return None
+def _transform_worker(
+    tournament: Tournament,
+    *,
+    data_root: Path | None,
+    refresh: bool,
+    new_stats: int,
+) -> tuple[str | None, list[dict]]:
+    """`_transform_tournament` in a pool process. Returns ``(error, records)``.
+
+    The child's WARNING+ records are captured here and shipped back as plain
+    dicts (a LogRecord's exc_info holds a traceback, which does not pickle) for
+    the parent to replay. Whatever handlers the child inherited -- spawn re-runs
+    the parent's ``__main__`` logging setup -- are detached for the task, or its
+    detail logs would bypass the buffering and interleave on the console.
+    """
+    buffer = _BufferHandler(threading.current_thread().ident)
+    buffer.setLevel(logging.WARNING)
+    root = logging.getLogger()
+    inherited, root.handlers = root.handlers, [buffer]
+    error = None
+    try:
+        _transform_tournament(
+            tournament, data_root=data_root, refresh=refresh, new_stats=new_stats
+        )
     except Exception as e:
-        logger.exception("Failed processing tournament %s (%d)", tid, year)
-        error_result = (tid, year, str(e))
-        return error_result
+        logger.exception(
+            "Failed processing tournament %s (%d)",
+            tournament.tournament_id, tournament.year,
+        )
+        error = str(e)
     finally:
-        logging.getLogger().removeHandler(buffer)
-        thread_filter.unregister(thread_id)
-        with replay_lock:
-            # Progress line
-            if error_result is None:
-                print(f"  Completed {logging_id}")
-            else:
-                print(f"  FAILED {logging_id}")
-            # Only surface warnings/errors
-            for record in buffer.records:
-                if record.levelno >= logging.WARNING:
-                    for handler in logging.getLogger().handlers:
-                        handler.emit(record)
+        root.handlers = inherited
+    formatter = logging.Formatter()
+    shipped = []
+    for record in buffer.records:
+        if record.exc_info:
+            record.exc_text = formatter.formatException(record.exc_info)
+            record.exc_info = None
+        record.msg, record.args = record.getMessage(), None
+        shipped.append(record.__dict__)
+    return error, shipped
+
+
+def _process_tournaments_pooled(
+    tournaments: list[tuple[str, int, bool, Circuit | None]],
+    *,
+    data_root: Path | None,
+    refresh: bool,
+    n_workers: int,
+    thread_filter: _WorkerThreadFilter,
+) -> list[tuple[str, int, str]]:
+    """Fetch on the thread pool, stage the feeds and aggregate on a process pool.
+
+    Fetching waits on the network and is capped at MAX_TOURNAMENT_WORKERS to
+    stay polite to the host; staging is parsing, validation and polars glue that
+    threads serialise on the GIL. Each tournament is handed to a process as soon
+    as its fetch lands, so the two overlap. Spawn, not fork: the parent holds
+    live HTTP sessions and logging locks from the fetch threads.
+    """
+    replay_lock = threading.Lock()
+    failed: list[tuple[str, int, str]] = []
+    with (
+        ThreadPoolExecutor(max_workers=MAX_TOURNAMENT_WORKERS) as fetch_pool,
+        ProcessPoolExecutor(
+            max_workers=n_workers, mp_context=multiprocessing.get_context("spawn"),
+        ) as stage_pool,
+    ):
+        fetches = {
+            fetch_pool.submit(
+                _extract_buffered,
+                tid,
+                year,
+                is_archive,
+                circuit,
+                data_root=data_root,
+                refresh=refresh,
+                thread_filter=thread_filter,
+            ): (tid, year)
+            for tid, year, is_archive, circuit in tournaments
+        }
+        stages = {}
+        for future in as_completed(fetches):
+            tid, year = fetches[future]
+            tournament, new_stats, error, records = future.result()
+            if tournament is None:
+                failed.append((tid, year, error))
+                _replay(f"{tid} ({year})", True, records, replay_lock)
+                continue
+            stage = stage_pool.submit(
+                _transform_worker,
+                tournament,
+                data_root=data_root,
+                refresh=refresh,
+                new_stats=new_stats,
+            )
+            stages[stage] = (tournament, records)
+
+        for future in as_completed(stages):
+            tournament, records = stages[future]
+            try:
+                error, shipped = future.result()
+            except Exception as e:  # the worker process itself died
+                error, shipped = str(e), []
+            records = records + [logging.makeLogRecord(d) for d in shipped]
+            if error is not None:
+                failed.append((tournament.tournament_id, tournament.year, error))
+            _replay(tournament.logging_id, error is not None, records, replay_lock)
+    return failed
 
 
 def _process_tournaments(
@@ -275,17 +473,33 @@ def _process_tournaments(
     *,
     data_root: Path | None,
     refresh: bool,
+    workers: int | None = 1,
 ) -> list[tuple[str, int, str]]:
-    """Per-tournament extraction + transformation loop (parallel)."""
+    """Per-tournament extraction + transformation loop (parallel).
+
+    ``workers`` sets the processes for the CPU-bound staging half (None = one
+    per core). At 1 -- the default, and what the live tick uses for its
+    handful of tournaments -- everything runs on the fetch threads in-process,
+    where spawning would cost more than it saves.
+    """
     if not tournaments:
         return []
 
     total = len(tournaments)
-    logger.info(
-        "Processing %d tournaments in parallel (%d workers)",
-        total,
-        MAX_TOURNAMENT_WORKERS,
-    )
+    n_workers = min(workers or os.cpu_count() or 1, total)
+    if n_workers > 1:
+        logger.info(
+            "Processing %d tournaments (%d fetch threads, %d staging processes)",
+            total,
+            MAX_TOURNAMENT_WORKERS,
+            n_workers,
+        )
+    else:
+        logger.info(
+            "Processing %d tournaments in parallel (%d workers)",
+            total,
+            MAX_TOURNAMENT_WORKERS,
+        )
 
     thread_filter = _WorkerThreadFilter()
     replay_lock = threading.Lock()
@@ -295,25 +509,34 @@ def _process_tournaments(
 
     failed: list[tuple[str, int, str]] = []
     try:
-        with ThreadPoolExecutor(max_workers=MAX_TOURNAMENT_WORKERS) as pool:
-            futures = {
-                pool.submit(
-                    _process_single_tournament,
-                    tid,
-                    year,
-                    is_archive,
-                    circuit,
-                    data_root=data_root,
-                    refresh=refresh,
-                    thread_filter=thread_filter,
-                    replay_lock=replay_lock,
-                ): (tid, year)
-                for tid, year, is_archive, circuit in tournaments
-            }
-            for future in as_completed(futures):
-                result = future.result()
-                if result is not None:
-                    failed.append(result)
+        if n_workers > 1:
+            failed = _process_tournaments_pooled(
+                tournaments,
+                data_root=data_root,
+                refresh=refresh,
+                n_workers=n_workers,
+                thread_filter=thread_filter,
+            )
+        else:
+            with ThreadPoolExecutor(max_workers=MAX_TOURNAMENT_WORKERS) as pool:
+                futures = {
+                    pool.submit(
+                        _process_single_tournament,
+                        tid,
+                        year,
+                        is_archive,
+                        circuit,
+                        data_root=data_root,
+                        refresh=refresh,
+                        thread_filter=thread_filter,
+                        replay_lock=replay_lock,
+                    ): (tid, year)
+                    for tid, year, is_archive, circuit in tournaments
+                }
+                for future in as_completed(futures):
+                    result = future.result()
+                    if result is not None:
+                        failed.append(result)
     finally:
         for handler in logging.getLogger().handlers:
             handler.removeFilter(thread_filter)
@@ -431,11 +654,12 @@ def run_player_data(
         if scheduled:
             stager = PlayerActivityStager(data_root=data_root)
             result.failed_activity_stage = stager.run(player_ids=scheduled)
-            # Consolidate only if something re-staged. The transformer rebuilds
-            # `activity.parquet` from all ~12k per-player files, and most ticks change
-            # nothing.
+            # Consolidate only if something re-staged, and then only the re-staged
+            # players' rows; most ticks change nothing.
             if stager.last_staged:
-                PlayerActivityTransformer(data_root=data_root).run()
+                PlayerActivityTransformer(data_root=data_root).run(
+                    player_ids=stager.last_staged
+                )
 
     if player_tournaments and refresh_players:
         players_with_results = get_players_with_results(
@@ -472,10 +696,13 @@ def run_player_data(
                     activity_ledger.record(
                         default_root, pid, uids, activity_ledger.OK
                     )
-        result.failed_activity_stage = PlayerActivityStager(
-            data_root=data_root
-        ).run(player_ids=set(activity_tournaments))
-        PlayerActivityTransformer(data_root=data_root).run()
+        stager = PlayerActivityStager(data_root=data_root)
+        result.failed_activity_stage = stager.run(
+            player_ids=set(activity_tournaments)
+        )
+        PlayerActivityTransformer(data_root=data_root).run(
+            player_ids=stager.last_staged
+        )
         _touch_activity_marker(default_root)
     elif player_tournaments:
         logger.info(
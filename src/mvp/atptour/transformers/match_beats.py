@@ -14,9 +14,69 @@ from mvp.atptour.schemas.match_beats import (
 )
 from mvp.atptour.tournament import Tournament
 from mvp.common.base_job import BaseJob
+from mvp.common.utils import columnar_frame
 
 logger = logging.getLogger(__name__)
 
+# Set/game context repeated onto each of the game's points, in the order
+# _transform_file builds the context tuple.
+_CONTEXT_COLUMNS = (
+    "set_num",
+    "set_winner",
+    "game_num",
+    "game_duration",
+    "easy_hold",
+    "difficult_hold",
+    "multiple_deuces",
+    "game_winner",
+    "is_tiebreak",
+)
+
+# Raw pointData key -> (column, default when the key is absent)
+_POINT_FIELDS = (
+    ("point", "point_num", 0),
+    ("pointId", "point_id", ""),
+    ("result", "result", "N"),
+    ("scorer", "scorer", "1"),
+    ("server", "server", "1"),
+    ("serve", "serve", 1),
+    ("serveSpeed", "serve_speed", 0.0),
+    ("faultSrvSpd", "fault_serve_speed", 0.0),
+    ("tm1Rally", "p1_rally_shots", 0),
+    ("tm2Rally", "p2_rally_shots", 0),
+    ("rallyLengthMissing", "rally_length_missing", False),
+    ("isBrkPt", "is_break_point", False),
+    ("brkPts", "break_points_in_game", 0),
+    ("brkPtsLost", "break_points_lost", 0),
+    ("isCrucialPt", "is_crucial_point", False),
+    ("tm1GameScore", "p1_game_score", "0"),
+    ("tm2GameScore", "p2_game_score", "0"),
+    ("currentMatchDuration", "match_duration_at_point", 0),
+)
+
+_POINT_RESULTS = [e.value for e in PointResult]
+
+
+def _zero_to_null(c: pl.Expr) -> pl.Expr:
+    """Untracked (0) speed to null.
+
+    Compares on a lenient Float64 cast: one non-numeric speed turns the whole
+    built column to String, and that value must pass through unchanged for the
+    row check to reject its point.
+    """
+    return pl.when(c.cast(pl.Float64, strict=False) == 0).then(None).otherwise(c)
+
+
+# Column forms of MatchBeatsPointRecord's before-validators. Int set/game
+# winners and scorer/server become strings in the String cast. "N" (no data)
+# and any untracked result type stage as null.
+_BEFORE = {
+    "match_id": lambda c: c.str.to_uppercase().str.strip_chars(),
+    "result": lambda c: pl.when(c.is_in(_POINT_RESULTS)).then(c),
+    "serve_speed": _zero_to_null,
+    "fault_serve_speed": _zero_to_null,
+}
+
 
 class MatchBeatsTransformer(BaseJob):
     """Transform MatchBeats JSON files to point-level Parquet."""
@@ -34,20 +94,19 @@ class MatchBeatsTransformer(BaseJob):
             )
             return
 
-        json_files = list(raw_dir.glob("*.json"))
+        json_files = self.list_files(raw_dir, "*.json")
         if not json_files:
             logger.debug(
                 "No match_beats JSON files for %s", self.tournament.logging_id
             )
             return
 
-        all_records = []
+        columns: dict[str, list] = {}
         parsed_at = datetime.now()
 
         for json_file in json_files:
             try:
-                records = self._transform_file(json_file, parsed_at)
-                all_records.extend(records)
+                file_columns = self._transform_file(json_file, parsed_at)
             except Exception as e:
                 logger.warning(
                     "Failed to transform %s: %s",
@@ -55,19 +114,28 @@ class MatchBeatsTransformer(BaseJob):
                     e,
                 )
                 continue
+            for name, values in file_columns.items():
+                columns.setdefault(name, []).extend(values)
 
-        if not all_records:
+        df, rejected = (
+            columnar_frame(columns, MatchBeatsPointRecord, before=_BEFORE)
+            if columns.get("point_num")
+            else (pl.DataFrame(), [])
+        )
+        if rejected:
+            logger.debug(
+                "%s: skipped %d invalid points (first: %s)",
+                self.tournament.logging_id,
+                len(rejected),
+                rejected[0],
+            )
+
+        if df.is_empty():
             logger.info(
                 "%s: no valid match_beats records", self.tournament.logging_id
             )
             return
 
-        # Convert to DataFrame with explicit schema inference
-        df = pl.DataFrame(
-            [r.model_dump() for r in all_records],
-            infer_schema_length=None,  # Scan all rows for schema
-        )
-
         # Add schema hash
         df = df.with_columns(pl.lit(SCHEMA_HASH).alias("schema_hash"))
 
@@ -81,16 +149,15 @@ class MatchBeatsTransformer(BaseJob):
         logger.info(
             "%s: staged %d points from %d matches",
             self.tournament.logging_id,
-            len(all_records),
+            len(df),
             len(json_files),
         )
 
     def _transform_file(
         self, json_file: Path, parsed_at: datetime
-    ) -> list[MatchBeatsPointRecord]:
-        """Transform a single JSON file to point records."""
-        with open(json_file) as f:
-            data = json.load(f)
+    ) -> dict[str, list]:
+        """Transform a single JSON file to point-level column lists."""
+        data = json.loads(self.read_text(json_file))
 
         match_id = data.get("matchId", json_file.stem)
         is_doubles = data.get("isDoubles", False)
@@ -100,127 +167,40 @@ class MatchBeatsTransformer(BaseJob):
         p1_id = player_data.get("tm1Ply1Id", "")
         p2_id = player_data.get("tm2Ply1Id", "")
 
-        records = []
-
+        columns: dict[str, list] = {
+            name: [] for name in (*_CONTEXT_COLUMNS, *(c for _, c, _ in _POINT_FIELDS))
+        }
         for set_data in data.get("setData", []):
-            set_num = set_data.get("set", 0)
-            set_winner = set_data.get("setWinner")
-            if isinstance(set_winner, int):
-                set_winner = str(set_winner)
+            set_context = (set_data.get("set", 0), set_data.get("setWinner"))
 
             for game_data in set_data.get("gameData", []):
-                game_num = game_data.get("game", 0)
-                game_duration = game_data.get("duration")
-                easy_hold = game_data.get("easyHold")
-                difficult_hold = game_data.get("difficultHold")
-                multiple_deuces = game_data.get("multipleDeuces")
-                game_winner = game_data.get("gameWinner")
-                if isinstance(game_winner, int):
-                    game_winner = str(game_winner)
-                is_tiebreak = game_data.get("isTieBreak", False)
-
+                context = (
+                    *set_context,
+                    game_data.get("game", 0),
+                    game_data.get("duration"),
+                    game_data.get("easyHold"),
+                    game_data.get("difficultHold"),
+                    game_data.get("multipleDeuces"),
+                    game_data.get("gameWinner"),
+                    game_data.get("isTieBreak", False),
+                )
                 for point_data in game_data.get("pointData", []):
-                    try:
-                        record = self._create_point_record(
-                            point_data=point_data,
-                            tournament_id=self.tournament.tournament_id,
-                            year=self.tournament.year,
-                            match_id=match_id,
-                            is_doubles=is_doubles,
-                            p1_id=p1_id,
-                            p2_id=p2_id,
-                            set_num=set_num,
-                            set_winner=set_winner,
-                            game_num=game_num,
-                            game_duration=game_duration,
-                            easy_hold=easy_hold,
-                            difficult_hold=difficult_hold,
-                            multiple_deuces=multiple_deuces,
-                            game_winner=game_winner,
-                            is_tiebreak=is_tiebreak,
-                            source_file=str(json_file),
-                            parsed_at=parsed_at,
-                        )
-                        records.append(record)
-                    except Exception as e:
-                        logger.debug(
-                            "Skipping point in %s: %s",
-                            json_file.name,
-                            e,
-                        )
-                        continue
-
-        return records
-
-    def _create_point_record(
-        self,
-        point_data: dict,
-        tournament_id: str,
-        year: int,
-        match_id: str,
-        is_doubles: bool,
-        p1_id: str,
-        p2_id: str,
-        set_num: int,
-        set_winner: str | None,
-        game_num: int,
-        game_duration: int | None,
-        easy_hold: bool | None,
-        difficult_hold: bool | None,
-        multiple_deuces: bool | None,
-        game_winner: str | None,
-        is_tiebreak: bool,
-        source_file: str,
-        parsed_at: datetime,
-    ) -> MatchBeatsPointRecord:
-        """Create a MatchBeatsPointRecord from raw point data."""
-        # Normalize result — "N" means no data, map to None
-        result = point_data.get("result", "N")
-        if result == "N" or result not in [e.value for e in PointResult]:
-            result = None
-
-        # Normalize scorer/server (can be int or str)
-        scorer = point_data.get("scorer", "1")
-        if isinstance(scorer, int):
-            scorer = str(scorer)
-        server = point_data.get("server", "1")
-        if isinstance(server, int):
-            server = str(server)
-
-        return MatchBeatsPointRecord(
-            tournament_id=tournament_id,
-            year=year,
-            match_id=match_id,
-            is_doubles=is_doubles,
-            p1_id=p1_id,
-            p2_id=p2_id,
-            set_num=set_num,
-            set_winner=set_winner,
-            game_num=game_num,
-            game_duration=game_duration,
-            easy_hold=easy_hold,
-            difficult_hold=difficult_hold,
-            multiple_deuces=multiple_deuces,
-            game_winner=game_winner,
-            is_tiebreak=is_tiebreak,
-            point_num=point_data.get("point", 0),
-            point_id=point_data.get("pointId", ""),
-            result=result,
-            scorer=scorer,
-            server=server,
-            serve=point_data.get("serve", 1),
-            serve_speed=point_data.get("serveSpeed", 0.0),
-            fault_serve_speed=point_data.get("faultSrvSpd", 0.0),
-            p1_rally_shots=point_data.get("tm1Rally", 0),
-            p2_rally_shots=point_data.get("tm2Rally", 0),
-            rally_length_missing=point_data.get("rallyLengthMissing", False),
-            is_break_point=point_data.get("isBrkPt", False),
-            break_points_in_game=point_data.get("brkPts", 0),
-            break_points_lost=point_data.get("brkPtsLost", 0),
-            is_crucial_point=point_data.get("isCrucialPt", False),
-            p1_game_score=str(point_data.get("tm1GameScore", "0")),
-            p2_game_score=str(point_data.get("tm2GameScore", "0")),
-            match_duration_at_point=point_data.get("currentMatchDuration", 0),
-            source_file=source_file,
-            parsed_at=parsed_at,
+                    for name, value in zip(_CONTEXT_COLUMNS, context):
+                        columns[name].append(value)
+                    for key, name, default in _POINT_FIELDS:
+                        columns[name].append(point_data.get(key, default))
+
+        n_points = len(columns["point_num"])
+        columns["p1_game_score"] = [str(v) for v in columns["p1_game_score"]]
+        columns["p2_game_score"] = [str(v) for v in columns["p2_game_score"]]
+        columns.update(
+            tournament_id=[self.tournament.tournament_id] * n_points,
+            year=[self.tournament.year] * n_points,
+            match_id=[match_id] * n_points,
+            is_doubles=[is_doubles] * n_points,
+            p1_id=[p1_id] * n_points,
+            p2_id=[p2_id] * n_points,
+            source_file=[str(json_file)] * n_points,
+            parsed_at=[parsed_at] * n_points,
         )
+        return columns
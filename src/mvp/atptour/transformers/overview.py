@@ -21,11 +21,23 @@ class OverviewTransformer(BaseJob):
         super().__init__(domain="atptour", data_root=data_root)
         self.tournament = tournament
 
+    def is_stale(self) -> bool:
+        """Whether overview.json is newer than overview.parquet, or the parquet
+        predates the current OverviewRecord schema."""
+        out = self.build_path("stage", self.tournament.path, "overview.parquet")
+        if self.is_stage_stale(
+            [self.build_path("raw", self.tournament.path, "overview.json")], out
+        ):
+            return True
+        return out.exists() and not self.is_schema_current(
+            out, OverviewRecord.SCHEMA_HASH
+        )
+
     def run(self) -> list[Path]:
         """Process overview JSON. Returns parquet paths (0 or 1)."""
         raw_path = self.build_path("raw", self.tournament.path, "overview.json")
 
-        if not raw_path.exists():
+        if not self.raw_exists(raw_path):
             logger.info(
                 "No overview file for %s", self.tournament.logging_id
             )
@@ -73,7 +85,9 @@ class OverviewTransformer(BaseJob):
         out_path = self.build_path(
             "stage", self.tournament.path, "overview.parquet"
         )
-        result = self.save_parquet(df, out_path)
+        result = self.save_parquet(
+            df, out_path, schema_hash=OverviewRecord.SCHEMA_HASH
+        )
         if result is None:
             return []
         return [result]
@@ -106,13 +106,14 @@ class PlayerActivityStager(BaseJob):
         self.last_staged = set()
         raw_dir = self.build_path("raw", "activity")
         if player_ids is not None:
-            raw_files = [
-                raw_dir / f"{pid}.json"
+            raw_mtimes = {
+                raw_dir / f"{pid}.json": mtime
                 for pid in player_ids
-                if (raw_dir / f"{pid}.json").exists()
-            ]
+                if (mtime := self.raw_mtime(raw_dir / f"{pid}.json")) is not None
+            }
         else:
-            raw_files = self.list_files(raw_dir, "*.json")
+            raw_mtimes = self.raw_mtimes(raw_dir, "*.json")
+        raw_files = list(raw_mtimes)
         if not raw_files:
             return []
 
@@ -125,7 +126,7 @@ class PlayerActivityStager(BaseJob):
             staged_path = existing.get(pid)
             if staged_path is None:
                 to_process.append(raw_path)
-            elif raw_path.stat().st_mtime > staged_path.stat().st_mtime:
+            elif raw_mtimes[raw_path] > staged_path.stat().st_mtime:
                 to_process.append(raw_path)
             elif not self.is_schema_current(
                 staged_path, PlayerActivityRecord.SCHEMA_HASH
@@ -166,38 +167,58 @@ class PlayerActivityStager(BaseJob):
         return failed
 
 
+def _dedup_activity(df: pl.DataFrame) -> tuple[pl.DataFrame, int]:
+    """Drop duplicate (player_id, match_uid) non-bye rows; (rows, n dropped).
+
+    A handful of raw activity entries are genuine duplicates from ATP. The key
+    includes player_id, so duplicates never span two per-player files.
+    """
+    matches = df.filter(pl.col("match_uid").is_not_null())
+    byes = df.filter(pl.col("match_uid").is_null())
+    deduped = matches.unique(subset=["player_id", "match_uid"], keep="first")
+    return (
+        pl.concat([deduped, byes], how="vertical_relaxed"),
+        len(matches) - len(deduped),
+    )
+
+
 class PlayerActivityTransformer(BaseJob):
     """Consolidate per-player parquets into a single activity.parquet."""
 
     def __init__(self, data_root: Path | None = None):
         super().__init__(domain="atptour", data_root=data_root)
 
-    def run(self) -> Path | None:
+    def run(self, player_ids: set[str] | None = None) -> Path | None:
+        """Write activity.parquet from the per-player parquets.
+
+        With ``player_ids`` (the stager's ``last_staged``), only those players'
+        rows are replaced in the existing activity.parquet -- plus any player
+        whose file is newer than it (staged by a run that died before
+        consolidating) or whose file is gone. Without it, or with no existing
+        consolidated file, every per-player file is re-read.
+        """
         stage_dir = self.build_path("stage", "activity")
         parquet_files = self.list_files(stage_dir, "*.parquet")
         if not parquet_files:
             logger.info("No player activity parquets to consolidate")
             return None
 
+        target = self.build_path("stage", "activity.parquet")
+        if player_ids is None or not target.exists():
+            return self._rebuild(parquet_files, target)
+        return self._splice(parquet_files, target, player_ids)
+
+    def _rebuild(self, parquet_files: list[Path], target: Path) -> Path | None:
         dfs = [pl.read_parquet(p) for p in parquet_files]
-        combined = pl.concat(dfs, how="vertical_relaxed")
-
-        # Deduplicate on (player_id, match_uid) for non-bye rows.
-        # A handful of raw activity entries are genuine duplicates from ATP.
-        matches = combined.filter(pl.col("match_uid").is_not_null())
-        byes = combined.filter(pl.col("match_uid").is_null())
-        key_cols = ["player_id", "match_uid"]
-        n_before = len(matches)
-        matches = matches.unique(subset=key_cols, keep="first")
-        n_dropped = n_before - len(matches)
+        combined, n_dropped = _dedup_activity(
+            pl.concat(dfs, how="vertical_relaxed")
+        )
         if n_dropped:
             logger.info(
                 "Player activity consolidate: dropped %d duplicate rows",
                 n_dropped,
             )
-        combined = pl.concat([matches, byes], how="vertical_relaxed")
 
-        target = self.build_path("stage", "activity.parquet")
         result = self.save_parquet(combined, target)
 
         logger.info(
@@ -206,3 +227,51 @@ class PlayerActivityTransformer(BaseJob):
             len(combined),
         )
         return result
+
+    def _splice(
+        self, parquet_files: list[Path], target: Path, player_ids: set[str]
+    ) -> Path | None:
+        consolidated_mtime = target.stat().st_mtime
+        staged = {p.stem: p for p in parquet_files}
+        changed = {pid for pid in player_ids if pid in staged} | {
+            pid for pid, p in staged.items() if p.stat().st_mtime > consolidated_mtime
+        }
+
+        existing = pl.read_parquet(target)
+        # Players dropped from stage/ leave, as they would on a full rebuild
+        gone = set(existing["player_id"].unique().to_list()) - staged.keys()
+        replaced = changed | gone | (player_ids - staged.keys())
+        if not changed and not gone:
+            logger.info("Player activity consolidate: no changed players")
+            return target
+
+        fresh, n_dropped = (
+            _dedup_activity(
+                pl.concat(
+                    [pl.read_parquet(staged[pid]) for pid in sorted(changed)],
+                    how="vertical_relaxed",
+                )
+            )
+            if changed
+            else (existing.clear(), 0)
+        )
+        if n_dropped:
+            logger.info(
+                "Player activity consolidate: dropped %d duplicate rows",
+                n_dropped,
+            )
+        if fresh.columns != existing.columns:
+            # Schema bump mid-restage: the kept rows are in the old shape
+            logger.info("Player activity consolidate: schema changed, rebuilding")
+            return self._rebuild(parquet_files, target)
+
+        kept = existing.filter(~pl.col("player_id").is_in(list(replaced)))
+        combined = pl.concat([kept, fresh], how="vertical_relaxed")
+        result = self.save_parquet(combined, target)
+
+        logger.info(
+            "Player activity consolidate: replaced %d players, %d total rows",
+            len(replaced),
+            len(combined),
+        )
+        return result
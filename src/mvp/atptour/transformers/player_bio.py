@@ -61,7 +61,8 @@ class PlayerBioStager(BaseJob):
             List of (player_id, error_message) tuples for failed records.
         """
         raw_dir = self.build_path("raw", "players")
-        raw_files = self.list_files(raw_dir, "*.json")
+        raw_mtimes = self.raw_mtimes(raw_dir, "*.json")
+        raw_files = list(raw_mtimes)
         if not raw_files:
             return []
 
@@ -74,7 +75,7 @@ class PlayerBioStager(BaseJob):
             staged_path = existing.get(pid)
             if staged_path is None:
                 to_process.append(raw_path)
-            elif raw_path.stat().st_mtime > staged_path.stat().st_mtime:
+            elif raw_mtimes[raw_path] > staged_path.stat().st_mtime:
                 to_process.append(raw_path)
             elif not self.is_schema_current(staged_path, PlayerBioRecord.SCHEMA_HASH):
                 to_process.append(raw_path)
@@ -1,13 +1,15 @@
 """Transform raw rankings HTML into staged parquet via RankingsRecord schema."""
 
 import datetime as dt
+import json
 import logging
 from datetime import date
 from pathlib import Path
 
 import polars as pl
-from bs4 import BeautifulSoup
 
+from mvp.atptour.parsers.cache import PARSE_CACHE_FILENAME, ParseCache
+from mvp.atptour.parsers.rankings import PARSER_VERSION, scan_rankings_page
 from mvp.atptour.schemas.rankings import RankingsRecord
 from mvp.common.base_job import BaseJob
 from mvp.common.utils import polars_schema
@@ -21,12 +23,31 @@ def _parse_date_from_stem(stem: str) -> date:
     return date(int(d[:4]), int(d[4:6]), int(d[6:8]))
 
 
-def _dash_to_none(text: str) -> int | None:
-    """Parse an integer from text, treating '-' as None."""
-    text = text.strip()
-    if text == "-":
-        return None
-    return int(text.replace(",", ""))
+# Consolidated store: stage/atptour/rankings/singles/{year}.parquet, one
+# partition per ranking year, each sorted by (player_id, ranking_date).
+STORE_DIRNAME = "singles"
+# Pre-store single-file consolidation, still read when no store exists.
+LEGACY_CONSOLIDATED = "rankings_singles.parquet"
+# Partition metadata key: JSON {weekly stem: staged mtime_ns} of the weeks it holds.
+_WEEKS_KEY = "weeks"
+
+
+def load_rankings(rankings_dir: Path) -> pl.DataFrame | None:
+    """Read the consolidated rankings under ``stage/atptour/rankings``.
+
+    Rows come back sorted by ranking_date within each player_id (partitions
+    are read in year order), which is what an as-of join grouped by player
+    needs; see ``join_rankings(presorted=True)``. Falls back to the legacy
+    single-file consolidation, sorted to the same layout.
+    """
+    store = rankings_dir / STORE_DIRNAME
+    partitions = sorted(store.glob("*.parquet"), key=lambda p: int(p.stem))
+    if partitions:
+        return pl.concat([pl.read_parquet(p) for p in partitions])
+    legacy = rankings_dir / LEGACY_CONSOLIDATED
+    if legacy.exists():
+        return pl.read_parquet(legacy).sort("player_id", "ranking_date")
+    return None
 
 
 class RankingsTransformer(BaseJob):
@@ -34,6 +55,9 @@ class RankingsTransformer(BaseJob):
 
     def __init__(self, data_root: Path | None = None):
         super().__init__(domain="atptour", data_root=data_root)
+        self._parse_cache = ParseCache(
+            self.build_path("stage", "", PARSE_CACHE_FILENAME)
+        )
 
     def run(self, start_year: int | None = None) -> list[Path]:
         """Process rankings HTML files into per-date parquets.
@@ -115,36 +139,78 @@ class RankingsTransformer(BaseJob):
         return paths
 
     def consolidate(self) -> Path | None:
-        """Merge all per-date parquets into a single rankings_singles.parquet.
+        """Fold newly staged weeks into the per-year rankings store.
 
-        Returns the consolidated file path, or None if no files to merge.
+        Only year partitions whose staged weeks changed (new, restaged after a
+        schema bump, or removed) are rewritten, and within one only the changed
+        weeks are read; a weekly update touches the current year alone.
+
+        Returns the store directory, or None if no files to merge.
         """
         stage_dir = self.build_path("stage", "rankings")
         parquet_files = self.list_files(stage_dir, "rankings_singles_*.parquet")
 
-        # Exclude any existing consolidated file
-        parquet_files = [
-            f for f in parquet_files if f.stem != "rankings_singles"
-        ]
-
         if not parquet_files:
             logger.info("No per-date parquets to consolidate")
             return None
 
-        dfs = [pl.read_parquet(f) for f in parquet_files]
-        combined = pl.concat(dfs)
+        by_year: dict[int, dict[str, Path]] = {}
+        for f in parquet_files:
+            by_year.setdefault(_parse_date_from_stem(f.stem).year, {})[f.stem] = f
+
+        store_dir = stage_dir / STORE_DIRNAME
+        for stale in store_dir.glob("*.parquet"):
+            if int(stale.stem) not in by_year:
+                stale.unlink()
+
+        n_weeks = 0
+        n_partitions = 0
+        for year, weeks in sorted(by_year.items()):
+            part = store_dir / f"{year}.parquet"
+            stamps = {stem: f.stat().st_mtime_ns for stem, f in weeks.items()}
+            recorded = json.loads(
+                self.read_parquet_metadata(part).get(_WEEKS_KEY, "{}")
+            )
+            if recorded == stamps:
+                continue
+
+            pending = [stem for stem in stamps if recorded.get(stem) != stamps[stem]]
+            dfs = [pl.read_parquet(weeks[stem]) for stem in pending]
+            if len(pending) < len(stamps):
+                replaced = [
+                    _parse_date_from_stem(stem)
+                    for stem in set(recorded) - (stamps.keys() - set(pending))
+                ]
+                dfs.insert(
+                    0,
+                    pl.read_parquet(part).filter(
+                        ~pl.col("ranking_date").is_in(replaced)
+                    ),
+                )
+            combined = pl.concat(dfs).sort("player_id", "ranking_date")
 
-        self.assert_unique(combined, ["ranking_date", "player_id"], "rankings")
+            self.assert_unique(combined, ["ranking_date", "player_id"], "rankings")
+            self.save_parquet(
+                combined,
+                part,
+                extra_metadata={_WEEKS_KEY: json.dumps(stamps, sort_keys=True)},
+            )
+            n_weeks += len(pending)
+            n_partitions += 1
 
-        out_path = self.build_path("stage", "rankings", "rankings_singles.parquet")
-        result = self.save_parquet(combined, out_path)
+        legacy = stage_dir / LEGACY_CONSOLIDATED
+        if legacy.exists():
+            legacy.unlink()
 
         logger.info(
-            "Rankings consolidate: merged %d files, %d total rows",
+            "Rankings consolidate: %d new/restaged weeks in %d of %d year "
+            "partitions (%d weeks total)",
+            n_weeks,
+            n_partitions,
+            len(by_year),
             len(parquet_files),
-            len(combined),
         )
-        return result
+        return store_dir
 
     def _parse_rankings_page(
         self,
@@ -154,81 +220,22 @@ class RankingsTransformer(BaseJob):
         parsed_at: dt.datetime,
     ) -> list[RankingsRecord]:
         """Parse one rankings HTML page into validated records."""
-        soup = BeautifulSoup(html, "lxml")
-        table = soup.select_one("table.mega-table.desktop-table.non-live")
-        if table is None:
+        rows = self._parse_cache.parse(
+            "rankings", PARSER_VERSION, html, scan_rankings_page
+        )
+        if rows is None:
             logger.warning(
                 "No desktop table in rankings HTML for %s — skipping",
                 ranking_date,
             )
             return []
 
-        rows = table.select("tbody tr")
-        records = []
-        for tr in rows:
-            rank_td = tr.select_one("td.rank")
-            if rank_td is None:
-                continue
-
-            rank_text = rank_td.get_text(strip=True)
-            rank = int(rank_text.rstrip("T"))
-
-            player_cell = tr.select_one("td.player")
-            link = player_cell.select_one("li.name a")
-            href = link["href"]
-            player_id = href.split("/")[-2]
-            player_name = link.get_text(strip=True)
-
-            flag_svg = player_cell.select_one("svg use")
-            flag_href = flag_svg["href"]
-            nationality = flag_href.split("#flag-")[-1]
-
-            age = int(tr.select_one("td.age").get_text(strip=True))
-
-            points_text = tr.select_one("td.points").get_text(strip=True)
-            points = int(points_text.replace(",", ""))
-
-            rank_li = player_cell.select_one("li.rank")
-            rank_up = rank_li.select_one("span.rank-up")
-            rank_down = rank_li.select_one("span.rank-down")
-            if rank_up:
-                rank_move = int(rank_up.get_text(strip=True))
-            elif rank_down:
-                rank_move = -int(rank_down.get_text(strip=True))
-            else:
-                rank_move = None
-
-            points_move = _dash_to_none(
-                tr.select_one("td.pointsMove").get_text(strip=True)
-            )
-            tournaments_played = int(
-                tr.select_one("td.tourns").get_text(strip=True)
-            )
-            points_dropping = _dash_to_none(
-                tr.select_one("td.drop").get_text(strip=True)
+        return [
+            RankingsRecord(
+                ranking_date=ranking_date,
+                **row,
+                source_file=source_file,
+                parsed_at=parsed_at,
             )
-            next_best = _dash_to_none(
-                tr.select_one("td.best").get_text(strip=True)
-            )
-
-            records.append(
-                RankingsRecord(
-                    ranking_date=ranking_date,
-                    rank=rank,
-                    player_id=player_id,
-                    player_name=player_name,
-                    nationality=nationality,
-                    age=age,
-                    points=points,
-                    rank_move=rank_move,
-                    points_move=points_move,
-                    tournaments_played=tournaments_played,
-                    points_dropping=points_dropping,
-                    next_best=next_best,
-                    source_file=source_file,
-                    parsed_at=parsed_at,
-                )
-            )
-
-        return records
-
+            for row in rows
+        ]
@@ -12,7 +12,8 @@ from mvp.atptour.mappings import (
     parse_duration,
     parse_seed_entry,
 )
-from mvp.atptour.parsers.results import ResultsParser
+from mvp.atptour.parsers.cache import PARSE_CACHE_FILENAME, ParseCache
+from mvp.atptour.parsers.results import PARSER_VERSION, ResultsParser
 from mvp.atptour.schemas.results import ResultRecord
 from mvp.atptour.tournament import Tournament
 from mvp.common.base_job import BaseJob
@@ -35,6 +36,23 @@ class ResultsTransformer(BaseJob):
         super().__init__(domain="atptour", data_root=data_root)
         self.tournament = tournament
         self._parser = ResultsParser()
+        self._parse_cache = ParseCache(
+            self.build_path("stage", "", PARSE_CACHE_FILENAME)
+        )
+
+    def is_stale(self) -> bool:
+        """Whether either draw's raw HTML is newer than results.parquet, or the
+        parquet predates the current ResultRecord schema."""
+        raw = [
+            self.build_path("raw", self.tournament.path, name)
+            for name in ("results_singles.html", "results_doubles.html")
+        ]
+        out = self.build_path("stage", self.tournament.path, "results.parquet")
+        if self.is_stage_stale(raw, out):
+            return True
+        return out.exists() and not self.is_schema_current(
+            out, ResultRecord.SCHEMA_HASH
+        )
 
     def run(self) -> list[Path]:
         """Process singles and doubles draws. Returns list of parquet paths (0 or 1)."""
@@ -63,7 +81,9 @@ class ResultsTransformer(BaseJob):
         self.assert_unique(df, ["match_uid"], "results")
 
         out_path = self.build_path("stage", self.tournament.path, "results.parquet")
-        result = self.save_parquet(df, out_path)
+        result = self.save_parquet(
+            df, out_path, schema_hash=ResultRecord.SCHEMA_HASH
+        )
         if result is None:
             return []
         return [result]
@@ -74,7 +94,7 @@ class ResultsTransformer(BaseJob):
         """Parse one draw's HTML and validate into ResultRecord instances."""
         raw_path = self.build_path("raw", self.tournament.path, filename)
 
-        if not raw_path.exists():
+        if not self.raw_exists(raw_path):
             logger.info(
                 "No %s file for %s: %s",
                 draw_type.value,
@@ -87,9 +107,13 @@ class ResultsTransformer(BaseJob):
         is_doubles = draw_type == DrawType.doubles
 
         if is_doubles:
-            raw_matches = self._parser.parse_doubles(html)
+            raw_matches = self._parse_cache.parse(
+                "results_doubles", PARSER_VERSION, html, self._parser.parse_doubles
+            )
         else:
-            raw_matches = self._parser.parse_singles(html)
+            raw_matches = self._parse_cache.parse(
+                "results_singles", PARSER_VERSION, html, self._parser.parse_singles
+            )
 
         if not raw_matches:
             logger.info(
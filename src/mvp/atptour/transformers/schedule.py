@@ -2,24 +2,21 @@
 
 import datetime as dt
 import logging
-import re
-from datetime import date, datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 
 import polars as pl
-from bs4 import BeautifulSoup, Tag
 
-from mvp.atptour.mappings import parse_seed_entry
+from mvp.atptour.parsers.cache import PARSE_CACHE_FILENAME, ParseCache
+from mvp.atptour.parsers.schedule import PARSER_VERSION, scan_schedule_html
 from mvp.atptour.schemas.schedule import ScheduleRecord
 from mvp.atptour.tournament import Tournament
 from mvp.common.base_job import BaseJob
-from mvp.common.enums import Circuit, DrawType
+from mvp.common.enums import Circuit
 from mvp.common.utils import polars_schema
 
 logger = logging.getLogger(__name__)
 
-_MATCH_DURATION_ESTIMATE = timedelta(minutes=90)
-
 
 def _parse_snapshot_timestamp(stem: str) -> datetime:
     """Parse 'schedule_YYYYMMDD_HHMMSS' or 'schedule_dN_YYYYMMDD_HHMMSS'."""
@@ -27,101 +24,6 @@ def _parse_snapshot_timestamp(stem: str) -> datetime:
     return datetime.strptime(f"{parts[-2]}_{parts[-1]}", "%Y%m%d_%H%M%S")
 
 
-def _normalize_score(score_span: Tag) -> str | None:
-    """Convert HTML score to normalized string.
-
-    '76<sup>6</sup> 61' becomes '76(6) 61'.
-    All-ndash or empty text returns None.
-    """
-    if score_span is None:
-        return None
-
-    # Replace <sup> tags with parenthesized content
-    for sup in score_span.find_all("sup"):
-        sup.replace_with(f"({sup.get_text()})")
-
-    text = score_span.get_text()
-    # Normalize whitespace: collapse runs of whitespace to single space, strip edges
-    text = re.sub(r"\s+", " ", text).strip()
-    if not text:
-        return None
-
-    # Check if all characters are ndash
-    if all(c == "\u2013" for c in text):
-        return None
-
-    return text
-
-
-def _extract_player_info(
-    div: Tag,
-) -> tuple[str, str, str, str | None, bool, str | None]:
-    """Extract player ID, name, country, seed/entry, doubles flag, and partner ID.
-
-    Returns (player_id, display_name, country_code, seed_entry, is_doubles, partner_id).
-    For singles, partner_id is None.
-    For doubles: display_name joins both players with ' / '; player_id is the first
-    pair member, partner_id is the second.
-    """
-    # Check for doubles structure (multiple names in a "names" div)
-    names_div = div.select_one("div.names")
-    if names_div:
-        # Doubles
-        name_links = names_div.select("div.name a")
-        names = []
-        ids: list[str] = []
-        for link in name_links:
-            name_text = link.get_text(separator=" ", strip=True)
-            names.append(name_text)
-            href = link.get("href", "")
-            parts = href.strip("/").split("/")
-            ids.append(parts[-2] if len(parts) >= 2 else "")
-        display_name = " / ".join(names)
-        first_id = ids[0] if ids else ""
-        partner_id = ids[1] if len(ids) >= 2 else None
-
-        # Country: first flag in countries div
-        countries_div = div.select_one("div.countries")
-        if countries_div:
-            flag_use = countries_div.select_one("svg use")
-            flag_href = flag_use["href"] if flag_use else ""
-        else:
-            flag_use = div.select_one("svg use")
-            flag_href = flag_use["href"] if flag_use else ""
-        country = flag_href.split("#flag-")[-1] if "#flag-" in flag_href else ""
-
-        # Seed/entry from rank span (in "players" div)
-        rank_span = div.select_one("div.players div.rank span")
-        seed_entry = rank_span.get_text(strip=True) if rank_span else ""
-        seed_entry = seed_entry if seed_entry else None
-
-        return first_id, display_name, country, seed_entry, True, partner_id
-
-    # Singles
-    name_div = div.select_one("div.name")
-    link = name_div.select_one("a") if name_div else None
-    if link:
-        name_text = link.get_text(separator=" ", strip=True)
-        href = link.get("href", "")
-        parts = href.strip("/").split("/")
-        player_id = parts[-2] if len(parts) >= 2 else ""
-    else:
-        name_text = ""
-        player_id = ""
-
-    # Country from flag svg
-    flag_use = div.select_one("svg use")
-    flag_href = flag_use["href"] if flag_use else ""
-    country = flag_href.split("#flag-")[-1] if "#flag-" in flag_href else ""
-
-    # Seed/entry
-    rank_span = div.select_one("div.rank span")
-    seed_entry = rank_span.get_text(strip=True) if rank_span else ""
-    seed_entry = seed_entry if seed_entry else None
-
-    return player_id, name_text, country, seed_entry, False, None
-
-
 def _parse_schedule_html(
     html: str,
     tournament_id: str,
@@ -130,153 +32,29 @@ def _parse_schedule_html(
     snapshot_timestamp: datetime,
     source_file: str,
     parsed_at: datetime,
+    *,
+    cache: ParseCache | None = None,
 ) -> list[ScheduleRecord]:
     """Parse schedule HTML into list of ScheduleRecord."""
-    soup = BeautifulSoup(html, "lxml")
-    records = []
-
-    # Extract tournament schedule day number from "<h4 class="day">...(Day N)</h4>"
-    schedule_day: int | None = None
-    day_heading = soup.select_one("h4.day")
-    if day_heading:
-        day_span = day_heading.select_one("span")
-        if day_span:
-            day_match = re.search(r"Day\s+(\d+)", day_span.get_text())
-            if day_match:
-                schedule_day = int(day_match.group(1))
-
-    for group in soup.select("div.content-group"):
-        court_name = None
-        court_match_num = 0
-        anchor_time: datetime | None = None
-        anchor_position: int = 0
-
-        for match_div in group.select("div.schedule[data-matchdate]"):
-            court_match_num += 1
-
-            match_date_str = match_div["data-matchdate"]
-            match_date = date.fromisoformat(match_date_str)
-
-            datetime_str = match_div.get("data-datetime", "").strip()
-            if datetime_str:
-                scheduled_datetime = datetime.strptime(
-                    datetime_str, "%Y-%m-%d %H:%M:%S"
-                )
-            else:
-                scheduled_datetime = None
-
-            time_suffix = match_div.get("data-suffix", "").strip()
-            display_time = match_div.get("data-displaytime", "").strip()
-
-            # Court name: extract from <strong> if present, otherwise propagate
-            header = match_div.select_one("div.schedule-header")
-            if header:
-                strong = header.select_one(
-                    "div.schedule-location-timestamp strong"
-                )
-                if strong:
-                    extracted = strong.get_text(strip=True) or None
-                    if extracted:
-                        court_name = extracted
-
-            # Time anchor and estimation
-            if datetime_str:
-                is_time_estimated = False
-                if time_suffix in ("Starts At", "Not Before"):
-                    anchor_time = scheduled_datetime
-                    anchor_position = court_match_num
-            elif time_suffix == "Followed By" and anchor_time is not None:
-                offset = (court_match_num - anchor_position) * _MATCH_DURATION_ESTIMATE
-                scheduled_datetime = anchor_time + offset
-                is_time_estimated = True
-            else:
-                is_time_estimated = True
-
-            # Round
-            round_div = match_div.select_one(
-                "div.schedule-header div.schedule-type"
-            )
-            round_str = round_div.get_text(strip=True) if round_div else ""
-
-            # Players
-            content = match_div.select_one("div.schedule-content")
-            if content is None:
-                continue
-
-            # Skip matches where opponent is not yet determined
-            # (e.g., "M. Landaluce Or J. Pinnington Jones" from an unfinished prior round)
-            if content.select_one("div.possible-players-container"):
-                continue
-
-            player_div = content.select_one("div.player")
-            opponent_div = content.select_one("div.opponent")
-            if player_div is None or opponent_div is None:
-                continue
-
-            p1_id, p1_name, p1_country, p1_seed_entry, p1_is_dbl, p1_partner_id = (
-                _extract_player_info(player_div)
-            )
-            p2_id, p2_name, p2_country, p2_seed_entry, p2_is_dbl, p2_partner_id = (
-                _extract_player_info(opponent_div)
-            )
-
-            # Skip matches without ATP profile links (e.g., WTA players)
-            if not p1_id or not p2_id:
-                continue
-
-            is_doubles = p1_is_dbl or p2_is_dbl
-            draw_type = DrawType.doubles if is_doubles else DrawType.singles
-
-            # Skip doubles matches where we couldn't extract both partner IDs:
-            # the resulting match_uid would only have 2 IDs and wouldn't join
-            # against the 4-ID uids built from results/match_stats.
-            if is_doubles and (p1_partner_id is None or p2_partner_id is None):
-                continue
-
-            status_div = content.select_one("div.status")
-            status = status_div.get_text(strip=True) if status_div else None
-            if status == "":
-                status = None
-
-            score_span = content.select_one("span.schedule-cta-score")
-            score = _normalize_score(score_span)
-
-            records.append(
-                ScheduleRecord(
-                    tournament_id=tournament_id,
-                    year=year,
-                    circuit=circuit,
-                    draw_type=draw_type,
-                    match_date=match_date,
-                    schedule_day=schedule_day,
-                    scheduled_datetime=scheduled_datetime,
-                    time_suffix=time_suffix,
-                    display_time=display_time,
-                    court_name=court_name,
-                    court_match_num=court_match_num,
-                    is_time_estimated=is_time_estimated,
-                    round=round_str,
-                    p1_id=p1_id,
-                    p1_name=p1_name,
-                    p1_country=p1_country,
-                    p1_seed=parse_seed_entry(p1_seed_entry)[0],
-                    p1_entry=parse_seed_entry(p1_seed_entry)[1],
-                    p1_partner_id=p1_partner_id,
-                    p2_id=p2_id,
-                    p2_name=p2_name,
-                    p2_country=p2_country,
-                    p2_seed=parse_seed_entry(p2_seed_entry)[0],
-                    p2_entry=parse_seed_entry(p2_seed_entry)[1],
-                    p2_partner_id=p2_partner_id,
-                    status=status,
-                    score=score,
-                    snapshot_timestamp=snapshot_timestamp,
-                    source_file=source_file,
-                    parsed_at=parsed_at,
-                )
-            )
-
-    return records
+    if cache is None:
+        schedule_day, rows = scan_schedule_html(html)
+    else:
+        schedule_day, rows = cache.parse(
+            "schedule", PARSER_VERSION, html, scan_schedule_html
+        )
+    return [
+        ScheduleRecord(
+            tournament_id=tournament_id,
+            year=year,
+            circuit=circuit,
+            schedule_day=schedule_day,
+            snapshot_timestamp=snapshot_timestamp,
+            source_file=source_file,
+            parsed_at=parsed_at,
+            **row,
+        )
+        for row in rows
+    ]
 
 
 class ScheduleTransformer(BaseJob):
@@ -285,6 +63,9 @@ class ScheduleTransformer(BaseJob):
     def __init__(self, tournament: Tournament, data_root: Path | None = None):
         super().__init__(domain="atptour", data_root=data_root)
         self.tournament = tournament
+        self._parse_cache = ParseCache(
+            self.build_path("stage", "", PARSE_CACHE_FILENAME)
+        )
 
     def stage(self) -> list[Path]:
         """Parse new HTML snapshots into per-snapshot parquets.
@@ -296,7 +77,8 @@ class ScheduleTransformer(BaseJob):
             "raw",
             f"tournaments/{self.tournament.circuit.value}/{self.tournament.tournament_id}/{self.tournament.year}/schedule",
         )
-        html_files = self.list_files(schedule_dir, "schedule_*.html")
+        raw_mtimes = self.raw_mtimes(schedule_dir, "schedule_*.html")
+        html_files = list(raw_mtimes)
         if not html_files:
             logger.info("No schedule files for %s", self.tournament.logging_id)
             return []
@@ -312,7 +94,7 @@ class ScheduleTransformer(BaseJob):
             staged_path = existing.get(html_path.stem)
             if staged_path is None:
                 to_process.append(html_path)
-            elif html_path.stat().st_mtime > staged_path.stat().st_mtime:
+            elif raw_mtimes[html_path] > staged_path.stat().st_mtime:
                 to_process.append(html_path)
             elif not self.is_schema_current(staged_path, ScheduleRecord.SCHEMA_HASH):
                 to_process.append(html_path)
@@ -340,6 +122,7 @@ class ScheduleTransformer(BaseJob):
                 snapshot_timestamp=snapshot_ts,
                 source_file=source_file,
                 parsed_at=parsed_at,
+                cache=self._parse_cache,
             )
             if not records:
                 logger.info(
@@ -372,8 +155,29 @@ class ScheduleTransformer(BaseJob):
         return paths
 
     def run(self) -> Path | None:
-        """Stage new snapshots and consolidate into schedule.parquet."""
+        """Stage new snapshots and consolidate into schedule.parquet.
+
+        Consolidation is skipped when no snapshot parquet is newer than the
+        consolidated file, so a tick with no new schedule leaves it (and the
+        aggregator's input fingerprint) untouched.
+        """
         self.stage()
+        snapshot_dir = self.build_path(
+            "stage",
+            f"tournaments/{self.tournament.circuit.value}/{self.tournament.tournament_id}/{self.tournament.year}/schedule",
+        )
+        target = self.build_path(
+            "stage",
+            f"tournaments/{self.tournament.circuit.value}/{self.tournament.tournament_id}/{self.tournament.year}",
+            "schedule.parquet",
+        )
+        snapshots = self.list_files(snapshot_dir, "schedule_*.parquet")
+        if target.exists() and not self.is_stage_stale(snapshots, target):
+            logger.info(
+                "Schedule unchanged for %s, skipping consolidate",
+                self.tournament.logging_id,
+            )
+            return target
         return self.consolidate()
 
     def consolidate(self) -> Path | None:
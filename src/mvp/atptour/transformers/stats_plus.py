@@ -96,7 +96,7 @@ class StatsPlusTransformer(BaseJob):
             logger.debug("No stats_plus directory for %s", self.tournament.logging_id)
             return
 
-        json_files = list(raw_dir.glob("*.json"))
+        json_files = self.list_files(raw_dir, "*.json")
         if not json_files:
             logger.debug("No stats_plus JSON files for %s", self.tournament.logging_id)
             return
@@ -141,8 +141,7 @@ class StatsPlusTransformer(BaseJob):
 
         Returns an empty list for an incomplete match or absent set stats.
         """
-        with open(json_file) as f:
-            data = json.load(f)
+        data = json.loads(self.read_text(json_file))
 
         if not data.get("matchCompleted", False):
             return []
@@ -14,9 +14,13 @@ from mvp.atptour.schemas.stroke_analysis import (
 )
 from mvp.atptour.tournament import Tournament
 from mvp.common.base_job import BaseJob
+from mvp.common.utils import columnar_frame, rows_to_columns
 
 logger = logging.getLogger(__name__)
 
+# Column form of StrokeAnalysisRecord's match_id before-validator.
+_BEFORE = {"match_id": lambda c: c.str.to_uppercase().str.strip_chars()}
+
 
 class StrokeAnalysisTransformer(BaseJob):
     """Transform stroke_analysis JSON files to match-level Parquet."""
@@ -34,21 +38,21 @@ class StrokeAnalysisTransformer(BaseJob):
             )
             return
 
-        json_files = list(raw_dir.glob("*.json"))
+        json_files = self.list_files(raw_dir, "*.json")
         if not json_files:
             logger.debug(
                 "No stroke_analysis JSON files for %s", self.tournament.logging_id
             )
             return
 
-        all_records = []
+        rows: list[dict] = []
         parsed_at = datetime.now()
 
         for json_file in json_files:
             try:
-                record = self._transform_file(json_file, parsed_at)
-                if record:
-                    all_records.append(record)
+                fields = self._transform_file(json_file, parsed_at)
+                if fields:
+                    rows.append(fields)
             except Exception as e:
                 logger.warning(
                     "Failed to transform %s: %s",
@@ -57,16 +61,24 @@ class StrokeAnalysisTransformer(BaseJob):
                 )
                 continue
 
-        if not all_records:
+        df, rejected = columnar_frame(
+            rows_to_columns(rows, StrokeAnalysisRecord),
+            StrokeAnalysisRecord,
+            before=_BEFORE,
+        )
+        for reason in rejected:
+            logger.warning(
+                "%s: dropped invalid stroke_analysis row: %s",
+                self.tournament.logging_id,
+                reason,
+            )
+
+        if df.is_empty():
             logger.info(
                 "%s: no valid stroke_analysis records", self.tournament.logging_id
             )
             return
 
-        df = pl.DataFrame(
-            [r.model_dump() for r in all_records],
-            infer_schema_length=None,
-        )
         df = df.with_columns(pl.lit(SCHEMA_HASH).alias("schema_hash"))
 
         output_path = self.build_path(
@@ -78,16 +90,15 @@ class StrokeAnalysisTransformer(BaseJob):
         logger.info(
             "%s: staged %d matches from %d files",
             self.tournament.logging_id,
-            len(all_records),
+            len(df),
             len(json_files),
         )
 
     def _transform_file(
         self, json_file: Path, parsed_at: datetime
-    ) -> StrokeAnalysisRecord | None:
-        """Transform a single JSON file to a match-level record."""
-        with open(json_file) as f:
-            data = json.load(f)
+    ) -> dict | None:
+        """Transform a single JSON file to a match-level field dict."""
+        data = json.loads(self.read_text(json_file))
 
         if not data.get("matchCompleted", False):
             return None
@@ -114,7 +125,7 @@ class StrokeAnalysisTransformer(BaseJob):
         self._extract_total_points_count(rally_shots, fields)
         self._extract_shot_type_totals(rally_shots, fields)
 
-        return StrokeAnalysisRecord(**fields)
+        return fields
 
     def _extract_total_points_count(
         self, rally_shots: dict, fields: dict
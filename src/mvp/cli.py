@@ -1114,6 +1114,11 @@ def parse_args(args: list[str] | None = None) -> argparse.Namespace:
         "--refresh-matcher", action="store_true",
         help="Rebuild the fixture -> match_uid crosswalk before transforming",
     )
+    oap_parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Processes for parsing raw files (default: one per core; "
+             "small batches always parse in-process)",
+    )
 
     # iid-sweep subcommand - evaluate N tuning trials of an IID projection config
     iid_sweep_parser = subparsers.add_parser(
@@ -1197,6 +1202,12 @@ def parse_args(args: list[str] | None = None) -> argparse.Namespace:
         help="Path to alternate production-shaped YAML for voter override "
              "(default: production.yaml's voters)",
     )
+    bt_parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Processes for training folds concurrently, each holding its own "
+             "copy of the feature frame and an even share of the n_jobs budget "
+             "(default: 1, serial)",
+    )
     bt_parser.add_argument(
         "--memory-limit", type=int, default=None,
         help="Override memory limit %% (0 to disable, default 75)",
@@ -2953,6 +2964,7 @@ def cmd_oddspapi_transform(args: argparse.Namespace) -> int:
 
     report = transform(
         refresh=args.refresh, refresh_matcher=args.refresh_matcher,
+        workers=args.workers,
     )
     print(f"\n{report.summary()}")
     print(f"\nticks read: {report.ticks_parsed:,}")
@@ -3186,6 +3198,7 @@ def cmd_backtest(args: argparse.Namespace) -> int:
         start=start,
         end=end,
         voters_override_path=args.voters,
+        workers=args.workers,
     )
     return 0
 
@@ -1,6 +1,7 @@
 """Base class for pipeline jobs providing file I/O and path management."""
 
 import datetime as dt
+import fnmatch
 import hashlib
 import json
 import logging
@@ -9,6 +10,10 @@ from pathlib import Path
 
 import polars as pl
 
+from mvp.common import dir_manifest
+from mvp.common.raw_archive import ARCHIVE_PREFIX, RawArchive, archive_enabled
+from mvp.common.utils import html_content_hash
+
 logger = logging.getLogger(__name__)
 
 BUCKETS = ("raw", "stage", "aggregate", "analytics")
@@ -50,6 +55,8 @@ class BaseJob:
         self._run_dt = run_at or dt.datetime.now()
         self._run_date_str = self._run_dt.strftime("%Y%m%d")
         self._run_datetime_str = self._run_dt.strftime("%Y%m%d_%H%M%S")
+        # Opt-in (MVP_RAW_ARCHIVE): raw payloads go to per-directory packs.
+        self.raw_archive = archive_enabled()
 
     def _display_path(self, path: Path) -> Path | str:
         """Path relative to data_root for logging; falls back to full path."""
@@ -83,56 +90,143 @@ class BaseJob:
             )
         return path
 
-    def save_json(self, data: dict | list, path: Path) -> Path:
-        """Save JSON data with atomic write."""
+    def _archives(self, path: Path) -> bool:
+        """Whether a write to `path` goes to its directory's raw archive."""
+        return self.raw_archive and path.is_relative_to(self.data_root / "raw")
+
+    def _write_atomic(self, path: Path, text: str) -> None:
         tmp_path = path.with_suffix(path.suffix + ".tmp")
         path.parent.mkdir(parents=True, exist_ok=True)
         try:
             with tmp_path.open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.write(text)
             tmp_path.replace(path)
         except Exception:
             if tmp_path.exists():
                 tmp_path.unlink()
             raise
+
+    def _land(self, path: Path, text: str) -> None:
+        """Write a payload atomically. Raw payloads are also noted in their
+        directory's manifest, and go to its archive when that is on."""
+        if not path.is_relative_to(self.data_root / "raw"):
+            self._write_atomic(path, text)
+            return
+        data = text.encode("utf-8")
+        with dir_manifest.writing(path.parent) as manifest:
+            if self.raw_archive:
+                entry = RawArchive(path.parent).write(path.name, data)
+                # A loose copy from before the archive was on would shadow it.
+                path.unlink(missing_ok=True)
+                manifest.add(path.name, entry.sha256, mtime=entry.mtime)
+            else:
+                self._write_atomic(path, text)
+                manifest.add(path.name, hashlib.sha256(data).hexdigest())
+
+    def save_json(self, data: dict | list, path: Path) -> Path:
+        """Save JSON data with atomic write (compact, to the raw archive if on)."""
+        if self._archives(path):
+            text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+            self._land(path, text)
+            logger.info("Archived JSON to %s", self._display_path(path))
+            return path
+        self._land(path, json.dumps(data, indent=2, ensure_ascii=False))
         logger.info("Saved JSON to %s", self._display_path(path))
         return path
 
+    def read_text(self, path: Path) -> str:
+        """Content of a loose or archived file (a loose file wins), unlogged."""
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return RawArchive(path.parent).read(path.name).decode("utf-8")
+
     def read_json(self, path: Path) -> dict | list:
         """Read JSON data from file."""
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json.loads(self.read_text(path))
         logger.info("Read JSON from %s", self._display_path(path))
         return data
 
     def save_html(self, content: str, path: Path) -> Path:
-        """Save HTML content with atomic write."""
-        tmp_path = path.with_suffix(path.suffix + ".tmp")
-        path.parent.mkdir(parents=True, exist_ok=True)
-        try:
-            with tmp_path.open("w", encoding="utf-8") as f:
-                f.write(content)
-            tmp_path.replace(path)
-        except Exception:
-            if tmp_path.exists():
-                tmp_path.unlink()
-            raise
-        logger.info("Saved HTML to %s", self._display_path(path))
+        """Save HTML content with atomic write (to the raw archive if on)."""
+        self._land(path, content)
+        verb = "Archived" if self._archives(path) else "Saved"
+        logger.info("%s HTML to %s", verb, self._display_path(path))
         return path
 
     def read_html(self, path: Path) -> str:
         """Read HTML content from file."""
-        with path.open("r", encoding="utf-8") as f:
-            content = f.read()
+        content = self.read_text(path)
         logger.info("Read HTML from %s", self._display_path(path))
         return content
 
+    def raw_mtime(self, path: Path) -> float | None:
+        """mtime of a loose or archived file, None when it is neither."""
+        try:
+            return path.stat().st_mtime
+        except FileNotFoundError:
+            entry = RawArchive(path.parent).get(path.name)
+            return None if entry is None else entry.mtime
+
+    def raw_mtimes(self, directory: Path, pattern: str = "*") -> dict[Path, float]:
+        """mtime of each file in `directory` matching `pattern`, loose or archived.
+
+        Read from the directory's manifest when it is current (one small file),
+        else by listing and stat-ing as ``list_files`` does. Sorted by name.
+        """
+        manifest = dir_manifest.load(directory)
+        if manifest is not None:
+            return {
+                directory / name: mtime
+                for name, mtime in sorted(manifest.mtimes(pattern).items())
+            }
+        return {p: self.raw_mtime(p) for p in self.list_files(directory, pattern)}
+
+    def raw_exists(self, path: Path) -> bool:
+        """Whether `path` exists loose or in its directory's raw archive."""
+        return self.raw_mtime(path) is not None
+
+    def is_html_unchanged(self, path: Path, content: str) -> bool:
+        """Whether `path` already holds this page, modulo per-request noise.
+
+        Lets always-refreshed pages skip the rewrite, so the raw mtime only moves
+        when content does and everything gated on it downstream stays idle.
+        """
+        if not self.raw_exists(path):
+            return False
+        existing = self.read_text(path)
+        return html_content_hash(existing) == html_content_hash(content)
+
+    def is_json_unchanged(self, path: Path, data: dict | list) -> bool:
+        """Whether `path` already holds this payload (compared parsed, not as text)."""
+        if not self.raw_exists(path):
+            return False
+        try:
+            return json.loads(self.read_text(path)) == data
+        except json.JSONDecodeError:
+            return False
+
+    def is_stage_stale(self, raw_paths: list[Path], output_path: Path) -> bool:
+        """Whether `output_path` must be rebuilt from `raw_paths`.
+
+        Stale when any raw exists and the output is missing or older than it. Raw
+        that does not exist is ignored, so an all-missing input is never stale.
+        """
+        raw_mtimes = [m for p in raw_paths if (m := self.raw_mtime(p)) is not None]
+        if not raw_mtimes:
+            return False
+        if not output_path.exists():
+            return True
+        return max(raw_mtimes) > output_path.stat().st_mtime
+
     def save_parquet(
         self,
         df: pl.DataFrame,
         path: Path,
         *,
         schema_hash: str | None = None,
+        extra_metadata: dict[str, str] | None = None,
     ) -> Path | None:
         """Save DataFrame to parquet with schema hash metadata.
 
@@ -141,6 +235,8 @@ class BaseJob:
             path: Target path.
             schema_hash: Pydantic SCHEMA_HASH for drift detection. If provided,
                 stored in metadata for later comparison via is_schema_current().
+            extra_metadata: Additional key/value pairs stored alongside the
+                schema hashes (read back with read_parquet_metadata()).
 
         Returns None if the DataFrame is empty.
         """
@@ -157,6 +253,8 @@ class BaseJob:
         metadata = {"schema_hash": polars_hash}
         if schema_hash is not None:
             metadata["pydantic_schema_hash"] = schema_hash
+        if extra_metadata:
+            metadata.update(extra_metadata)
         try:
             df.write_parquet(tmp_path, metadata=metadata)
             tmp_path.replace(path)
@@ -192,11 +290,41 @@ class BaseJob:
         except Exception:
             return False
 
+    @staticmethod
+    def read_parquet_metadata(path: Path) -> dict[str, str]:
+        """Key/value metadata of a parquet file ({} if missing or unreadable)."""
+        if not path.exists():
+            return {}
+        try:
+            import pyarrow.parquet as pq
+
+            meta = pq.read_metadata(path)
+        except Exception:
+            return {}
+        if meta.metadata is None:
+            return {}
+        return {
+            k.decode(errors="replace"): v.decode(errors="replace")
+            for k, v in meta.metadata.items()
+        }
+
     def list_files(self, directory: Path, pattern: str = "*") -> list[Path]:
-        """List files matching a glob pattern, sorted by name."""
+        """List files matching a glob pattern, sorted by name.
+
+        Includes entries of the directory's raw archive, as the paths they would
+        have had loose (read them through ``read_*``/``raw_mtime``, not ``open``).
+        """
         if not directory.is_dir():
             return []
-        return sorted(directory.glob(pattern))
+        files = set(directory.glob(pattern))
+        if "/" not in pattern:
+            files.update(
+                directory / name
+                for name in RawArchive(directory).entries()
+                if fnmatch.fnmatchcase(name, pattern)
+            )
+        internal = (ARCHIVE_PREFIX, dir_manifest.MANIFEST_PREFIX)
+        return sorted(f for f in files if not f.name.startswith(internal))
 
     @staticmethod
     def assert_unique(
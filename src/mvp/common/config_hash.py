@@ -69,7 +69,7 @@ def _canonicalize_features(features_dump: dict | None) -> dict:
 _NON_MODELING_PARAMS = frozenset({"n_jobs"})
 
 
-def _canonicalize_params(params: dict | None) -> dict:
+def canonicalize_params(params: dict | None) -> dict:
     """Deep-sort dict keys; leaves values as-is. Drops non-modeling operational
     params (thread count) so they don't enter the fingerprint."""
     if params is None:
@@ -113,11 +113,12 @@ def _canonicalize_ensemble_base_models(
         }
         out.append(entry)
     # Sort by base fingerprint so YAML order doesn't affect parent hash
-    out.sort(key=lambda e: _hash_dict(e["base_canonical"]))
+    out.sort(key=lambda e: hash_dict(e["base_canonical"]))
     return out
 
 
-def _hash_dict(d: dict) -> str:
+def hash_dict(d: dict) -> str:
+    """SHA-256 of a dict's key-sorted JSON form (non-JSON values via str)."""
     return hashlib.sha256(
         json.dumps(d, sort_keys=True, default=str).encode()
     ).hexdigest()
@@ -160,12 +161,12 @@ def _canonicalize_config(
             "strategy": params.get("strategy", "average"),
             "base_models": _canonicalize_ensemble_base_models(base_models),
             "meta_features": sorted(params.get("meta_features") or []),
-            "meta_model_params": _canonicalize_params(
+            "meta_model_params": canonicalize_params(
                 params.get("meta_model_params")
             ),
         }
     else:
-        canon_model["params"] = _canonicalize_params(params)
+        canon_model["params"] = canonicalize_params(params)
     canon["model"] = canon_model
 
     # validation
@@ -197,7 +198,7 @@ def compute_fingerprint(
 ) -> str:
     """SHA-256 of the canonical config, truncated to 12 hex chars."""
     canon = _canonicalize_config(config, config_path=config_path)
-    return _hash_dict(canon)[:FINGERPRINT_LEN]
+    return hash_dict(canon)[:FINGERPRINT_LEN]
 
 
 # (key, default) for ServeModelConfig fields added after the first IID
@@ -266,7 +267,7 @@ def _canonicalize_iid_config(
             _normalize_feature_spec(s) for s in (sm.get("match_level_features") or [])
         ],
         "point_level_features": list(sm.get("point_level_features") or []),
-        "params": _canonicalize_params(sm.get("params")),
+        "params": canonicalize_params(sm.get("params")),
         "regressor": _deep_sort(sm.get("regressor")),
     }
 
@@ -299,7 +300,7 @@ def compute_iid_fingerprint(
     config_path: Path | None = None,
 ) -> str:
     """SHA-256 of the canonical IID config, truncated to 12 hex chars."""
-    return _hash_dict(_canonicalize_iid_config(config, config_path=config_path))[
+    return hash_dict(_canonicalize_iid_config(config, config_path=config_path))[
         :FINGERPRINT_LEN
     ]
 
@@ -0,0 +1,248 @@
+"""Per-directory manifest of the files landed in a directory.
+
+Staleness checks ask a directory one question: what is in it, and when did it
+last change. Answering that by globbing and stat-ing every file is most of a
+tick's bookkeeping on a slow or network disk. Writers that record here
+(``BaseJob.save_json``/``save_html`` for raw payloads, the oddspapi tick stager)
+note each file as they land it. A reader then gets names, mtimes, the file
+count, the latest mtime and a content digest from one small file.
+
+**Format.** ``_dir_manifest.jsonl`` is append-only. Each write adds one line per
+file (name, mtime, sha256 of the content) and a ``{"dir": st_mtime_ns}`` stamp.
+Both go out in a single append, so a landed file is recorded atomically and
+nothing already written is rewritten. A rescan replaces the whole file
+atomically.
+
+**Trust.** The stamp is the directory's own mtime, taken after the write.
+Anything that adds, removes or renames an entry behind the manifest's back moves
+that mtime. A reader whose stamp does not match gets None and scans as before,
+and the next recorded write rescans first. Writers therefore create nothing in
+the directory outside a ``writing`` block, including temp files. An in-place
+rewrite of an existing file does not move the directory mtime; every writer
+here replaces instead.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from mvp.common.raw_archive import ARCHIVE_PREFIX, RawArchive
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_PREFIX = "_dir_manifest."
+MANIFEST_NAME = MANIFEST_PREFIX + "jsonl"
+LOCK_NAME = MANIFEST_PREFIX + "lock"
+# A manifest this large, and several times its compacted size (~120 bytes per
+# file), is rewritten in place of its history of appends.
+COMPACT_AFTER_BYTES = 256 * 1024
+_LINE_BYTES = 120
+
+# name -> (mtime, sha256 of the content)
+Files = dict[str, tuple[float, str]]
+
+
+@dataclass(frozen=True)
+class DirManifest:
+    """The files a directory holds, as last recorded."""
+
+    files: Files
+
+    @property
+    def count(self) -> int:
+        return len(self.files)
+
+    @property
+    def latest_mtime(self) -> float | None:
+        return max((mtime for mtime, _ in self.files.values()), default=None)
+
+    @property
+    def digest(self) -> str:
+        """sha256 over every (name, content hash): equal iff the contents are."""
+        h = hashlib.sha256()
+        for name in sorted(self.files):
+            h.update(f"{name}\0{self.files[name][1]}\n".encode())
+        return h.hexdigest()
+
+    def mtimes(self, pattern: str = "*") -> dict[str, float]:
+        """mtime by name of the files matching a glob `pattern`."""
+        return {
+            name: mtime
+            for name, (mtime, _) in self.files.items()
+            if fnmatch.fnmatchcase(name, pattern)
+        }
+
+
+# Folded manifests by path: (inode, bytes folded, files, last stamp). Only whole
+# lines are folded, so a reader racing an append resumes at the torn line.
+_CACHE: dict[Path, tuple[int, int, Files, int | None]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _fold(path: Path) -> tuple[Files, int | None] | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    with _CACHE_LOCK:
+        cached = _CACHE.get(path)
+    if cached is not None and cached[0] == st.st_ino and cached[1] <= st.st_size:
+        _, start, files, stamp = cached
+        if start == st.st_size:
+            return files, stamp
+        # Cached dicts are shared and never mutated; fold into a copy.
+        files = dict(files)
+    else:
+        start, files, stamp = 0, {}, None
+
+    with path.open("rb") as fh:
+        fh.seek(start)
+        tail = fh.read(st.st_size - start)
+    whole = tail.rfind(b"\n") + 1
+    for line in tail[:whole].splitlines():
+        if not line.strip():
+            continue
+        try:
+            rec = json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning("Skipping malformed manifest line in %s", path)
+            continue
+        if "dir" in rec:
+            stamp = rec["dir"]
+        elif rec.get("removed"):
+            files.pop(rec["name"], None)
+        else:
+            files[rec["name"]] = (rec["mtime"], rec["sha256"])
+
+    with _CACHE_LOCK:
+        _CACHE[path] = (st.st_ino, start + whole, files, stamp)
+    return files, stamp
+
+
+def load(directory: Path) -> DirManifest | None:
+    """`directory`'s manifest, or None when it has none or it is out of step."""
+    folded = _fold(directory / MANIFEST_NAME)
+    if folded is None:
+        return None
+    files, stamp = folded
+    try:
+        current = directory.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    if stamp != current:
+        return None
+    return DirManifest(files)
+
+
+def _hash_file(path: str | Path) -> str:
+    with open(path, "rb") as fh:
+        return hashlib.file_digest(fh, "sha256").hexdigest()
+
+
+def _rescan(directory: Path, known: Files) -> Files:
+    """What the directory holds now, loose files winning over archived ones.
+
+    A file whose mtime still matches its recorded entry keeps that entry's
+    hash, so only files changed behind the manifest's back are read. The first
+    write into a directory that has no manifest yet hashes all of its files.
+    """
+    files: Files = {}
+    with os.scandir(directory) as it:
+        for e in it:
+            if (
+                not e.is_file()
+                or e.name.startswith((MANIFEST_PREFIX, ARCHIVE_PREFIX))
+                or e.name.endswith(".tmp")
+            ):
+                continue
+            mtime = e.stat().st_mtime
+            prior = known.get(e.name)
+            if prior is not None and prior[0] == mtime:
+                files[e.name] = prior
+            else:
+                files[e.name] = (mtime, _hash_file(e.path))
+    for name, entry in RawArchive(directory).entries().items():
+        files.setdefault(name, (entry.mtime, entry.sha256))
+    return files
+
+
+class ManifestWriter:
+    """Collects what a ``writing`` block landed in or removed from its directory."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.added: Files = {}
+        self.removed: set[str] = set()
+
+    def add(self, name: str, sha256: str, mtime: float | None = None) -> None:
+        """Record `name` as landed; mtime None reads it from the file."""
+        if mtime is None:
+            mtime = (self.directory / name).stat().st_mtime
+        self.added[name] = (mtime, sha256)
+        self.removed.discard(name)
+
+    def remove(self, name: str) -> None:
+        """Record `name` as deleted (the caller unlinks it)."""
+        self.removed.add(name)
+        self.added.pop(name, None)
+
+
+@contextlib.contextmanager
+def writing(directory: Path):
+    """Hold `directory`'s manifest while the caller writes into it, then record.
+
+    The caller lands its files inside the block and ``add``s each one. Writers of
+    one directory are serialised for the duration, so keep slow work (encoding,
+    compressing) outside the block.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / MANIFEST_NAME
+    with (directory / LOCK_NAME).open("a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            current = load(directory)
+            if current is None:
+                folded = _fold(path)
+                base = _rescan(directory, folded[0] if folded is not None else {})
+                rewrite = True
+            else:
+                base = current.files
+                size = path.stat().st_size
+                rewrite = size > max(COMPACT_AFTER_BYTES, 4 * _LINE_BYTES * len(base))
+            writer = ManifestWriter(directory)
+            yield writer
+
+            if rewrite:
+                files = {n: e for n, e in base.items() if n not in writer.removed}
+                files.update(writer.added)
+                tmp = path.with_suffix(".jsonl.tmp")
+                tmp.write_text(
+                    "".join(
+                        json.dumps({"name": n, "mtime": m, "sha256": h}) + "\n"
+                        for n, (m, h) in sorted(files.items())
+                    ),
+                    encoding="utf-8",
+                )
+                os.replace(tmp, path)
+                lines = []
+            else:
+                lines = [{"name": n, "removed": True} for n in sorted(writer.removed)]
+                lines += [
+                    {"name": n, "mtime": m, "sha256": h}
+                    for n, (m, h) in writer.added.items()
+                ]
+            lines.append({"dir": directory.stat().st_mtime_ns})
+            with path.open("a", encoding="utf-8") as fh:
+                fh.write("".join(json.dumps(rec) + "\n" for rec in lines))
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
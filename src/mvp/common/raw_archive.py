@@ -0,0 +1,292 @@
+"""Opt-in packed storage for raw JSON and HTML payloads.
+
+One raw file per fetched payload leaves the raw tree with hundreds of thousands
+of small files. They dominate inode counts and backup time, and every staleness
+check that globs a raw directory pays for them. With ``MVP_RAW_ARCHIVE=1`` set,
+``BaseJob.save_json``/``save_html`` instead append each payload, compressed, to
+a pack file in the directory it would have been written to (one pack per
+tournament directory or per feed, which is also the unit the stagers scan).
+``BaseJob``'s readers, ``list_files`` and the staleness checks see archived
+entries exactly as they would loose files, so the reading side needs no switch.
+
+**Layout.** A directory holds ``_raw_archive.idx`` (JSONL: a header line naming
+the current pack, then one line per write carrying name, offset, length, write
+mtime, sha256 of the payload and codec; the last line for a name wins) and the
+pack it names. Both are append-only, so a write is two appends and never
+rewrites what is already there. A rewritten name leaves its old bytes dead in
+the pack; once dead bytes outweigh live ones the pack is rewritten under a new
+generation and the index replaced atomically.
+
+**Codec.** zstd when the optional ``zstandard`` package is installed, stdlib
+zlib otherwise. The codec is recorded per entry, so packs written either way
+stay readable (a zstd entry does need ``zstandard`` to read).
+
+**Concurrency.** Writers take an exclusive flock on ``_raw_archive.lock``,
+readers a shared one, so tournament threads and pooled processes can share a
+directory and a compaction never deletes a pack under a reader.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+try:
+    # Optional: compresses these payloads markedly better and faster than zlib.
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_ENV = "MVP_RAW_ARCHIVE"
+# The archive's own files, which listings must not report as payloads.
+ARCHIVE_PREFIX = "_raw_archive."
+INDEX_NAME = ARCHIVE_PREFIX + "idx"
+LOCK_NAME = ARCHIVE_PREFIX + "lock"
+# Dead bytes a pack tolerates before a compaction is worth its rewrite.
+COMPACT_AFTER_BYTES = 4 * 1024 * 1024
+
+ZSTD = "zstd"
+ZLIB = "zlib"
+
+
+def archive_enabled() -> bool:
+    """Whether raw writes go to pack archives (``MVP_RAW_ARCHIVE`` set and not 0)."""
+    return os.environ.get(ARCHIVE_ENV, "") not in ("", "0")
+
+
+@dataclass(frozen=True)
+class Entry:
+    """Where one archived payload lives in its pack, and what it was."""
+
+    offset: int
+    length: int
+    mtime: float
+    sha256: str
+    codec: str
+
+
+def _compress(data: bytes) -> tuple[str, bytes]:
+    if zstandard is not None:
+        return ZSTD, zstandard.ZstdCompressor(level=10).compress(data)
+    return ZLIB, zlib.compress(data, 6)
+
+
+def _decompress(codec: str, blob: bytes) -> bytes:
+    if codec == ZLIB:
+        return zlib.decompress(blob)
+    if codec == ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstd-packed raw entry needs the zstandard package")
+        return zstandard.ZstdDecompressor().decompress(blob)
+    raise ValueError(f"Unknown raw archive codec '{codec}'")
+
+
+def _pack_name(generation: int) -> str:
+    return f"{ARCHIVE_PREFIX}{generation:06d}.pack"
+
+
+# Folded indexes by index path: (inode, bytes folded, pack name, entries). The
+# index only grows between compactions, so a refresh folds just the new tail.
+_INDEX_CACHE: dict[Path, tuple[int, int, str, dict[str, Entry]]] = {}
+_INDEX_CACHE_LOCK = threading.Lock()
+
+
+class RawArchive:
+    """The pack archive of one raw directory."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+        self.index_path = self.directory / INDEX_NAME
+
+    @contextlib.contextmanager
+    def _locked(self, *, exclusive: bool = False):
+        """flock the directory's archive; released by the kernel if the holder dies."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with (self.directory / LOCK_NAME).open("a") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def _load(self) -> tuple[str, dict[str, Entry]]:
+        """Current pack name and live entries. Caller holds the lock."""
+        try:
+            st = self.index_path.stat()
+        except FileNotFoundError:
+            return _pack_name(0), {}
+        with _INDEX_CACHE_LOCK:
+            cached = _INDEX_CACHE.get(self.index_path)
+        if cached is not None and cached[0] == st.st_ino and cached[1] <= st.st_size:
+            _, start, pack, entries = cached
+            if start == st.st_size:
+                return pack, entries
+            # Cached dicts are shared and never mutated; fold into a copy.
+            entries = dict(entries)
+        else:
+            start, pack, entries = 0, _pack_name(0), {}
+
+        with self.index_path.open("rb") as fh:
+            fh.seek(start)
+            tail = fh.read(st.st_size - start)
+        for line in tail.splitlines():
+            if not line.strip():
+                continue
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(
+                    "Skipping malformed raw index line in %s", self.index_path
+                )
+                continue
+            if "pack" in rec:
+                pack = rec["pack"]
+            else:
+                name = rec.pop("name")
+                entries[name] = Entry(**rec)
+
+        with _INDEX_CACHE_LOCK:
+            _INDEX_CACHE[self.index_path] = (st.st_ino, st.st_size, pack, entries)
+        return pack, entries
+
+    def entries(self) -> dict[str, Entry]:
+        """Every archived name and its entry; empty when there is no archive."""
+        if not self.index_path.exists():
+            return {}
+        with self._locked():
+            return dict(self._load()[1])
+
+    def get(self, name: str) -> Entry | None:
+        """The entry archived under `name`, or None."""
+        if not self.index_path.exists():
+            return None
+        with self._locked():
+            return self._load()[1].get(name)
+
+    def read(self, name: str) -> bytes:
+        """The payload archived under `name`. FileNotFoundError when absent."""
+        if not self.index_path.exists():
+            raise FileNotFoundError(self.directory / name)
+        with self._locked():
+            pack, entries = self._load()
+            entry = entries.get(name)
+            if entry is None:
+                raise FileNotFoundError(self.directory / name)
+            with (self.directory / pack).open("rb") as fh:
+                fh.seek(entry.offset)
+                blob = fh.read(entry.length)
+        return _decompress(entry.codec, blob)
+
+    def write(self, name: str, data: bytes, mtime: float | None = None) -> Entry:
+        """Archive `data` under `name`, superseding any earlier entry."""
+        return self.write_many([(name, data, mtime)])[name]
+
+    def write_many(
+        self, items: list[tuple[str, bytes, float | None]],
+    ) -> dict[str, Entry]:
+        """Archive several payloads under one lock; mtime None means now."""
+        written: dict[str, Entry] = {}
+        with self._locked(exclusive=True):
+            pack, entries = self._load()
+            entries = dict(entries)
+            pack_path = self.directory / pack
+            new_index = not self.index_path.exists()
+            lines = [json.dumps({"pack": pack})] if new_index else []
+            with pack_path.open("ab") as fh:
+                for name, data, mtime in items:
+                    codec, blob = _compress(data)
+                    offset = fh.seek(0, os.SEEK_END)
+                    fh.write(blob)
+                    entry = Entry(
+                        offset=offset,
+                        length=len(blob),
+                        mtime=time.time() if mtime is None else mtime,
+                        sha256=hashlib.sha256(data).hexdigest(),
+                        codec=codec,
+                    )
+                    written[name] = entries[name] = entry
+                    lines.append(json.dumps({"name": name, **asdict(entry)}))
+                fh.flush()
+                os.fsync(fh.fileno())
+            with self.index_path.open("a", encoding="utf-8") as fh:
+                fh.write("".join(line + "\n" for line in lines))
+
+            live = sum(e.length for e in entries.values())
+            dead = pack_path.stat().st_size - live
+            if dead > COMPACT_AFTER_BYTES and dead > live:
+                written = self._compact(pack, entries, written)
+        return written
+
+    def _compact(
+        self, pack: str, entries: dict[str, Entry], written: dict[str, Entry],
+    ) -> dict[str, Entry]:
+        """Rewrite the live entries into a new pack generation. Caller holds it."""
+        generation = int(pack.split(".")[1]) + 1
+        new_pack = _pack_name(generation)
+        moved: dict[str, Entry] = {}
+        with (self.directory / pack).open("rb") as src, \
+                (self.directory / new_pack).open("wb") as dst:
+            for name, entry in sorted(entries.items(), key=lambda kv: kv[1].offset):
+                src.seek(entry.offset)
+                blob = src.read(entry.length)
+                moved[name] = Entry(
+                    dst.tell(), entry.length, entry.mtime, entry.sha256, entry.codec,
+                )
+                dst.write(blob)
+            dst.flush()
+            os.fsync(dst.fileno())
+
+        lines = [json.dumps({"pack": new_pack})]
+        lines += [json.dumps({"name": n, **asdict(e)}) for n, e in moved.items()]
+        tmp = self.index_path.with_suffix(".idx.tmp")
+        tmp.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+        os.replace(tmp, self.index_path)
+        (self.directory / pack).unlink()
+        logger.info(
+            "Compacted raw archive %s: %d entries", self.directory, len(moved)
+        )
+        return {name: moved[name] for name in written}
+
+    def absorb(self, paths: list[Path]) -> int:
+        """Move loose files of this directory into the archive, keeping mtimes.
+
+        For packing a tree written before the archive was switched on. Each file
+        is unlinked only after its entry is durably indexed.
+        """
+        items = [(p.name, p.read_bytes(), p.stat().st_mtime) for p in paths]
+        if not items:
+            return 0
+        self.write_many(items)
+        for p in paths:
+            p.unlink()
+        return len(items)
+
+
+
+def pack_tree(root: Path, suffixes: tuple[str, ...] = (".json", ".html")) -> int:
+    """Absorb every loose payload under `root` into its directory's archive.
+
+    The one-off migration for a raw tree written before the archive was on.
+    Returns the number of files packed.
+    """
+    packed = 0
+    for directory, _, names in os.walk(root):
+        loose = sorted(
+            Path(directory) / name
+            for name in names
+            if name.endswith(suffixes) and not name.startswith(ARCHIVE_PREFIX)
+        )
+        if loose:
+            packed += RawArchive(Path(directory)).absorb(loose)
+    return packed
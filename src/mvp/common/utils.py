@@ -1,8 +1,15 @@
 """Common utility functions shared across the project."""
 
+import hashlib
+import operator
+import re
 import types
+from collections.abc import Callable
 from datetime import date, datetime
+from enum import Enum
 
+import annotated_types
+import numpy as np
 import polars as pl
 from pydantic import BaseModel
 
@@ -15,6 +22,62 @@ _PYTHON_TO_POLARS: dict[type, pl.DataType] = {
     date: pl.Date,
 }
 
+# Field(ge=..., ...) constraint -> (bound attribute, comparison that must hold)
+_BOUND_CHECKS: dict[type, tuple[str, Callable[[pl.Expr, object], pl.Expr]]] = {
+    annotated_types.Ge: ("ge", operator.ge),
+    annotated_types.Gt: ("gt", operator.gt),
+    annotated_types.Le: ("le", operator.le),
+    annotated_types.Lt: ("lt", operator.lt),
+}
+
+# Parts of a served page that change on every request without the content changing:
+# inline scripts (nonces, analytics, build ids), comments, and layout whitespace.
+_VOLATILE_HTML_RE = re.compile(
+    r"<script\b[^>]*>.*?</script\s*>|<!--.*?-->", re.DOTALL | re.IGNORECASE
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def html_content_hash(html: str) -> str:
+    """SHA-256 of a page with per-request noise stripped.
+
+    Two fetches of an unchanged page hash equal even when the server varies its
+    scripts or whitespace; nothing the parsers read is removed.
+    """
+    text = _VOLATILE_HTML_RE.sub("", html)
+    text = _WHITESPACE_RE.sub(" ", text).strip()
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def hash_arrays(*arrays: np.ndarray | None) -> str:
+    """SHA-256 over the dtype, shape and bytes of each array (None allowed)."""
+    h = hashlib.sha256()
+    for arr in arrays:
+        if arr is None:
+            h.update(b"none;")
+            continue
+        a = np.ascontiguousarray(arr)
+        h.update(f"{a.dtype.str}{a.shape};".encode())
+        if a.dtype == object:
+            h.update("\x1f".join(map(str, a.ravel())).encode())
+        else:
+            h.update(a.tobytes())
+    return h.hexdigest()
+
+
+def _unwrap_optional(annotation) -> tuple[object, bool]:
+    """(inner type, allows None) for ``X``, ``X | None`` and ``Optional[X]``."""
+    args = None
+    origin = getattr(annotation, "__origin__", None)
+    if origin is types.UnionType or origin is type(int | None):
+        args = [a for a in annotation.__args__ if a is not type(None)]
+    elif hasattr(annotation, "__args__") and type(None) in annotation.__args__:
+        args = [a for a in annotation.__args__ if a is not type(None)]
+
+    if args and len(args) == 1:
+        return args[0], True
+    return annotation, args is not None
+
 
 def polars_schema(model: type[BaseModel]) -> dict[str, pl.DataType]:
     """Derive a full Polars schema from a Pydantic model.
@@ -25,18 +88,7 @@ def polars_schema(model: type[BaseModel]) -> dict[str, pl.DataType]:
     """
     schema: dict[str, pl.DataType] = {}
     for name, field_info in model.model_fields.items():
-        annotation = field_info.annotation
-        args = None
-        origin = getattr(annotation, "__origin__", None)
-        if origin is types.UnionType or origin is type(int | None):
-            args = [a for a in annotation.__args__ if a is not type(None)]
-        elif hasattr(annotation, "__args__") and type(None) in annotation.__args__:
-            args = [a for a in annotation.__args__ if a is not type(None)]
-
-        if args and len(args) == 1:
-            inner = args[0]
-        else:
-            inner = annotation
+        inner, _ = _unwrap_optional(field_info.annotation)
 
         pl_type = _PYTHON_TO_POLARS.get(inner)
         if pl_type is None and isinstance(inner, type):
@@ -47,3 +99,102 @@ def polars_schema(model: type[BaseModel]) -> dict[str, pl.DataType]:
         if pl_type:
             schema[name] = pl_type
     return schema
+
+
+def columnar_frame(
+    columns: dict[str, list],
+    model: type[BaseModel],
+    *,
+    before: dict[str, Callable[[pl.Expr], pl.Expr]] | None = None,
+) -> tuple[pl.DataFrame, list[str]]:
+    """Build a model-shaped frame straight from parsed column lists.
+
+    The bulk counterpart of ``pl.DataFrame([Model(**r).model_dump() ...])``
+    for models whose validation is declarative. ``before`` expressions stand in
+    for the model's mode="before" field validators; the field declarations then
+    become row checks: the value casts to its polars_schema dtype (integers
+    reject fractional floats), non-Optional fields are non-null, enum fields
+    hold a member value, and Field(ge/gt/le/lt) bounds hold. Fields absent
+    from ``columns`` take their model default.
+
+    Returns the valid rows in model field order, and one message per rejected
+    row naming the first field that failed.
+    """
+    schema = polars_schema(model)
+    n_rows = len(next(iter(columns.values()))) if columns else 0
+    raw: dict[str, pl.Series] = {}
+    for name, info in model.model_fields.items():
+        if name not in schema:
+            raise ValueError(f"{model.__name__}.{name}: no polars dtype")
+        if name in columns:
+            raw[name] = pl.Series(name, columns[name], strict=False)
+        elif not info.is_required():
+            raw[name] = pl.repeat(info.default, n_rows, eager=True).alias(name)
+        else:
+            raise ValueError(f"{model.__name__}.{name}: required column missing")
+    if n_rows == 0:
+        return pl.DataFrame(schema=schema), []
+    # All-null columns take the target dtype so `before` string/numeric
+    # expressions apply to them.
+    df = pl.DataFrame(raw).with_columns(
+        pl.col(name).cast(schema[name])
+        for name, series in raw.items()
+        if series.dtype == pl.Null
+    )
+    if before:
+        df = df.with_columns(
+            fn(pl.col(name)).alias(name) for name, fn in before.items()
+        )
+
+    frame = df.select(
+        *(pl.col(name).alias(f"_raw_{name}") for name in schema),
+        *(pl.col(name).cast(dtype, strict=False) for name, dtype in schema.items()),
+    )
+    checks: list[tuple[str, pl.Expr]] = []
+    for name, info in model.model_fields.items():
+        inner, nullable = _unwrap_optional(info.annotation)
+        value, original = pl.col(name), pl.col(f"_raw_{name}")
+        checks.append(
+            (f"{name}: cannot convert to {schema[name]}",
+             original.is_not_null() & value.is_null())
+        )
+        if schema[name] == pl.Int64 and df.schema[name].is_float():
+            checks.append(
+                (f"{name}: fractional value for int", original != original.round(0))
+            )
+        if not nullable:
+            checks.append((f"{name}: null in non-Optional field", value.is_null()))
+        if isinstance(inner, type) and issubclass(inner, Enum):
+            members = [m.value for m in inner]
+            checks.append(
+                (f"{name}: not a {inner.__name__} value", ~value.is_in(members))
+            )
+        for constraint in info.metadata:
+            if type(constraint) not in _BOUND_CHECKS:
+                raise ValueError(
+                    f"{model.__name__}.{name}: unsupported constraint {constraint!r}"
+                )
+            attr, holds = _BOUND_CHECKS[type(constraint)]
+            bound = getattr(constraint, attr)
+            checks.append((f"{name}: violates {attr}={bound}", ~holds(value, bound)))
+
+    reason = pl.coalesce(
+        pl.when(mask.fill_null(False)).then(pl.lit(message))
+        for message, mask in checks
+    )
+    frame = frame.with_columns(reason.alias("_reason"))
+    valid = frame.filter(pl.col("_reason").is_null()).select(list(schema))
+    return valid, frame["_reason"].drop_nulls().to_list()
+
+
+def rows_to_columns(rows: list[dict], model: type[BaseModel]) -> dict[str, list]:
+    """Pivot field dicts into columnar_frame input.
+
+    A key a row omits takes the field's model default (None for required
+    fields, which columnar_frame then rejects).
+    """
+    columns: dict[str, list] = {}
+    for name, info in model.model_fields.items():
+        default = None if info.is_required() else info.default
+        columns[name] = [row.get(name, default) for row in rows]
+    return columns
@@ -10,8 +10,10 @@ with banded views by consensus / opening-edge / calibration tier.
 
 import json
 import logging
+import multiprocessing
 import shutil
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -22,11 +24,15 @@ from dateutil.relativedelta import relativedelta
 
 from mvp.common.base_job import get_data_root, get_local_data_root
 from mvp.model import backtest_views as views
+from mvp.model import engine
 from mvp.model.cal_tiers import (
     classify_cal_tier,
     extract_circuit_round_lookup,
 )
 from mvp.model.config import ExperimentConfig, apply_filters
+from mvp.model.engine import FeatureEngine
+from mvp.model.models import set_n_jobs_override
+from mvp.model.parallelism import resolve_candidate_parallelism
 from mvp.model.predictor import ProductionPredictor
 
 logger = logging.getLogger(__name__)
@@ -525,6 +531,132 @@ def _schedule_test_windows(
     return windows
 
 
+def _pending_training(
+    temp_config: dict, *, retrain: bool
+) -> tuple[bool, list[dict]]:
+    """(train the lead?, voter entries to train) for one fold's temp config."""
+    lead_artifact = Path(temp_config["winner"]["active"]["artifact"])
+    train_lead = retrain or not lead_artifact.exists()
+    if not train_lead:
+        logger.info("Using cached lead artifact %s", lead_artifact)
+    voters: list[dict] = []
+    for voter in temp_config["winner"]["voters"]:
+        if retrain or not Path(voter["artifact"]).exists():
+            voters.append(voter)
+        else:
+            logger.info("Using cached voter artifact %s", voter["artifact"])
+    return train_lead, voters
+
+
+def _train_fold(
+    temp_yaml_path: Path,
+    train_lead: bool,
+    voters: list[dict],
+    matches_path: Path,
+    shared: pl.DataFrame | None,
+) -> None:
+    """Train one fold's lead and voters; each fit calibrates on its own fold."""
+    predictor = ProductionPredictor(
+        production_config_path=temp_yaml_path,
+        cache_dir=BACKTEST_CACHE_DIR,
+        matches_path=matches_path,
+        shared_features=shared,
+    )
+    if train_lead:
+        predictor.train()
+    for voter in voters:
+        predictor._train_single(voter)
+
+
+# Per-worker shared feature frame, read once by the pool initializer.
+_worker_features: pl.DataFrame | None = None
+
+
+def _fold_worker_init(
+    features_path: str, n_jobs: int, memory_limit_pct: int,
+) -> None:
+    """Load the shared frame and re-apply the parent's CLI overrides.
+
+    A spawned worker imports everything afresh, so without this its fits would
+    claim the default cpu - 2 threads and its memory guard the default limit.
+    """
+    global _worker_features
+    set_n_jobs_override(n_jobs)
+    engine._MEMORY_LIMIT_PCT = memory_limit_pct
+    _worker_features = pl.read_parquet(features_path)
+
+
+def _train_fold_worker(
+    temp_yaml_path: str, train_lead: bool, voters: list[dict], matches_path: str,
+) -> None:
+    _train_fold(
+        Path(temp_yaml_path), train_lead, voters, Path(matches_path),
+        _worker_features,
+    )
+
+
+def _train_folds(
+    plans: list[tuple[str, dict, Path, date, date, date]],
+    *,
+    config_stem: str,
+    retrain: bool,
+    shared: pl.DataFrame,
+    matches_path: Path,
+    workers: int | None,
+) -> None:
+    """Train every fold that lacks artifacts, concurrently when there are several.
+
+    Fold artifacts are tagged by test start, so concurrent folds never share a
+    path. Serial unless ``workers`` asks for more: each worker holds its own
+    copy of the shared frame, which it reads from one parquet at start-up rather
+    than having it pickled per task. The thread budget (``--n-jobs``, else
+    cpu - 2) is split across the workers, as in the null-importance pool, so
+    concurrent fits do not each claim every core. Spawn, not fork: the parent
+    may already hold OpenMP threads from an earlier fit.
+    """
+    jobs: list[tuple[str, Path, bool, list[dict]]] = []
+    for fold_tag, temp_config, temp_yaml_path, train_cutoff, _ps, _pe in plans:
+        train_lead, voters = _pending_training(temp_config, retrain=retrain)
+        if not (train_lead or voters):
+            continue
+        logger.info(
+            "Training fold %s (train <= %s): %s%d voter(s)",
+            fold_tag, train_cutoff, f"lead {config_stem}, " if train_lead else "",
+            len(voters),
+        )
+        jobs.append((fold_tag, temp_yaml_path, train_lead, voters))
+
+    n_workers = min(workers or 1, len(jobs))
+    if n_workers <= 1:
+        for _tag, temp_yaml_path, train_lead, voters in jobs:
+            _train_fold(temp_yaml_path, train_lead, voters, matches_path, shared)
+        return
+
+    n_workers, n_jobs = resolve_candidate_parallelism(None, n_workers)
+    logger.info(
+        "Training %d folds on %d worker processes (n_jobs=%d each)",
+        len(jobs), n_workers, n_jobs,
+    )
+    with tempfile.TemporaryDirectory(prefix="backtest_features_") as tmp:
+        features_path = Path(tmp) / "features.parquet"
+        shared.write_parquet(features_path)
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_fold_worker_init,
+            initargs=(str(features_path), n_jobs, engine._MEMORY_LIMIT_PCT),
+        ) as ex:
+            futures = [
+                ex.submit(
+                    _train_fold_worker, str(temp_yaml_path), train_lead, voters,
+                    str(matches_path),
+                )
+                for _tag, temp_yaml_path, train_lead, voters in jobs
+            ]
+            for future in futures:
+                future.result()
+
+
 def run_backtest(
     config_path: Path | str,
     *,
@@ -532,6 +664,7 @@ def run_backtest(
     start: date | None = None,
     end: date | None = None,
     voters_override_path: Path | str | None = None,
+    workers: int | None = None,
 ) -> Path:
     """Run the lead backtest end-to-end and return the CSV path.
 
@@ -543,6 +676,10 @@ def run_backtest(
     and predicts that fold's slice of the betting period. Predictions across
     folds are concatenated, joined to odds, and settled. Today that's a single
     fold; the loop covers the multi-fold case if the odds span ever grows.
+
+    Features are computed once for all folds and voters. Folds that need
+    training run concurrently on up to `workers` processes (None = serial);
+    predictions are then made in fold order, so output is unchanged.
     """
     config_path = Path(config_path)
     if not config_path.exists():
@@ -585,44 +722,52 @@ def run_backtest(
     fold_predictions: list[pl.DataFrame] = []
     fold_feature_frames: list[pl.DataFrame] = []
     last_lead_stem: str | None = None
-    for train_cutoff, test_start, pred_start, pred_end in folds:
-        fold_tag = test_start.isoformat()
-        temp_config = _build_temp_config(
-            config_path, voters, artifact_root,
-            train_cutoff=train_cutoff, fold_tag=fold_tag,
+    plans: list[tuple[str, dict, Path, date, date, date]] = []
+    try:
+        for train_cutoff, test_start, pred_start, pred_end in folds:
+            fold_tag = test_start.isoformat()
+            temp_config = _build_temp_config(
+                config_path, voters, artifact_root,
+                train_cutoff=train_cutoff, fold_tag=fold_tag,
+            )
+            with tempfile.NamedTemporaryFile(
+                mode="w", suffix=".yaml", delete=False, encoding="utf-8",
+            ) as f:
+                yaml.safe_dump(temp_config, f)
+            plans.append((
+                fold_tag, temp_config, Path(f.name),
+                train_cutoff, pred_start, pred_end,
+            ))
+
+        # One feature frame for every fold, model and voter: the union of their
+        # specs over the full timeline. Folds differ only in the date slices
+        # they train and predict on, which the predictor applies itself.
+        matches_path = _frozen_matches_path()
+        specs, columns = ProductionPredictor(
+            production_config_path=plans[0][2],
+            cache_dir=BACKTEST_CACHE_DIR,
+            matches_path=matches_path,
+        ).feature_request(include_features=True)
+        shared = FeatureEngine(
+            matches_path=matches_path, cache_dir=BACKTEST_CACHE_DIR
+        ).compute(specs, extra_columns=columns)
+        logger.info(
+            "Shared feature frame: %d specs, %d rows x %d columns",
+            len(specs), shared.height, shared.width,
         )
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False, encoding="utf-8",
-        ) as f:
-            yaml.safe_dump(temp_config, f)
-            temp_yaml_path = Path(f.name)
-        try:
+
+        _train_folds(
+            plans, config_stem=config_path.stem, retrain=retrain,
+            shared=shared, matches_path=matches_path, workers=workers,
+        )
+
+        for fold_tag, _cfg, temp_yaml_path, _tc, pred_start, pred_end in plans:
             predictor = ProductionPredictor(
                 production_config_path=temp_yaml_path,
                 cache_dir=BACKTEST_CACHE_DIR,
-                matches_path=_frozen_matches_path(),
+                matches_path=matches_path,
+                shared_features=shared,
             )
-
-            lead_artifact = Path(temp_config["winner"]["active"]["artifact"])
-            if retrain or not lead_artifact.exists():
-                logger.info(
-                    "Training lead %s for fold %s (train <= %s) ...",
-                    config_path.stem, fold_tag, train_cutoff,
-                )
-                predictor.train()
-            else:
-                logger.info("Using cached lead artifact %s", lead_artifact)
-
-            for voter in temp_config["winner"]["voters"]:
-                voter_artifact = Path(voter["artifact"])
-                if retrain or not voter_artifact.exists():
-                    logger.info(
-                        "Training voter %s for fold %s ...", voter["name"], fold_tag
-                    )
-                    predictor._train_single(voter)
-                else:
-                    logger.info("Using cached voter artifact %s", voter_artifact)
-
             preds = predictor.predict(
                 include_settled=True, date_window=(pred_start, pred_end),
                 include_features=True,
@@ -642,7 +787,8 @@ def run_backtest(
             )
             fold_predictions.append(preds)
             logger.info("Fold %s predicted %d match rows", fold_tag, len(preds))
-        finally:
+    finally:
+        for _tag, _cfg, temp_yaml_path, *_ in plans:
             temp_yaml_path.unlink(missing_ok=True)
 
     if not fold_predictions:
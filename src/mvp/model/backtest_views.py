@@ -2,7 +2,9 @@
 
 Functions here compute structured stats from filtered slices of the per-row
 backtest CSV. They contain no rendering logic — both `backtest.py`'s summary
-writer and `report.py`'s Section D consume them.
+writer and `report.py`'s Section D consume them. Grouped views (`by_tier`,
+`by_month`, ...) aggregate every slice in one group_by via `grouped_stats`
+rather than filtering the frame once per slice.
 
 Conventions:
 - All functions take a polars DataFrame (the slice to aggregate).
@@ -55,21 +57,18 @@ def filter_band(
     return df.filter((pl.col(col) >= lo) & (pl.col(col) < hi))
 
 
-def slice_stats(df: pl.DataFrame) -> dict[str, Any]:
-    """Compute betting stats for one filtered slice.
+_PRICES: tuple[str, ...] = ("open", "formed", "close")
 
-    Returns a dict with these keys (None for fields that can't be computed
-    from the available columns):
-      n, hit,
-      n_open, pnl_open, roi_open,
-      n_formed, pnl_formed, roi_formed,
-      n_close, pnl_close, roi_close,
-      clv_pos, avg_clv,
-      me_open_pos, avg_me_open,
-      me_close_pos, avg_me_close
-    """
-    n = len(df)
-    out: dict[str, Any] = {
+# (output prefix, source column) for the share-positive / mean pairs.
+_SIGNED_MEANS: tuple[tuple[str, str, str], ...] = (
+    ("clv_pos", "avg_clv", "clv"),
+    ("me_open_pos", "avg_me_open", "opening_edge"),
+    ("me_close_pos", "avg_me_close", "closing_edge"),
+)
+
+
+def _empty_stats(n: int = 0) -> dict[str, Any]:
+    return {
         "n": n,
         "hit": None,
         "n_open": 0,
@@ -88,47 +87,77 @@ def slice_stats(df: pl.DataFrame) -> dict[str, Any]:
         "me_close_pos": None,
         "avg_me_close": None,
     }
-    if n == 0:
-        return out
 
-    if "won" in df.columns:
-        won = df["won"].drop_nulls()
-        out["hit"] = float(won.mean()) if len(won) else None
 
-    for price in ("open", "formed", "close"):
+def _stats_exprs(columns: list[str]) -> list[pl.Expr]:
+    """Aggregations producing `slice_stats` fields for the columns present.
+
+    Null-skipping matches the per-slice semantics: means ignore nulls, and
+    per-side pnl/roi only count rows where that side's pnl is non-null.
+    """
+    exprs: list[pl.Expr] = [pl.len().alias("n")]
+    if "won" in columns:
+        exprs.append(pl.col("won").cast(pl.Float64).mean().alias("hit"))
+    for price in _PRICES:
         pnl_col = f"pnl_{price}"
-        if pnl_col not in df.columns:
+        if pnl_col not in columns:
             continue
-        priced = df.filter(pl.col(pnl_col).is_not_null())
-        n_p = len(priced)
-        out[f"n_{price}"] = n_p
-        if n_p == 0:
-            continue
-        pnl = float(priced[pnl_col].sum())
-        out[f"pnl_{price}"] = pnl
-        out[f"roi_{price}"] = pnl / n_p
-
-    if "clv" in df.columns:
-        clv = df["clv"].drop_nulls()
-        if len(clv):
-            out["clv_pos"] = float((clv > 0).mean())
-            out["avg_clv"] = float(clv.mean())
-
-    if "opening_edge" in df.columns:
-        oe = df["opening_edge"].drop_nulls()
-        if len(oe):
-            out["me_open_pos"] = float((oe > 0).mean())
-            out["avg_me_open"] = float(oe.mean())
-
-    if "closing_edge" in df.columns:
-        ce = df["closing_edge"].drop_nulls()
-        if len(ce):
-            out["me_close_pos"] = float((ce > 0).mean())
-            out["avg_me_close"] = float(ce.mean())
-
+        n_p = pl.col(pnl_col).is_not_null().sum()
+        pnl = pl.col(pnl_col).cast(pl.Float64).sum()
+        exprs += [
+            n_p.alias(f"n_{price}"),
+            pl.when(n_p > 0).then(pnl).alias(f"pnl_{price}"),
+            pl.when(n_p > 0).then(pnl / n_p).alias(f"roi_{price}"),
+        ]
+    for pos_key, avg_key, col in _SIGNED_MEANS:
+        if col in columns:
+            exprs += [
+                (pl.col(col) > 0).cast(pl.Float64).mean().alias(pos_key),
+                pl.col(col).cast(pl.Float64).mean().alias(avg_key),
+            ]
+    return exprs
+
+
+def _record(row: dict[str, Any]) -> dict[str, Any]:
+    out = _empty_stats()
+    out.update((k, v) for k, v in row.items() if k in out)
     return out
 
 
+def grouped_stats(df: pl.DataFrame, key: pl.Expr) -> dict[Any, dict[str, Any]]:
+    """`slice_stats` for every value of `key`, from one group_by.
+
+    Null keys are dropped; groups come back in first-appearance order.
+    """
+    if len(df) == 0:
+        return {}
+    agg = (
+        df.with_columns(key.alias("_key"))
+        .filter(pl.col("_key").is_not_null())
+        .group_by("_key", maintain_order=True)
+        .agg(_stats_exprs(df.columns))
+    )
+    return {row.pop("_key"): _record(row) for row in agg.iter_rows(named=True)}
+
+
+def slice_stats(df: pl.DataFrame) -> dict[str, Any]:
+    """Compute betting stats for one filtered slice.
+
+    Returns a dict with these keys (None for fields that can't be computed
+    from the available columns):
+      n, hit,
+      n_open, pnl_open, roi_open,
+      n_formed, pnl_formed, roi_formed,
+      n_close, pnl_close, roi_close,
+      clv_pos, avg_clv,
+      me_open_pos, avg_me_open,
+      me_close_pos, avg_me_close
+    """
+    if len(df) == 0:
+        return _empty_stats()
+    return _record(df.select(_stats_exprs(df.columns)).row(0, named=True))
+
+
 def by_tier(
     df: pl.DataFrame,
     tier_order: tuple[str, ...] = TIER_ORDER,
@@ -138,36 +167,41 @@ def by_tier(
     """
     if "cal_tier" not in df.columns:
         return [("ALL", slice_stats(df))]
-    rows: list[tuple[str, dict[str, Any]]] = []
-    for tier in tier_order:
-        rows.append((tier, slice_stats(df.filter(pl.col("cal_tier") == tier))))
+    groups = grouped_stats(df, pl.col("cal_tier"))
+    rows: list[tuple[str, dict[str, Any]]] = [
+        (tier, groups.get(tier) or _empty_stats()) for tier in tier_order
+    ]
     seen = set(tier_order)
-    extras = (
-        df.filter(~pl.col("cal_tier").is_in(list(seen)))
-        .filter(pl.col("cal_tier").is_not_null())
-        .get_column("cal_tier")
-        .unique()
-        .to_list()
+    rows.extend(
+        (str(tier), stats) for tier, stats in groups.items() if tier not in seen
     )
-    for tier in extras:
-        if tier is None:
-            continue
-        rows.append(
-            (str(tier), slice_stats(df.filter(pl.col("cal_tier") == tier)))
-        )
     rows.append(("ALL", slice_stats(df)))
     return rows
 
 
+def _band_label(
+    col: str, bands: tuple[tuple[str, float, float | None], ...]
+) -> pl.Expr:
+    """Label each row with its [lo, hi) band on `col` (bands are disjoint)."""
+    expr: Any = pl
+    for label, lo, hi in bands:
+        cond = pl.col(col) >= lo
+        if hi is not None:
+            cond = cond & (pl.col(col) < hi)
+        expr = expr.when(cond).then(pl.lit(label))
+    return expr.otherwise(None)
+
+
 def by_edge_band(
     df: pl.DataFrame,
     edge_col: str,
     bands: tuple[tuple[str, float, float | None], ...] = EDGE_BANDS,
 ) -> list[tuple[str, dict[str, Any]]]:
     """Group by edge band on `edge_col` plus an ALL row."""
-    rows: list[tuple[str, dict[str, Any]]] = []
-    for label, lo, hi in bands:
-        rows.append((label, slice_stats(filter_band(df, edge_col, lo, hi))))
+    groups = grouped_stats(df, _band_label(edge_col, bands))
+    rows: list[tuple[str, dict[str, Any]]] = [
+        (label, groups.get(label) or _empty_stats()) for label, _, _ in bands
+    ]
     rows.append(("ALL", slice_stats(df)))
     return rows
 
@@ -186,18 +220,22 @@ def by_consensus(df: pl.DataFrame) -> list[tuple[str, dict[str, Any]]]:
     if len(n_agree_col) == 0:
         return []
     n_subs = int(n_agree_col.max())
+    groups = grouped_stats(df, pl.col("n_agree"))
     rows: list[tuple[str, dict[str, Any]]] = []
     for n_agree in range(n_subs, 0, -1):
-        n_disagree = n_subs - n_agree
-        bucket = df.filter(pl.col("n_agree") == n_agree)
-        stats = slice_stats(bucket)
-        if stats["n"] == 0:
+        stats = groups.get(n_agree)
+        if stats is None:
             continue
-        rows.append((f"{n_agree}-{n_disagree}", stats))
+        rows.append((f"{n_agree}-{n_subs - n_agree}", stats))
     rows.append(("ALL", slice_stats(df)))
     return rows
 
 
+def _month_key() -> pl.Expr:
+    month = pl.col("effective_match_date").cast(pl.Utf8).str.slice(0, 7)
+    return pl.when(month.str.len_chars() == 7).then(month)
+
+
 def month_slices(df: pl.DataFrame) -> list[tuple[str, pl.DataFrame]]:
     """Group by YYYY-MM, returning the (label, sub-DataFrame) for each month in
     chronological order. Callers that need per-bet-point gating (each of
@@ -206,30 +244,24 @@ def month_slices(df: pl.DataFrame) -> list[tuple[str, pl.DataFrame]]:
     """
     if "effective_match_date" not in df.columns:
         return []
-    tagged = df.with_columns(
-        pl.col("effective_match_date").cast(pl.Utf8).str.slice(0, 7).alias("_month")
-    ).filter(
-        pl.col("_month").is_not_null() & (pl.col("_month").str.len_chars() == 7)
+    tagged = df.with_columns(_month_key().alias("_month")).filter(
+        pl.col("_month").is_not_null()
     )
-    months = sorted(m for m in tagged["_month"].unique().to_list() if m is not None)
-    out: list[tuple[str, pl.DataFrame]] = []
-    for m in months:
-        sub = tagged.filter(pl.col("_month") == m)
-        if len(sub) > 0:
-            out.append((m, sub))
-    return out
+    parts = tagged.partition_by("_month", as_dict=True, maintain_order=True)
+    return sorted((m, sub) for (m,), sub in parts.items())
 
 
 def by_month(df: pl.DataFrame) -> list[tuple[str, dict[str, Any]]]:
     """Group by YYYY-MM, attaching `cum_open` / `cum_formed` / `cum_close`
     running totals to each record's stats dict (in addition to per-month stats).
     """
+    if "effective_match_date" not in df.columns:
+        return []
     rows: list[tuple[str, dict[str, Any]]] = []
     cum_open = 0.0
     cum_formed = 0.0
     cum_close = 0.0
-    for m, sub in month_slices(df):
-        stats = slice_stats(sub)
+    for m, stats in sorted(grouped_stats(df, _month_key()).items()):
         cum_open += float(stats.get("pnl_open") or 0.0)
         cum_formed += float(stats.get("pnl_formed") or 0.0)
         cum_close += float(stats.get("pnl_close") or 0.0)
@@ -247,6 +279,13 @@ def by_month(df: pl.DataFrame) -> list[tuple[str, dict[str, Any]]]:
 _ROUND_ORDER = ["Q1", "Q2", "Q3", "RR", "R128", "R64", "R32", "R16", "QF", "SF", "F"]
 
 
+_ROUND_INDEX = {r: i for i, r in enumerate(_ROUND_ORDER)}
+
+
+def _round_sort_key(r: str) -> tuple[int, str]:
+    return (_ROUND_INDEX.get(r, len(_ROUND_ORDER)), r)
+
+
 def round_slices(df: pl.DataFrame) -> list[tuple[str, pl.DataFrame]]:
     """Group by tournament round, returning (label, sub-DataFrame) ordered
     Q1..F via `_ROUND_ORDER` with any unrecognized rounds appended last (name
@@ -255,21 +294,20 @@ def round_slices(df: pl.DataFrame) -> list[tuple[str, pl.DataFrame]]:
     """
     if "round" not in df.columns:
         return []
-    order = {r: i for i, r in enumerate(_ROUND_ORDER)}
-    present = sorted(
-        (r for r in df["round"].unique().to_list() if r is not None),
-        key=lambda r: (order.get(r, len(_ROUND_ORDER)), r),
+    parts = df.drop_nulls("round").partition_by(
+        "round", as_dict=True, maintain_order=True,
+    )
+    return sorted(
+        ((r, sub) for (r,), sub in parts.items()),
+        key=lambda item: _round_sort_key(item[0]),
     )
-    out: list[tuple[str, pl.DataFrame]] = []
-    for r in present:
-        sub = df.filter(pl.col("round") == r)
-        if len(sub) > 0:
-            out.append((r, sub))
-    return out
 
 
 def by_round(df: pl.DataFrame) -> list[tuple[str, dict[str, Any]]]:
     """Group by tournament round, ordered Q1..F via `_ROUND_ORDER` with any
     unrecognized rounds appended last (name order). Returns empty if `round`
     isn't present."""
-    return [(r, slice_stats(sub)) for r, sub in round_slices(df)]
+    if "round" not in df.columns:
+        return []
+    groups = grouped_stats(df, pl.col("round"))
+    return [(r, groups[r]) for r in sorted(groups, key=_round_sort_key)]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import calendar
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, timedelta
 
 import numpy as np
 import polars as pl
@@ -56,81 +56,215 @@ class ReliabilityProfile:
     cal_12mo: WindowDistribution | None
 
 
-def compute_rolling_signed_calibration(
-    df: pl.DataFrame,
+_EPOCH = date(1970, 1, 1)
+
+
+@dataclass(frozen=True)
+class _ProfileArrays:
+    """One slice's columns as numpy, rows sorted by date with undated rows last.
+
+    Every profile metric reads these instead of re-filtering a frame; rolling
+    windows read the first `n_dated` rows through prefix sums.
+    """
+
+    days: np.ndarray          # epoch days of the dated rows, ascending
+    favored_won: np.ndarray
+    favored_prob: np.ndarray
+    y_true: np.ndarray | None
+    y_prob: np.ndarray | None
+
+    @property
+    def n_dated(self) -> int:
+        return len(self.days)
+
+    def take(self, idx: np.ndarray) -> _ProfileArrays:
+        """Sub-slice by row positions, keeping date order."""
+        idx = np.sort(idx)
+        n_dated = int(np.searchsorted(idx, self.n_dated))
+        return _ProfileArrays(
+            days=self.days[idx[:n_dated]],
+            favored_won=self.favored_won[idx],
+            favored_prob=self.favored_prob[idx],
+            y_true=None if self.y_true is None else self.y_true[idx],
+            y_prob=None if self.y_prob is None else self.y_prob[idx],
+        )
+
+
+def _profile_arrays(df: pl.DataFrame) -> _ProfileArrays:
+    has_scores = "y_true" in df.columns and "y_prob" in df.columns
+    ordered = df.select(
+        pl.col("effective_match_date").cast(pl.Date).cast(pl.Int64).alias("_day"),
+        pl.col("favored_won").cast(pl.Float64),
+        pl.col("favored_prob").cast(pl.Float64),
+        *([pl.col("y_true").cast(pl.Float64), pl.col("y_prob").cast(pl.Float64)]
+          if has_scores else []),
+    ).sort("_day", nulls_last=True, maintain_order=True)
+    days = ordered["_day"].drop_nulls().to_numpy()
+    return _ProfileArrays(
+        days=days,
+        favored_won=ordered["favored_won"].to_numpy(),
+        favored_prob=ordered["favored_prob"].to_numpy(),
+        y_true=ordered["y_true"].to_numpy() if has_scores else None,
+        y_prob=ordered["y_prob"].to_numpy() if has_scores else None,
+    )
+
+
+def _rolling_calibration(
+    arrays: _ProfileArrays,
     window_months: int,
     step_months: int = 1,
     min_matches_per_window: int = 10,
 ) -> WindowDistribution | None:
-    """Compute signed calibration error in rolling time windows.
+    """Month windows over date-sorted rows, each window two prefix-sum lookups.
 
-    signed_error = mean(favored_won) - mean(favored_prob)
-    Positive = underconfident. Negative = overconfident.
+    Window starts walk from the first date by `step_months` through `_add_months`
+    — clamping included, so a start on the 31st drifts exactly as it always has.
     """
-    dates = df["effective_match_date"].cast(pl.Date).sort()
-    min_date = dates.min()
-    max_date = dates.max()
-    if min_date is None or max_date is None:
+    days = arrays.days
+    if len(days) == 0:
         return None
+    min_date = _EPOCH + timedelta(days=int(days[0]))
+    max_date = _EPOCH + timedelta(days=int(days[-1]))
 
-    errors: list[float] = []
-    window_ns: list[int] = []
-
+    starts: list[int] = []
+    ends: list[int] = []
     current_start = min_date
     while True:
         window_end = _add_months(current_start, window_months)
         if window_end > max_date:
             break
+        starts.append((current_start - _EPOCH).days)
+        ends.append((window_end - _EPOCH).days)
+        current_start = _add_months(current_start, step_months)
+    if not starts:
+        return None
 
-        window_df = df.filter(
-            (pl.col("effective_match_date") >= current_start)
-            & (pl.col("effective_match_date") < window_end)
-        )
+    n_dated = arrays.n_dated
+    cum_won = np.concatenate(([0.0], np.cumsum(arrays.favored_won[:n_dated])))
+    cum_prob = np.concatenate(([0.0], np.cumsum(arrays.favored_prob[:n_dated])))
+    lo = np.searchsorted(days, starts, side="left")
+    hi = np.searchsorted(days, ends, side="left")
+    n = hi - lo
+    keep = n >= min_matches_per_window
+    lo, hi, n = lo[keep], hi[keep], n[keep]
+    errors = (cum_won[hi] - cum_won[lo]) / n - (cum_prob[hi] - cum_prob[lo]) / n
+    return WindowDistribution.from_values(errors.tolist(), n.tolist())
 
-        if len(window_df) >= min_matches_per_window:
-            actual = window_df["favored_won"].mean()
-            predicted = window_df["favored_prob"].mean()
-            signed_error = actual - predicted
-            errors.append(signed_error)
-            window_ns.append(len(window_df))
 
-        current_start = _add_months(current_start, step_months)
+def compute_rolling_signed_calibration(
+    df: pl.DataFrame,
+    window_months: int,
+    step_months: int = 1,
+    min_matches_per_window: int = 10,
+) -> WindowDistribution | None:
+    """Compute signed calibration error in rolling time windows.
 
-    return WindowDistribution.from_values(errors, window_ns)
+    signed_error = mean(favored_won) - mean(favored_prob)
+    Positive = underconfident. Negative = overconfident.
+    """
+    return _rolling_calibration(
+        _profile_arrays(df), window_months, step_months, min_matches_per_window,
+    )
 
 
 def compute_reliability_profile(df: pl.DataFrame) -> ReliabilityProfile:
     """Compute full reliability profile for a slice of OOF predictions."""
-    n = len(df)
-    if n == 0:
+    if len(df) == 0:
+        return _profile_from_arrays(None)
+    return _profile_from_arrays(_profile_arrays(df))
+
+
+def compute_reliability_profiles_by(
+    df: pl.DataFrame, by: str, min_matches: int = 1,
+) -> dict[object, ReliabilityProfile]:
+    """Profiles for every value of `by`, from one sort of the frame.
+
+    Rows are ordered once by date and grouped on `by` as index arrays, so each
+    group's profile is numpy over its own rows rather than a filter of the frame.
+    Null keys and groups under `min_matches` are skipped.
+    """
+    if len(df) == 0:
+        return {}
+    arrays = _profile_arrays(df)
+    keys = df.select(
+        pl.col(by),
+        pl.col("effective_match_date").cast(pl.Date).alias("_day"),
+    ).sort("_day", nulls_last=True, maintain_order=True)
+    groups = (
+        keys.with_row_index("_pos")
+        .drop_nulls(by)
+        .group_by(by)
+        .agg(pl.col("_pos"))
+        .sort(by)
+    )
+    out: dict[object, ReliabilityProfile] = {}
+    for key, pos in groups.iter_rows():
+        if len(pos) < min_matches:
+            continue
+        out[key] = _profile_from_arrays(arrays.take(np.asarray(pos, dtype=np.int64)))
+    return out
+
+
+def compute_threshold_profiles(
+    df: pl.DataFrame, score_col: str, thresholds: list[int] | list[float],
+) -> dict[int | float, tuple[int, ReliabilityProfile]]:
+    """(n, profile) of the rows with `score_col >= threshold`, per threshold.
+
+    Rows are ranked by score once; every threshold's slice is a prefix of that
+    ranking found by binary search. Null scores never qualify and thresholds
+    with no rows are omitted.
+    """
+    if len(df) == 0:
+        return {}
+    arrays = _profile_arrays(df)
+    scores = (
+        df.select(
+            pl.col(score_col).cast(pl.Float64),
+            pl.col("effective_match_date").cast(pl.Date).alias("_day"),
+        )
+        .sort("_day", nulls_last=True, maintain_order=True)[score_col]
+        .to_numpy()
+    )
+    neg = -np.nan_to_num(scores, nan=-np.inf)
+    rank = np.argsort(neg, kind="stable")
+    neg_sorted = neg[rank]
+    out: dict[int | float, tuple[int, ReliabilityProfile]] = {}
+    for threshold in thresholds:
+        k = int(np.searchsorted(neg_sorted, -threshold, side="right"))
+        if k:
+            out[threshold] = (k, _profile_from_arrays(arrays.take(rank[:k])))
+    return out
+
+
+def _profile_from_arrays(arrays: _ProfileArrays | None) -> ReliabilityProfile:
+    if arrays is None or len(arrays.favored_won) == 0:
         return ReliabilityProfile(
             n_matches=0, accuracy=0.0, err80=0.0, signed_cal=0.0,
             log_loss=0.0, brier_score=0.0, roc_auc=None,
             cal_3mo=None, cal_6mo=None, cal_12mo=None,
         )
+    won = arrays.favored_won
+    prob = arrays.favored_prob
+    n = len(won)
 
-    accuracy = float(df["favored_won"].mean())
+    accuracy = float(won.mean())
 
-    high_conf = df.filter(pl.col("favored_prob") >= 0.80)
-    if len(high_conf) > 0:
-        err80 = 1.0 - float(high_conf["favored_won"].mean())
+    high_conf = prob >= 0.80
+    if high_conf.any():
+        err80 = 1.0 - float(won[high_conf].mean())
     else:
         err80 = 0.0
 
-    signed_cal = float(df["favored_won"].mean() - df["favored_prob"].mean())
+    signed_cal = float(won.mean() - prob.mean())
 
     # Scoring metrics (use raw y_prob/y_true for proper computation)
-    y_true = df["y_true"].to_numpy().astype(float)
-    y_prob = np.clip(df["y_prob"].to_numpy(), 1e-15, 1 - 1e-15)
+    y_true = arrays.y_true
+    y_prob = np.clip(arrays.y_prob, 1e-15, 1 - 1e-15)
     log_loss = -float(np.mean(y_true * np.log(y_prob) + (1 - y_true) * np.log(1 - y_prob)))
     brier_score = float(np.mean((y_prob - y_true) ** 2))
 
     roc_auc = _roc_auc(y_true, y_prob)
 
-    cal_3mo = compute_rolling_signed_calibration(df, window_months=3)
-    cal_6mo = compute_rolling_signed_calibration(df, window_months=6)
-    cal_12mo = compute_rolling_signed_calibration(df, window_months=12)
-
     return ReliabilityProfile(
         n_matches=n,
         accuracy=accuracy,
@@ -139,9 +273,9 @@ def compute_reliability_profile(df: pl.DataFrame) -> ReliabilityProfile:
         log_loss=log_loss,
         brier_score=brier_score,
         roc_auc=roc_auc,
-        cal_3mo=cal_3mo,
-        cal_6mo=cal_6mo,
-        cal_12mo=cal_12mo,
+        cal_3mo=_rolling_calibration(arrays, window_months=3),
+        cal_6mo=_rolling_calibration(arrays, window_months=6),
+        cal_12mo=_rolling_calibration(arrays, window_months=12),
     )
 
 
@@ -151,21 +285,11 @@ def _roc_auc(y_true: np.ndarray, y_prob: np.ndarray) -> float | None:
     n_neg = len(y_true) - n_pos
     if n_pos == 0 or n_neg == 0:
         return None
-    order = np.argsort(y_prob)
-    ranks = np.empty(len(y_prob), dtype=float)
-    ranks[order] = np.arange(1, len(y_prob) + 1, dtype=float)
-    # Handle ties: replace ranks with average rank for tied values
-    sorted_probs = y_prob[order]
-    i = 0
-    while i < len(sorted_probs):
-        j = i + 1
-        while j < len(sorted_probs) and sorted_probs[j] == sorted_probs[i]:
-            j += 1
-        if j > i + 1:
-            avg_rank = (i + 1 + j) / 2.0
-            for k in range(i, j):
-                ranks[order[k]] = avg_rank
-        i = j
+    # Average rank within ties: a run of equal probabilities occupying 1-based
+    # ranks i+1..j gets (i+1+j)/2.
+    _, inverse, counts = np.unique(y_prob, return_inverse=True, return_counts=True)
+    first = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    ranks = (first + (counts + 1) / 2.0)[inverse]
     auc = (ranks[y_true == 1].sum() - n_pos * (n_pos + 1) / 2) / (n_pos * n_neg)
     return float(auc)
 
@@ -12,7 +12,11 @@ from mvp.model.confidence.dimensions import (
     get_modifier_slices,
     get_structural_slices,
 )
-from mvp.model.confidence.metrics import ReliabilityProfile, compute_reliability_profile
+from mvp.model.confidence.metrics import (
+    ReliabilityProfile,
+    compute_reliability_profile,
+    compute_reliability_profiles_by,
+)
 from mvp.model.confidence.voter_analysis import (
     CoverageCurveResult,
     VoterCorrelationResult,
@@ -149,10 +153,10 @@ class ConfidenceValidator:
 
         # Voter consensus slices (voter-system configs — detected by voter_consensus column)
         if "voter_consensus" in self._oof.columns:
-            for level in self._oof["voter_consensus"].unique().sort().to_list():
-                if level is None:
-                    continue
-                slice_df = self._oof.filter(pl.col("voter_consensus") == level)
+            by_level = self._oof.drop_nulls("voter_consensus").partition_by(
+                "voter_consensus", as_dict=True, maintain_order=True,
+            )
+            for (level,), slice_df in sorted(by_level.items()):
                 label = f"consensus:{level}"
                 logger.debug("Computing profiles for %s (n=%d)", label, len(slice_df))
                 result.profiles[label] = self._compute_slice_profiles(slice_df)
@@ -166,10 +170,10 @@ class ConfidenceValidator:
 
             # Slice by voter count (how many voters participated)
             if "voter_count" in self._oof.columns:
-                for count in self._oof["voter_count"].unique().sort().to_list():
-                    if count is None:
-                        continue
-                    slice_df = self._oof.filter(pl.col("voter_count") == count)
+                by_count = self._oof.drop_nulls("voter_count").partition_by(
+                    "voter_count", as_dict=True, maintain_order=True,
+                )
+                for (count,), slice_df in sorted(by_count.items()):
                     label = f"voter_count:{count}"
                     logger.debug("Computing profiles for %s (n=%d)", label, len(slice_df))
                     result.profiles[label] = self._compute_slice_profiles(slice_df)
@@ -194,10 +198,7 @@ class ConfidenceValidator:
     def _compute_slice_profiles(self, df: pl.DataFrame) -> dict[str, ReliabilityProfile]:
         profiles: dict[str, ReliabilityProfile] = {}
         profiles["overall"] = compute_reliability_profile(df)
-        for bucket in df["prob_bucket"].unique().sort().to_list():
-            if bucket is None:
-                continue
-            bucket_df = df.filter(pl.col("prob_bucket") == bucket)
-            if len(bucket_df) >= 10:
-                profiles[bucket] = compute_reliability_profile(bucket_df)
+        profiles.update(
+            compute_reliability_profiles_by(df, "prob_bucket", min_matches=10)
+        )
         return profiles
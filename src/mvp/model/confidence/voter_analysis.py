@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 import numpy as np
 import polars as pl
 
-from mvp.model.confidence.metrics import ReliabilityProfile, compute_reliability_profile
+from mvp.model.confidence.metrics import ReliabilityProfile, compute_threshold_profiles
 
 logger = logging.getLogger(__name__)
 
@@ -150,21 +150,19 @@ def compute_coverage_curve(
         .alias("_agree_pct")
     )
 
-    for threshold in [100, 90, 80, 70, 60, 50]:
-        filtered = oof_df.filter(pl.col("_agree_pct") >= threshold)
-        n = len(filtered)
-        if n == 0:
+    thresholds = [100, 90, 80, 70, 60, 50]
+    by_threshold = compute_threshold_profiles(oof_df, "_agree_pct", thresholds)
+    for threshold in thresholds:
+        if threshold not in by_threshold:
             continue
-        coverage_pct = n / n_total * 100
-        profile = compute_reliability_profile(filtered)
+        n, profile = by_threshold[threshold]
         result.points.append(CoveragePoint(
             threshold_pct=threshold,
             n_matches=n,
-            coverage_pct=coverage_pct,
+            coverage_pct=n / n_total * 100,
             profile=profile,
         ))
 
-    # Clean up temp columns
     return result
 
 
@@ -302,21 +300,25 @@ def _threshold_metrics(
     df: pl.DataFrame, threshold: int, n_total: int
 ) -> tuple[float, float, float, float]:
     """Return (coverage_pct, accuracy, signed_cal, err80) at a consensus threshold."""
-    filtered = df.filter(pl.col("_agree_pct") >= threshold)
-    n = len(filtered)
-    if n == 0:
-        return (0.0, 0.0, 0.0, 0.0)
-    profile = compute_reliability_profile(filtered)
-    return (n / n_total * 100, profile.accuracy, profile.signed_cal, profile.err80)
+    return _threshold_metrics_series(df, "_agree_pct", threshold, n_total)
 
 
 def _threshold_metrics_series(
     df: pl.DataFrame, pct_col: str, threshold: int, n_total: int
 ) -> tuple[float, float, float, float]:
-    """Return (coverage_pct, accuracy, signed_cal, err80) using a custom pct column."""
-    filtered = df.filter(pl.col(pct_col) >= threshold)
-    n = len(filtered)
+    """Return (coverage_pct, accuracy, signed_cal, err80) using a custom pct column.
+
+    Only the three headline metrics are needed here, so they come straight from
+    masked sums rather than a full reliability profile.
+    """
+    pct = df[pct_col].cast(pl.Float64).to_numpy()
+    mask = pct >= threshold  # NaN (null consensus) never qualifies
+    n = int(mask.sum())
     if n == 0:
         return (0.0, 0.0, 0.0, 0.0)
-    profile = compute_reliability_profile(filtered)
-    return (n / n_total * 100, profile.accuracy, profile.signed_cal, profile.err80)
+    won = df["favored_won"].cast(pl.Float64).to_numpy()[mask]
+    prob = df["favored_prob"].cast(pl.Float64).to_numpy()[mask]
+    accuracy = float(won.mean())
+    high_conf = prob >= 0.80
+    err80 = 1.0 - float(won[high_conf].mean()) if high_conf.any() else 0.0
+    return (n / n_total * 100, accuracy, float(won.mean() - prob.mean()), err80)
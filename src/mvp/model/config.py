@@ -423,6 +423,47 @@ class EarlyStoppingConfig(_StrictModel):
     tail_fraction: float = 0.2
 
 
+class TuningConfig(_StrictModel):
+    """Optuna pruning for `mvp tune`. Off by default (``pruner: none``).
+
+    Trials report the objective after every tuning fold; with
+    ``round_checkpoints > 0`` boosted (xgboost) fits also report at that many
+    evenly-spaced boosting-round checkpoints inside each fold, so the pruner can
+    cut a bad configuration before its first fold finishes. ``min_resource`` and
+    ``reduction_factor`` are the successive-halving / Hyperband rung knobs, in
+    units of reported steps (folds, or fold checkpoints when enabled).
+
+    Read only by the tuner and the runner's pruning hook — not part of the
+    config fingerprint (it changes which trials finish, not what a trial fits).
+    """
+
+    pruner: Literal["none", "median", "successive_halving", "hyperband"] = "none"
+    min_resource: int = 1
+    reduction_factor: int = 3
+    round_checkpoints: int = 0
+
+    @field_validator("min_resource")
+    @classmethod
+    def validate_min_resource(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError(f"tuning.min_resource must be >= 1, got {v}")
+        return v
+
+    @field_validator("reduction_factor")
+    @classmethod
+    def validate_reduction_factor(cls, v: int) -> int:
+        if v < 2:
+            raise ValueError(f"tuning.reduction_factor must be >= 2, got {v}")
+        return v
+
+    @field_validator("round_checkpoints")
+    @classmethod
+    def validate_round_checkpoints(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError(f"tuning.round_checkpoints must be >= 0, got {v}")
+        return v
+
+
 class ExperimentConfig(_StrictModel):
     """Complete experiment configuration."""
 
@@ -437,6 +478,7 @@ class ExperimentConfig(_StrictModel):
     calibration: CalibrationConfig | None = None
     mtl: MTLConfig | None = None
     early_stopping: EarlyStoppingConfig | None = None
+    tuning: TuningConfig | None = None
 
     @model_validator(mode="after")
     def validate_features_required(self) -> "ExperimentConfig":
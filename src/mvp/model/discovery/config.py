@@ -72,6 +72,12 @@ class NullImportanceConfig(BaseModel):
     # of null runs whose importance >= the real importance is <= alpha.
     alpha: float = 0.05
     random_seed: int = 42
+    # Concurrent null fits on a process pool (the matrix is memory-mapped, not
+    # copied). None = auto: the run's thread budget split ~4 threads/fit, as the
+    # forward candidate loop does; 1 = serial in-process. Results-invariant —
+    # shuffles are drawn from the one seeded stream in run order — so it is not
+    # part of the screen-cache fingerprint.
+    n_workers: int | None = None
 
 
 class StabilitySelectionConfig(BaseModel):
@@ -156,6 +162,48 @@ class PoolPruningConfig(BaseModel):
     first_cut_round: int = 3
 
 
+class RacingConfig(BaseModel):
+    """Successive-halving fold racing for forward-selection candidates. Off by
+    default: omitting this block scores every candidate on every fold, as
+    before.
+
+    When on, each round first scores candidates on the leading
+    ``initial_folds`` folds, keeps the best ``keep_fraction`` (never fewer than
+    ``min_survivors``) and doubles the fold budget, until the survivors are few
+    enough to finish on all folds. Independently of the cut, a candidate is
+    dropped early once its paired per-fold deltas show it is clearly worse than
+    the stage leader, or clearly cannot clear ``min_delta`` over the current
+    set (mean delta beyond ``z`` standard errors). The round winner and every
+    recorded score come from the full-fold evaluation of the survivors, so the
+    acceptance rule and the score scale are unchanged.
+    """
+
+    enabled: bool = False
+    # Folds scored in the first stage (the leading folds, in fold order).
+    initial_folds: int = 2
+    # Fraction of the field advanced after each stage.
+    keep_fraction: float = 0.25
+    # Survivor floor: racing stops once the field is this small, and the
+    # remaining candidates are scored on all folds.
+    min_survivors: int = 8
+    # Standard errors on the paired per-fold delta before an early drop.
+    z: float = 2.0
+
+    @field_validator("initial_folds", "min_survivors")
+    @classmethod
+    def _positive(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError(f"must be >= 1, got {v}")
+        return v
+
+    @field_validator("keep_fraction")
+    @classmethod
+    def _fraction(cls, v: float) -> float:
+        if not 0.0 < v <= 1.0:
+            raise ValueError(f"keep_fraction must be in (0, 1], got {v}")
+        return v
+
+
 class DiscoveryOptions(BaseModel):
     """Discovery-specific options."""
 
@@ -195,6 +243,12 @@ class DiscoveryOptions(BaseModel):
     null_importance: NullImportanceConfig | None = None
     features: DiscoveryFeaturesConfig = DiscoveryFeaturesConfig()
     pool_pruning: PoolPruningConfig = PoolPruningConfig()
+    # Persistent per-fold subset-score memo (sqlite beside the feature cache).
+    # A hit is the exact score the fit produced, keyed by subset, model params,
+    # fold geometry and a data fingerprint — so resumed, repeated or overlapping
+    # fast-path runs skip known evaluations without changing any selection.
+    score_cache: bool = False
+    racing: RacingConfig = RacingConfig()
 
     @model_validator(mode="after")
     def _warn_direction_mismatch(self) -> "DiscoveryOptions":
@@ -16,6 +16,7 @@ import yaml
 from mvp.common.base_job import get_local_data_root
 from mvp.model.discovery.config import DiscoveryConfig
 from mvp.model.discovery.fast_selection import FastForwardSelector
+from mvp.model.discovery.score_cache import SCORE_CACHE_FILENAME, SubsetScoreCache
 from mvp.model.discovery.importance import compute_importance
 from mvp.model.discovery.segments import (
     SegmentImportanceResult,
@@ -275,6 +276,7 @@ class FeatureDiscovery:
         self.verbose = verbose
 
         self._experiment_count = 0
+        self._score_cache: SubsetScoreCache | None = None
 
     def _log(self, msg: str) -> None:
         """Log discovery progress."""
@@ -387,6 +389,21 @@ class FeatureDiscovery:
             )
         return workers, n_jobs
 
+    def _attach_score_cache(self, fast: FastForwardSelector) -> None:
+        """Give *fast* the persistent subset-score cache when enabled.
+
+        Lives beside the feature cache it is keyed against; call after
+        precompute() so the data fingerprint exists.
+        """
+        if not self.config.discovery.score_cache:
+            return
+        if self._score_cache is None:
+            self._score_cache = SubsetScoreCache(
+                fast.cache_dir / SCORE_CACHE_FILENAME
+            )
+            self._log(f"Subset-score cache: {self._score_cache.path}")
+        fast.score_cache = self._score_cache
+
     def _create_fast_scorer(
         self, all_features: list[str], metric: str | None = None,
         n_jobs: int | None = None,
@@ -431,6 +448,7 @@ class FeatureDiscovery:
         else:
             fast.precompute()
 
+        self._attach_score_cache(fast)
         return fast.create_scorer(target_metric, n_jobs=n_jobs)
 
     def _create_scorer(self, metric: str | None = None) -> callable:
@@ -559,6 +577,7 @@ class FeatureDiscovery:
             cache_dir=self.cache_dir,
         )
         fast.precompute()
+        self._attach_score_cache(fast)
 
         # PHASE 0: Null-importance pre-filter (optional) — shrink the pool that
         # stability selection then searches.
@@ -568,11 +587,17 @@ class FeatureDiscovery:
             ni_cache_dir = (
                 get_local_data_root() / "discovery" / "null_importance_cache"
             )
+            ni_workers, ni_n_jobs = resolve_candidate_parallelism(
+                (self.config.model.params or {}).get("n_jobs"), ni_cfg.n_workers,
+            )
+            ni_workers = min(ni_workers, ni_cfg.n_runs)
             ni_result = run_null_importance(
                 fast,
                 all_features=all_features,
                 config=ni_cfg,
                 cache_dir=ni_cache_dir,
+                n_workers=ni_workers,
+                n_jobs=ni_n_jobs if ni_workers > 1 else None,
             )
             self._log_null_importance_report(ni_result)
             self._null_importance_result = ni_result
@@ -774,6 +799,16 @@ class FeatureDiscovery:
                 f"from forward round {pruning.first_cut_round} on"
             )
 
+        # Fold racing (default off). Forward path only, like pool pruning; the
+        # selector warns and stays exhaustive if the scorer lacks score_folds.
+        racing = self.config.discovery.racing
+        if racing.enabled and method == "forward":
+            self._log(
+                f"fold racing: {racing.initial_folds} initial folds, keep "
+                f"{racing.keep_fraction:.0%}/stage (min {racing.min_survivors}), "
+                f"z={racing.z}"
+            )
+
         selector = FeatureSelector(
             scorer=scorer,
             all_features=all_features,
@@ -790,6 +825,7 @@ class FeatureDiscovery:
             round1_exclude=round1_exclude,
             bottom_cut_n=pruning.bottom_cut_n,
             first_cut_round=pruning.first_cut_round,
+            racing=racing,
         )
 
         # For BLAS-threaded models (the fit ignores n_jobs), cap each concurrent
@@ -817,6 +853,8 @@ class FeatureDiscovery:
             )
 
         self._log(f"Selected {len(result.selected_features)} features")
+        if self._score_cache is not None:
+            self._log(f"Subset-score cache: {self._score_cache.stats()}")
         for step in result.history:
             if step.get("action") == "add":
                 self._log(
@@ -11,8 +11,10 @@ import numpy as np
 import polars as pl
 from sklearn.linear_model import LogisticRegression
 
+from mvp.common.utils import hash_arrays
 from mvp.model.config import apply_filters
 from mvp.model.discovery.config import DiscoveryConfig
+from mvp.model.discovery.score_cache import SubsetScoreCache, score_context
 from mvp.model.completeness import is_incomplete_match
 from mvp.model.early_stopping import two_stage_fit
 from mvp.model.engine import check_memory, get_feature_columns, make_fs_engine
@@ -251,6 +253,12 @@ class FastForwardSelector:
         # of blanket median-filling. See _resolve_column_impute.
         self.fill_strategies: list[str] = []
         self.fill_constants: np.ndarray | None = None
+        # Persistent subset-score memo (see score_cache.py). None = every
+        # evaluation fits. data_fingerprint keys the cache to the exact matrix
+        # precompute() built: feature-cache key (matches data + feature code),
+        # column layout, and the target/weight/mask/date arrays.
+        self.score_cache: SubsetScoreCache | None = None
+        self.data_fingerprint: str | None = None
 
     def precompute(
         self,
@@ -685,6 +693,18 @@ class FastForwardSelector:
         if hasattr(splitter, "date_windows"):
             self.fold_windows = splitter.date_windows(df)
 
+        # Hashing X_wide itself would cost more than a fit on large pools; the
+        # feature-cache key already pins the matches data and feature code, and
+        # the row-aligned arrays pin which rows (and targets/weights) were kept.
+        self.data_fingerprint = hash_arrays(
+            np.frombuffer(
+                "\x1f".join([cache_key, *augmented_col_names]).encode(), np.uint8,
+            ),
+            np.asarray(self.X_wide.shape),
+            self.y, self.y_aux, self.sample_weights, self.eval_mask,
+            self.row_dates.astype("datetime64[D]").view(np.int64),
+        )
+
         logger.info("Precomputing per-fold medians for %d folds", len(self.folds))
         t0 = time.perf_counter()
         self.fold_medians = []
@@ -817,16 +837,49 @@ class FastForwardSelector:
         # asymmetric_logloss mirrors the training-side objective.
         metric_fn = _make_metric_fn(metric, lambda_over=model_params.get("lambda_over"))
 
-        def scorer(features: list[str]) -> float:
+        # Subset-score memo: the context covers every scorer input other than
+        # the subset, so a hit is exactly the score a fresh fit would produce.
+        # The fold index arrays stand in for the splitter config (and make
+        # stability's per-resample folds key separately).
+        score_cache = self.score_cache
+        context = None
+        if score_cache is not None:
+            context = score_context({
+                "data": self.data_fingerprint,
+                "metric": metric,
+                "model_type": model_type,
+                "model_params": model_params,
+                "mtl": self.config.mtl.model_dump() if is_mtl else None,
+                "early_stopping": es_cfg.model_dump() if es_enabled else None,
+                "validation": self.config.validation.model_dump(),
+                "folds": hash_arrays(*(a for pair in folds for a in pair)),
+                "fold_medians": hash_arrays(*fold_medians),
+                "fill": [fill_strategies, hash_arrays(fill_constants)],
+            })
+
+        def score_folds(
+            features: list[str], fold_ids: list[int] | None = None,
+        ) -> np.ndarray:
+            """Per-fold metric for *features* on ``fold_ids`` (default: all
+            folds), aligned to ``fold_ids``. NaN marks a fold whose test slice
+            was empty under eval_filters; inf marks an unscoreable subset."""
+            fold_ids = list(range(len(folds))) if fold_ids is None else list(fold_ids)
             if not features:
-                return float("inf")
+                return np.full(len(fold_ids), np.inf)
 
             try:
                 col_names = get_feature_columns(features)
                 col_indices = np.array([col_to_idx[c] for c in col_names])
             except KeyError as e:
                 logger.warning("Column lookup failed for %s: %s", features, e)
-                return float("inf")
+                return np.full(len(fold_ids), np.inf)
+
+            cached = (
+                score_cache.get(context, features, fold_ids)
+                if score_cache is not None else {}
+            )
+            if len(cached) == len(set(fold_ids)):
+                return np.array([cached[f] for f in fold_ids])
 
             # Partition selected columns by FS-time fill strategy so the inner
             # loop honors each feature's declared impute contract. A column
@@ -867,9 +920,13 @@ class FastForwardSelector:
                     feature_names=col_names,
                 )
 
-            fold_metrics = []
+            fold_metrics = np.full(len(fold_ids), np.nan)
             es_best_iters: list[int | None] = []
-            for fold_idx, (train_idx, test_idx) in enumerate(folds):
+            for slot, fold_idx in enumerate(fold_ids):
+                if fold_idx in cached:
+                    fold_metrics[slot] = cached[fold_idx]
+                    continue
+                train_idx, test_idx = folds[fold_idx]
                 # ES watch embargo anchors on the fold's TRUE test-window start —
                 # the raw pre-eval_mask test fold — so a restricted eval slice
                 # (e.g. finals-only, whose earliest date can fall later in the
@@ -990,11 +1047,11 @@ class FastForwardSelector:
                 # returns the primary head for the MTL model).
                 if is_mtl and mtl_select_on == "combined":
                     assert y_aux is not None
-                    fold_metrics.append(
-                        _compute_mtl_loss(model, X_test, y_test, y_aux[test_idx])
+                    fold_metrics[slot] = _compute_mtl_loss(
+                        model, X_test, y_test, y_aux[test_idx]
                     )
                 else:
-                    fold_metrics.append(metric_fn(y_test, y_prob))
+                    fold_metrics[slot] = metric_fn(y_test, y_prob)
 
             # One compact ES line per round (see _logged_es_rounds above). "fb"
             # marks a fold that fell back to fixed rounds (its own WARNING also
@@ -1010,11 +1067,26 @@ class FastForwardSelector:
                         "Round %d ES best_iteration/fold: [%s]", round_num, per_fold
                     )
 
-            if not fold_metrics:
+            if score_cache is not None:
+                score_cache.put(context, features, {
+                    f: float(m) for f, m in zip(fold_ids, fold_metrics)
+                    if f not in cached
+                })
+            return fold_metrics
+
+        def scorer(features: list[str]) -> float:
+            fold_metrics = score_folds(features)
+            scored = fold_metrics[~np.isnan(fold_metrics)]
+            if not scored.size:
                 # Every fold's test slice was empty under eval_filters.
                 return float("inf")
-            return float(np.mean(fold_metrics))
+            return float(np.mean(scored))
 
+        # Per-fold entry point for fold-racing forward selection (see
+        # FeatureSelector._race_candidates). Mean of a full score_folds() row is
+        # exactly scorer(), so raced and exhaustive rounds rank on one scale.
+        scorer.score_folds = score_folds
+        scorer.n_folds = len(folds)
         return scorer
 
     def resample_folds(
@@ -16,9 +16,13 @@ intended design rather than per-fold scoring.
 import hashlib
 import json
 import logging
+import multiprocessing
+import tempfile
 import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 import numpy as np
 
@@ -128,15 +132,51 @@ def _prepare_matrix(
     return X
 
 
+# Per-process state for pooled null fits, set once by _null_worker_init so the
+# design matrix crosses the process boundary as a memmap path, not per task.
+_WORKER: dict[str, Any] = {}
+
+
+def _null_worker_init(
+    x_path: str,
+    model_type: str,
+    params: dict,
+    col_names: list[str],
+    sample_weights: np.ndarray | None,
+) -> None:
+    _WORKER.update(
+        X=np.load(x_path, mmap_mode="r"),
+        model_type=model_type,
+        params=params,
+        col_names=col_names,
+        fit_kwargs=(
+            {"sample_weight": sample_weights} if sample_weights is not None else {}
+        ),
+    )
+
+
+def _null_worker_fit(y_shuf: np.ndarray) -> dict[str, float]:
+    """One shuffled-target fit in a pool worker; returns its gain importances."""
+    w = _WORKER
+    m = get_model(w["model_type"], w["params"], feature_names=w["col_names"])
+    m.fit(w["X"], y_shuf, **w["fit_kwargs"])
+    return gain_importance(m, w["col_names"])
+
+
 def _compute_screen(
     fast: FastForwardSelector,
     all_features: list[str],
     config: NullImportanceConfig,
+    n_workers: int = 1,
+    n_jobs: int | None = None,
 ) -> tuple[dict[str, float], dict[str, float], dict[str, float]]:
     """Run the real + shuffled-target fits; return per-spec (real, null_mean, p).
 
     This is the expensive part (n_runs + 1 full-width fits) that the cache in
-    run_null_importance exists to avoid re-running.
+    run_null_importance exists to avoid re-running. With ``n_workers > 1`` the
+    null fits run on a process pool (see _run_null_pool); ``n_jobs`` is then the
+    per-fit thread share. Either way the shuffles come from the one seeded
+    stream in run order, so worker count never changes the screen.
     """
     model_type = fast.config.model.type
     col_names = get_feature_columns(all_features)  # index-aligned to all_features
@@ -157,8 +197,9 @@ def _compute_screen(
 
     logger.info(
         "Null-importance: %d features × %d rows; fitting real model + %d "
-        "shuffled-target models (sequential)...",
+        "shuffled-target models (%s)...",
         len(col_names), X.shape[0], config.n_runs,
+        "sequential" if n_workers <= 1 else f"{n_workers} worker processes",
     )
     t0 = time.perf_counter()
     real_model = get_model(model_type, params, feature_names=col_names)
@@ -174,16 +215,17 @@ def _compute_screen(
     null_ge = {c: 0 for c in col_names}  # # null runs with importance >= real
     null_sum = {c: 0.0 for c in col_names}
     null_t0 = time.perf_counter()
-    for k in range(config.n_runs):
-        y_shuf = rng.permutation(y)
-        m = get_model(model_type, params, feature_names=col_names)
-        m.fit(X, y_shuf, **fit_kwargs)
-        ni = gain_importance(m, col_names)
+    done = 0
+
+    # Folded strictly in run order (the pool buffers early finishers), so the
+    # float sums are bit-identical to the sequential loop.
+    def _accumulate(ni: dict[str, float]) -> None:
+        nonlocal done
         for c in col_names:
             null_sum[c] += ni[c]
             if ni[c] >= real_imp[c]:
                 null_ge[c] += 1
-        done = k + 1
+        done += 1
         elapsed = time.perf_counter() - null_t0
         avg = elapsed / done
         eta = avg * (config.n_runs - done)
@@ -192,6 +234,21 @@ def _compute_screen(
             done, config.n_runs, avg, eta,
         )
 
+    if n_workers <= 1:
+        for _ in range(config.n_runs):
+            y_shuf = rng.permutation(y)
+            m = get_model(model_type, params, feature_names=col_names)
+            m.fit(X, y_shuf, **fit_kwargs)
+            _accumulate(gain_importance(m, col_names))
+    else:
+        pool_params = {**params, "n_jobs": int(n_jobs)} if n_jobs else params
+        _run_null_pool(
+            X, (rng.permutation(y) for _ in range(config.n_runs)),
+            n_workers=n_workers,
+            initargs=(model_type, pool_params, col_names, sw),
+            on_result=_accumulate,
+        )
+
     real_importance: dict[str, float] = {}
     null_mean: dict[str, float] = {}
     p_value: dict[str, float] = {}
@@ -202,12 +259,62 @@ def _compute_screen(
     return real_importance, null_mean, p_value
 
 
+def _run_null_pool(
+    X: np.ndarray,
+    shuffles,
+    *,
+    n_workers: int,
+    initargs: tuple,
+    on_result,
+) -> None:
+    """Fit the shuffled targets on a spawn-context process pool.
+
+    X is written once to a temporary ``.npy`` that every worker memory-maps, so
+    the matrix is neither pickled per task nor copied per worker. ``shuffles``
+    is consumed lazily with at most ``2 * n_workers`` runs in flight (bounds the
+    pending label copies); results reach ``on_result`` in run order. Spawn, not
+    fork: the parent has already run an OpenMP-threaded fit.
+    """
+    with tempfile.TemporaryDirectory(prefix="null_importance_") as tmp:
+        x_path = str(Path(tmp) / "X.npy")
+        np.save(x_path, np.ascontiguousarray(X))
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_null_worker_init,
+            initargs=(x_path, *initargs),
+        ) as ex:
+            pending: dict = {}
+            finished: dict[int, dict[str, float]] = {}
+            next_submit = next_emit = 0
+            it = iter(shuffles)
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < 2 * n_workers:
+                    y_shuf = next(it, None)
+                    if y_shuf is None:
+                        exhausted = True
+                        break
+                    pending[ex.submit(_null_worker_fit, y_shuf)] = next_submit
+                    next_submit += 1
+                if not pending:
+                    break
+                completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in completed:
+                    finished[pending.pop(fut)] = fut.result()
+                while next_emit in finished:
+                    on_result(finished.pop(next_emit))
+                    next_emit += 1
+
+
 def run_null_importance(
     fast: FastForwardSelector,
     *,
     all_features: list[str],
     config: NullImportanceConfig,
     cache_dir: Path | str | None = None,
+    n_workers: int = 1,
+    n_jobs: int | None = None,
 ) -> NullImportanceResult:
     """Screen the candidate pool against shuffled-target gain importance.
 
@@ -222,6 +329,8 @@ def run_null_importance(
         all_features: candidate feature specs to screen.
         config: null-importance configuration.
         cache_dir: directory for the screen cache. None disables caching.
+        n_workers: concurrent null fits (process pool). 1 = in-process serial.
+        n_jobs: per-fit thread share under the pool; None keeps model params.
 
     Returns:
         NullImportanceResult with kept/dropped specs and per-spec diagnostics.
@@ -249,7 +358,7 @@ def run_null_importance(
         p_value = cached["p_value"]
     else:
         real_importance, null_mean, p_value = _compute_screen(
-            fast, all_features, config
+            fast, all_features, config, n_workers=n_workers, n_jobs=n_jobs,
         )
         if cache_path is not None:
             _save_screen_cache(
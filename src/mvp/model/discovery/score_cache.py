@@ -0,0 +1,119 @@
+"""Persistent per-fold score cache for feature-subset evaluations.
+
+Forward selection, stability resamples and resumed runs re-score identical
+(subset, model, folds, data) combinations. Each fold's metric is stored under a
+content-addressed key — a *context* hash covering everything the scorer depends
+on besides the subset (model type/params, metric, fold index arrays, feature
+data fingerprint, ...) plus the sorted subset — so a repeat evaluation is a
+sqlite lookup instead of a fit. Per-fold rows (rather than one mean per subset)
+let fold racing's partial evaluations populate and reuse the cache too.
+
+The cache is a pure memo: a hit returns exactly what the fit produced, so it
+can never change which feature is selected. Anything that could change a score
+must enter the context hash; when in doubt, add it there.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SCORE_CACHE_FILENAME = "subset_scores.sqlite"
+
+
+def score_context(parts: dict[str, Any]) -> str:
+    """Hash a scorer's non-subset inputs into one context key.
+
+    Model params go through the fingerprint canonicalizer so operational knobs
+    (n_jobs) don't split the cache. Imported lazily: config_hash imports the
+    discovery package, which imports this module.
+    """
+    from mvp.common.config_hash import canonicalize_params, hash_dict
+
+    canon = dict(parts)
+    if "model_params" in canon:
+        canon["model_params"] = canonicalize_params(canon["model_params"])
+    return hash_dict(canon)
+
+
+def _subset_key(features: list[str]) -> str:
+    return hashlib.sha256("\n".join(sorted(features)).encode()).hexdigest()
+
+
+class SubsetScoreCache:
+    """sqlite-backed ``(context, sorted subset, fold) -> metric`` store.
+
+    Safe to share across the candidate thread pool: one connection guarded by
+    a lock (lookups and inserts are tiny next to a fit). NaN — a fold whose
+    eval slice was empty — round-trips through sqlite NULL.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS fold_scores ("
+            " context TEXT NOT NULL, subset TEXT NOT NULL, fold INTEGER NOT NULL,"
+            " metric REAL, PRIMARY KEY (context, subset, fold))"
+        )
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self, context: str, features: list[str], fold_ids: list[int],
+    ) -> dict[int, float]:
+        """Cached metrics for the requested folds (absent folds omitted)."""
+        if not fold_ids:
+            return {}
+        placeholders = ",".join("?" * len(fold_ids))
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT fold, metric FROM fold_scores WHERE context = ? AND "
+                f"subset = ? AND fold IN ({placeholders})",
+                (context, _subset_key(features), *fold_ids),
+            ).fetchall()
+            self.hits += len(rows)
+            self.misses += len(fold_ids) - len(rows)
+        return {
+            int(fold): float("nan") if metric is None else float(metric)
+            for fold, metric in rows
+        }
+
+    def put(
+        self, context: str, features: list[str], scores: dict[int, float],
+    ) -> None:
+        """Record freshly computed fold metrics. Best-effort: never fatal."""
+        if not scores:
+            return
+        subset = _subset_key(features)
+        rows = [
+            (context, subset, int(fold), None if np.isnan(m) else float(m))
+            for fold, m in scores.items()
+        ]
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO fold_scores VALUES (?, ?, ?, ?)", rows,
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("Failed to write subset scores to %s: %s", self.path, e)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> str:
+        total = self.hits + self.misses
+        pct = 100.0 * self.hits / total if total else 0.0
+        return f"{self.hits}/{total} fold scores from cache ({pct:.0f}%)"
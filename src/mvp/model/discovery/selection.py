@@ -18,6 +18,7 @@ from mvp.model.discovery.checkpoint import (
     load_checkpoint,
     save_checkpoint,
 )
+from mvp.model.discovery.config import RacingConfig
 from mvp.model.metrics import fs_display_precision
 
 logger = logging.getLogger(__name__)
@@ -151,6 +152,7 @@ class FeatureSelector:
         round1_exclude: set[str] | None = None,
         bottom_cut_n: int | None = None,
         first_cut_round: int = 3,
+        racing: RacingConfig | None = None,
     ) -> None:
         """Initialize selector.
 
@@ -171,6 +173,9 @@ class FeatureSelector:
                 the best candidate must achieve over the current metric to be
                 accepted. 0.0 (default) preserves prior behavior — any strict
                 improvement passes.
+            racing: Optional fold-racing config for forward selection. Needs a
+                scorer exposing ``score_folds``/``n_folds`` (the fast scorer);
+                any other scorer falls back to exhaustive scoring.
         """
         self.scorer = scorer
         self.all_features = list(all_features)
@@ -200,6 +205,15 @@ class FeatureSelector:
         self.bottom_cut_n = bottom_cut_n
         self.first_cut_round = first_cut_round
         self._pruned_features: set[str] = set()
+        # Fold racing (default off). Only honoured when the scorer can score a
+        # fold subset; otherwise every round is exhaustive, as before.
+        self.racing = racing if racing is not None and racing.enabled else None
+        if self.racing is not None and not hasattr(scorer, "score_folds"):
+            logger.warning(
+                "Fold racing requested but the scorer has no per-fold entry "
+                "point; scoring every candidate on every fold."
+            )
+            self.racing = None
 
     def _fmt_metric(self, value: float) -> str:
         """Format a metric value at the min_delta-scaled display precision."""
@@ -410,7 +424,19 @@ class FeatureSelector:
                         best=self._fmt_metric(metric), feat=feat, refresh=False
                     )
 
-            if workers == 1:
+            # Fold racing: the race narrows the field on fold subsets, and only
+            # its survivors' full-fold scores reach _record — so the winner
+            # reduction, the checkpoint and the ranking below see the same
+            # full-fold scale as an exhaustive round. Too small a field to race
+            # falls through to the exhaustive loop.
+            raced_out: list[tuple[str, float, int]] = []
+            if self.racing is not None and len(to_eval) > self.racing.min_survivors:
+                full_scores, raced_out = self._race_candidates(
+                    selected, to_eval, workers, round_num,
+                )
+                for feat in sorted(full_scores):
+                    _record(feat, full_scores[feat])
+            elif workers == 1:
                 bar = tqdm(to_eval, desc=desc, leave=False, ncols=120)
                 for feature in bar:
                     feat, metric = _eval(feature)
@@ -495,6 +521,7 @@ class FeatureSelector:
                         round_results, key=lambda x: x[1],
                         reverse=self.direction == "maximize",
                     ),
+                    **({"raced_out": raced_out} if raced_out else {}),
                 })
                 break
 
@@ -526,6 +553,7 @@ class FeatureSelector:
                 "feature": best_feature,
                 "metric": best_metric,
                 "ranking": sorted_results,
+                **({"raced_out": raced_out} if raced_out else {}),
             })
 
             # Bottom-cut: from the warmup round on, permanently drop the N
@@ -533,10 +561,13 @@ class FeatureSelector:
             # so the tail is worst; the winner is already out of `remaining`, so
             # intersecting with it can never re-admit the winner (base seeds are
             # never scored, so they can't land here either). Persisted via
-            # _pruned_features so resume does not resurrect them.
+            # _pruned_features so resume does not resurrect them. Raced-out
+            # candidates rank below every full-fold survivor (best-first among
+            # themselves), so under racing the tail is drawn from them first.
             if self.bottom_cut_n and round_num >= self.first_cut_round:
                 n = self.bottom_cut_n
-                bottom = {f for f, _ in sorted_results[-n:]}
+                cut_order = sorted_results + [(f, m) for f, m, _ in raced_out]
+                bottom = {f for f, _ in cut_order[-n:]}
                 newly = remaining & bottom
                 # Skip the cut if it would leave fewer than one more cut's worth
                 # of survivors (belt-and-suspenders; FS converges well before the
@@ -616,6 +647,139 @@ class FeatureSelector:
             pruned_features=sorted(self._pruned_features),
         )
 
+    def _race_dominated(
+        self, cand: np.ndarray, ref: np.ndarray, threshold: float,
+    ) -> bool:
+        """True when the paired per-fold loss deltas ``cand - ref`` sit above
+        *threshold* by more than ``z`` standard errors (needs >= 2 folds)."""
+        assert self.racing is not None
+        d = cand - ref
+        d = d[np.isfinite(d)]
+        if d.size < 2:
+            return False
+        se = float(np.std(d, ddof=1)) / np.sqrt(d.size)
+        return float(np.mean(d)) - self.racing.z * se > threshold
+
+    def _race_candidates(
+        self,
+        selected: list[str],
+        candidates: list[str],
+        workers: int,
+        round_num: int,
+    ) -> tuple[dict[str, float], list[tuple[str, float, int]]]:
+        """Successive-halving fold race over one forward round's candidates.
+
+        Returns the survivors' full-fold scores (the same mean ``self.scorer``
+        would return) and the raced-out candidates as
+        ``(feature, partial_mean, n_folds_scored)``, best-first. A candidate
+        whose scorer call raises is skipped, as in the exhaustive loop.
+        """
+        from tqdm import tqdm
+
+        cfg = self.racing
+        assert cfg is not None
+        score_folds = self.scorer.score_folds  # type: ignore[attr-defined]
+        n_folds: int = self.scorer.n_folds  # type: ignore[attr-defined]
+        # Losses are oriented lower-is-better so one comparison serves both
+        # directions; reported scores are flipped back.
+        sign = 1.0 if self.direction == "minimize" else -1.0
+
+        def _mean(row: np.ndarray) -> float:
+            scored = row[~np.isnan(row)]
+            return float(np.mean(scored)) if scored.size else float("inf")
+
+        # Per-fold loss of the current set, for the "cannot clear min_delta"
+        # rule. Off in a genuine round 1 (nothing selected to compare against).
+        base_loss: np.ndarray | None = None
+        if selected:
+            try:
+                base_loss = sign * np.asarray(score_folds(selected), dtype=float)
+            except Exception as e:  # noqa: BLE001 — the rule is an optimization
+                logger.warning("Race baseline scoring failed: %s", e)
+
+        rows = {f: np.full(n_folds, np.nan) for f in candidates}
+        alive = list(candidates)
+        raced_out: list[tuple[str, float, int]] = []
+        done = 0
+        budget = min(cfg.initial_folds, n_folds)
+        fits = 0
+
+        def _eval(feat: str, fold_ids: list[int]) -> tuple[str, np.ndarray | None]:
+            try:
+                return feat, np.asarray(
+                    score_folds(selected + [feat], fold_ids), dtype=float
+                )
+            except Exception as e:  # noqa: BLE001 — match serial skip-on-error
+                logger.warning("Scorer failed for %s: %s", feat, e)
+                return feat, None
+
+        while True:
+            fold_ids = list(range(done, budget))
+            desc = f"Round {round_num} race {budget}/{n_folds} folds"
+            results: list[tuple[str, np.ndarray | None]] = []
+            if workers == 1:
+                for feat in tqdm(alive, desc=desc, leave=False, ncols=120):
+                    results.append(_eval(feat, fold_ids))
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as ex:
+                    futures = [ex.submit(_eval, f, fold_ids) for f in alive]
+                    for fut in tqdm(
+                        as_completed(futures), total=len(futures),
+                        desc=f"{desc} (x{workers})", leave=False, ncols=120,
+                    ):
+                        results.append(fut.result())
+            failed = set()
+            for feat, vals in results:
+                if vals is None:
+                    failed.add(feat)
+                else:
+                    rows[feat][done:budget] = vals
+            fits += len(alive) * len(fold_ids)
+            alive = [f for f in alive if f not in failed]
+            done = budget
+            if done >= n_folds or not alive:
+                break
+
+            # Rank on the shared partial budget (ties by name, so the cut is
+            # independent of completion order), keep the top fraction, then
+            # drop any kept candidate the paired-delta rule already rules out.
+            loss = {f: _mean(sign * rows[f][:done]) for f in alive}
+            ordered = sorted(alive, key=lambda f: (loss[f], f))
+            leader = ordered[0]
+            keep_n = max(
+                cfg.min_survivors, int(np.ceil(cfg.keep_fraction * len(ordered)))
+            )
+            dropped = ordered[keep_n:]
+            kept = [leader]
+            for f in ordered[1:keep_n]:
+                part = sign * rows[f][:done]
+                if self._race_dominated(part, sign * rows[leader][:done], 0.0) or (
+                    base_loss is not None
+                    and self._race_dominated(part, base_loss[:done], -self.min_delta)
+                ):
+                    dropped.append(f)
+                else:
+                    kept.append(f)
+            # Later stages were outscored with more evidence: list them first.
+            raced_out[:0] = [
+                (f, sign * loss[f], done)
+                for f in sorted(dropped, key=lambda f: (loss[f], f))
+            ]
+            alive = kept
+            # Small enough field: finish everyone on every fold next stage.
+            budget = (
+                n_folds if len(alive) <= cfg.min_survivors
+                else min(n_folds, budget * 2)
+            )
+
+        full = len(candidates) * n_folds
+        logger.info(
+            "  Round %d race: %d -> %d candidates, %d/%d fold fits (%.0f%%)",
+            round_num, len(candidates), len(alive), fits, full,
+            100.0 * fits / full if full else 0.0,
+        )
+        return {f: _mean(rows[f]) for f in alive}, raced_out
+
     def _write_checkpoint(
         self,
         path: Path,
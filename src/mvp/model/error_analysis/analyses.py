@@ -17,7 +17,7 @@ of picks (same player appears in many picks).
 from __future__ import annotations
 
 import logging
-from typing import Sequence
+from collections.abc import Sequence
 
 import numpy as np
 import polars as pl
@@ -131,6 +131,11 @@ def _decile_edges(edges: np.ndarray, bucket: int, is_categorical: bool = False)
     return (float(edges[bucket - 1]), float(edges[bucket]))
 
 
+# Cap on (iterations x players) cells materialised per bootstrap chunk, so the
+# resample-count matrix stays a few tens of MB however large the pick set.
+_BOOTSTRAP_CHUNK_CELLS = 4_000_000
+
+
 def _player_level_bootstrap_ci(
     player_ids: np.ndarray,
     values: np.ndarray,
@@ -147,6 +152,12 @@ def _player_level_bootstrap_ci(
 
     This preserves within-player correlation (same player in many picks).
     Pick-level bootstrap would treat each pick as independent → too narrow.
+
+    The mean is additive, so it is computed from per-player sufficient
+    statistics (pick count and value sum): each iteration's draw becomes a row
+    of per-player resample counts, and all resampled means fall out of two
+    matrix-vector products per chunk of iterations, whose draws are one
+    ``rng.integers`` call.
     """
     if len(values) == 0:
         return (float("nan"), float("nan"))
@@ -155,17 +166,22 @@ def _player_level_bootstrap_ci(
     n_players = len(unique_players)
     if n_players == 0:
         return (float("nan"), float("nan"))
-    # Index picks by player
-    player_to_picks: dict[int, np.ndarray] = {
-        i: np.where(player_indices == i)[0] for i in range(n_players)
-    }
+
+    values = np.asarray(values, dtype=np.float64)
+    pick_count = np.bincount(player_indices, minlength=n_players).astype(np.float64)
+    value_sum = np.bincount(player_indices, weights=values, minlength=n_players)
     means = np.empty(n_iterations, dtype=np.float64)
-    for it in range(n_iterations):
-        sampled_players = rng.integers(0, n_players, size=n_players)
-        sampled_idx = np.concatenate(
-            [player_to_picks[p] for p in sampled_players]
-        )
-        means[it] = float(np.mean(values[sampled_idx]))
+    chunk = max(1, _BOOTSTRAP_CHUNK_CELLS // n_players)
+    for start in range(0, n_iterations, chunk):
+        stop = min(start + chunk, n_iterations)
+        draws = rng.integers(0, n_players, size=(stop - start, n_players))
+        # Row r's per-player resample counts (multinomial weights).
+        offsets = draws + (np.arange(stop - start) * n_players)[:, None]
+        counts = np.bincount(
+            offsets.ravel(), minlength=(stop - start) * n_players,
+        ).reshape(stop - start, n_players).astype(np.float64)
+        means[start:stop] = (counts @ value_sum) / (counts @ pick_count)
+
     alpha = (1 - confidence) / 2
     lo = float(np.quantile(means, alpha))
     hi = float(np.quantile(means, 1 - alpha))
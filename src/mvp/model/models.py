@@ -297,6 +297,7 @@ class XGBoostModel(BaseModel):
         eval_set: list[tuple[np.ndarray, np.ndarray]] | None = None,
         early_stopping_rounds: int | None = 10,
         eval_metric: Any | None = None,
+        callbacks: list[Any] | None = None,
     ) -> None:
         import xgboost as xgb
 
@@ -329,7 +330,14 @@ class XGBoostModel(BaseModel):
             fit_kwargs["verbose"] = False
             if early_stopping_rounds is not None:
                 self._model.set_params(early_stopping_rounds=early_stopping_rounds)
+        if callbacks:
+            self._model.set_params(callbacks=callbacks)
         self._model.fit(X, y, **fit_kwargs)
+        # Training callbacks (the tuner's round-checkpoint pruner) hold the test
+        # fold and the Optuna trial; drop them so they never ride along when the
+        # fitted model is pickled.
+        if callbacks:
+            self._model.set_params(callbacks=None)
 
     @property
     def best_iteration(self) -> int | None:
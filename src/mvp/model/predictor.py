@@ -102,12 +102,16 @@ class ProductionPredictor:
         predictions_path: Path | str = PREDICTIONS_PATH,
         *,
         target_section: str = "winner",
+        shared_features: pl.DataFrame | None = None,
     ) -> None:
         self.production_config_path = Path(production_config_path)
         self.matches_path = Path(matches_path)
         self.cache_dir = Path(cache_dir)
         self.predictions_path = Path(predictions_path)
         self.target_section = target_section
+        # Precomputed full-history frame covering feature_request() (backtest
+        # folds share one); None computes per call as live serving does.
+        self._shared_features = shared_features
 
         with open(self.production_config_path) as f:
             raw_config: dict[str, Any] = yaml.safe_load(f)
@@ -131,6 +135,15 @@ class ProductionPredictor:
         self._experiment_config = ExperimentConfig.from_file(
             self.config["active"]["config"]
         )
+        # Feature columns the shared frame carries for *other* requests; each
+        # call drops the ones it didn't ask for so it sees what a fresh
+        # engine.compute would have returned (confidence modifiers key on
+        # column presence).
+        self._shared_feature_cols: set[str] = (
+            set(get_feature_columns(self.feature_request(include_features=True)[0]))
+            if shared_features is not None
+            else set()
+        )
 
     @property
     def target(self) -> str:
@@ -373,25 +386,17 @@ class ProductionPredictor:
             assert config.features is not None
             return config, config.features.include, None
 
-    def _train_single(self, entry: dict) -> None:
-        """Train a single model from an entry dict and save its artifact.
-
-        Args:
-            entry: Dict with keys config, artifact, train_date_range, filters.
-        """
-        config, feature_specs, base_model_specs = self._resolve_entry_features(entry)
-        is_ensemble = config.model.type == "ensemble"
-        engine = FeatureEngine(
-            matches_path=self.matches_path, cache_dir=self.cache_dir
-        )
-
+    def _train_request(
+        self, config: ExperimentConfig, feature_specs: list[str], filters: Any,
+    ) -> tuple[list[str], list[str]]:
+        """(specs, extra columns) `_train_single` computes for one entry."""
         # Compute features (include compute_only and filter-referenced features)
         compute_only = (
             config.features.compute_only
             if config.features and config.features.compute_only
             else []
         )
-        filter_specs = get_filter_feature_specs(entry.get("filters"))
+        filter_specs = get_filter_feature_specs(filters)
         extra = compute_only + filter_specs
         all_specs = feature_specs + [s for s in extra if s not in feature_specs]
         # MTL: aux target derivation reads raw matches.parquet columns directly.
@@ -434,7 +439,72 @@ class ProductionPredictor:
             for col in config.sample_weight.referenced_columns():
                 if col not in extra_cols_eff:
                     extra_cols_eff.append(col)
-        df = engine.compute(all_specs, extra_columns=extra_cols_eff)
+        return all_specs, extra_cols_eff
+
+    def _compute_features(
+        self, specs: list[str], extra_columns: list[str],
+    ) -> pl.DataFrame:
+        """Full-history feature frame for `specs` plus `extra_columns`.
+
+        Served from the shared frame when one was supplied and it carries every
+        requested feature column; otherwise computed by a fresh FeatureEngine.
+        """
+        shared = self._shared_features
+        if shared is not None:
+            wanted = get_feature_columns(specs)
+            missing = [c for c in wanted if c not in shared.columns]
+            if not missing:
+                unwanted = self._shared_feature_cols - set(wanted) - set(extra_columns)
+                return shared.drop([c for c in shared.columns if c in unwanted])
+            logger.warning(
+                "Shared feature frame lacks %d column(s) (%s); computing",
+                len(missing), ", ".join(missing[:3]),
+            )
+        engine = FeatureEngine(
+            matches_path=self.matches_path, cache_dir=self.cache_dir
+        )
+        return engine.compute(specs, extra_columns=extra_columns)
+
+    def feature_request(
+        self, *, include_features: bool = False,
+    ) -> tuple[list[str], list[str]]:
+        """Union of the (specs, extra columns) that training the active model,
+        training every voter, and `predict` / `predict_voters` will request.
+
+        Computing this once gives a frame every call can share via
+        ``shared_features``. Voters are requested both as trained (their entry
+        filters) and as scored (scoped config filters).
+        """
+        specs: list[str] = []
+        columns: list[str] = []
+
+        def _add(request: tuple[list[str], list[str]]) -> None:
+            specs.extend(s for s in request[0] if s not in specs)
+            columns.extend(c for c in request[1] if c not in columns)
+
+        active = self.config["active"]
+        config, feature_specs, _ = self._resolve_entry_features(active)
+        _add(self._train_request(config, feature_specs, active.get("filters")))
+        _add(self._predict_request(include_features=include_features))
+        for voter in self.config.get("voters", []):
+            config, feature_specs, _ = self._resolve_entry_features(voter)
+            _add(self._train_request(config, feature_specs, voter.get("filters")))
+            _add(self._train_request(config, feature_specs, config.data.filters))
+            _add(self._raw_request(config, feature_specs, scoped=True))
+        return specs, columns
+
+    def _train_single(self, entry: dict) -> None:
+        """Train a single model from an entry dict and save its artifact.
+
+        Args:
+            entry: Dict with keys config, artifact, train_date_range, filters.
+        """
+        config, feature_specs, base_model_specs = self._resolve_entry_features(entry)
+        is_ensemble = config.model.type == "ensemble"
+        all_specs, extra_cols_eff = self._train_request(
+            config, feature_specs, entry.get("filters")
+        )
+        df = self._compute_features(all_specs, extra_cols_eff)
 
         # Apply training filters
         train_range = entry["train_date_range"]
@@ -1046,6 +1116,22 @@ class ProductionPredictor:
             raise FileNotFoundError(f"No trained model at {artifact_path}")
         return joblib.load(artifact_path)
 
+    def _raw_request(
+        self, config: ExperimentConfig, feature_specs: list[str], *, scoped: bool,
+    ) -> tuple[list[str], list[str]]:
+        """(specs, extra columns) `_predict_raw` computes for one voter."""
+        # Include filter-referenced features so scoping can evaluate filter
+        # columns (e.g., player_elo_surface_diff)
+        compute_only = (
+            config.features.compute_only
+            if config.features and config.features.compute_only
+            else []
+        )
+        filter_specs = get_filter_feature_specs(config.data.filters) if scoped else []
+        extra = compute_only + filter_specs
+        all_specs = feature_specs + [s for s in extra if s not in feature_specs]
+        return all_specs, list(_PREDICTOR_EXTRA_COLS)
+
     def _predict_raw(
         self,
         entry: dict,
@@ -1064,33 +1150,31 @@ class ProductionPredictor:
 
         Returns {match_uid: p1_win_prob}.
         """
-        artifact = self._load_single(entry)
-        model = artifact["model"]
-        feature_cols = artifact["feature_cols"]
-        calibrator = artifact.get("calibrator")
         config, feature_specs, _ = self._resolve_entry_features(entry)
-        engine = FeatureEngine(
-            matches_path=self.matches_path, cache_dir=self.cache_dir
+        df = self._compute_features(
+            *self._raw_request(config, feature_specs, scoped=scoped)
         )
-
-        # Compute features — include filter-referenced features so scoping
-        # can evaluate filter columns (e.g., player_elo_surface_diff)
-        compute_only = (
-            config.features.compute_only
-            if config.features and config.features.compute_only
-            else []
+        pending = self._pending_rows(
+            df, tournament_keys, match_uids, include_settled=include_settled
         )
-        filter_specs = get_filter_feature_specs(config.data.filters) if scoped else []
-        extra = compute_only + filter_specs
-        all_specs = feature_specs + [s for s in extra if s not in feature_specs]
-        df = engine.compute(all_specs, extra_columns=_PREDICTOR_EXTRA_COLS)
+        if len(pending) == 0:
+            return {}
+        scored = self._score_pending(entry, config, pending, scoped=scoped)
+        return dict(zip(scored["match_uid"].to_list(), scored["prob"].to_list()))
 
-        # Determine in-scope match UIDs for scoped voters
-        in_scope_uids: set[str] | None = None
-        if scoped and config.data.filters:
-            scoped_df = apply_filters(df, config.data.filters)
-            in_scope_uids = set(scoped_df["match_uid"].unique().to_list())
+    @staticmethod
+    def _pending_rows(
+        df: pl.DataFrame,
+        tournament_keys: list[tuple[str, int]] | None,
+        match_uids: set[str],
+        *,
+        include_settled: bool,
+    ) -> pl.DataFrame:
+        """Both orientations of the production-set rows `_score_pending` scores.
 
+        Tournament-scoped, restricted to match_uids (pending only unless
+        include_settled) and tagged with ``_is_canonical``.
+        """
         # Scope to tournaments
         if tournament_keys is not None:
             keys_df = pl.DataFrame(
@@ -1102,38 +1186,56 @@ class ProductionPredictor:
             ).join(keys_df, on=["tournament_id", "_year"], how="semi").drop("_year")
 
         # Keep matches in the production set (pending only, unless include_settled)
-        if include_settled:
-            pending = df.filter(pl.col("match_uid").is_in(list(match_uids)))
-        else:
-            pending = df.filter(
-                pl.col("won").is_null() & pl.col("match_uid").is_in(list(match_uids))
-            )
+        in_set = pl.col("match_uid").is_in(list(match_uids))
+        if not include_settled:
+            in_set = pl.col("won").is_null() & in_set
+        pending = df.filter(in_set)
 
-        if len(pending) == 0:
-            return {}
-
-        # Deduplicate to canonical row per match
         if "draw_p1_id" in pending.columns:
-            pending = pending.with_columns(
+            return pending.with_columns(
                 pl.when(pl.col("draw_p1_id").is_not_null())
                 .then(pl.col("player_id") == pl.col("draw_p1_id"))
                 .otherwise(pl.col("player_id") < pl.col("opp_id"))
                 .alias("_is_canonical")
             )
-        else:
-            pending = pending.with_columns(
-                (pl.col("player_id") < pl.col("opp_id")).alias("_is_canonical")
-            )
-        canonical = pending.filter(pl.col("_is_canonical"))
-        non_canonical = pending.filter(~pl.col("_is_canonical"))
+        return pending.with_columns(
+            (pl.col("player_id") < pl.col("opp_id")).alias("_is_canonical")
+        )
 
-        if len(non_canonical) > 0:
-            seen_uids = set(canonical["match_uid"].to_list())
-            missing = non_canonical.filter(
-                ~pl.col("match_uid").is_in(list(seen_uids))
-            )
-            if len(missing) > 0:
-                canonical = pl.concat([canonical, missing], how="diagonal_relaxed")
+    def _score_pending(
+        self,
+        entry: dict,
+        config: ExperimentConfig,
+        pending: pl.DataFrame,
+        *,
+        scoped: bool,
+    ) -> pl.DataFrame:
+        """Score `_pending_rows` output with one entry's artifact.
+
+        ``pending`` may carry other voters' feature columns too; the design
+        matrix selects this artifact's columns by name. Returns one
+        (match_uid, prob) row per in-scope match, prob in p1 orientation.
+        """
+        artifact = self._load_single(entry)
+        model = artifact["model"]
+        feature_cols = artifact["feature_cols"]
+        calibrator = artifact.get("calibrator")
+
+        # Scoped voters only vote on matches within their training domain. A
+        # match is in scope when either orientation passes the filters.
+        in_scope: list[str] | None = None
+        if scoped and config.data.filters:
+            scoped_df = apply_filters(pending, config.data.filters)
+            in_scope = scoped_df["match_uid"].unique().to_list()
+
+        # Deduplicate to canonical row per match
+        canonical = pending.filter(pl.col("_is_canonical"))
+        seen_uids = canonical["match_uid"].to_list()
+        missing = pending.filter(
+            ~pl.col("_is_canonical") & ~pl.col("match_uid").is_in(seen_uids)
+        )
+        if len(missing) > 0:
+            canonical = pl.concat([canonical, missing], how="diagonal_relaxed")
 
         # Predict
         aux_cols = artifact.get("aux_base_col_names", [])
@@ -1175,20 +1277,16 @@ class ProductionPredictor:
 
         # For non-canonical rows that were included, flip the prob (winner only;
         # deciding_set prob is symmetric — no flip needed)
-        is_deciding_set = self.target == "deciding_set"
-        result: dict[str, float] = {}
-        for i, row in enumerate(canonical.iter_rows(named=True)):
-            uid = row["match_uid"]
-            # Scoped voters skip matches outside their training domain
-            if in_scope_uids is not None and uid not in in_scope_uids:
-                continue
-            p = float(probs[i])
-            is_canonical = row["_is_canonical"]
-            if not is_canonical and not is_deciding_set:
-                p = 1.0 - p
-            result[uid] = p
-
-        return result
+        prob = pl.col("prob")
+        if self.target != "deciding_set":
+            prob = pl.when(pl.col("_is_canonical")).then(prob).otherwise(1.0 - prob)
+        scored = canonical.select(
+            "match_uid", "_is_canonical",
+            pl.Series("prob", np.asarray(probs, dtype=np.float64)),
+        ).select("match_uid", prob.alias("prob"))
+        if in_scope is not None:
+            scored = scored.filter(pl.col("match_uid").is_in(in_scope))
+        return scored
 
     def train_voters(self) -> int:
         """Train all voter models using each config's native filters."""
@@ -1238,47 +1336,77 @@ class ProductionPredictor:
 
         match_uids = set(predictions["match_uid"].to_list())
 
-        # Production binary pick per match
-        is_ds = self.target == "deciding_set"
-        prob_col = "deciding_set_prob" if is_ds else "p1_win_prob"
-        prod_picks: dict[str, bool] = {}
-        for row in predictions.iter_rows(named=True):
-            prod_picks[row["match_uid"]] = row[prob_col] >= 0.5
-
-        # Collect voter picks (scoped voters will have fewer UIDs)
-        voter_picks: list[dict[str, bool]] = []
+        # One engine pass over the union of every voter's specs; each voter
+        # then selects its own design-matrix columns from the shared rows.
+        resolved = []
+        specs: list[str] = []
+        columns: list[str] = []
         for voter in voters:
+            config, feature_specs, _ = self._resolve_entry_features(voter)
             is_scoped = voter.get("scoped", False)
-            raw = self._predict_raw(
-                voter,
-                tournament_keys,
-                match_uids,
-                scoped=is_scoped,
-                include_settled=include_settled,
+            request = self._raw_request(config, feature_specs, scoped=is_scoped)
+            specs.extend(s for s in request[0] if s not in specs)
+            columns.extend(c for c in request[1] if c not in columns)
+            resolved.append((voter, config, is_scoped))
+        pending = self._pending_rows(
+            self._compute_features(specs, columns),
+            tournament_keys,
+            match_uids,
+            include_settled=include_settled,
+        )
+
+        # Production binary pick per match; voters count when present (scoped
+        # voters will have fewer UIDs) and agree when their pick matches it.
+        is_ds = self.target == "deciding_set"
+        prob_col = "deciding_set_prob" if is_ds else "p1_win_prob"
+        prod_pick = pl.col(prob_col) >= 0.5
+        total = pl.lit(1, dtype=pl.Int64)  # production always counts
+        agree = pl.lit(1, dtype=pl.Int64)  # production always agrees with itself
+        result = predictions
+        for i, (voter, config, is_scoped) in enumerate(resolved):
+            pick = f"_voter_{i}"
+            scored = (
+                self._score_pending(voter, config, pending, scoped=is_scoped)
+                if len(pending) > 0
+                else pl.DataFrame(schema={"match_uid": pl.String, "prob": pl.Float64})
             )
-            picks = {uid: prob >= 0.5 for uid, prob in raw.items()}
-            voter_picks.append(picks)
-
-        # Build consensus (decimal) and voter_count
-        consensus_values: list[float] = []
-        voter_count_values: list[int] = []
-        for row in predictions.iter_rows(named=True):
-            uid = row["match_uid"]
-            prod_pick = prod_picks[uid]
-            total = 1  # production always counts
-            agree = 1  # production always agrees with itself
-            for picks in voter_picks:
-                if uid in picks:
-                    total += 1
-                    if picks[uid] == prod_pick:
-                        agree += 1
-            consensus_values.append(round(agree / total, 2))
-            voter_count_values.append(total)
-
-        return predictions.with_columns(
-            pl.Series("consensus", consensus_values),
-            pl.Series("voter_count", voter_count_values),
+            result = result.join(
+                scored.select("match_uid", (pl.col("prob") >= 0.5).alias(pick)),
+                on="match_uid",
+                how="left",
+                maintain_order="left",
+            )
+            total = total + pl.col(pick).is_not_null().cast(pl.Int64)
+            agree = agree + (pl.col(pick) == prod_pick).fill_null(False).cast(pl.Int64)
+
+        return result.with_columns(
+            (agree / total).round(2).alias("consensus"),
+            total.alias("voter_count"),
+        ).drop([f"_voter_{i}" for i in range(len(resolved))])
+
+    def _predict_request(
+        self, *, include_features: bool = False,
+    ) -> tuple[list[str], list[str]]:
+        """(specs, extra columns) `predict` computes for the active model."""
+        config = self._experiment_config
+        if config.model.type == "ensemble":
+            feature_specs, _ = self._resolve_ensemble_features()
+        else:
+            assert config.features is not None
+            feature_specs = config.features.include
+        compute_only = (
+            config.features.compute_only
+            if config.features and config.features.compute_only
+            else []
         )
+        filter_specs = get_filter_feature_specs(self.config["active"].get("filters"))
+        extra = compute_only + filter_specs
+        if include_features and config.data.eval_filters:
+            # Backtest wants eval_filters columns available (to carry into the CSV
+            # and restrict the bet set) even when they aren't model features.
+            extra = extra + get_filter_feature_specs(config.data.eval_filters)
+        all_specs = feature_specs + [s for s in extra if s not in feature_specs]
+        return all_specs, list(_PREDICTOR_EXTRA_COLS)
 
     def predict(
         self,
@@ -1313,29 +1441,12 @@ class ProductionPredictor:
         feature_cols = artifact["feature_cols"]
         calibrator = artifact.get("calibrator")
         config = self._experiment_config
-        engine = FeatureEngine(
-            matches_path=self.matches_path, cache_dir=self.cache_dir
-        )
-
         # Compute features on all data (needed for temporal features)
-        if config.model.type == "ensemble":
-            feature_specs, _ = self._resolve_ensemble_features()
-        else:
-            assert config.features is not None
-            feature_specs = config.features.include
-        compute_only = (
-            config.features.compute_only
-            if config.features and config.features.compute_only
-            else []
+        all_specs, extra_columns = self._predict_request(
+            include_features=include_features
         )
         filter_specs = get_filter_feature_specs(self.config["active"].get("filters"))
-        extra = compute_only + filter_specs
-        if include_features and config.data.eval_filters:
-            # Backtest wants eval_filters columns available (to carry into the CSV
-            # and restrict the bet set) even when they aren't model features.
-            extra = extra + get_filter_feature_specs(config.data.eval_filters)
-        all_specs = feature_specs + [s for s in extra if s not in feature_specs]
-        df = engine.compute(all_specs, extra_columns=_PREDICTOR_EXTRA_COLS)
+        df = self._compute_features(all_specs, extra_columns)
 
         # Apply non-date filters (same as training, minus date range)
         if self.config["active"].get("filters"):
@@ -15,6 +15,7 @@ from sklearn.metrics import r2_score
 
 run_logger = logging.getLogger(__name__)
 
+from mvp.common.utils import hash_arrays
 from mvp.model.completeness import is_incomplete_match
 from mvp.model.calibration import (
     AsymmIsotonicCalibrator,
@@ -45,7 +46,7 @@ from mvp.model.features._score_helpers import (
 from mvp.model.imputation import apply_imputation, build_imputation, fit_imputation
 from mvp.model.metrics import compute_metrics, metric_direction
 from mvp.model.mlflow_logger import ExperimentLogger
-from mvp.model.models import EnsembleModel, XGBoostMTLModel, get_model
+from mvp.model.models import EnsembleModel, XGBoostModel, XGBoostMTLModel, get_model
 from mvp.model.registry import get_registry
 from mvp.model.splitters import BaseSplitter, make_splitter
 from mvp.model.weighting import sample_weights_from_frame
@@ -135,6 +136,90 @@ def _calibrated_objective_metrics(
     return compute_metrics(y_true_oof, pooled, lambda_over=lambda_over)
 
 
+def _prune_value(
+    y_true: np.ndarray,
+    y_prob: np.ndarray,
+    prune_metric: str,
+    lambda_over: float | None,
+    rank_only: bool,
+) -> float:
+    """The value a trial reports to the pruner for one fidelity step.
+
+    ``rank_only`` is the calibrated-frame case: the OOF-calibrated objective
+    can't be computed mid-run (later folds aren't in yet), and raw log_loss
+    over-penalizes the raw overconfidence that the calibrated objective
+    forgives — pruning on it would kill exactly the trials calibrated-frame
+    search exists to credit. Prune on AUC instead: rank-based (identical raw vs
+    calibrated) and the discrimination signal that survives calibration; it only
+    prunes weak discriminators, never a good-AUC/raw-overconfident trial.
+    Oriented to the study direction so lower-is-worse matches how the objective
+    is reported (minimize obj → -auc). NaN when the metric can't be computed.
+    """
+    step_metrics = compute_metrics(y_true, y_prob, lambda_over=lambda_over)
+    if rank_only:
+        auc = float(step_metrics.get("roc_auc", float("nan")))
+        return -auc if metric_direction(prune_metric) == "minimize" else auc
+    return float(step_metrics.get(prune_metric, float("nan")))
+
+
+def _report_or_prune(
+    trial: Any, value: float, step: int, fidelity: dict[str, Any],
+) -> None:
+    """Report one fidelity step to the trial; raise TrialPruned if the pruner
+    fires. The reached fidelity is stamped on the trial first (``pruned_at``)
+    so a pruned trial's record says how much budget it consumed — pruned trials
+    never reach the tuner's own user-attr bookkeeping."""
+    # Inline import: runner is also called from `mvp model` (no optuna dep).
+    # Importing at the top would force optuna onto every code path.
+    import optuna
+
+    trial.report(value, step=step)
+    if trial.should_prune():
+        trial.set_user_attr("pruned_at", {"step": step, **fidelity})
+        raise optuna.TrialPruned()
+
+
+def _make_round_checkpoint_callback(
+    trial: Any,
+    X_test: np.ndarray,
+    y_test: np.ndarray,
+    checkpoints: dict[int, int],
+    value_fn: Any,
+    fidelity: dict[str, Any],
+):
+    """XGBoost training callback that reports the test-fold objective at
+    boosting-round checkpoints inside a fold.
+
+    ``checkpoints`` maps a 1-based boosting round to its pruner step. The fold's
+    predictions are read from the booster as margins and squashed here, which is
+    right for binary:logistic and for the custom log-loss objectives alike (their
+    boosters emit raw margins). Built lazily so xgboost is only imported on the
+    tuning path — same pattern as the sequence module factory in models.py.
+    """
+    import xgboost as xgb
+
+    class _RoundCheckpoint(xgb.callback.TrainingCallback):
+        def __init__(self) -> None:
+            super().__init__()
+            self._dtest = xgb.DMatrix(X_test)
+
+        def after_iteration(self, model, epoch: int, evals_log) -> bool:
+            n_rounds = epoch + 1
+            step = checkpoints.get(n_rounds)
+            if step is None:
+                return False
+            margin = model.predict(
+                self._dtest, output_margin=True, iteration_range=(0, n_rounds),
+            )
+            y_prob = 1.0 / (1.0 + np.exp(-margin))
+            value = value_fn(y_test, y_prob)
+            if not np.isnan(value):
+                _report_or_prune(trial, value, step, {**fidelity, "round": n_rounds})
+            return False
+
+    return _RoundCheckpoint()
+
+
 class ExperimentRunner:
     """Runner for executing experiments."""
 
@@ -152,6 +237,8 @@ class ExperimentRunner:
         calibrate: bool = True,
         report_calibrated_holdout: bool = False,
         report_calibrated_objective: bool = False,
+        feature_memo: dict[tuple, pl.DataFrame] | None = None,
+        fit_memo: dict[tuple, Any] | None = None,
     ) -> None:
         """Initialize runner.
 
@@ -195,6 +282,15 @@ class ExperimentRunner:
                 `metrics_calibrated`. The tuner optimizes it for probability-scale
                 objectives (calibrated-frame search); raw `metrics` is untouched.
                 See `_calibrated_objective_metrics`. Default False.
+            feature_memo: Optional dict shared between runners of the same
+                config. The computed feature frame is stored under its
+                (specs, columns) key, so a second run skips the engine entirely.
+                Used by the cadence sweep.
+            fit_memo: Optional dict shared between runners that differ only in
+                their validation windows. Fitted models are stored under
+                (train indices, test start), and a later fold with the same
+                train window reuses the model instead of refitting. Ignored
+                when a trial is passed (pruning callbacks see the test fold).
         """
         if holdout_folds < 0:
             raise ValueError(f"holdout_folds must be >= 0, got {holdout_folds}")
@@ -234,6 +330,8 @@ class ExperimentRunner:
         # `metrics_calibrated`. The tuner optimizes it for probability-scale
         # objectives; raw `metrics` is untouched. Default False.
         self.report_calibrated_objective = report_calibrated_objective
+        self.feature_memo = feature_memo
+        self.fit_memo = fit_memo
 
         self.engine = make_fs_engine(
             matches_path=self.matches_path,
@@ -551,9 +649,11 @@ class ExperimentRunner:
         Args:
             trial: Optional Optuna Trial. When provided, the runner reports
                 each tuning outer-fold's objective metric (metrics.objective)
-                to the trial via
-                trial.report(step=outer_idx) and consults trial.should_prune()
-                at each outer-fold boundary. If pruning fires, raises
+                to the trial and consults trial.should_prune() at each
+                outer-fold boundary — plus, with `tuning.round_checkpoints`,
+                at boosting-round checkpoints inside xgboost folds. Steps are
+                1-based fidelity units. If pruning fires, stamps the reached
+                fidelity as the `pruned_at` user attr and raises
                 optuna.TrialPruned. Only the tuning folds (0..n_tuning-1)
                 are reported — the holdout fold(s) never feed the pruner.
 
@@ -691,7 +791,14 @@ class ExperimentRunner:
                     if col not in runner_columns:
                         runner_columns.append(col)
 
-        df = self.engine.compute(all_specs, extra_columns=runner_columns)
+        feature_key = (tuple(all_specs), tuple(runner_columns))
+        if self.feature_memo is not None and feature_key in self.feature_memo:
+            df = self.feature_memo[feature_key]
+            run_logger.info("Reusing computed feature frame (%d rows)", len(df))
+        else:
+            df = self.engine.compute(all_specs, extra_columns=runner_columns)
+            if self.feature_memo is not None:
+                self.feature_memo[feature_key] = df
 
         # Apply additional filters (e.g., draw_type: "singles")
         # These are applied AFTER feature computation so workload features
@@ -795,6 +902,31 @@ class ExperimentRunner:
         # crashing at the first outer-fold boundary.
         pruning_enabled = trial is not None and len(trial.study.directions) == 1
 
+        # Pruner fidelity. Each tuning fold is one or more pruner steps: the
+        # fold-end report, preceded by `tuning.round_checkpoints` intra-fold
+        # boosting-round reports for plain xgboost fits. Steps count fidelity
+        # units consumed (1-based), so a pruner's min_resource reads directly as
+        # "folds (or fold checkpoints) seen". Prune on the tuning
+        # OBJECTIVE, not a hardcoded log_loss: a single-objective study
+        # ranks/stops on metrics.objective, so the pruner must too (else it kills
+        # trials by a metric the study isn't optimizing).
+        round_checkpoints = (
+            self.config.tuning.round_checkpoints
+            if pruning_enabled and self.config.tuning is not None
+            else 0
+        )
+        steps_per_fold = round_checkpoints + 1
+        prune_metric = (
+            self.config.metrics.objective[0]
+            if self.config.metrics.objective else "log_loss"
+        )
+        prune_rank_only = self.report_calibrated_objective and not self.calibrate
+
+        def _fold_prune_value(y_true: np.ndarray, y_prob: np.ndarray) -> float:
+            return _prune_value(
+                y_true, y_prob, prune_metric, lambda_over_eval, prune_rank_only,
+            )
+
         # Train and evaluate
         check_memory("before training loop")
         all_metrics: list[dict[str, float]] = []
@@ -1114,6 +1246,23 @@ class ExperimentRunner:
                         else:
                             per_model_data.append(None)
 
+                # A sibling run (cadence sweep) may already have fitted this
+                # exact train window: same rows, same test start, same config.
+                fit_key = None
+                reused = None
+                if self.fit_memo is not None and trial is None:
+                    _ts = test_df["effective_match_date"].min()
+                    fit_key = (
+                        hash_arrays(np.asarray(train_idx, dtype=np.int64)),
+                        str(_ts),
+                    )
+                    reused = self.fit_memo.get(fit_key)
+                    if reused is not None:
+                        run_logger.info(
+                            "Iter %d: reusing model fitted on identical train window",
+                            fold_idx + 1,
+                        )
+
                 # Train model. MTL dispatches to XGBoostMTLModel directly:
                 # model.type stays "xgboost" in config, but the runner routes
                 # to the multi-task wrapper because MTL is a runner-level
@@ -1140,7 +1289,7 @@ class ExperimentRunner:
                         self.config.model.params or {},
                         feature_names=feature_cols,
                     )
-                if self.config.model.type == "sequence":
+                if self.config.model.type == "sequence" and reused is None:
                     # Build per-fold history DataFrame: pre-start seed (anti-cold-start)
                     # plus this fold's training rows. Encode player_id with the same
                     # vocab used for X columns so history dict keys align.
@@ -1172,7 +1321,9 @@ class ExperimentRunner:
                     )
                     model.set_history_features(history_df)
 
-                if is_ensemble and base_model_specs is not None:
+                if reused is not None:
+                    model = reused
+                elif is_ensemble and base_model_specs is not None:
                     assert isinstance(model, EnsembleModel)
                     model.configure(base_model_specs)
                     model.fit(
@@ -1211,8 +1362,35 @@ class ExperimentRunner:
                             es, metric=self.config.metrics.objective[0],
                             lambda_over=params.get("lambda_over"), is_mtl=is_mtl,
                         )
+                    elif (
+                        round_checkpoints
+                        and self.inner_cv_folds == 0
+                        and outer_fold_id < n_tuning
+                        and isinstance(model, XGBoostModel)
+                    ):
+                        # Intra-fold fidelity: report the test-fold objective at
+                        # evenly spaced boosting rounds so the pruner can stop a
+                        # bad trial mid-fit. Plain single-task xgboost only — ES
+                        # owns its round count, and inner CV regroups iterations
+                        # per outer fold after the fact.
+                        n_rounds = int(model.params.get("n_estimators", 100))
+                        checkpoints = {
+                            max(1, n_rounds * (k + 1) // steps_per_fold):
+                                outer_fold_id * steps_per_fold + k + 1
+                            for k in range(round_checkpoints)
+                        }
+                        model.fit(
+                            X_train, y_train_for_fit, sample_weight=train_weights,
+                            callbacks=[_make_round_checkpoint_callback(
+                                trial, X_test, y_test, checkpoints,
+                                _fold_prune_value,
+                                {"fold": outer_fold_id + 1, "n_tuning_folds": n_tuning},
+                            )],
+                        )
                     else:
                         model.fit(X_train, y_train_for_fit, sample_weight=train_weights)
+                if fit_key is not None and reused is None:
+                    self.fit_memo[fit_key] = model
 
                 # Predict and evaluate on test
                 is_stacking = (
@@ -1308,10 +1486,10 @@ class ExperimentRunner:
                         {f"fold_{fold_idx}_{k}": v for k, v in metrics.items()}
                     )
 
-                # Pruning check at outer-fold boundaries only. Aggregate the
+                # Pruning check at outer-fold boundaries. Aggregate the
                 # current outer fold's per-iteration predictions (only one
                 # entry when inner_cv_folds=0; up to inner_cv_folds entries
-                # otherwise), compute the outer-fold log_loss, report to
+                # otherwise), compute the outer-fold objective, report to
                 # the trial, and consult the pruner. Holdout folds are
                 # excluded (only the tuning folds 0..n_tuning-1 are reported).
                 if pruning_enabled:
@@ -1334,33 +1512,7 @@ class ExperimentRunner:
                         outer_y_prob = np.concatenate(
                             [all_predictions[i]["y_prob"] for i in outer_iter_idxs]
                         )
-                        # Prune on the tuning OBJECTIVE, not a hardcoded log_loss:
-                        # a single-objective study ranks/stops on metrics.objective,
-                        # so the pruner must too (else it kills trials by a metric
-                        # the study isn't optimizing). objective is single here (the
-                        # ES validator / single-objective pruning both guarantee it).
-                        obj = self.config.metrics.objective
-                        prune_metric = obj[0] if obj else "log_loss"
-                        fold_metrics = compute_metrics(
-                            outer_y_true, outer_y_prob, lambda_over=lambda_over_eval,
-                        )
-                        if self.report_calibrated_objective and not self.calibrate:
-                            # Calibrated-frame study: the OOF-calibrated objective
-                            # can't be computed mid-run (later folds aren't in yet),
-                            # and raw log_loss over-penalizes the raw overconfidence
-                            # that the calibrated objective forgives — pruning on it
-                            # would kill exactly the trials calibrated-frame search
-                            # exists to credit. Prune on AUC instead: rank-based
-                            # (identical raw vs calibrated) and the discrimination
-                            # signal that survives calibration; it only prunes weak
-                            # discriminators, never a good-AUC/raw-overconfident trial.
-                            # Orient to the study direction so lower-is-worse matches
-                            # how the objective is reported (minimize obj → -auc).
-                            auc = float(fold_metrics.get("roc_auc", float("nan")))
-                            minimize = metric_direction(prune_metric) == "minimize"
-                            outer_val = -auc if minimize else auc
-                        else:
-                            outer_val = float(fold_metrics.get(prune_metric, float("nan")))
+                        outer_val = _fold_prune_value(outer_y_true, outer_y_prob)
                         if np.isnan(outer_val):
                             # The objective should be in the computed metrics (the
                             # study optimizes it). If not, skip pruning rather than
@@ -1371,13 +1523,11 @@ class ExperimentRunner:
                                 prune_metric, current_outer,
                             )
                         else:
-                            trial.report(outer_val, step=current_outer)
-                            if trial.should_prune():
-                                # Inline import: runner is also called from
-                                # `mvp model` (no optuna dep). Importing at the
-                                # top would force optuna onto every code path.
-                                import optuna
-                                raise optuna.TrialPruned()
+                            _report_or_prune(
+                                trial, outer_val,
+                                (current_outer + 1) * steps_per_fold,
+                                {"fold": current_outer + 1, "n_tuning_folds": n_tuning},
+                            )
 
             # If inner CV was active, the per-iteration lists above hold one
             # entry per inner split. Regroup them by outer fold so downstream
@@ -14,6 +14,7 @@ import yaml
 from optuna.exceptions import ExperimentalWarning
 
 from mvp.common.base_job import get_data_root
+from mvp.model.config import TuningConfig
 from mvp.model.metrics import (
     CALIBRATION_INVARIANT_METRICS,
     MAXIMIZE_METRICS as _MODEL_MAXIMIZE_METRICS,
@@ -307,6 +308,40 @@ def _decode_params(params: dict[str, Any]) -> dict[str, Any]:
     return decoded
 
 
+def _build_pruner(
+    tuning: TuningConfig, n_startup_trials: int,
+) -> optuna.pruners.BasePruner:
+    """Optuna pruner for the config's ``tuning:`` block.
+
+    Steps are the runner's fidelity units: one per tuning fold, or
+    ``round_checkpoints + 1`` per fold when boosted fits also report at
+    boosting-round checkpoints. Successive halving and Hyperband promote the top
+    ``1/reduction_factor`` of trials at each rung starting from
+    ``min_resource`` steps; Hyperband's ``max_resource`` is inferred from the
+    first trial to finish (the full fold budget). The median pruner keeps the
+    TPE startup threshold so random-phase trials are never culled.
+    """
+    if tuning.pruner == "median":
+        return optuna.pruners.MedianPruner(
+            n_startup_trials=n_startup_trials,
+            n_warmup_steps=tuning.min_resource,
+            n_min_trials=10,
+            interval_steps=1,
+        )
+    if tuning.pruner == "successive_halving":
+        return optuna.pruners.SuccessiveHalvingPruner(
+            min_resource=tuning.min_resource,
+            reduction_factor=tuning.reduction_factor,
+        )
+    if tuning.pruner == "hyperband":
+        return optuna.pruners.HyperbandPruner(
+            min_resource=tuning.min_resource,
+            max_resource="auto",
+            reduction_factor=tuning.reduction_factor,
+        )
+    return optuna.pruners.NopPruner()
+
+
 def _param_combo_str(params: dict[str, Any]) -> str:
     return ", ".join(f"{k}={v}" for k, v in sorted(params.items()))
 
@@ -379,6 +414,12 @@ class HyperparamTuner:
         # can't feed a trustworthy forward-aligned search.
         self._preflight_fold_check()
 
+        # Optional `tuning:` block (pruner + fidelity). Validated here, before
+        # the study exists, so a typo'd pruner name can't half-create a study.
+        self.tuning_config = TuningConfig.model_validate(
+            self.base_config.get("tuning") or {}
+        )
+
         if self.is_iid:
             self.model_type = self.base_config["serve_model"].get("model_type", "xgboost")
         else:
@@ -409,6 +450,25 @@ class HyperparamTuner:
             # would build one study direction per CHARACTER.
             self.metrics = [objective] if isinstance(objective, str) else list(objective)
 
+        # Per-fold reports (and hence pruning) exist only on the classification
+        # runner, and only for single-objective studies (trial.report raises on
+        # multi-objective). Refuse a configured pruner that could never fire
+        # rather than let the config imply a budget saving that doesn't happen.
+        if self.tuning_config.pruner != "none":
+            if self.is_iid or self.model_type in _PROJECTION_MODEL_TYPES:
+                raise ValueError(
+                    f"tuning.pruner={self.tuning_config.pruner!r} is only supported "
+                    "for classification configs; IID/projection runners don't "
+                    "report per-fold values. Drop the `tuning:` block."
+                )
+            if len(self.metrics) > 1:
+                raise ValueError(
+                    f"tuning.pruner={self.tuning_config.pruner!r} needs a single "
+                    f"objective; metrics.objective is multi-objective "
+                    f"({self.metrics}). Pareto tuning and pruning are mutually "
+                    "exclusive."
+                )
+
         # Search frame. Probability-scale objectives search on the calibrated
         # out-of-fold metric (raw-frame HPs are not the calibrated optimum); the
         # pure ranking metrics (roc_auc, partial_auc_tail) are Platt-invariant, so
@@ -556,22 +616,15 @@ class HyperparamTuner:
                 seed=self.seed,
             )
 
-        # Pruning DISABLED (2026-07). The tune metric carries no between-trial
-        # signal in the current regime (sep < 1 across every logged axis), so
-        # MedianPruner culls ~20% of trials on a noise ranking of the final
-        # objective — the culled trials never reach the backtest, and the cull
-        # criterion is a betting-irrelevant proxy, so we may be dropping good
-        # bettors sight-unseen. There is no signal-bearing target to validate
-        # the prunes against, so we run the full pool. To re-enable (e.g. once a
-        # metric actually separates trials), swap NopPruner for the MedianPruner
-        # below.
-        pruner = optuna.pruners.NopPruner()
-        # pruner = optuna.pruners.MedianPruner(
-        #     n_startup_trials=startup_trials,
-        #     n_warmup_steps=2,
-        #     n_min_trials=10,
-        #     interval_steps=1,
-        # )
+        # Pruning is OFF by default (2026-07). The tune metric carries no
+        # between-trial signal in the current regime (sep < 1 across every
+        # logged axis), so MedianPruner culled ~20% of trials on a noise ranking
+        # of the final objective — the culled trials never reach the backtest,
+        # and the cull criterion is a betting-irrelevant proxy, so we may be
+        # dropping good bettors sight-unseen. A config opts back in through its
+        # `tuning:` block (successive halving / Hyperband for budget-bound
+        # xgboost and sequence searches); see _build_pruner.
+        pruner = _build_pruner(self.tuning_config, startup_trials)
 
         self.study = optuna.create_study(
             study_name=self.config_path.stem,
@@ -1075,13 +1128,22 @@ class HyperparamTuner:
         user_attrs (which `_objective` sets after `_run_one` returns) are
         empty — the prune raised before that code ran."""
         if trial.state == optuna.trial.TrialState.PRUNED:
-            # Pruned trials carry no user_attrs; report which fold step
-            # killed them (intermediate_values is set by Optuna from the
-            # runner's trial.report() calls before the prune).
-            last_step = max(trial.intermediate_values) if trial.intermediate_values else "?"
+            # Pruned trials carry only the runner's `pruned_at` fidelity stamp;
+            # report which fold (and boosting round, for intra-fold
+            # checkpoints) killed them. Fall back to the last reported step.
+            pruned_at = trial.user_attrs.get("pruned_at")
+            if pruned_at:
+                where = f"fold {pruned_at['fold']}/{pruned_at['n_tuning_folds']}"
+                if pruned_at.get("round") is not None:
+                    where += f" round {pruned_at['round']}"
+            else:
+                where = (
+                    f"step {max(trial.intermediate_values)}"
+                    if trial.intermediate_values else "step ?"
+                )
             logger.info(
-                "Trial %d: PRUNED at step %s | %s",
-                trial.number, last_step, _param_combo_str(trial.params),
+                "Trial %d: PRUNED at %s | %s",
+                trial.number, where, _param_combo_str(trial.params),
             )
             return
         metrics_str = ", ".join(
@@ -20,16 +20,44 @@ the first moment `n` books are genuinely live together.
 Prices persist between ticks (the feed emits on change), so a book's state at any T is
 its last transition at or before T. Books never tick in the same millisecond; that is a
 fact about rows, not about availability.
+
+The sweep does not depend on `n_books`, so it is run once per (market, book set,
+prematch flag) over every match and persisted under `paths.anchor_cache_dir()`. Any
+threshold, and any subset of matches, is then a filter over that count. A study
+sweeping `formed(n)` for n = 1..4 scans the corpus once, not four times. A subset
+asked for while that cache is stale is swept on its own, through the tick index, and
+not persisted: a small query after an organise does not pay for the whole corpus.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+
 import polars as pl
+import pyarrow.parquet as pq
 
 from mvp.oddspapi import board, paths
 
 TOTALS_SIDES = board.TOTALS_SIDES
 
+# parquet metadata key carrying the source fingerprint of a cached count
+CACHE_META_KEY = "anchor_source_fingerprint"
+
+# In-process memo over the persisted counts and the fixture-map start times, keyed
+# on their paths and revalidated against the fingerprint on every call. Each entry
+# can be a whole market's counts, so only the most recently used few are held.
+_MEMO: dict[object, tuple[str, pl.DataFrame]] = {}
+_MEMO_MAX_ENTRIES = 8
+
+
+def _remember(key: object, fp: str, frame: pl.DataFrame) -> None:
+    _MEMO.pop(key, None)
+    _MEMO[key] = (fp, frame)
+    while len(_MEMO) > _MEMO_MAX_ENTRIES:
+        del _MEMO[next(iter(_MEMO))]
+
 
 def _rung_live_transitions(
     df: pl.DataFrame, over_side: str, under_side: str
@@ -108,6 +136,89 @@ def _ready_book_count(book_tx: pl.DataFrame) -> pl.DataFrame:
     )
 
 
+def _source_fingerprint(market: str, books: list[str]) -> str:
+    """(book, mtime, size) of each market file the sweep reads.
+
+    ORGANISE swaps whole book directories in, so any rewrite moves the mtime. A
+    book with no file for this market is part of the fingerprint too: its file
+    appearing later must invalidate.
+    """
+    parts = []
+    for bk in books:
+        p = board.market_path(bk, market)
+        st = p.stat() if p.exists() else None
+        parts.append([bk, st.st_mtime_ns if st else None, st.st_size if st else None])
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+
+def _sweep(df: pl.DataFrame, over_side: str, under_side: str) -> pl.DataFrame:
+    """`_ready_book_count` of loaded ticks, typed even when there are none."""
+    if df.is_empty():
+        return pl.DataFrame(
+            schema={"match_uid": pl.String, "t": pl.Datetime("us", "UTC"),
+                    "n_books": pl.Int32}
+        )
+    return _ready_book_count(
+        _book_ready_transitions(_rung_live_transitions(df, over_side, under_side))
+    )
+
+
+def _ready_counts(
+    market: str,
+    books: list[str],
+    prematch_only: bool,
+    over_side: str,
+    under_side: str,
+    match_uids: pl.Series | None = None,
+) -> pl.DataFrame:
+    """`_ready_book_count` over every match, from the cache when it is current.
+
+    Keyed on everything the sweep depends on besides the threshold and the match
+    subset -- both are filters over the result. A stale or unreadable cache file is
+    rebuilt, never trusted; a failed write only costs the next caller a rebuild.
+
+    The rebuild is for unfiltered calls. With `match_uids` and no current cache, only
+    those matches are swept and the result is returned unpersisted -- the caller
+    still filters it, so either path gives the same answer.
+    """
+    bks = sorted(books)
+    key = hashlib.sha256(
+        json.dumps([market, bks, prematch_only, over_side, under_side]).encode()
+    ).hexdigest()[:16]
+    path = paths.anchor_cache_dir() / f"{market}_{key}.parquet"
+    fp = _source_fingerprint(market, bks)
+
+    memo = _MEMO.get(path)
+    if memo is not None and memo[0] == fp:
+        return memo[1]
+    _MEMO.pop(path, None)     # stale: do not hold it while sweeping
+    if path.exists():
+        try:
+            meta = pq.read_metadata(path).metadata or {}
+        except OSError:
+            meta = {}
+        if meta.get(CACHE_META_KEY.encode(), b"").decode() == fp:
+            counts = pl.read_parquet(path)
+            _remember(path, fp, counts)
+            return counts
+
+    if match_uids is not None:
+        return _sweep(
+            _load(market, bks, match_uids, prematch_only), over_side, under_side
+        )
+
+    counts = _sweep(_load(market, bks, None, prematch_only), over_side, under_side)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    try:
+        counts.write_parquet(tmp, metadata={CACHE_META_KEY: fp})
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+    _remember(path, fp, counts)
+    return counts
+
+
 def _empty_times() -> pl.DataFrame:
     """The `(match_uid, t)` contract, typed to match the non-empty path.
 
@@ -127,15 +238,22 @@ def _start_times(match_uids: pl.Series | None = None) -> pl.DataFrame:
     arbitrary one would make the anchor non-reproducible, which is the single property
     it exists to provide.
     """
-    fm = pl.read_parquet(paths.stage_root() / "_fixture_map.parquet")
-    col = "true_start_time" if "true_start_time" in fm.columns else "start_time"
-    out = (
-        fm.filter(pl.col("match_uid").is_not_null())
-        .select("match_uid", pl.coalesce(col, "start_time").alias("t"))
-        .drop_nulls("t")
-        .group_by("match_uid")
-        .agg(pl.col("t").max())
-    )
+    fm_path = paths.stage_root() / "_fixture_map.parquet"
+    fp = str(fm_path.stat().st_mtime_ns)
+    memo = _MEMO.get(fm_path)
+    if memo is not None and memo[0] == fp:
+        out = memo[1]
+    else:
+        fm = pl.read_parquet(fm_path)
+        col = "true_start_time" if "true_start_time" in fm.columns else "start_time"
+        out = (
+            fm.filter(pl.col("match_uid").is_not_null())
+            .select("match_uid", pl.coalesce(col, "start_time").alias("t"))
+            .drop_nulls("t")
+            .group_by("match_uid")
+            .agg(pl.col("t").max())
+        )
+        _remember(fm_path, fp, out)
     if match_uids is not None:
         out = out.filter(pl.col("match_uid").is_in(match_uids.implode()))
     return out.sort("match_uid")
@@ -144,7 +262,8 @@ def _start_times(match_uids: pl.Series | None = None) -> pl.DataFrame:
 def _load(
     market: str, books: list[str], uids: pl.Series | None, prematch_only: bool
 ) -> pl.DataFrame:
-    """Ticks for the requested books.
+    """Ticks for the requested books, read through `board._ticks` so an indexed
+    market file decodes only the requested matches' row groups.
 
     Note what the exclusions mean downstream: the sweep forward-fills, so a row dropped
     here for `odds <= 1.0` or a non-prematch status reads as "state unchanged", not as
@@ -154,20 +273,14 @@ def _load(
     """
     frames = []
     for bk in books:
-        p = board.market_path(bk, market)
-        if not p.exists():
+        if not board.market_path(bk, market).exists():
             continue
-        lf = pl.scan_parquet(p).filter(
-            pl.col("match_uid").is_not_null() & (pl.col("odds") > 1.0)
-        )
-        if prematch_only:
-            lf = lf.filter(pl.col("event_status") == "NOT_STARTED")
-        if uids is not None:
-            lf = lf.filter(pl.col("match_uid").is_in(uids.implode()))
         frames.append(
-            lf.select("match_uid", "points", "side", "fetched_at", "active")
-            .collect()
-            .with_columns(pl.lit(bk).alias("book"))
+            board._ticks(
+                bk, market, uids,
+                ["match_uid", "points", "side", "fetched_at", "active"],
+                prematch_only=prematch_only,
+            ).with_columns(pl.lit(bk).alias("book"))
         )
     return pl.concat(frames) if frames else pl.DataFrame()
 
@@ -195,12 +308,13 @@ def formed(
     if n_books < 1:
         raise ValueError("n_books must be >= 1")
     bks = books if books is not None else board.entry_books(market)
-    df = _load(market, bks, match_uids, prematch_only)
-    if df.is_empty():
-        return _empty_times()
-    counts = _ready_book_count(
-        _book_ready_transitions(_rung_live_transitions(df, over_side, under_side))
+    counts = _ready_counts(
+        market, bks, prematch_only, over_side, under_side, match_uids
     )
+    if match_uids is not None:
+        counts = counts.filter(pl.col("match_uid").is_in(match_uids.implode()))
+    if counts.is_empty():
+        return _empty_times()
     return (
         counts.filter(pl.col("n_books") >= n_books)
         .group_by("match_uid")
@@ -26,6 +26,7 @@ produce a board keyed to the wrong player.
 from __future__ import annotations
 
 import polars as pl
+import pyarrow.parquet as pq
 
 from mvp.oddspapi import paths
 
@@ -69,13 +70,62 @@ def entry_books(market: str) -> list[str]:
     return [b for b in available_books(market) if b in paths.ENTRY_BOOKS]
 
 
-def _scan(book: str, market: str, *, prematch_only: bool) -> pl.LazyFrame:
-    lf = pl.scan_parquet(market_path(book, market)).filter(
-        pl.col("match_uid").is_not_null() & (pl.col("odds") > 1.0)
-    )
+def _tick_index(book: str, market: str) -> pl.DataFrame | None:
+    """The market file's per-match offset index, or None if it cannot be trusted.
+
+    Absent for files written before ORGANISE sorted its output, and stale if the
+    market file was rewritten without it -- either way the caller scans. Stale is
+    judged by the write id both files carry, not the row count, which a rebuild
+    can keep while moving every match's offsets.
+    """
+    idx = paths.tick_index_path(book, market)
+    if not idx.exists():
+        return None
+    key = paths.TICK_INDEX_WRITE_KEY.encode()
+    write_id = (pq.read_metadata(idx).metadata or {}).get(key)
+    if write_id is None or write_id != (
+        pq.read_metadata(market_path(book, market)).metadata or {}
+    ).get(key):
+        return None
+    return pl.read_parquet(idx)
+
+
+def _ticks(
+    book: str,
+    market: str,
+    uids: pl.Series | None,
+    columns: list[str],
+    *,
+    prematch_only: bool,
+) -> pl.DataFrame:
+    """Priced, resolved ticks for `uids` (all matches if None), in `TICK_ORDER`.
+
+    Indexed files decode only the row groups holding the requested matches and are
+    already in order. Anything else is scanned and the (filtered) result sorted, so
+    callers can rely on the order either way.
+    """
+    keep = pl.col("match_uid").is_not_null() & (pl.col("odds") > 1.0)
     if prematch_only:
-        lf = lf.filter(pl.col("event_status") == "NOT_STARTED")
-    return lf
+        keep &= pl.col("event_status") == "NOT_STARTED"
+    if uids is not None:
+        keep &= pl.col("match_uid").is_in(uids.implode())
+
+    path = market_path(book, market)
+    index = _tick_index(book, market)
+    if index is None:
+        return (
+            pl.scan_parquet(path).filter(keep).select(columns).collect()
+            .sort([c for c in paths.TICK_ORDER if c in columns], maintain_order=True)
+        )
+    if uids is None:
+        return pl.scan_parquet(path).filter(keep).select(columns).collect()
+    groups = (
+        index.filter(pl.col("match_uid").is_in(uids.implode()))["row_group"]
+        .unique().sort().to_list()
+    )
+    read = list(dict.fromkeys([*columns, "match_uid", "odds", "event_status"]))
+    table = pq.ParquetFile(path).read_row_groups(groups, columns=read)
+    return pl.from_arrow(table).filter(keep).select(columns)
 
 
 def excluded_rows(book: str, market: str) -> dict[str, int]:
@@ -96,21 +146,23 @@ def excluded_rows(book: str, market: str) -> dict[str, int]:
 def _latest_per_side(
     book: str, market: str, times: pl.DataFrame, *, prematch_only: bool
 ) -> pl.DataFrame:
-    """Each (match, rung, side)'s most recent quote at or before its match's T."""
-    uids = times["match_uid"]
+    """Each (match, rung, side)'s most recent quote at or before its match's T.
+
+    An as-of lookup: ticks arrive in `TICK_ORDER`, so after dropping those past T
+    the last row of each rung-side is its quote at T.
+    """
+    ticks = _ticks(
+        book, market, times["match_uid"],
+        ["match_uid", "points", "side", "odds", "fetched_at", "active"],
+        prematch_only=prematch_only,
+    )
     return (
-        _scan(book, market, prematch_only=prematch_only)
-        .filter(pl.col("match_uid").is_in(uids.implode()))
-        .select("match_uid", "points", "side", "odds", "fetched_at", "active")
-        .collect()
-        .join(times, on="match_uid", how="inner")
+        ticks.join(times, on="match_uid", how="inner", maintain_order="left")
         .filter(pl.col("fetched_at") <= pl.col("t"))
-        .group_by("match_uid", "points", "side")
-        .agg(
-            pl.col("odds").sort_by("fetched_at").last(),
-            pl.col("active").sort_by("fetched_at").last(),
-            pl.col("fetched_at").max().alias("quoted_at"),
-            pl.col("t").first(),
+        .unique(["match_uid", "points", "side"], keep="last", maintain_order=True)
+        .select(
+            "match_uid", "points", "side", "odds", "active",
+            pl.col("fetched_at").alias("quoted_at"), "t",
         )
     )
 
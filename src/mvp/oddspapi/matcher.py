@@ -84,6 +84,70 @@ def to_first_last(name: str) -> str:
     return name
 
 
+def _first_last(col: str) -> pl.Expr:
+    """`to_first_last` over a column: same regex, same single split on the first
+    comma, same stripping."""
+    name = (
+        pl.col(col).fill_null("")
+        .str.replace(_YEAR_SUFFIX.pattern, "").str.strip_chars()
+    )
+    parts = name.str.splitn(",", 2)
+    flipped = pl.concat_str(
+        [parts.struct.field("field_1").str.strip_chars(),
+         parts.struct.field("field_0").str.strip_chars()],
+        separator=" ",
+    ).str.strip_chars()
+    return pl.when(name.str.contains(",", literal=True)).then(flipped).otherwise(name)
+
+
+def _start_column(values: pl.Series) -> pl.Series:
+    """`parse_ts` over a column, as UTC: one vectorized parse, and `parse_ts` per
+    value only for whatever the fixed ISO format misses. Empty -> null."""
+    s = values.fill_null("")
+    out = s.str.replace(r"Z$", "+00:00").str.to_datetime(
+        "%Y-%m-%dT%H:%M:%S%.f%:z", time_unit="us", time_zone="UTC", strict=False,
+    )
+    leftover = (out.is_null() & (s != "")).arg_true()
+    if len(leftover):
+        out = out.scatter(leftover, [parse_ts(s[int(i)]) for i in leftover])
+    return out
+
+
+def event_rows(fixtures: list[dict]) -> pl.DataFrame:
+    """The mapper's input: two rows per fixture, participant1 first, built as frame
+    operations rather than a loop over fixture dicts.
+
+    Tournament identity rides along so the mapper can constrain on it instead of
+    leaning on the estimated per-match date. 92% of fixtures pin to one
+    tournament_id and another 7% narrow to one city's events; the rest carry no
+    constraint and fall back to the player-pair path exactly as before.
+    """
+    fx = tournaments.fixture_frame(
+        fixtures,
+        {"participant1Name": pl.Utf8, "participant2Name": pl.Utf8},
+    )
+    tids, trep = tournaments.resolve_frame(fx)
+    logger.info(
+        "Tournaments: %d fixtures pinned, %d narrowed, %d unresolved (%d names)",
+        trep.pinned, trep.narrowed, sum(trep.unresolved.values()),
+        len(trep.unresolved),
+    )
+    return (
+        fx.with_columns(_start_column(fx["startTime"]).alias("fetched_at"))
+        .join(tids, on="fixtureId", how="left", maintain_order="left")
+        .select(
+            pl.col("fixtureId").alias("oap_event_id"),
+            pl.concat_list(
+                _first_last("participant1Name"), _first_last("participant2Name"),
+            ).alias("player_name"),
+            pl.col("tournamentName").fill_null("").alias("tournament"),
+            "fetched_at",
+            "tournament_ids",
+        )
+        .explode("player_name", empty_as_null=False)
+    )
+
+
 def _is_singles(f: dict) -> bool:
     return not any(
         "/" in str(f.get(k, "")) for k in ("participant1Name", "participant2Name")
@@ -132,34 +196,9 @@ def resolve_raw(fixtures: list[dict]):
     diagnostic can never drift from the real query — building a second `matches`
     select for analysis is how a fix silently fails to show up in its own probe.
     """
-    # Tournament identity, so the mapper can constrain on it instead of leaning on
-    # the estimated per-match date. 92% of fixtures pin to one tournament_id and
-    # another 7% narrow to one city's events; the rest carry no constraint and fall
-    # back to the player-pair path exactly as before.
-    tournament_ids, trep = tournaments.resolve_fixtures(fixtures)
-    logger.info(
-        "Tournaments: %d fixtures pinned, %d narrowed, %d unresolved (%d names)",
-        trep.pinned, trep.narrowed, sum(trep.unresolved.values()),
-        len(trep.unresolved),
-    )
-
-    rows = []
-    for f in fixtures:
-        start = parse_ts(f["startTime"])
-        tids = tournament_ids.get(f["fixtureId"])
-        for nm in (
-            to_first_last(f.get("participant1Name", "")),
-            to_first_last(f.get("participant2Name", "")),
-        ):
-            rows.append({
-                "oap_event_id": f["fixtureId"],
-                "player_name": nm,
-                "tournament": f.get("tournamentName", ""),
-                "fetched_at": start,
-                "tournament_ids": sorted(tids) if tids else None,
-            })
-    if not rows:
+    if not fixtures:
         return None
+    rows = event_rows(fixtures)
 
     lookup = build_player_lookup(aliases_path=ALIASES_PATH)
     matches = (
@@ -180,9 +219,7 @@ def resolve_raw(fixtures: list[dict]):
         .collect()
     )
     catalog = build_match_catalog(matches)
-    return map_book_events(
-        pl.DataFrame(rows), "oap_event_id", "oddspapi", lookup, catalog
-    )
+    return map_book_events(rows, "oap_event_id", "oddspapi", lookup, catalog)
 
 
 def resolve(fixtures: list[dict]) -> pl.DataFrame:
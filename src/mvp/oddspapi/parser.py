@@ -17,8 +17,29 @@ from pathlib import Path
 
 from mvp.oddspapi.markets import Market
 
+try:
+    # Optional: several times faster than json on these payloads, and the decode
+    # is most of a file's parse cost. Same values either way.
+    import orjson
+
+    def _loads(data: bytes):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson refuses the NaN/Infinity literals json accepts; a file
+            # that parsed before must not turn unreadable.
+            return json.loads(data)
+except ImportError:
+    _loads = json.loads
+
 PARSER_VERSION = 1
 
+# Column order of parse_columns' output; the transformer's TICK_SCHEMA keys.
+TICK_COLUMNS = (
+    "fixture_id", "book", "market", "points", "side", "odds", "fetched_at",
+    "active", "limit", "exchange_meta",
+)
+
 
 @dataclass(frozen=True)
 class Tick:
@@ -47,7 +68,7 @@ def parse_file(path: Path, index: dict[str, Market]) -> tuple[str | None, list[T
     than exceptional — it is skipped and counted, never raised.
     """
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = _loads(path.read_bytes())
     except Exception:
         return None, []
 
@@ -90,3 +111,62 @@ def parse_file(path: Path, index: dict[str, Market]) -> tuple[str | None, list[T
                             ),
                         ))
     return fixture_id, out
+
+
+def parse_columns(
+    path: Path, index: dict[str, Market],
+) -> tuple[str | None, dict[str, list]]:
+    """(fixture_id, columns) — the staged rows of one file, column-wise.
+
+    The stage-facing counterpart of `parse_file`: same walk and same ticks, minus
+    the ones with no price (never staged), appended straight onto per-column
+    lists instead of a Tick and then a dict per quote. `fetched_at` is left as the
+    raw `createdAt` string for the caller to parse in one vectorized pass.
+    Returns (None, {}) for an unreadable file, as `parse_file` does.
+    """
+    try:
+        payload = _loads(path.read_bytes())
+    except Exception:
+        return None, {}
+
+    fixture_id = payload.get("fixtureId")
+    if not fixture_id:
+        return None, {}
+
+    cols: dict[str, list] = {c: [] for c in TICK_COLUMNS}
+    books, mkts, points, sides = (
+        cols["book"], cols["market"], cols["points"], cols["side"],
+    )
+    odds, fetched, active, limit, meta = (
+        cols["odds"], cols["fetched_at"], cols["active"], cols["limit"],
+        cols["exchange_meta"],
+    )
+    for book, bm in (payload.get("bookmakers") or {}).items():
+        for market_id, mk in ((bm or {}).get("markets") or {}).items():
+            market = index.get(str(market_id))
+            if market is None:
+                continue
+            outcomes = (mk or {}).get("outcomes") or {}
+            # Hoisted: stage_name is a regex normalisation, not a field.
+            stage_name, handicap = market.stage_name, market.handicap
+            for outcome in market.outcomes:
+                side = outcome.name or outcome.outcome_id
+                series = (outcomes.get(outcome.outcome_id) or {}).get("players", {})
+                for arr in series.values():
+                    for tick in arr or []:
+                        created = tick.get("createdAt")
+                        price = tick.get("price")
+                        if created is None or price is None:
+                            continue
+                        books.append(book)
+                        mkts.append(stage_name)
+                        points.append(handicap)
+                        sides.append(side)
+                        odds.append(float(price))
+                        fetched.append(created)
+                        active.append(bool(tick.get("active", True)))
+                        limit.append(tick.get("limit"))
+                        em = tick.get("exchangeMeta")
+                        meta.append(None if em is None else str(em))
+    cols["fixture_id"] = [fixture_id] * len(books)
+    return fixture_id, cols
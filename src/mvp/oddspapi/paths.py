@@ -85,6 +85,29 @@ def market_path(book: str, market: str) -> Path:
     return book_dir(book) / f"{market}.parquet"
 
 
+# Row order of every market file ORGANISE writes. Point-in-time reads rely on it:
+# within a (match, rung, side) the last row at or before T is the quote at T, so
+# nothing at read time has to sort. `market` is constant within a file.
+TICK_ORDER: tuple[str, ...] = ("match_uid", "points", "side", "fetched_at")
+
+# Key in BOTH the market file's and its index's parquet metadata: one id per
+# `_sort_and_index` write. A mismatch means the pair was not written together, and
+# readers fall back to a full scan rather than trust offsets into a different file
+# -- even one with the same row count, whose per-match offsets may still differ.
+TICK_INDEX_WRITE_KEY = "tick_write_id"
+
+
+def tick_index_path(book: str, market: str) -> Path:
+    """Per-match offset index for one market file: `<book>/_index/<market>.parquet`.
+
+    One row per match_uid — (row_group, row_start, n_rows) — into the market file,
+    whose row groups are cut on match boundaries so a match lives in exactly one.
+    A subdirectory rather than a sibling, so globbing a book's `*.parquet` still
+    finds only market files. Optional: a market file without one is read by scan.
+    """
+    return book_dir(book) / "_index" / f"{market}.parquet"
+
+
 def fixture_map_path() -> Path:
     """Cached fixture -> match_uid map, shared across markets.
 
@@ -99,12 +122,37 @@ def fixture_map_path() -> Path:
     return stage_root() / "_fixture_map.parquet"
 
 
+def anchor_cache_dir() -> Path:
+    """Materialised ready-book counts behind `anchors.formed`, one file per
+    (market, book set, prematch flag, sides).
+
+    A cache, not a layer: each file records the mtimes of the market files it was
+    built from and is rebuilt when they move, so deleting the directory is always
+    safe.
+    """
+    return stage_root() / "_anchors"
+
+
+def organise_manifest_path() -> Path:
+    """What the last ORGANISE consumed: each staged file's mtime, crosswalk key and
+    the (book, market) partitions it fed.
+
+    Unlike the ticks tree, ORGANISE cannot skip on per-file existence — a market
+    file mixes thousands of captures — so this side-car is what lets a run rewrite
+    only the partitions whose inputs moved. Losing it costs one full rebuild.
+    """
+    return stage_root() / "_organise_manifest.parquet"
+
+
 def ticks_dir() -> Path:
     """Parsed ticks, one parquet per raw file, mirroring raw/historical/<group>/.
 
     Per-file staging rather than a manifest, following atptour
     (`atptour/pipeline.py:131-148`): the staged file's own existence and mtime are
     the skip signal, so there is no side-car table to drift from what is on disk.
+    Each group's `_dir_manifest.jsonl` only lists those files and their mtimes, so
+    that reading them is not a stat per file. It is trusted only while it matches
+    the group directory's own mtime (see `mvp.common.dir_manifest`).
     """
     return stage_root() / "ticks"
 
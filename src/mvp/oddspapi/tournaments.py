@@ -30,6 +30,7 @@ import logging
 import re
 from collections import defaultdict
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 
 import polars as pl
@@ -89,6 +90,7 @@ def strip_suffix(name: str) -> str:
     return _SUFFIX.sub("", name).strip()
 
 
+@cache
 def parse_name(name: str) -> tuple[str, int | None]:
     """('ATP Challenger Oeiras 1, Portugal Men Singles') -> ('oeiras', 1).
 
@@ -141,11 +143,12 @@ class TournamentIndex:
                 )
             if r["city"] and r["circuit"] in ("tour", "chal"):
                 self.by_city[(_norm_city(r["city"]), r["circuit"], year)].append(r)
+        self._memo: dict[tuple[str, str | None, int], tuple[frozenset[str], str]] = {}
 
     def lookup(
         self, name: str, circuit: str | None, year: int,
     ) -> tuple[frozenset[str], str]:
-        """(candidate tournament_ids, how).
+        """(candidate tournament_ids, how), memoised per (name, circuit, year).
 
         A SET rather than one id, because a city can host two same-circuit events
         that neither side numbers consistently — we hold two tournaments both named
@@ -153,6 +156,15 @@ class TournamentIndex:
         date then chooses between two candidates instead of every meeting the pair
         ever played. `how` is one of name / city / narrowed / miss.
         """
+        key = (name, circuit, year)
+        hit = self._memo.get(key)
+        if hit is None:
+            hit = self._memo[key] = self._lookup(name, circuit, year)
+        return hit
+
+    def _lookup(
+        self, name: str, circuit: str | None, year: int,
+    ) -> tuple[frozenset[str], str]:
         direct = self.by_name.get((_norm_city(strip_suffix(name)), year))
         if direct is not None:
             return frozenset({direct}), "name"
@@ -188,48 +200,117 @@ def build_index() -> TournamentIndex:
     return TournamentIndex(_our_tournaments())
 
 
-def resolve_fixtures(
-    fixtures: list[dict],
-    index: TournamentIndex | None = None,
-) -> tuple[dict[str, frozenset[str]], ResolveReport]:
-    """fixtureId -> candidate tournament_ids.
+# The fixture fields tournament resolution reads, as frame columns.
+FIXTURE_COLUMNS: dict[str, pl.DataType] = {
+    "fixtureId": pl.Utf8,
+    "tournamentName": pl.Utf8,
+    "categoryName": pl.Utf8,
+    "startTime": pl.Utf8,
+    "trueStartTime": pl.Utf8,
+}
 
-    A fixture with no entry is left to the player-pair path as before; absence is
-    not an error, it just means no tournament constraint is available for it.
+
+def fixture_frame(fixtures: list[dict], extra: dict | None = None) -> pl.DataFrame:
+    """Fixture dicts -> one typed column per field (`FIXTURE_COLUMNS` plus `extra`)."""
+    schema = {**FIXTURE_COLUMNS, **(extra or {})}
+    if not fixtures:
+        return pl.DataFrame(schema=schema)
+    return pl.from_dicts(fixtures, schema=schema)
+
+
+def _start_years(fx: pl.DataFrame) -> pl.Series:
+    """Year of each fixture's start, trueStartTime first; null where it has none.
+
+    An ISO timestamp's year is its first four characters in its own offset, which
+    is what `parse_ts(...).year` returns, so the column needs no datetime parse.
+    Anything not shaped like that goes through `parse_ts` one value at a time.
     """
     from mvp.oddspapi.matcher import parse_ts
 
+    ts = fx.select(
+        pl.when(pl.col("trueStartTime").fill_null("") != "")
+        .then(pl.col("trueStartTime"))
+        .otherwise(pl.col("startTime"))
+        .fill_null("")
+    ).to_series()
+    iso = ts.str.contains(r"^\d{4}-")
+    years = pl.when(iso).then(ts.str.slice(0, 4).cast(pl.Int32, strict=False))
+    out = pl.select(years).to_series()
+    leftover = (~iso & (ts != "")).arg_true()
+    if len(leftover):
+        out = out.scatter(
+            leftover, [parse_ts(ts[int(i)]).year for i in leftover],
+        )
+    return out
+
+
+def resolve_frame(
+    fx: pl.DataFrame,
+    index: TournamentIndex | None = None,
+) -> tuple[pl.DataFrame, ResolveReport]:
+    """(fixtureId, tournament_ids) for every fixture that resolved, plus the report.
+
+    Resolution depends only on (tournamentName, categoryName, start year), and a
+    season's thousands of fixtures share a few hundred of those, so each distinct
+    key is resolved once and joined back. `tournament_ids` is sorted.
+    """
     index = index or build_index()
     aliases = _load_aliases()
-    out: dict[str, frozenset[str]] = {}
     report = ResolveReport()
 
-    for f in fixtures:
-        name = f.get("tournamentName") or ""
-        ts = parse_ts(f.get("trueStartTime")) or parse_ts(f.get("startTime"))
-        if not name or ts is None:
-            continue
-        circuit = CIRCUIT_OF_CATEGORY.get(f.get("categoryName") or "")
+    keyed = fx.select(
+        "fixtureId",
+        pl.col("tournamentName").fill_null("").alias("name"),
+        pl.col("categoryName").fill_null("").alias("category"),
+        _start_years(fx).alias("year"),
+    ).filter((pl.col("name") != "") & pl.col("year").is_not_null())
+    groups = keyed.group_by("name", "category", "year", maintain_order=True).agg(
+        pl.col("fixtureId")
+    )
 
+    fids: list[str] = []
+    ids_out: list[list[str]] = []
+    for name, category, year, members in groups.iter_rows():
+        n = len(members)
         alias = aliases.get(_norm_city(strip_suffix(name)))
         if alias is not None:
-            out[f["fixtureId"]] = frozenset({alias})
-            report.pinned += 1
-            report.by_alias += 1
-            continue
-
-        ids, how = index.lookup(name, circuit, ts.year)
+            ids, how = frozenset({alias}), "alias"
+        else:
+            ids, how = index.lookup(name, CIRCUIT_OF_CATEGORY.get(category), year)
         if not ids:
-            report.unresolved[name] = report.unresolved.get(name, 0) + 1
+            report.unresolved[name] = report.unresolved.get(name, 0) + n
             continue
-        out[f["fixtureId"]] = ids
+        fids.extend(members)
+        ids_out.extend([sorted(ids)] * n)
         if how == "narrowed":
-            report.narrowed += 1
-            report.narrowed_names[name] = report.narrowed_names.get(name, 0) + 1
+            report.narrowed += n
+            report.narrowed_names[name] = report.narrowed_names.get(name, 0) + n
         else:
-            report.pinned += 1
-            if how == "name":
-                report.by_name += 1
+            report.pinned += n
+            if how == "alias":
+                report.by_alias += n
+            elif how == "name":
+                report.by_name += n
             else:
-                report.by_city += 1
+                report.by_city += n
+
+    out = pl.DataFrame(
+        {"fixtureId": fids, "tournament_ids": ids_out},
+        schema={"fixtureId": pl.Utf8, "tournament_ids": pl.List(pl.Utf8)},
+    )
     return out, report
+
+
+def resolve_fixtures(
+    fixtures: list[dict],
+    index: TournamentIndex | None = None,
+) -> tuple[dict[str, frozenset[str]], ResolveReport]:
+    """fixtureId -> candidate tournament_ids.
+
+    A fixture with no entry is left to the player-pair path as before; absence is
+    not an error, it just means no tournament constraint is available for it.
+    """
+    out, report = resolve_frame(fixture_frame(fixtures), index)
+    return {
+        fid: frozenset(ids) for fid, ids in out.iter_rows()
+    }, report
@@ -10,14 +10,17 @@ Two layers, each with a different lifetime:
             keyed by fixture_id, no match resolution. Expensive (~10 min over
             35 GB) and rare, skipped per file on the rule atptour stages on
             (`atptour/pipeline.py:131-148`): staged file missing, raw newer than
-            staged, or the parser's schema hash changed.
+            staged, or the parser's schema hash changed. Files parse straight
+            into columns on a process pool, one file per task.
   ORGANISE  staged ticks -> stage/oddspapi/<book>/<market>.parquet, one row per
             captured tick, with `match_uid` joined and `event_status` derived. A
             transpose: input partitioned by capture file with books mixed inside,
             output partitioned by book and market with captures mixed inside.
             Nothing is aggregated or filtered, so every output row exists in the
             input. Cheap and rebuildable — 47s over the full tree — because the
-            matcher keeps improving and this is a re-join, not a reparse.
+            matcher keeps improving and this is a re-join, not a reparse. Runs
+            incrementally off a manifest: only partitions whose staged files or
+            crosswalk rows moved are rewritten.
 There was a third, `aggregate/oddspapi/quotes.parquet`: best-across-books at open,
 formed and close per (match_uid, market, points, side, role). It has been removed.
 It spent book identity on the aggregation and the time axis on three moments, and
@@ -45,9 +48,14 @@ the write.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import multiprocessing
 import os
 import shutil
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -56,13 +64,20 @@ from polars.io.partition import PartitionBy
 import pyarrow as pa
 import pyarrow.parquet as pq
 
+from mvp.common import dir_manifest
 from mvp.oddspapi import markets, matcher, parser
 from mvp.oddspapi.paths import (
+    ALL_BOOKS,
+    TICK_INDEX_WRITE_KEY,
+    TICK_ORDER,
     book_dir,
     ensure_dirs,
     historical_dirs,
+    market_path,
+    organise_manifest_path,
     role_of,
     stage_root,
+    tick_index_path,
     ticks_dir,
     ticks_path,
     ticks_schema_marker,
@@ -75,6 +90,15 @@ logger = logging.getLogger(__name__)
 # unmatched count and carried on, so a broken matcher looked like a thin season.
 MAX_UNMATCHED_FRACTION = 0.25
 
+# Below this many pending files PARSE stays in-process: pool start-up (a spawn
+# per worker, each re-importing polars) outweighs the parse itself.
+PARALLEL_PARSE_MIN_FILES = 64
+
+# Target rows per row group in a market file. Groups are cut on match boundaries,
+# so this is a floor plus at most one match; a point-in-time read for a handful of
+# matches decodes a handful of groups of about this size instead of the file.
+MARKET_ROW_GROUP_ROWS = 65_536
+
 PREMATCH = "NOT_STARTED"
 IN_PLAY = "IN_PLAY"
 
@@ -112,6 +136,19 @@ MARKET_SCHEMA: dict[str, pl.DataType] = {
     "limit": pl.Float64,
 }
 
+# One row per (staged tick file, book, market) the last ORGANISE consumed.
+MANIFEST_SCHEMA: dict[str, pl.DataType] = {
+    "file": pl.Utf8,
+    "fixture_id": pl.Utf8,
+    "mtime": pl.Float64,
+    "xw_key": pl.Utf8,
+    "book": pl.Utf8,
+    "market": pl.Utf8,
+    "n_rows": pl.Int64,
+}
+MANIFEST_META_KEY = "organise_layout"
+
+
 @dataclass
 class TransformReport:
     files_total: int = 0
@@ -128,6 +165,8 @@ class TransformReport:
     ticks_parsed: int = 0
     rows: int = 0
     rows_by_book: dict[str, int] = field(default_factory=dict)
+    partitions_rebuilt: int = 0
+    partitions_appended: int = 0
 
     def summary(self) -> str:
         return (
@@ -178,11 +217,22 @@ def _raw_entries() -> list[tuple[str, str, float]]:
 
 
 def _staged_index() -> dict[Path, float]:
-    """Staged tick file -> mtime, from one glob of the tree (0.4s for 16.5k)."""
+    """Staged tick file -> mtime, from each group's manifest (see `_write_ticks`).
+
+    A group whose manifest is missing or out of step with the directory is
+    scanned instead (0.4s for 16.5k).
+    """
     index: dict[Path, float] = {}
     for group_dir in ticks_dir().iterdir() if ticks_dir().exists() else []:
         if not group_dir.is_dir():
             continue
+        manifest = dir_manifest.load(group_dir)
+        if manifest is not None:
+            index.update(
+                (group_dir / name, mtime)
+                for name, mtime in manifest.mtimes("*.parquet").items()
+            )
+            continue
         with os.scandir(group_dir) as it:
             for e in it:
                 if e.name.endswith(".parquet"):
@@ -190,21 +240,87 @@ def _staged_index() -> dict[Path, float]:
     return index
 
 
-def _write_ticks(rows: list[dict], staged: Path) -> None:
+def _fetched_at(raw: list[str]) -> pl.Series:
+    """`createdAt` strings -> UTC datetimes in one vectorized parse.
+
+    The feed writes ISO-8601 with a `Z` or numeric offset and optional fraction.
+    Anything the fixed format misses falls back to `parser.parse_ts` per value, so
+    a format drift costs speed, never rows.
+    """
+    s = pl.Series("fetched_at", raw, dtype=pl.Utf8)
+    out = s.str.replace(r"Z$", "+00:00").str.to_datetime(
+        "%Y-%m-%dT%H:%M:%S%.f%:z", time_unit="us", time_zone="UTC", strict=False,
+    )
+    if out.null_count():
+        out = pl.Series(
+            "fetched_at", [parser.parse_ts(v) for v in raw],
+            dtype=TICK_SCHEMA["fetched_at"],
+        )
+    return out
+
+
+def _stage_file(
+    raw_path: Path, staged: Path, index: dict[str, markets.Market],
+) -> tuple[bool, int]:
+    """PARSE one raw file into its staged parquet; (readable, rows written).
+
+    Column arrays straight from `parser.parse_columns` — no Tick or row dict per
+    quote. Module-level and self-contained so the process pool in `transform` can
+    run it (through `_stage_file_worker`, which supplies the worker's index).
+    """
+    fixture_id, cols = parser.parse_columns(raw_path, index)
+    if fixture_id is None:
+        _write_ticks(pl.DataFrame(schema=TICK_SCHEMA), staged)
+        return False, 0
+    for book in set(cols["book"]):
+        role_of(book)     # refuse unclassified books loudly
+    fetched = _fetched_at(cols.pop("fetched_at"))
+    df = pl.DataFrame(
+        {c: cols[c] for c in TICK_SCHEMA if c != "fetched_at"},
+        schema={c: t for c, t in TICK_SCHEMA.items() if c != "fetched_at"},
+        strict=False,
+    ).with_columns(fetched).select(list(TICK_SCHEMA))
+    _write_ticks(df, staged)
+    return True, df.height
+
+
+# Per-worker markets index, set once by the PARSE pool's initializer.
+_worker_index: dict[str, markets.Market] | None = None
+
+
+def _stage_worker_init(index: dict[str, markets.Market]) -> None:
+    global _worker_index
+    _worker_index = index
+
+
+def _stage_file_worker(raw_path: Path, staged: Path) -> tuple[bool, int]:
+    return _stage_file(raw_path, staged, _worker_index)
+
+
+def _write_ticks(rows: list[dict] | pl.DataFrame, staged: Path) -> None:
     """Write one raw file's ticks, atomically so a kill cannot leave a half file.
 
     Zero-row writes are deliberate: a fixture with no usable quote, or a file that
     would not parse, still gets a staged file, otherwise it is re-parsed forever.
     The schema hash goes in the metadata (BaseJob.save_parquet's convention) so
     each file stays self-describing even though the skip path reads the marker.
+
+    The file lands through the group directory's manifest, which `_staged_index`
+    reads instead of stat-ing the group. The temp file is written beside the
+    group rather than in it, so pool workers only serialise on the rename.
     """
-    staged.parent.mkdir(parents=True, exist_ok=True)
-    tmp = staged.with_suffix(".parquet.tmp")
+    tmp = staged.parent.parent / ".tmp" / f"{staged.parent.name}.{staged.name}.tmp"
+    tmp.parent.mkdir(parents=True, exist_ok=True)
     try:
-        pl.DataFrame(rows, schema=TICK_SCHEMA).write_parquet(
-            tmp, metadata={SCHEMA_META_KEY: TICKS_SCHEMA_HASH}
+        df = rows if isinstance(rows, pl.DataFrame) else pl.DataFrame(
+            rows, schema=TICK_SCHEMA
         )
-        tmp.replace(staged)
+        df.write_parquet(tmp, metadata={SCHEMA_META_KEY: TICKS_SCHEMA_HASH})
+        with tmp.open("rb") as fh:
+            digest = hashlib.file_digest(fh, "sha256").hexdigest()
+        with dir_manifest.writing(staged.parent) as manifest:
+            tmp.replace(staged)
+            manifest.add(staged.name, digest)
     except Exception:
         tmp.unlink(missing_ok=True)
         raise
@@ -214,12 +330,15 @@ def transform(
     *,
     refresh: bool = False,
     refresh_matcher: bool = False,
+    workers: int | None = None,
 ) -> TransformReport:
     """Parse new raw files, then rebuild the per-book stage files.
 
     `refresh=True` re-parses every raw file regardless of what is staged. Normal
     runs skip per file, so re-running after an alias change re-reduces without
-    re-parsing.
+    re-parsing. `workers` caps the PARSE process pool (None = one per core); a
+    handful of pending files is parsed in-process, where spawning would cost more
+    than it saves.
     """
     ensure_dirs()
     index = markets.load_index()
@@ -286,12 +405,18 @@ def transform(
     # creates every historical dir, so an empty one is indistinguishable from a
     # missing one — and an unsynced or renamed capture group would otherwise have
     # its whole staged half (~8k files) deleted before anything was parsed.
+    prune: dict[Path, list[Path]] = {}
     for p in set(staged_index) - expected:
         if p.parent.name in seen_groups:
-            p.unlink()
-            report.files_pruned += 1
+            prune.setdefault(p.parent, []).append(p)
         else:
             report.files_orphan_kept += 1
+    for group_dir, orphans in prune.items():
+        with dir_manifest.writing(group_dir) as manifest:
+            for p in orphans:
+                p.unlink()
+                manifest.remove(p.name)
+        report.files_pruned += len(orphans)
     if report.files_orphan_kept:
         logger.warning(
             "%d staged files kept: their capture group yielded no raw files "
@@ -305,38 +430,41 @@ def transform(
         f", {report.files_pruned} orphans pruned" if report.files_pruned else "",
     )
 
-    for i, (f, staged) in enumerate(pending, start=1):
-        fixture_id, ticks = parser.parse_file(f, index)
-        if fixture_id is None:
+    n_workers = min(workers or os.cpu_count() or 1, len(pending))
+    if len(pending) < PARALLEL_PARSE_MIN_FILES:
+        n_workers = 1
+
+    def _tally(i: int, readable: bool) -> None:
+        if readable:
+            report.files_parsed += 1
+        else:
             report.files_unreadable += 1
-            _write_ticks([], staged)
-            continue
-        rows = []
-        for t in ticks:
-            if t.odds is None:
-                continue
-            role_of(t.book)     # refuse unclassified books loudly
-            rows.append({
-                "fixture_id": fixture_id,
-                "book": t.book,
-                "market": t.stage_name,
-                "points": t.points,
-                "side": t.side,
-                "odds": float(t.odds),
-                "fetched_at": t.ts,
-                "active": t.active,
-                "limit": t.limit,
-                "exchange_meta": t.exchange_meta,
-            })
-        _write_ticks(rows, staged)
-        report.files_parsed += 1
         if i % 1000 == 0:
             logger.info("parsed %d/%d", i, len(pending))
 
+    if n_workers <= 1:
+        for i, (f, staged) in enumerate(pending, start=1):
+            readable, _ = _stage_file(f, staged, index)
+            _tally(i, readable)
+    else:
+        # Files are independent, and a file's cost is its decode and column build
+        # — single-core Python work that threads would serialise on the GIL. Each
+        # worker writes its own staged file, so only (readable, rows) come back.
+        # The markets index ships once per worker, not pickled into every task.
+        logger.info("parsing on %d worker processes", n_workers)
+        with ProcessPoolExecutor(
+            max_workers=n_workers, mp_context=multiprocessing.get_context("spawn"),
+            initializer=_stage_worker_init, initargs=(index,),
+        ) as ex:
+            futures = [ex.submit(_stage_file_worker, f, st) for f, st in pending]
+            for i, fut in enumerate(as_completed(futures), start=1):
+                readable, _ = fut.result()
+                _tally(i, readable)
+
     if pending or not marker.exists():
         marker.write_text(TICKS_SCHEMA_HASH, encoding="utf-8")
 
-    _organise(xw, report)
+    _organise(xw, report, rebuild=refresh or report.schema_restage)
     logger.info(report.summary())
     return report
 
@@ -377,8 +505,206 @@ def _swap_books_in(new_root: Path, report: TransformReport) -> None:
         report.rows += report.rows_by_book[book]
 
 
-def _organise(xw: pl.DataFrame, report: TransformReport) -> None:
-    """Staged ticks -> stage/oddspapi/<book>/<market>.parquet, in one streaming pass.
+def _sort_and_index(path: Path, index_path: Path) -> None:
+    """Rewrite one market file in `TICK_ORDER` with match-aligned row groups, and
+    write its per-match offset index beside it.
+
+    The partitioned sink leaves rows in whatever order the streaming engine emitted
+    them, so every point-in-time read had to scan the whole file and sort inside
+    each group. Sorted here once, a read of N matches is the row groups the index
+    names and a last-row-per-rung, with no sort at all.
+
+    A group boundary falls at the first match starting at or after each multiple of
+    MARKET_ROW_GROUP_ROWS, so no match straddles two groups and the parquet min/max
+    statistics on match_uid are disjoint. Unresolved rows (null match_uid) sort last
+    into their own groups and are not indexed — no point-in-time query asks for them.
+
+    One book x market is held in memory for the sort: the largest, betrivers
+    total_games, is ~11M rows, against the whole corpus the transpose streams.
+
+    Both files carry the same fresh `TICK_INDEX_WRITE_KEY` id, so a reader can tell
+    an index from this write apart from one left over from an earlier write.
+    """
+    df = pl.read_parquet(path).sort(list(TICK_ORDER), nulls_last=True,
+                                    maintain_order=True)
+    spans = (
+        df.select("match_uid").with_row_index("row")
+        .group_by("match_uid", maintain_order=True)
+        .agg(pl.col("row").first().alias("row_start"), pl.len().alias("n_rows"))
+        .with_columns(
+            pl.when(pl.col("match_uid").is_null())
+            .then(pl.lit(-1, dtype=pl.Int64))
+            .otherwise(pl.col("row_start").cast(pl.Int64) // MARKET_ROW_GROUP_ROWS)
+            .alias("_bucket")
+        )
+        .with_columns(
+            # -1 ranks first; push it past every match bucket instead
+            pl.when(pl.col("_bucket") < 0).then(pl.col("_bucket").max() + 1)
+            .otherwise(pl.col("_bucket"))
+            .rank("dense").cast(pl.Int64).sub(1).alias("row_group")
+        )
+    )
+    groups = spans.group_by("row_group", maintain_order=True).agg(
+        pl.col("row_start").first(), pl.col("n_rows").sum()
+    )
+
+    write_id = uuid.uuid4().hex
+    table = df.to_arrow()
+    table = table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), TICK_INDEX_WRITE_KEY: write_id}
+    )
+    tmp = path.with_suffix(".sorting")
+    with pq.ParquetWriter(tmp, table.schema, compression="zstd") as w:
+        for start, n in groups.select("row_start", "n_rows").iter_rows():
+            w.write_table(table.slice(start, n), row_group_size=n)
+    os.replace(tmp, path)
+
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    spans.filter(pl.col("match_uid").is_not_null()).select(
+        "match_uid", "row_group", "row_start", "n_rows"
+    ).write_parquet(index_path, metadata={TICK_INDEX_WRITE_KEY: write_id})
+
+
+def _market_rows(
+    scan: pl.LazyFrame, fixtures: pl.DataFrame, participant_sided: list[str]
+) -> pl.LazyFrame:
+    """Staged ticks -> MARKET_SCHEMA rows: the crosswalk joined, two columns derived."""
+    boundary = pl.coalesce([pl.col("true_start_time"), pl.col("start_time")])
+    return (
+        # LEFT, not inner. An inner join drops every tick of a fixture the crosswalk
+        # cannot resolve — 290 fixtures and ~3.9M ticks on the current corpus — and
+        # makes the dropped universe invisible without going back to the ticks tree.
+        # Same reason nothing here cuts on prematch or `active`: an unresolved
+        # fixture is a null match_uid to filter, not an absence.
+        scan.join(fixtures.lazy(), on="fixture_id", how="left")
+        .with_columns(
+            # Which player a side refers to, resolved against the fixture's OWN
+            # participant order. Guarded on the market, not on the side string:
+            # `exactsets_result` has outcomes ["2","3","4","5"] for the number of
+            # sets a match takes, so matching side == "2" would attribute a set
+            # count to a player. Null for over/under, yes/no, correct-score, and
+            # the draw outcome in moneyline_aces_result.
+            pl.when(~pl.col("market").is_in(participant_sided))
+            .then(pl.lit(None, dtype=pl.Utf8))
+            .when(pl.col("side") == "1").then(pl.col("participant1_id"))
+            .when(pl.col("side") == "2").then(pl.col("participant2_id"))
+            .otherwise(pl.lit(None, dtype=pl.Utf8))
+            .alias("side_player_id")
+        )
+        .with_columns(
+            # Three-way, not two. With no crosswalk row there is no boundary, and
+            # `otherwise` would label those IN_PLAY — asserting a match state we do
+            # not know. Unknown is null.
+            pl.when(boundary.is_null())
+            .then(pl.lit(None, dtype=pl.Utf8))
+            .when(pl.col("fetched_at") <= boundary)
+            .then(pl.lit(PREMATCH))
+            .otherwise(pl.lit(IN_PLAY))
+            .alias("event_status")
+        )
+        .select(list(MARKET_SCHEMA))
+    )
+
+
+def _layout_key(participant_sided: list[str]) -> str:
+    """Everything besides the inputs that decides what an output row looks like.
+
+    A manifest written under a different key describes files this code would not
+    write, so it is discarded and the layer rebuilt in full.
+    """
+    return hashlib.sha256(json.dumps([
+        TICKS_SCHEMA_HASH,
+        {k: str(v) for k, v in MARKET_SCHEMA.items()},
+        list(TICK_ORDER), participant_sided, PREMATCH, IN_PLAY,
+    ]).encode()).hexdigest()
+
+
+def _crosswalk_keys(fixtures: pl.DataFrame) -> pl.DataFrame:
+    """(fixture_id, xw_key): every crosswalk value a fixture's rows depend on, as one
+    comparable string. A fixture the matcher re-resolved gets a new key."""
+    cols = [c for c in fixtures.columns if c != "fixture_id"]
+    return fixtures.select(
+        "fixture_id",
+        pl.concat_str(
+            [pl.col(c).cast(pl.Utf8).fill_null("\x00") for c in cols],
+            separator="\x1f",
+        ).alias("xw_key"),
+    ).unique("fixture_id", keep="first")
+
+
+def _manifest_rows(
+    files: list[Path], mtimes: dict[Path, float], xw_keys: pl.DataFrame
+) -> pl.DataFrame:
+    """One row per (staged file, book, market) it contributes, with its tick count.
+
+    A zero-row file still gets a row (null book/market) so it reads as seen, not
+    as new, on the next run.
+    """
+    if not files:
+        return pl.DataFrame(schema=MANIFEST_SCHEMA)
+    rel = {str(p): p.relative_to(ticks_dir()).as_posix() for p in files}
+    counts = (
+        pl.scan_parquet(list(rel), include_file_paths="_path")
+        .group_by("_path", "book", "market")
+        .agg(pl.len().cast(pl.Int64).alias("n_rows"))
+        .collect(engine="streaming")
+    )
+    base = pl.DataFrame({
+        "_path": list(rel),
+        "file": list(rel.values()),
+        "fixture_id": [_fixture_of(p) for p in files],
+        "mtime": [mtimes[p] for p in files],
+    }, schema_overrides={"mtime": pl.Float64})
+    return (
+        base.join(counts, on="_path", how="left")
+        .join(xw_keys, on="fixture_id", how="left")
+        .with_columns(pl.col("n_rows").fill_null(0))
+        .select(list(MANIFEST_SCHEMA))
+        .cast(MANIFEST_SCHEMA)
+    )
+
+
+def _read_manifest(layout: str) -> pl.DataFrame | None:
+    path = organise_manifest_path()
+    try:
+        meta = pq.read_metadata(path).metadata or {}
+    except (OSError, pa.ArrowException):
+        return None
+    if meta.get(MANIFEST_META_KEY.encode(), b"").decode() != layout:
+        return None
+    return pl.read_parquet(path)
+
+
+def _write_manifest(manifest: pl.DataFrame, layout: str) -> None:
+    path = organise_manifest_path()
+    tmp = path.with_suffix(".tmp")
+    manifest.write_parquet(tmp, metadata={MANIFEST_META_KEY: layout})
+    os.replace(tmp, path)
+
+
+def _partitions(manifest: pl.DataFrame) -> set[tuple[str, str]]:
+    return set(
+        manifest.filter(pl.col("n_rows") > 0)
+        .select("book", "market").unique().iter_rows()
+    )
+
+
+def _count_rows(report: TransformReport) -> None:
+    report.rows_by_book = {}
+    for book in ALL_BOOKS:
+        live = book_dir(book)
+        if not live.exists():
+            continue
+        report.rows_by_book[book] = sum(
+            pq.read_metadata(f).num_rows for f in live.glob("*.parquet")
+        )
+    report.rows = sum(report.rows_by_book.values())
+
+
+def _organise(
+    xw: pl.DataFrame, report: TransformReport, *, rebuild: bool = False
+) -> None:
+    """Staged ticks -> stage/oddspapi/<book>/<market>.parquet.
 
     A transpose, not a reduction. The input is partitioned by capture file with up
     to three books mixed inside; the output is partitioned by book and market with
@@ -393,12 +719,16 @@ def _organise(xw: pl.DataFrame, report: TransformReport) -> None:
     price changes fell inside a bucket, and on thin books it invented rows — bet365
     carried 44,774 filled rows built from 33,828 actual ticks.
 
-    polars partitions the write, so memory is bounded by the streaming engine rather
-    than by a batch size picked by hand. Measured over the full tree: 16,535 files
-    to 117 output files in 47s, 141M rows, 671 MB.
+    Incremental against `_organise_manifest.parquet`, which records every staged
+    file's mtime, crosswalk key and the (book, market) partitions it fed. A new
+    file's rows are appended to its partitions; a rewritten, pruned or re-resolved
+    file marks its partitions dirty and only those are rebuilt from their own
+    staged files. A missing or foreign-layout manifest, `rebuild=True`, or a book
+    directory gone from disk falls back to the full streaming rebuild.
     """
     by_fixture: dict[str, list[Path]] = {}
-    for p in _staged_index():
+    staged = _staged_index()
+    for p in staged:
         by_fixture.setdefault(_fixture_of(p), []).append(p)
     if not by_fixture:
         logger.warning("no staged ticks to organise")
@@ -430,55 +760,46 @@ def _organise(xw: pl.DataFrame, report: TransformReport) -> None:
         "fixture_id", "match_uid", "participant1_id", "participant2_id",
         "start_time", "true_start_time",
     )
-
-    files = [str(p) for p in sorted(_staged_index())]
-    scan = pl.scan_parquet(files)
-    # One cheap single-column pass for the counters. A fixture whose staged files
-    # are all zero-row is invisible downstream, and parse-time counters only show it
-    # on the run that parsed it, so it is surfaced every run.
-    stats = scan.select(
-        pl.len().alias("ticks"), pl.col("fixture_id").n_unique().alias("fixtures")
-    ).collect(engine="streaming")
-    report.ticks_parsed = int(stats["ticks"][0])
-    report.fixtures_empty = report.fixtures_staged - int(stats["fixtures"][0])
-
     participant_sided = sorted(markets.participant_sided_markets())
-    boundary = pl.coalesce([pl.col("true_start_time"), pl.col("start_time")])
-    lf = (
-        # LEFT, not inner. An inner join drops every tick of a fixture the crosswalk
-        # cannot resolve — 290 fixtures and ~3.9M ticks on the current corpus — and
-        # makes the dropped universe invisible without going back to the ticks tree.
-        # Same reason nothing here cuts on prematch or `active`: an unresolved
-        # fixture is a null match_uid to filter, not an absence.
-        scan.join(fixtures.lazy(), on="fixture_id", how="left")
-        .with_columns(
-            # Which player a side refers to, resolved against the fixture's OWN
-            # participant order. Guarded on the market, not on the side string:
-            # `exactsets_result` has outcomes ["2","3","4","5"] for the number of
-            # sets a match takes, so matching side == "2" would attribute a set
-            # count to a player. Null for over/under, yes/no, correct-score, and
-            # the draw outcome in moneyline_aces_result.
-            pl.when(~pl.col("market").is_in(participant_sided))
-            .then(pl.lit(None, dtype=pl.Utf8))
-            .when(pl.col("side") == "1").then(pl.col("participant1_id"))
-            .when(pl.col("side") == "2").then(pl.col("participant2_id"))
-            .otherwise(pl.lit(None, dtype=pl.Utf8))
-            .alias("side_player_id")
+    layout = _layout_key(participant_sided)
+    xw_keys = _crosswalk_keys(fixtures)
+
+    prev = None if rebuild else _read_manifest(layout)
+    if prev is not None and any(
+        not book_dir(b).exists() for b, _ in _partitions(prev)
+    ):
+        prev = None
+    # Dropped before any output moves and rewritten after: a run killed mid-swap
+    # leaves no manifest, so the next run rebuilds rather than re-appending rows
+    # that already landed.
+    organise_manifest_path().unlink(missing_ok=True)
+
+    if prev is None:
+        manifest = _manifest_rows(sorted(staged), staged, xw_keys)
+        _tally_manifest(manifest, report, unmatched)
+        _organise_full(manifest, fixtures, participant_sided, report)
+    else:
+        manifest = _organise_changed(
+            prev, staged, xw_keys, fixtures, participant_sided, report, unmatched,
         )
-        .with_columns(
-            # Three-way, not two. With no crosswalk row there is no boundary, and
-            # `otherwise` would label those IN_PLAY — asserting a match state we do
-            # not know. Unknown is null.
-            pl.when(boundary.is_null())
-            .then(pl.lit(None, dtype=pl.Utf8))
-            .when(pl.col("fetched_at") <= boundary)
-            .then(pl.lit(PREMATCH))
-            .otherwise(pl.lit(IN_PLAY))
-            .alias("event_status")
+    _write_manifest(manifest, layout)
+
+    if report.rows:
+        logger.info(
+            "wrote %d rows across %d books -> %s",
+            report.rows, len(report.rows_by_book), stage_root(),
         )
-        .select(list(MARKET_SCHEMA))
-    )
 
+
+def _tally_manifest(
+    manifest: pl.DataFrame, report: TransformReport, unmatched: int
+) -> None:
+    """Counters off the manifest rather than a pass over the ticks. A fixture whose
+    staged files are all zero-row is invisible downstream, and parse-time counters
+    only show it on the run that parsed it, so it is surfaced every run."""
+    report.ticks_parsed = int(manifest["n_rows"].sum())
+    with_ticks = manifest.filter(pl.col("n_rows") > 0)["fixture_id"].n_unique()
+    report.fixtures_empty = report.fixtures_staged - with_ticks
     logger.info(
         "organising %d ticks from %d fixtures (%d unmatched, %d matches with "
         "multiple fixtures)",
@@ -486,6 +807,23 @@ def _organise(xw: pl.DataFrame, report: TransformReport) -> None:
         report.matches_multi_fixture,
     )
 
+
+def _organise_full(
+    manifest: pl.DataFrame,
+    fixtures: pl.DataFrame,
+    participant_sided: list[str],
+    report: TransformReport,
+) -> None:
+    """Every book x market from every staged file, in one streaming pass.
+
+    polars partitions the write, so memory is bounded by the streaming engine rather
+    than by a batch size picked by hand. Measured over the full tree: 16,535 files
+    to 117 output files in 47s, 141M rows, 671 MB. Each output file is then sorted
+    and indexed for point-in-time reads (`_sort_and_index`) before it is swapped in.
+    """
+    files = [str(ticks_dir() / f) for f in manifest["file"].unique().sort()]
+    lf = _market_rows(pl.scan_parquet(files), fixtures, participant_sided)
+
     # Written aside and renamed in, so a reader on the shared B:/ never sees a
     # half-written file. A killed run leaves this behind; it is cleared on the next.
     new_root = stage_root() / ".new"
@@ -509,12 +847,114 @@ def _organise(xw: pl.DataFrame, report: TransformReport) -> None:
             ),
             engine="streaming",
         )
+        written = sorted(new_root.glob("*/*.parquet"))
+        for f in written:
+            _sort_and_index(f, f.parent / "_index" / f.name)
+        report.partitions_rebuilt = len(written)
         _swap_books_in(new_root, report)
     finally:
         shutil.rmtree(new_root, ignore_errors=True)
 
-    if report.rows:
-        logger.info(
-            "wrote %d rows across %d books -> %s",
-            report.rows, len(report.rows_by_book), stage_root(),
-        )
+
+def _organise_changed(
+    prev: pl.DataFrame,
+    staged: dict[Path, float],
+    xw_keys: pl.DataFrame,
+    fixtures: pl.DataFrame,
+    participant_sided: list[str],
+    report: TransformReport,
+    unmatched: int,
+) -> pl.DataFrame:
+    """Rewrite only the partitions touched since `prev`; returns the new manifest.
+
+    Appending is safe only for a file the previous run never saw: its rows are new,
+    and nothing already written came from it. Any other change — a rewritten or
+    pruned file, a fixture the matcher re-resolved — may have to remove rows, and
+    the market files do not carry the fixture a row came from, so the partition is
+    rebuilt from the staged files that feed it.
+    """
+    paths_sorted = sorted(staged)
+    current = pl.DataFrame({
+        "file": [p.relative_to(ticks_dir()).as_posix() for p in paths_sorted],
+        "fixture_id": [_fixture_of(p) for p in paths_sorted],
+        "mtime": [staged[p] for p in paths_sorted],
+    }, schema_overrides={"mtime": pl.Float64}).join(
+        xw_keys, on="fixture_id", how="left"
+    )
+    seen = prev.select("file", "mtime", "xw_key").unique("file")
+    cmp = current.join(seen, on="file", how="full", suffix="_prev", coalesce=True)
+    added = cmp.filter(pl.col("mtime_prev").is_null())["file"].to_list()
+    removed = cmp.filter(pl.col("mtime").is_null())["file"].to_list()
+    changed = cmp.filter(
+        pl.col("mtime").is_not_null() & pl.col("mtime_prev").is_not_null()
+        & ((pl.col("mtime") != pl.col("mtime_prev"))
+           | ~pl.col("xw_key").eq_missing(pl.col("xw_key_prev")))
+    )["file"].to_list()
+
+    by_rel = {p.relative_to(ticks_dir()).as_posix(): p for p in paths_sorted}
+    fresh = _manifest_rows(
+        [by_rel[f] for f in sorted(added + changed)], staged, xw_keys
+    )
+    stale = prev.filter(pl.col("file").is_in(removed + changed))
+    manifest = pl.concat([
+        prev.filter(~pl.col("file").is_in(removed + changed)), fresh,
+    ])
+    _tally_manifest(manifest, report, unmatched)
+
+    dirty = _partitions(stale) | _partitions(
+        fresh.filter(pl.col("file").is_in(changed))
+    )
+    live = _partitions(manifest)
+    appended = _partitions(fresh.filter(pl.col("file").is_in(added))) - dirty
+    logger.info(
+        "organise: %d new, %d changed, %d removed staged files -> %d partitions "
+        "rebuilt, %d appended",
+        len(added), len(changed), len(removed), len(dirty & live), len(appended),
+    )
+
+    new_root = stage_root() / ".new"
+    shutil.rmtree(new_root, ignore_errors=True)
+    try:
+        for book, market in sorted(dirty | appended):
+            dest = market_path(book, market)
+            index = tick_index_path(book, market)
+            if (book, market) not in live:
+                dest.unlink(missing_ok=True)
+                index.unlink(missing_ok=True)
+                continue
+            feeds = manifest if (book, market) in dirty else fresh
+            files = feeds.filter(
+                (pl.col("book") == book) & (pl.col("market") == market)
+            )["file"].unique().sort()
+            rows = _market_rows(
+                pl.scan_parquet([str(ticks_dir() / f) for f in files])
+                .filter((pl.col("book") == book) & (pl.col("market") == market)),
+                fixtures, participant_sided,
+            ).collect()
+            if (book, market) not in dirty and dest.exists():
+                # The new rows interleave with the old in TICK_ORDER, so an append
+                # re-sorts the whole partition: it costs the partition, not the
+                # new files.
+                rows = pl.concat([pl.read_parquet(dest).cast(MARKET_SCHEMA), rows])
+
+            out = new_root / book / f"{market}.parquet"
+            out.parent.mkdir(parents=True, exist_ok=True)
+            rows.write_parquet(out)
+            _sort_and_index(out, out.parent / "_index" / out.name)
+            # Data then index: a reader in between, or after a kill between the
+            # two renames, finds the old index's write id differing from the new
+            # file's (board._tick_index) and scans instead of trusting the old
+            # offsets.
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            index.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(out, dest)
+            os.replace(out.parent / "_index" / out.name, index)
+            if (book, market) in dirty:
+                report.partitions_rebuilt += 1
+            else:
+                report.partitions_appended += 1
+    finally:
+        shutil.rmtree(new_root, ignore_errors=True)
+
+    _count_rows(report)
+    return manifest
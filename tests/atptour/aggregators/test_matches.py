@@ -246,6 +246,32 @@ class TestRankingsJoin:
         result = join_rankings(matches, rankings)
         assert result["player_rankings_rank"][0] is None
 
+    def test_presorted_layout_matches_sorted_join(self):
+        """Per-player date order (the store layout) gives the same as-of join."""
+        from mvp.atptour.aggregators.matches import join_rankings
+
+        matches = pl.DataFrame({
+            "player_id": ["A001", "B002", "A001"],
+            "opp_id": ["B002", "A001", "C003"],
+            "tournament_start_date": [
+                date(2024, 3, 4), date(2024, 3, 4), date(2025, 1, 6),
+            ],
+        })
+        rankings = pl.DataFrame({
+            "player_id": ["A001", "A001", "A001", "B002", "C003"],
+            "ranking_date": [
+                date(2024, 2, 26), date(2024, 3, 4), date(2025, 1, 6),
+                date(2024, 3, 4), date(2025, 1, 6),
+            ],
+            "rank": [10, 9, 3, 20, 30],
+            "points": [1000, 1100, 2000, 500, 400],
+            "tournaments_played": [5, 6, 7, 10, 8],
+        })
+        key = ["player_id", "opp_id"]
+        expected = join_rankings(matches, rankings.reverse()).sort(key)
+        result = join_rankings(matches, rankings, presorted=True).sort(key)
+        assert result.equals(expected)
+
 
 class TestBioJoin:
     def test_bio_enrichment_adds_player_and_opp_fields(self):
@@ -2,6 +2,7 @@
 
 from datetime import date, datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import polars as pl
 
@@ -681,6 +682,32 @@ class TestTournamentMatchesAggregator:
         result = agg.run()
         assert result is None
 
+    def test_run_skips_when_inputs_unchanged(self, tmp_path):
+        """A second run over the same staged inputs does no work."""
+        _write_results_parquet(tmp_path)
+        agg = TournamentMatchesAggregator(
+            circuit=Circuit.tour, tid="580", year=2023, data_root=tmp_path
+        )
+        first = agg.run()
+        with patch.object(agg, "aggregate") as aggregate:
+            assert agg.run() == first
+            aggregate.assert_not_called()
+            agg.run(force=True)
+            aggregate.assert_called_once()
+
+    def test_run_rebuilds_when_input_changes(self, tmp_path):
+        """A restaged or newly landed input invalidates the fingerprint."""
+        _write_results_parquet(tmp_path)
+        agg = TournamentMatchesAggregator(
+            circuit=Circuit.tour, tid="580", year=2023, data_root=tmp_path
+        )
+        agg.run()
+        before = agg.input_fingerprint()
+        _write_schedule_parquet(tmp_path)
+        assert agg.input_fingerprint() != before
+        result_path = agg.run()
+        assert len(pl.read_parquet(result_path)) == 4
+
     def test_schedule_time_fields_in_output(self, tmp_path):
         """is_time_estimated and court_match_num from Schedule should be in output."""
         data_root = tmp_path / "data"
@@ -44,6 +44,22 @@ class TestResultsExtractor:
         with patch.object(extractor, "fetch_html", return_value="<html></html>"):
             extractor.run(tournament, refresh=True)
 
+    def test_unchanged_page_is_not_rewritten(self, extractor, tournament, tmp_path):
+        page = '<div class="match">6-4</div>'
+        with patch.object(extractor, "fetch_html", return_value=page):
+            assert extractor.run(tournament, refresh=True)
+        path = tmp_path / "raw" / "atptour" / tournament.path / "results_singles.html"
+        mtime = path.stat().st_mtime_ns
+
+        noisy = f"<script>var t = 2;</script>\n{page}\n"
+        with patch.object(extractor, "fetch_html", return_value=noisy):
+            assert not extractor.run(tournament, refresh=True)
+        assert path.stat().st_mtime_ns == mtime
+
+        with patch.object(extractor, "fetch_html", return_value=page + "7-5"):
+            assert extractor.run(tournament, refresh=True)
+        assert path.read_text(encoding="utf-8").endswith("7-5")
+
     def test_url_archive(self, extractor, tournament):
         url = extractor._results_url(tournament)
         assert "/archive/" in url
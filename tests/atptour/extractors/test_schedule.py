@@ -54,6 +54,27 @@ class TestScheduleExtractor:
         assert "schedule_" in result.stem
         assert result.suffix == ".html"
 
+    def test_unchanged_schedule_reuses_latest_snapshot(self, extractor):
+        t = Tournament(
+            tournament_id="580",
+            year=2026,
+            circuit=Circuit.tour,
+            location="Melbourne, Australia",
+            is_archive=False,
+        )
+        with patch.object(extractor, "fetch_html", return_value="<html>d1</html>"):
+            first = extractor.run(t)
+        extractor._run_datetime_str = "20991231_235959"
+        with patch.object(extractor, "fetch_html", return_value="<html>d1</html> "):
+            second = extractor.run(t)
+        assert second == first
+        assert len(list(first.parent.glob("schedule_*.html"))) == 1
+
+        with patch.object(extractor, "fetch_html", return_value="<html>d2</html>"):
+            third = extractor.run(t)
+        assert third != first
+        assert third.read_text(encoding="utf-8") == "<html>d2</html>"
+
     def test_url_construction(self, extractor):
         t = Tournament(
             tournament_id="580",
@@ -0,0 +1,85 @@
+"""Tests for the persistent parse cache."""
+
+import sqlite3
+from datetime import date
+
+from mvp.atptour.parsers import cache as parse_cache
+from mvp.atptour.parsers.cache import ParseCache
+
+
+class _CountingParser:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, html: str) -> list[dict]:
+        self.calls += 1
+        return [{"html": html, "day": date(2026, 2, 16)}]
+
+
+class TestParseCache:
+    def test_hit_skips_parse(self, tmp_path):
+        parser = _CountingParser()
+        cache = ParseCache(tmp_path / "cache.sqlite")
+
+        first = cache.parse("results_singles", 1, "<html/>", parser)
+        again = ParseCache(tmp_path / "cache.sqlite").parse(
+            "results_singles", 1, "<html/>", parser
+        )
+
+        assert again == first == [{"html": "<html/>", "day": date(2026, 2, 16)}]
+        assert parser.calls == 1
+        assert cache.misses == 1
+
+    def test_key_covers_parser_version_and_content(self, tmp_path):
+        parser = _CountingParser()
+        cache = ParseCache(tmp_path / "cache.sqlite")
+
+        cache.parse("results_singles", 1, "<html/>", parser)
+        cache.parse("results_singles", 2, "<html/>", parser)
+        cache.parse("results_doubles", 1, "<html/>", parser)
+        cache.parse("results_singles", 1, "<html></html>", parser)
+
+        assert parser.calls == 4
+        assert cache.hits == 0
+
+    def test_unusable_cache_falls_through_to_parse(self, tmp_path):
+        (tmp_path / "cache.sqlite").mkdir()
+        parser = _CountingParser()
+        cache = ParseCache(tmp_path / "cache.sqlite")
+
+        assert cache.parse("schedule", 1, "<html/>", parser) == parser("<html/>")
+        assert parser.calls == 2
+
+    def test_key_covers_parser_source(self, tmp_path, monkeypatch):
+        parser = _CountingParser()
+        cache = ParseCache(tmp_path / "cache.sqlite")
+
+        cache.parse("results_singles", 1, "<html/>", parser)
+        monkeypatch.setattr(parse_cache, "source_hash", lambda fn: "edited")
+        cache.parse("results_singles", 1, "<html/>", parser)
+
+        assert parser.calls == 2
+
+    def test_superseded_entries_pruned_on_first_use(self, tmp_path, monkeypatch):
+        path = tmp_path / "cache.sqlite"
+        parser = _CountingParser()
+        ParseCache(path).parse("results_singles", 1, "<a/>", parser)
+        ParseCache(path).parse("results_singles", 1, "<b/>", parser)
+        ParseCache(path).parse("schedule", 1, "<a/>", parser)
+
+        # A new process running an edited parser.
+        monkeypatch.setattr(parse_cache, "_PRUNED", set())
+        ParseCache(path).parse("results_singles", 2, "<a/>", parser)
+
+        with sqlite3.connect(path) as conn:
+            rows = conn.execute(
+                "SELECT parser, version FROM parses ORDER BY parser"
+            ).fetchall()
+        assert rows == [("results_singles", 2), ("schedule", 1)]
+
+    def test_scan_functions_are_keyed_on_parser_source_only(self):
+        """An edit to record building in a transformer must not reparse pages."""
+        from mvp.atptour.parsers import rankings, schedule
+
+        for fn in (rankings.scan_rankings_page, schedule.scan_schedule_html):
+            assert fn.__module__.startswith("mvp.atptour.parsers.")
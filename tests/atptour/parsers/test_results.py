@@ -638,11 +638,11 @@ class TestParseScores:
     def test_no_scores_div(self, parser):
         """stats-item with no scores div returns empty lists."""
         # Directly test the static method
-        from bs4 import BeautifulSoup
+        from mvp.atptour.parsers.lxml_utils import has_class, parse_html
 
         html = '<div class="stats-item"><div class="player-info"></div></div>'
-        soup = BeautifulSoup(html, "lxml")
-        div = soup.find("div", class_="stats-item")
+        root = parse_html(html)
+        div = root.xpath(f".//div[{has_class('stats-item')}]")[0]
         games, tbs = ResultsParser._parse_scores(div)
         assert games == []
         assert tbs == []
@@ -781,7 +781,7 @@ class TestParseMatchId:
 
     def test_trailing_slash_stripped(self, parser):
         """Trailing slash in URL doesn't affect match ID extraction."""
-        from bs4 import BeautifulSoup
+        from mvp.atptour.parsers.lxml_utils import has_class, parse_html
 
         footer_html = """
         <div class="match-footer">
@@ -790,8 +790,8 @@ class TestParseMatchId:
           </div>
         </div>
         """
-        soup = BeautifulSoup(footer_html, "lxml")
-        footer = soup.find("div", class_="match-footer")
+        root = parse_html(footer_html)
+        footer = root.xpath(f".//div[{has_class('match-footer')}]")[0]
         assert ResultsParser._parse_match_id(footer) == "ms099"
 
 
@@ -1044,7 +1044,7 @@ class TestParsePlayer:
 class TestParseTeam:
     def test_fewer_than_2_imgs_returns_none(self):
         """Team with only 1 player image returns None."""
-        from bs4 import BeautifulSoup
+        from mvp.atptour.parsers.lxml_utils import has_class, parse_html
 
         html = """
         <div class="stats-item">
@@ -1063,13 +1063,13 @@ class TestParseTeam:
           </div>
         </div>
         """
-        soup = BeautifulSoup(html, "lxml")
-        div = soup.find("div", class_="stats-item")
+        root = parse_html(html)
+        div = root.xpath(f".//div[{has_class('stats-item')}]")[0]
         assert ResultsParser._parse_team(div) is None
 
     def test_fewer_than_2_a_tags_returns_none(self):
         """Team with fewer than 2 name links returns None."""
-        from bs4 import BeautifulSoup
+        from mvp.atptour.parsers.lxml_utils import has_class, parse_html
 
         html = """
         <div class="stats-item">
@@ -1091,13 +1091,13 @@ class TestParseTeam:
           </div>
         </div>
         """
-        soup = BeautifulSoup(html, "lxml")
-        div = soup.find("div", class_="stats-item")
+        root = parse_html(html)
+        div = root.xpath(f".//div[{has_class('stats-item')}]")[0]
         assert ResultsParser._parse_team(div) is None
 
     def test_missing_countries_defaults_to_empty(self):
         """Team without countries div gets empty country strings."""
-        from bs4 import BeautifulSoup
+        from mvp.atptour.parsers.lxml_utils import has_class, parse_html
 
         html = """
         <div class="stats-item">
@@ -1119,8 +1119,8 @@ class TestParseTeam:
           </div>
         </div>
         """
-        soup = BeautifulSoup(html, "lxml")
-        div = soup.find("div", class_="stats-item")
+        root = parse_html(html)
+        div = root.xpath(f".//div[{has_class('stats-item')}]")[0]
         result = ResultsParser._parse_team(div)
         assert result is not None
         assert result["players"][0]["country"] == ""
@@ -1134,7 +1134,7 @@ class TestParseTournamentDates:
         """Parses '2-8 May, 2022' format correctly."""
         from datetime import date
 
-        from bs4 import BeautifulSoup
+        from mvp.atptour.parsers.lxml_utils import parse_html
 
         html = """
         <div class="date-location">
@@ -1143,8 +1143,8 @@ class TestParseTournamentDates:
           <span>2-8 May, 2022</span>
         </div>
         """
-        soup = BeautifulSoup(html, "lxml")
-        start, end = ResultsParser()._parse_tournament_dates(soup)
+        root = parse_html(html)
+        start, end = ResultsParser()._parse_tournament_dates(root)
         assert start == date(2022, 5, 2)
         assert end == date(2022, 5, 8)
 
@@ -1152,7 +1152,7 @@ class TestParseTournamentDates:
         """Parses '8 May, 2022' as start=end."""
         from datetime import date
 
-        from bs4 import BeautifulSoup
+        from mvp.atptour.parsers.lxml_utils import parse_html
 
         html = """
         <div class="date-location">
@@ -1161,8 +1161,8 @@ class TestParseTournamentDates:
           <span>8 May, 2022</span>
         </div>
         """
-        soup = BeautifulSoup(html, "lxml")
-        start, end = ResultsParser()._parse_tournament_dates(soup)
+        root = parse_html(html)
+        start, end = ResultsParser()._parse_tournament_dates(root)
         assert start == date(2022, 5, 8)
         assert end == date(2022, 5, 8)
 
@@ -1170,7 +1170,7 @@ class TestParseTournamentDates:
         """Parses '4-9 Jan, 2022' format."""
         from datetime import date
 
-        from bs4 import BeautifulSoup
+        from mvp.atptour.parsers.lxml_utils import parse_html
 
         html = """
         <div class="date-location">
@@ -1179,8 +1179,8 @@ class TestParseTournamentDates:
           <span>4-9 Jan, 2022</span>
         </div>
         """
-        soup = BeautifulSoup(html, "lxml")
-        start, end = ResultsParser()._parse_tournament_dates(soup)
+        root = parse_html(html)
+        start, end = ResultsParser()._parse_tournament_dates(root)
         assert start == date(2022, 1, 4)
         assert end == date(2022, 1, 9)
 
@@ -1188,7 +1188,7 @@ class TestParseTournamentDates:
         """Parses '18 Jan - 1 Feb, 2026' cross-month format."""
         from datetime import date
 
-        from bs4 import BeautifulSoup
+        from mvp.atptour.parsers.lxml_utils import parse_html
 
         html = """
         <div class="date-location">
@@ -1197,8 +1197,8 @@ class TestParseTournamentDates:
           <span>18 Jan - 1 Feb, 2026</span>
         </div>
         """
-        soup = BeautifulSoup(html, "lxml")
-        start, end = ResultsParser()._parse_tournament_dates(soup)
+        root = parse_html(html)
+        start, end = ResultsParser()._parse_tournament_dates(root)
         assert start == date(2026, 1, 18)
         assert end == date(2026, 2, 1)
 
@@ -1206,7 +1206,7 @@ class TestParseTournamentDates:
         """Parses '28 Dec - 3 Jan, 2022' cross-year format (year applies to end)."""
         from datetime import date
 
-        from bs4 import BeautifulSoup
+        from mvp.atptour.parsers.lxml_utils import parse_html
 
         html = """
         <div class="date-location">
@@ -1215,32 +1215,32 @@ class TestParseTournamentDates:
           <span>28 Dec - 3 Jan, 2022</span>
         </div>
         """
-        soup = BeautifulSoup(html, "lxml")
-        start, end = ResultsParser()._parse_tournament_dates(soup)
+        root = parse_html(html)
+        start, end = ResultsParser()._parse_tournament_dates(root)
         assert start == date(2021, 12, 28)
         assert end == date(2022, 1, 3)
 
     def test_missing_date_location_returns_none(self):
         """Missing date-location div returns (None, None)."""
-        from bs4 import BeautifulSoup
+        from mvp.atptour.parsers.lxml_utils import parse_html
 
         html = "<div>No date here</div>"
-        soup = BeautifulSoup(html, "lxml")
-        start, end = ResultsParser()._parse_tournament_dates(soup)
+        root = parse_html(html)
+        start, end = ResultsParser()._parse_tournament_dates(root)
         assert start is None
         assert end is None
 
     def test_missing_date_span_returns_none(self):
         """Only one span (no date) returns (None, None)."""
-        from bs4 import BeautifulSoup
+        from mvp.atptour.parsers.lxml_utils import parse_html
 
         html = """
         <div class="date-location">
           <span>City, Country</span>
         </div>
         """
-        soup = BeautifulSoup(html, "lxml")
-        start, end = ResultsParser()._parse_tournament_dates(soup)
+        root = parse_html(html)
+        start, end = ResultsParser()._parse_tournament_dates(root)
         assert start is None
         assert end is None
 
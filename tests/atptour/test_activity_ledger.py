@@ -74,6 +74,68 @@ class TestLedger:
         assert L.settled_pairs(root) == {("A1", "m1")}
 
 
+class TestCompaction:
+    """Folding the log into the snapshot must not change any answer."""
+
+    def _history(self, root):
+        L.record(root, "A1", ["m1"], L.ERROR, "403")
+        L.record(root, "A1", ["m1", "m2"], L.OK)
+        L.record(root, "B1", ["m3"], L.EMPTY, "empty Activity payload")
+
+    def test_answers_survive_compaction(self, root):
+        self._history(root)
+        before = (L.settled_pairs(root), L.closed_pairs(root, max_attempts=1))
+        assert L.compact(root)
+        assert not L.ledger_path(root).exists()
+        assert list(L.iter_records(root)) == []
+        assert (L.settled_pairs(root), L.closed_pairs(root, max_attempts=1)) == before
+
+    def test_attempts_keep_counting_across_compactions(self, root):
+        """Exhaustion must still be reached when the attempts straddle a compaction."""
+        for _ in range(L.MAX_ATTEMPTS):
+            L.record(root, "A1", ["m1"], L.EMPTY)
+            L.compact(root)
+        assert ("A1", "m1") in L.closed_pairs(root)
+        state = L.pair_state(root).row(0, named=True)
+        assert state["attempts"] == L.MAX_ATTEMPTS
+        assert state["last_outcome"] == L.EMPTY
+
+    def test_nothing_to_compact_is_a_no_op(self, root):
+        assert not L.compact(root)
+        assert not L.snapshot_path(root).exists()
+
+    def test_crash_before_snapshot_replays_the_segment(self, root):
+        """Rotated but not yet folded: the segment is still part of the tail."""
+        self._history(root)
+        expected = L.settled_pairs(root)
+        L.ledger_path(root).rename(L._segment_path(root, 1))
+        assert L.settled_pairs(root) == expected
+        L.record(root, "C1", ["m4"], L.OK)
+        assert L.compact(root)
+        assert L.settled_pairs(root) == expected | {("C1", "m4")}
+        assert not L._segment_path(root, 1).exists()
+
+    def test_crash_after_snapshot_does_not_double_count(self, root):
+        """Folded but not yet deleted: the snapshot's generation says to skip it."""
+        L.record(root, "A1", ["m1"], L.ERROR)
+        segment = L._segment_path(root, 1)
+        kept = L.ledger_path(root).read_text(encoding="utf-8")
+        L.compact(root)
+        segment.write_text(kept, encoding="utf-8")
+        assert L.pair_state(root)["attempts"].to_list() == [1]
+        L.record(root, "A1", ["m1"], L.ERROR)
+        L.compact(root)
+        assert not segment.exists()
+        assert L.pair_state(root)["attempts"].to_list() == [2]
+
+    def test_an_oversized_tail_is_compacted_on_read(self, root, monkeypatch):
+        monkeypatch.setattr(L, "COMPACT_AFTER_BYTES", 0)
+        self._history(root)
+        assert L.closed_pairs(root) == {("A1", "m1"), ("A1", "m2")}
+        assert L.snapshot_path(root).exists()
+        assert not L.ledger_path(root).exists()
+
+
 T0 = datetime(2026, 8, 3, 12, 0, 0)
 
 
@@ -90,7 +90,7 @@ class TestCmdBackfill:
         MockProcess.return_value = []
         MockPlayerData.return_value = MagicMock(has_failures=False)
 
-        args = SimpleNamespace(year=2023, tid=None, circuit=None)
+        args = SimpleNamespace(year=2023, tid=None, circuit=None, workers=None)
         cmd_backfill(args)
 
         MockRankings.assert_called_once()
@@ -114,7 +114,7 @@ class TestCmdBackfill:
         MockProcess.return_value = []
         MockPlayerData.return_value = MagicMock(has_failures=False)
 
-        args = SimpleNamespace(year=2023, tid=None, circuit="chal")
+        args = SimpleNamespace(year=2023, tid=None, circuit="chal", workers=None)
         cmd_backfill(args)
 
         MockResolve.assert_called_once_with(year=2023, tid=None, circuit="chal")
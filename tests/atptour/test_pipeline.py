@@ -291,6 +291,156 @@ class TestProcessTournaments:
         MockMatchStatsExt.assert_called_once_with(data_root=data_root)
         MockMatchStatsTx.assert_called_once_with(mock_tournament, data_root=data_root)
 
+    @patch("mvp.atptour.pipeline.MatchCentreExtractor")
+    @patch("mvp.atptour.pipeline.MatchStatsTransformer")
+    @patch("mvp.atptour.pipeline.MatchStatsExtractor")
+    @patch("mvp.atptour.pipeline.ResultsTransformer")
+    @patch("mvp.atptour.pipeline.ResultsExtractor")
+    @patch("mvp.atptour.pipeline.ScheduleTransformer")
+    @patch("mvp.atptour.pipeline.ScheduleExtractor")
+    @patch("mvp.atptour.pipeline.OverviewTransformer")
+    @patch("mvp.atptour.pipeline.OverviewExtractor")
+    def test_unchanged_pages_skip_transforms(
+        self,
+        MockOverviewExt,
+        MockOverviewTx,
+        MockScheduleExt,
+        MockScheduleTx,
+        MockResultsExt,
+        MockResultsTx,
+        MockMatchStatsExt,
+        MockMatchStatsTx,
+        MockMatchCentreExt,
+    ):
+        """A quiet tick: raw no newer than stage, so nothing restages."""
+        from mvp.atptour.pipeline import _process_tournaments
+
+        mock_tournament = MagicMock()
+        mock_tournament.logging_id = "Test"
+        MockOverviewExt.return_value.run.return_value = mock_tournament
+        MockOverviewTx.return_value.is_stale.return_value = False
+        MockResultsTx.return_value.is_stale.return_value = False
+        MockMatchStatsExt.return_value.run.return_value = 0
+
+        tournaments = [("580", 2026, False, None)]
+        failed = _process_tournaments(tournaments, data_root=None, refresh=False)
+
+        assert failed == []
+        MockResultsExt.return_value.run.assert_called_once()
+        MockResultsTx.return_value.run.assert_not_called()
+        MockOverviewTx.return_value.run.assert_not_called()
+        MockMatchStatsTx.return_value.run.assert_not_called()
+
+
+    @patch("mvp.atptour.pipeline._feed_stage_is_stale", return_value=False)
+    @patch("mvp.atptour.pipeline.TournamentMatchesAggregator")
+    @patch("mvp.atptour.pipeline.MatchCentreExtractor")
+    @patch("mvp.atptour.pipeline.MatchStatsTransformer")
+    @patch("mvp.atptour.pipeline.MatchStatsExtractor")
+    @patch("mvp.atptour.pipeline.ResultsTransformer")
+    @patch("mvp.atptour.pipeline.ResultsExtractor")
+    @patch("mvp.atptour.pipeline.ScheduleTransformer")
+    @patch("mvp.atptour.pipeline.ScheduleExtractor")
+    @patch("mvp.atptour.pipeline.OverviewTransformer")
+    @patch("mvp.atptour.pipeline.OverviewExtractor")
+    def test_results_staged_before_match_extractors(
+        self,
+        MockOverviewExt,
+        MockOverviewTx,
+        MockScheduleExt,
+        MockScheduleTx,
+        MockResultsExt,
+        MockResultsTx,
+        MockMatchStatsExt,
+        MockMatchStatsTx,
+        MockMatchCentreExt,
+        MockAggregator,
+        MockStale,
+    ):
+        """The match extractors read their IDs from the staged results, so a
+        first backfill must stage results before fetching stats."""
+        from mvp.atptour.pipeline import _process_tournaments
+
+        order = MagicMock()
+        order.attach_mock(MockResultsTx.return_value.run, "results_tx")
+        order.attach_mock(MockMatchStatsExt.return_value.run, "stats_ext")
+        order.attach_mock(MockMatchCentreExt.return_value.run, "centre_ext")
+        MockOverviewExt.return_value.run.return_value = MagicMock(logging_id="T")
+        MockResultsTx.return_value.is_stale.return_value = True
+        MockMatchStatsExt.return_value.run.return_value = 0
+
+        tournaments = [("580", 2026, False, None)]
+        failed = _process_tournaments(tournaments, data_root=None, refresh=False)
+
+        assert failed == []
+        assert [c[0] for c in order.mock_calls] == [
+            "results_tx", "stats_ext", "centre_ext",
+        ]
+
+
+class TestProcessTournamentsPooled:
+    """The process-pool mode: fetch on threads, stage on processes."""
+
+    @staticmethod
+    def _tournament(tid):
+        from mvp.atptour.tournament import Tournament
+
+        return Tournament(
+            tournament_id=tid, year=2019, circuit=Circuit.tour,
+            location="Melbourne, Australia", is_archive=True,
+        )
+
+    def test_worker_ships_picklable_records(self):
+        import pickle
+
+        from mvp.atptour import pipeline
+
+        def boom(tournament, **kwargs):
+            pipeline.logger.warning("odd page for %s", tournament.tournament_id)
+            raise ValueError("boom")
+
+        with patch.object(pipeline, "_transform_tournament", side_effect=boom):
+            error, shipped = pipeline._transform_worker(
+                self._tournament("580"), data_root=None, refresh=False, new_stats=0,
+            )
+
+        assert error == "boom"
+        pickle.dumps(shipped)
+        assert [d["msg"] for d in shipped][0] == "odd page for 580"
+        assert "ValueError: boom" in shipped[1]["exc_text"]
+
+    def test_failures_from_either_half_are_reported(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from mvp.atptour import pipeline
+
+        def extract(tid, year, *args, **kwargs):
+            if tid == "bad_fetch":
+                raise RuntimeError("403")
+            return self._tournament(tid), 0
+
+        def transform(tournament, **kwargs):
+            if tournament.tournament_id == "bad_stage":
+                raise ValueError("parse")
+
+        def in_process_pool(max_workers, mp_context):
+            return ThreadPoolExecutor(max_workers=max_workers)
+
+        tournaments = [(t, 2019, True, None) for t in ("ok", "bad_fetch", "bad_stage")]
+        with (
+            patch.object(pipeline, "_extract_tournament", side_effect=extract),
+            patch.object(pipeline, "_transform_tournament", side_effect=transform),
+            patch.object(pipeline, "ProcessPoolExecutor", side_effect=in_process_pool),
+        ):
+            failed = pipeline._process_tournaments(
+                tournaments, data_root=None, refresh=False, workers=2,
+            )
+
+        assert sorted(failed) == [
+            ("bad_fetch", 2019, "403"),
+            ("bad_stage", 2019, "parse"),
+        ]
+
 
 class TestFeedStageIsStale:
     """The match-centre staging gate: (re)stage when raw is unstaged or newer
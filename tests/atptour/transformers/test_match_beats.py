@@ -286,3 +286,45 @@ class TestMatchBeatsTransformer:
         point1 = df.filter(pl.col("point_num") == 1)
         assert point1["scorer"][0] == "1"
         assert point1["server"][0] == "2"
+
+    def test_invalid_point_skipped(
+        self, transformer, tmp_path, tournament, sample_match_data
+    ):
+        """A point the schema rejects is dropped; the rest of the match stages."""
+        sample_match_data["setData"][0]["gameData"][0]["pointData"][1]["serve"] = 3
+
+        raw_dir = tmp_path / "raw" / "atptour" / tournament.path / "match_beats"
+        raw_dir.mkdir(parents=True)
+
+        with open(raw_dir / "MS001.json", "w") as f:
+            json.dump(sample_match_data, f)
+
+        transformer.run()
+
+        stage_dir = tmp_path / "stage" / "atptour" / tournament.path
+        df = pl.read_parquet(stage_dir / "match_beats.parquet")
+
+        assert df["point_num"].to_list() == [1]
+
+    def test_non_numeric_serve_speed_skips_only_that_point(
+        self, transformer, tmp_path, tournament, sample_match_data
+    ):
+        """A non-numeric serveSpeed rejects its point, not the whole stage."""
+        points = sample_match_data["setData"][0]["gameData"][0]["pointData"]
+        points[0]["serveSpeed"] = 0
+        points[1]["serveSpeed"] = "n/a"
+
+        raw_dir = tmp_path / "raw" / "atptour" / tournament.path / "match_beats"
+        raw_dir.mkdir(parents=True)
+
+        with open(raw_dir / "MS001.json", "w") as f:
+            json.dump(sample_match_data, f)
+
+        transformer.run()
+
+        stage_dir = tmp_path / "stage" / "atptour" / tournament.path
+        df = pl.read_parquet(stage_dir / "match_beats.parquet")
+
+        assert df["point_num"].to_list() == [1]
+        assert df["serve_speed"].dtype == pl.Float64
+        assert df["serve_speed"].to_list() == [None]
@@ -5,6 +5,7 @@ from pathlib import Path
 
 import polars as pl
 
+from mvp.atptour.schemas.overview import OverviewRecord
 from mvp.atptour.tournament import Tournament
 from mvp.atptour.transformers.overview import OverviewTransformer
 from mvp.common.enums import Circuit
@@ -211,3 +212,24 @@ class TestEdgeCases:
         paths = xf.run()
         df = pl.read_parquet(paths[0])
         assert df.row(0, named=True)["sponsor_title"] is None
+
+
+class TestIsStale:
+    def test_fresh_stage_is_not_stale(self, tmp_path):
+        t = _make_tournament()
+        _write_overview(tmp_path, t, _overview_json())
+        xf = OverviewTransformer(tournament=t, data_root=tmp_path)
+        xf.run()
+        assert not xf.is_stale()
+
+    def test_schema_change_restages_unchanged_raw(self, tmp_path, monkeypatch):
+        t = _make_tournament()
+        _write_overview(tmp_path, t, _overview_json())
+        xf = OverviewTransformer(tournament=t, data_root=tmp_path)
+        xf.run()
+        monkeypatch.setattr(OverviewRecord, "SCHEMA_HASH", "changed")
+        assert xf.is_stale()
+
+    def test_no_raw_and_no_stage_is_not_stale(self, tmp_path):
+        xf = OverviewTransformer(tournament=_make_tournament(), data_root=tmp_path)
+        assert not xf.is_stale()
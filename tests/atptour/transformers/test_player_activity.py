@@ -249,3 +249,63 @@ class TestPlayerActivityTransformer:
         transformer = PlayerActivityTransformer(data_root=tmp_path)
         result = transformer.run()
         assert result is None
+
+    def test_splices_only_changed_players(self, tmp_path, monkeypatch):
+        import copy
+        import os
+
+        self._stage_player(tmp_path, "N409", SAMPLE_ACTIVITY)
+        self._stage_player(tmp_path, "AB01", SAMPLE_ACTIVITY)
+        PlayerActivityTransformer(data_root=tmp_path).run()
+        consolidated = tmp_path / "stage" / "atptour" / "activity.parquet"
+        stage_dir = tmp_path / "stage" / "atptour" / "activity"
+        # Consolidated is newer than every per-player file
+        os.utime(consolidated, (2e9, 2e9))
+
+        # N409 gains a match (plus an ATP duplicate of it) and is restaged
+        updated = copy.deepcopy(SAMPLE_ACTIVITY)
+        matches = updated["Activity"][0]["Tournaments"][0]["Matches"]
+        extra = {**matches[0], "MatchId": "MS002", "Round": {"ShortName": "R64"}}
+        matches.extend([extra, dict(extra)])
+        (tmp_path / "raw" / "atptour" / "activity" / "N409.json").write_text(
+            json.dumps(updated), encoding="utf-8"
+        )
+        stager = PlayerActivityStager(data_root=tmp_path)
+        stager.run(player_ids={"N409"})
+        os.utime(stage_dir / "N409.parquet", (1e9, 1e9))
+
+        read = []
+        real_read = pl.read_parquet
+
+        def spy(path, *args, **kwargs):
+            read.append(path)
+            return real_read(path, *args, **kwargs)
+
+        monkeypatch.setattr(pl, "read_parquet", spy)
+        PlayerActivityTransformer(data_root=tmp_path).run(
+            player_ids=stager.last_staged
+        )
+        monkeypatch.undo()
+
+        assert stage_dir / "AB01.parquet" not in read
+        spliced = pl.read_parquet(consolidated)
+        PlayerActivityTransformer(data_root=tmp_path).run()
+        rebuilt = pl.read_parquet(consolidated)
+        key = ["player_id", "match_id"]
+        assert spliced.sort(key).equals(rebuilt.sort(key))
+        assert len(spliced.filter(pl.col("player_id") == "N409")) == 2
+
+    def test_picks_up_players_staged_before_a_crash(self, tmp_path):
+        import os
+
+        self._stage_player(tmp_path, "N409", SAMPLE_ACTIVITY)
+        PlayerActivityTransformer(data_root=tmp_path).run()
+        consolidated = tmp_path / "stage" / "atptour" / "activity.parquet"
+        os.utime(consolidated, (1e9, 1e9))
+        # AB01 was staged by a run that died before consolidating
+        self._stage_player(tmp_path, "AB01", SAMPLE_ACTIVITY)
+
+        PlayerActivityTransformer(data_root=tmp_path).run(player_ids=set())
+
+        df = pl.read_parquet(consolidated)
+        assert set(df["player_id"].to_list()) == {"N409", "AB01"}
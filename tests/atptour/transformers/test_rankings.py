@@ -5,10 +5,11 @@ from pathlib import Path
 
 import polars as pl
 
+from mvp.atptour.parsers.rankings import _dash_to_none
 from mvp.atptour.transformers.rankings import (
     RankingsTransformer,
-    _dash_to_none,
     _parse_date_from_stem,
+    load_rankings,
 )
 
 # --- Helper tests ---
@@ -255,9 +256,9 @@ class TestConsolidate:
         xf.run()
         result = xf.consolidate()
         assert result is not None
-        df = pl.read_parquet(result)
+        df = load_rankings(result.parent)
         assert len(df) == 2
-        assert result.name == "rankings_singles.parquet"
+        assert [p.name for p in result.glob("*.parquet")] == ["2026.parquet"]
 
     def test_no_parquets_returns_none(self, tmp_path):
         xf = RankingsTransformer(data_root=tmp_path)
@@ -275,6 +276,77 @@ class TestConsolidate:
         df = pl.read_parquet(result)
         assert len(df) == 1
 
+    def _two_players(self, tmp_path, filename, points="13,150"):
+        html = _make_html(
+            _row_html(points=points),
+            _row_html(
+                rank="2",
+                player_href="/en/players/jannik-sinner/s0ag/overview",
+                points="11,000",
+            ),
+        )
+        _write_rankings_html(tmp_path, filename, html)
+
+    def test_partitions_by_year_sorted_within_player(self, tmp_path):
+        for stem in ("20251229", "20260105", "20250106"):
+            self._two_players(tmp_path, f"rankings_singles_{stem}.html")
+        xf = RankingsTransformer(data_root=tmp_path)
+        xf.run()
+        store = xf.consolidate()
+
+        assert sorted(p.name for p in store.glob("*.parquet")) == [
+            "2025.parquet", "2026.parquet",
+        ]
+        df = load_rankings(store.parent)
+        assert len(df) == 6
+        for _, group in df.group_by("player_id"):
+            assert group["ranking_date"].is_sorted()
+
+    def test_new_week_reads_only_new_week(self, tmp_path, monkeypatch):
+        for stem in ("20250106", "20260105"):
+            self._two_players(tmp_path, f"rankings_singles_{stem}.html")
+        xf = RankingsTransformer(data_root=tmp_path)
+        xf.run()
+        store = xf.consolidate()
+        untouched = (store / "2025.parquet").stat().st_mtime_ns
+
+        self._two_players(tmp_path, "rankings_singles_20260112.html")
+        xf.run()
+        read = []
+        real_read = pl.read_parquet
+
+        def spy(path, *args, **kwargs):
+            read.append(Path(path).name)
+            return real_read(path, *args, **kwargs)
+
+        monkeypatch.setattr(pl, "read_parquet", spy)
+        xf.consolidate()
+        monkeypatch.undo()
+
+        assert sorted(read) == ["2026.parquet", "rankings_singles_20260112.parquet"]
+        assert (store / "2025.parquet").stat().st_mtime_ns == untouched
+        assert len(load_rankings(store.parent)) == 6
+
+    def test_restaged_week_replaces_its_rows(self, tmp_path):
+        self._two_players(tmp_path, "rankings_singles_20260105.html")
+        self._two_players(tmp_path, "rankings_singles_20260112.html")
+        xf = RankingsTransformer(data_root=tmp_path)
+        xf.run()
+        xf.consolidate()
+
+        weekly = tmp_path / "stage" / "atptour" / "rankings"
+        restaged = pl.read_parquet(weekly / "rankings_singles_20260112.parquet")
+        restaged.with_columns(pl.lit(1, pl.Int64).alias("points")).write_parquet(
+            weekly / "rankings_singles_20260112.parquet"
+        )
+        store = xf.consolidate()
+
+        df = load_rankings(store.parent)
+        assert len(df) == 4
+        assert df.filter(pl.col("ranking_date") == date(2026, 1, 12))[
+            "points"
+        ].to_list() == [1, 1]
+
 
 class TestSkipLogic:
     def test_skips_already_staged(self, tmp_path):
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import polars as pl
 
+from mvp.atptour.schemas.results import ResultRecord
 from mvp.atptour.tournament import Tournament
 from mvp.atptour.transformers.results import ResultsTransformer
 from mvp.common.enums import Circuit
@@ -738,3 +739,15 @@ class TestMatchId:
         df = pl.read_parquet(paths[0])
         row = df.row(0, named=True)
         assert row["match_id"] == "MS001"
+
+
+class TestIsStale:
+    def test_schema_change_restages_unchanged_raw(self, tmp_path, monkeypatch):
+        t = _make_tournament()
+        _write_html(tmp_path, t, "results_singles.html", SINGLES_HTML)
+        xf = ResultsTransformer(tournament=t, data_root=tmp_path)
+        xf.run()
+        assert not xf.is_stale()
+
+        monkeypatch.setattr(ResultRecord, "SCHEMA_HASH", "changed")
+        assert xf.is_stale()
@@ -4,12 +4,12 @@ from datetime import date, datetime
 from pathlib import Path
 
 import polars as pl
-from bs4 import BeautifulSoup
 
+from mvp.atptour.parsers.lxml_utils import has_class, parse_html
+from mvp.atptour.parsers.schedule import _normalize_score
 from mvp.atptour.schemas.schedule import ScheduleRecord
 from mvp.atptour.transformers.schedule import (
     ScheduleTransformer,
-    _normalize_score,
     _parse_schedule_html,
     _parse_snapshot_timestamp,
 )
@@ -247,8 +247,8 @@ def _score_html(inner):
 
 
 def _parse_score_span(inner):
-    soup = BeautifulSoup(_score_html(inner), "lxml")
-    return soup.select_one("span.schedule-cta-score")
+    root = parse_html(_score_html(inner))
+    return root.xpath(f".//span[{has_class('schedule-cta-score')}]")[0]
 
 
 def _parse_fixture(html, **kwargs):
@@ -1054,6 +1054,19 @@ class TestConsolidate:
         df = pl.read_parquet(result)
         assert len(df) == 1
 
+    def test_run_skips_consolidate_without_new_snapshots(self, tmp_path):
+        """A tick with no new schedule leaves schedule.parquet untouched."""
+        _write_schedule_html(
+            tmp_path, "schedule_20260207_140000.html", FIXTURE_SINGLES
+        )
+        tournament = _make_tournament()
+        xf = ScheduleTransformer(tournament, data_root=tmp_path)
+        result = xf.run()
+        mtime = result.stat().st_mtime_ns
+
+        assert xf.run() == result
+        assert result.stat().st_mtime_ns == mtime
+
     def test_consolidate_no_snapshots_returns_none(self, tmp_path):
         """No per-snapshot parquets returns None."""
         tournament = _make_tournament()
@@ -284,3 +284,87 @@ class TestAtomicWrite:
         path = tmp_path / "test.parquet"
         job.save_parquet(df, path)
         assert not (tmp_path / "test.parquet.tmp").exists()
+
+
+class TestRawArchiveBackend:
+    def _job(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("MVP_RAW_ARCHIVE", "1")
+        return BaseJob(domain="atptour", data_root=tmp_path)
+
+    def test_archived_writes_read_back_transparently(self, tmp_path, monkeypatch):
+        job = self._job(tmp_path, monkeypatch)
+        raw_dir = job.build_path("raw", "tournaments/tour/580/2023/match_beats")
+        job.save_json({"matchId": "MS001"}, raw_dir / "MS001.json")
+        job.save_html("<html>x</html>", raw_dir / "page.html")
+
+        assert not (raw_dir / "MS001.json").exists()
+        assert job.read_json(raw_dir / "MS001.json") == {"matchId": "MS001"}
+        assert job.read_html(raw_dir / "page.html") == "<html>x</html>"
+        assert job.list_files(raw_dir, "*.json") == [raw_dir / "MS001.json"]
+        assert job.raw_exists(raw_dir / "page.html")
+        assert job.is_json_unchanged(raw_dir / "MS001.json", {"matchId": "MS001"})
+        assert job.is_html_unchanged(raw_dir / "page.html", "<html>x</html>")
+
+    def test_stage_staleness_sees_archived_mtime(self, tmp_path, monkeypatch):
+        job = self._job(tmp_path, monkeypatch)
+        raw = job.build_path("raw", "t", "overview.json")
+        out = job.build_path("stage", "t", "overview.parquet")
+        job.save_json({}, raw)
+        assert job.is_stage_stale([raw], out)
+
+        job.save_parquet(pl.DataFrame({"a": [1]}), out)
+        assert not job.is_stage_stale([raw], out)
+
+    def test_archive_replaces_loose_copy(self, tmp_path):
+        loose_job = BaseJob(domain="atptour", data_root=tmp_path)
+        path = loose_job.build_path("raw", "t", "overview.json")
+        loose_job.save_json({"v": 1}, path)
+
+        archived = BaseJob(domain="atptour", data_root=tmp_path)
+        archived.raw_archive = True
+        archived.save_json({"v": 2}, path)
+
+        assert not path.exists()
+        assert loose_job.read_json(path) == {"v": 2}
+
+    def test_off_by_default_and_outside_raw(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("MVP_RAW_ARCHIVE", raising=False)
+        job = BaseJob(domain="atptour", data_root=tmp_path)
+        path = job.build_path("raw", "t", "a.json")
+        job.save_json({}, path)
+        assert path.exists()
+
+        job = self._job(tmp_path, monkeypatch)
+        path = job.build_path("stage", "t", "b.json")
+        job.save_json({}, path)
+        assert path.exists()
+
+
+class TestRawManifest:
+    def test_raw_writes_keep_a_manifest(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("MVP_RAW_ARCHIVE", raising=False)
+        job = BaseJob(domain="atptour", data_root=tmp_path)
+        raw_dir = job.build_path("raw", "tournaments/tour/580/2023/match_beats")
+        job.save_json({"a": 1}, raw_dir / "MS001.json")
+        job.save_json({"a": 2}, raw_dir / "MS002.json")
+
+        mtimes = job.raw_mtimes(raw_dir, "*.json")
+        assert mtimes == {
+            raw_dir / "MS001.json": (raw_dir / "MS001.json").stat().st_mtime,
+            raw_dir / "MS002.json": (raw_dir / "MS002.json").stat().st_mtime,
+        }
+        assert job.list_files(raw_dir) == list(mtimes)
+
+    def test_raw_mtimes_falls_back_to_scanning(self, tmp_path):
+        job = BaseJob(domain="atptour", data_root=tmp_path)
+        raw_dir = job.build_path("raw", "players")
+        raw_dir.mkdir(parents=True)
+        (raw_dir / "N409.json").write_text("{}")
+
+        assert list(job.raw_mtimes(raw_dir, "*.json")) == [raw_dir / "N409.json"]
+
+    def test_stage_writes_have_no_manifest(self, tmp_path):
+        job = BaseJob(domain="atptour", data_root=tmp_path)
+        path = job.build_path("stage", "t", "a.json")
+        job.save_json({}, path)
+        assert [p.name for p in path.parent.iterdir()] == ["a.json"]
@@ -0,0 +1,81 @@
+"""Tests for the per-directory manifest."""
+
+import hashlib
+import os
+
+from mvp.common import dir_manifest
+from mvp.common.dir_manifest import MANIFEST_NAME, writing
+
+
+def _land(directory, name, content: bytes):
+    with writing(directory) as manifest:
+        (directory / name).write_bytes(content)
+        manifest.add(name, hashlib.sha256(content).hexdigest())
+
+
+class TestDirManifest:
+    def test_records_landed_files(self, tmp_path):
+        _land(tmp_path, "a.json", b"{}")
+        _land(tmp_path, "b.json", b"[]")
+        _land(tmp_path, "a.json", b'{"v": 2}')
+
+        manifest = dir_manifest.load(tmp_path)
+        assert manifest.count == 2
+        assert set(manifest.mtimes("*.json")) == {"a.json", "b.json"}
+        assert manifest.latest_mtime == max(
+            (tmp_path / n).stat().st_mtime for n in ("a.json", "b.json")
+        )
+        assert manifest.files["a.json"][1] == hashlib.sha256(b'{"v": 2}').hexdigest()
+
+    def test_digest_tracks_content(self, tmp_path):
+        _land(tmp_path, "a.json", b"{}")
+        before = dir_manifest.load(tmp_path).digest
+        _land(tmp_path, "a.json", b"{}")
+        assert dir_manifest.load(tmp_path).digest == before
+        _land(tmp_path, "a.json", b"[]")
+        assert dir_manifest.load(tmp_path).digest != before
+
+    def test_first_write_seeds_existing_files(self, tmp_path):
+        (tmp_path / "old.json").write_text("{}")
+        _land(tmp_path, "new.json", b"[]")
+
+        assert set(dir_manifest.load(tmp_path).files) == {"old.json", "new.json"}
+
+    def test_write_behind_its_back_invalidates_until_next_record(self, tmp_path):
+        _land(tmp_path, "a.json", b"{}")
+        (tmp_path / "sneaky.json").write_text("{}")
+
+        assert dir_manifest.load(tmp_path) is None
+        _land(tmp_path, "b.json", b"{}")
+        assert set(dir_manifest.load(tmp_path).files) == {
+            "a.json", "b.json", "sneaky.json",
+        }
+
+    def test_remove(self, tmp_path):
+        _land(tmp_path, "a.json", b"{}")
+        _land(tmp_path, "b.json", b"{}")
+        with writing(tmp_path) as manifest:
+            (tmp_path / "a.json").unlink()
+            manifest.remove("a.json")
+
+        assert set(dir_manifest.load(tmp_path).files) == {"b.json"}
+
+    def test_compacts_history(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(dir_manifest, "COMPACT_AFTER_BYTES", 0)
+        for i in range(20):
+            _land(tmp_path, "a.json", str(i).encode())
+
+        lines = (tmp_path / MANIFEST_NAME).read_text().splitlines()
+        assert len(lines) < 10  # vs two lines per write uncompacted
+        assert dir_manifest.load(tmp_path).files["a.json"][1] == (
+            hashlib.sha256(b"19").hexdigest()
+        )
+
+    def test_torn_tail_is_left_for_later(self, tmp_path):
+        _land(tmp_path, "a.json", b"{}")
+        stamp = tmp_path.stat().st_mtime_ns
+        with (tmp_path / MANIFEST_NAME).open("a") as fh:
+            fh.write('{"name": "b.json", "mt')
+        os.utime(tmp_path, ns=(stamp, stamp))
+
+        assert set(dir_manifest.load(tmp_path).files) == {"a.json"}
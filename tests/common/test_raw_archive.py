@@ -0,0 +1,59 @@
+"""Tests for the packed raw archive."""
+
+import pytest
+
+from mvp.common import raw_archive
+from mvp.common.raw_archive import INDEX_NAME, RawArchive, pack_tree
+
+
+class TestRawArchive:
+    def test_roundtrip_and_overwrite(self, tmp_path):
+        archive = RawArchive(tmp_path)
+        archive.write("a.json", b'{"v":1}', mtime=100.0)
+        archive.write("b.html", b"<html></html>")
+        archive.write("a.json", b'{"v":2}', mtime=200.0)
+
+        assert archive.read("a.json") == b'{"v":2}'
+        assert archive.read("b.html") == b"<html></html>"
+        assert archive.get("a.json").mtime == 200.0
+        assert sorted(RawArchive(tmp_path).entries()) == ["a.json", "b.html"]
+
+    def test_missing_name_raises(self, tmp_path):
+        archive = RawArchive(tmp_path)
+        archive.write("a.json", b"{}")
+        with pytest.raises(FileNotFoundError):
+            archive.read("b.json")
+        assert archive.get("b.json") is None
+        assert RawArchive(tmp_path / "none").entries() == {}
+
+    def test_compaction_keeps_live_entries(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(raw_archive, "COMPACT_AFTER_BYTES", 0)
+        archive = RawArchive(tmp_path)
+        archive.write("keep.json", b'{"keep":true}', mtime=50.0)
+        for i in range(6):
+            archive.write("churn.json", f'{{"i":{i}}}'.encode())
+
+        packs = list(tmp_path.glob("*.pack"))
+        assert len(packs) == 1 and packs[0].name != "_raw_archive.000000.pack"
+        assert archive.read("keep.json") == b'{"keep":true}'
+        assert archive.get("keep.json").mtime == 50.0
+        assert archive.read("churn.json") == b'{"i":5}'
+
+    def test_skips_torn_index_line(self, tmp_path):
+        archive = RawArchive(tmp_path)
+        archive.write("a.json", b"{}")
+        with (tmp_path / INDEX_NAME).open("a") as fh:
+            fh.write('{"name": "b.js')
+
+        assert list(RawArchive(tmp_path).entries()) == ["a.json"]
+
+    def test_pack_tree_absorbs_loose_files(self, tmp_path):
+        feed = tmp_path / "t" / "match_beats"
+        feed.mkdir(parents=True)
+        (feed / "MS001.json").write_text('{"x": 1}')
+        (feed / "notes.txt").write_text("left alone")
+
+        assert pack_tree(tmp_path) == 1
+        assert not (feed / "MS001.json").exists()
+        assert (feed / "notes.txt").exists()
+        assert RawArchive(feed).read("MS001.json") == b'{"x": 1}'
@@ -1,11 +1,20 @@
 """Tests for common utility functions."""
 
 from datetime import date
+from enum import StrEnum
 
+import numpy as np
 import polars as pl
-from pydantic import BaseModel
+import pytest
+from pydantic import BaseModel, Field
 
-from mvp.common.utils import polars_schema
+from mvp.common.utils import (
+    columnar_frame,
+    hash_arrays,
+    html_content_hash,
+    polars_schema,
+    rows_to_columns,
+)
 
 
 class SampleModel(BaseModel):
@@ -49,3 +58,97 @@ class TestPolarsSchema:
 
         schema = polars_schema(Simple)
         assert schema == {"name": pl.String, "age": pl.Int64}
+
+
+class Hand(StrEnum):
+    LEFT = "L"
+    RIGHT = "R"
+
+
+class PointModel(BaseModel):
+    player_id: str
+    serve: int = Field(ge=1, le=2)
+    hand: Hand | None = None
+    speed: float | None = None
+    aces: int = 0
+
+
+class TestColumnarFrame:
+    def test_matches_model_dump(self):
+        rows = [
+            {"player_id": "a", "serve": 1, "hand": "L", "speed": 201.5},
+            {"player_id": "b", "serve": 2},
+        ]
+        df, rejected = columnar_frame(rows_to_columns(rows, PointModel), PointModel)
+        expected = pl.DataFrame(
+            [PointModel(**r).model_dump() for r in rows],
+            schema_overrides=polars_schema(PointModel),
+        )
+        assert rejected == []
+        assert df.columns == expected.columns
+        assert df.equals(expected)
+
+    @pytest.mark.parametrize(
+        "row, reason",
+        [
+            ({"player_id": None, "serve": 1}, "player_id: null in non-Optional"),
+            ({"player_id": "a", "serve": 3}, "serve: violates le=2"),
+            ({"player_id": "a", "serve": 1.5}, "serve: fractional value"),
+            ({"player_id": "a", "serve": "x"}, "serve: cannot convert"),
+            ({"player_id": "a", "serve": 1, "hand": "X"}, "hand: not a Hand value"),
+        ],
+    )
+    def test_rejects_rows_the_model_rejects(self, row, reason):
+        rows = [{"player_id": "ok", "serve": 1}, row]
+        with pytest.raises(ValueError):
+            PointModel(**row)
+        df, rejected = columnar_frame(rows_to_columns(rows, PointModel), PointModel)
+        assert df["player_id"].to_list() == ["ok"]
+        assert len(rejected) == 1
+        assert rejected[0].startswith(reason)
+
+    def test_absent_columns_take_defaults(self):
+        df, _ = columnar_frame({"player_id": ["a"], "serve": [1]}, PointModel)
+        assert df.row(0, named=True) == {
+            "player_id": "a", "serve": 1, "hand": None, "speed": None, "aces": 0,
+        }
+
+    def test_before_runs_ahead_of_checks(self):
+        df, rejected = columnar_frame(
+            {"player_id": [" a "], "serve": [0]},
+            PointModel,
+            before={
+                "player_id": lambda c: c.str.strip_chars(),
+                "serve": lambda c: c + 1,
+            },
+        )
+        assert rejected == []
+        assert df["player_id"].to_list() == ["a"]
+
+
+class TestHtmlContentHash:
+    PAGE = '<div class="match"><span>6-4</span></div>'
+
+    def test_ignores_scripts_comments_and_whitespace(self):
+        noisy = (
+            '<script nonce="abc">var build = 1;</script>\n<!-- rendered 12:00 -->'
+            '<div class="match">\n  <span>6-4</span>\n</div>'
+        )
+        assert html_content_hash(noisy) == html_content_hash(
+            self.PAGE.replace("><", "> <")
+        )
+
+    def test_content_change_changes_hash(self):
+        assert html_content_hash(self.PAGE) != html_content_hash(
+            self.PAGE.replace("6-4", "7-5")
+        )
+
+
+class TestHashArrays:
+    def test_sees_values_and_shape(self):
+        x = np.arange(6)
+
+        assert hash_arrays(x) == hash_arrays(x.copy())
+        assert hash_arrays(x) != hash_arrays(x.reshape(2, 3))
+        assert hash_arrays(x) != hash_arrays(x + 1)
+        assert hash_arrays(None) != hash_arrays(x)
@@ -10,7 +10,11 @@ from mvp.model.confidence.metrics import (
     WindowDistribution,
     compute_rolling_signed_calibration,
     compute_reliability_profile,
+    compute_reliability_profiles_by,
+    compute_threshold_profiles,
     ReliabilityProfile,
+    _add_months,
+    _roc_auc,
 )
 
 
@@ -111,3 +115,98 @@ class TestReliabilityProfile:
         assert 0.0 <= profile.accuracy <= 1.0
         assert profile.err80 >= 0.0
         assert profile.cal_3mo is not None or profile.cal_6mo is not None or profile.cal_12mo is not None
+
+
+def _reference_rolling(df, window_months, step_months=1, min_matches_per_window=10):
+    """Window-by-window filter loop the prefix-sum version must reproduce."""
+    dates = df["effective_match_date"].drop_nulls()
+    start, max_date = dates.min(), dates.max()
+    errors, counts = [], []
+    while (end := _add_months(start, window_months)) <= max_date:
+        w = df.filter(
+            (pl.col("effective_match_date") >= start)
+            & (pl.col("effective_match_date") < end)
+        )
+        if len(w) >= min_matches_per_window:
+            errors.append(w["favored_won"].mean() - w["favored_prob"].mean())
+            counts.append(len(w))
+        start = _add_months(start, step_months)
+    return errors, counts
+
+
+def _oof(make_oof_df, **kwargs):
+    from mvp.model.confidence.validator import prepare_oof
+    df = make_oof_df(**kwargs)
+    return prepare_oof([{
+        "df": df.drop("y_true", "y_prob"),
+        "y_true": df["y_true"].to_numpy(),
+        "y_prob": df["y_prob"].to_numpy(),
+    }])
+
+
+class TestSortedCumulativeWindows:
+    @pytest.mark.parametrize("window,step", [(3, 1), (6, 2), (12, 1)])
+    def test_rolling_matches_filter_loop(self, make_oof_df, window, step):
+        # Month-end start exercises the clamped stepping (Jan 31 -> Feb 28 -> ...)
+        oof = _oof(make_oof_df, n=1500, date_start=date(2022, 1, 31))
+        oof = oof.sample(fraction=1.0, shuffle=True, seed=7)
+        errors, counts = _reference_rolling(oof, window, step)
+        dist = compute_rolling_signed_calibration(oof, window, step_months=step)
+        assert dist is not None
+        assert dist.n_windows == len(errors)
+        assert dist.median_n_per_window == int(np.median(counts))
+        assert dist.median == pytest.approx(float(np.median(errors)), abs=1e-12)
+        assert dist.min == pytest.approx(float(np.min(errors)), abs=1e-12)
+
+    def test_undated_rows_count_in_profile_not_windows(self, make_oof_df):
+        oof = _oof(make_oof_df, n=600)
+        undated = oof.with_columns(
+            pl.when(pl.int_range(pl.len()) % 5 == 0)
+            .then(None)
+            .otherwise(pl.col("effective_match_date"))
+            .alias("effective_match_date")
+        )
+        profile = compute_reliability_profile(undated)
+        assert profile.n_matches == 600
+        assert profile.accuracy == pytest.approx(oof["favored_won"].mean())
+        dated = undated.drop_nulls("effective_match_date")
+        assert profile.cal_3mo == compute_rolling_signed_calibration(dated, 3)
+
+    def test_roc_auc_ties_match_pairwise(self, rng):
+        y_prob = rng.choice([0.2, 0.4, 0.6, 0.8], size=300)
+        y_true = (rng.random(300) < y_prob).astype(float)
+        pos, neg = y_prob[y_true == 1], y_prob[y_true == 0]
+        diff = pos[:, None] - neg[None, :]
+        expected = ((diff > 0).sum() + 0.5 * (diff == 0).sum()) / diff.size
+        assert _roc_auc(y_true, y_prob) == pytest.approx(expected)
+
+    def test_profiles_by_match_filtered_profiles(self, make_oof_df):
+        oof = _oof(make_oof_df, n=1200)
+        grouped = compute_reliability_profiles_by(oof, "prob_bucket", min_matches=10)
+        for bucket in oof["prob_bucket"].unique().sort().to_list():
+            sub = oof.filter(pl.col("prob_bucket") == bucket)
+            if len(sub) < 10:
+                assert bucket not in grouped
+                continue
+            got, want = grouped[bucket], compute_reliability_profile(sub)
+            assert got.n_matches == want.n_matches
+            assert got.accuracy == pytest.approx(want.accuracy)
+            assert got.log_loss == pytest.approx(want.log_loss)
+            assert got.roc_auc == pytest.approx(want.roc_auc)
+            assert (got.cal_6mo is None) == (want.cal_6mo is None)
+            if got.cal_6mo is not None:
+                assert got.cal_6mo.n_windows == want.cal_6mo.n_windows
+
+    def test_threshold_profiles_are_prefixes(self, make_oof_df):
+        oof = _oof(make_oof_df, n=800).with_columns(
+            (pl.col("favored_prob") * 100).alias("_score")
+        )
+        out = compute_threshold_profiles(oof, "_score", [90, 70, 99.9])
+        assert 99.9 not in out
+        for t in (90, 70):
+            sub = oof.filter(pl.col("_score") >= t)
+            n, profile = out[t]
+            assert n == len(sub)
+            assert profile.signed_cal == pytest.approx(
+                compute_reliability_profile(sub).signed_cal
+            )
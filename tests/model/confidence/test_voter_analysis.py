@@ -126,6 +126,22 @@ class TestCoverageCurve:
         # and >= 50 filter has float precision issues
         assert last_point.coverage_pct > 95.0
 
+    def test_points_match_filtered_profiles(self, make_oof_df):
+        from mvp.model.confidence.metrics import compute_reliability_profile
+        oof, voter_names = _make_voter_oof(make_oof_df)
+        result = compute_coverage_curve(oof, voter_names)
+        agree = oof["voter_consensus"].str.split("-").list.eval(
+            pl.element().cast(pl.Float64)
+        )
+        pct = agree.list.get(0) / agree.list.sum() * 100
+        for point in result.points:
+            sub = oof.filter(pct >= point.threshold_pct)
+            want = compute_reliability_profile(sub)
+            assert point.n_matches == len(sub)
+            assert point.profile.accuracy == pytest.approx(want.accuracy)
+            assert point.profile.err80 == pytest.approx(want.err80)
+            assert point.profile.brier_score == pytest.approx(want.brier_score)
+
     def test_no_voter_consensus_returns_empty(self, make_oof_df):
         df = make_oof_df(n=100)
         oof = prepare_oof([{
@@ -187,6 +187,58 @@ class TestFastForwardSelector:
         assert isinstance(result, float)
         assert np.isfinite(result)
 
+    def test_score_folds_matches_scorer(
+        self, discovery_config: Path, sample_matches: Path, tmp_path: Path
+    ):
+        """Per-fold scores on a fold subset agree with the full-fold scorer."""
+        config = DiscoveryConfig.from_file(discovery_config)
+        features = ["player_ranking_points_diff"]
+
+        fast = FastForwardSelector(
+            config=config,
+            all_feature_specs=features,
+            matches_path=sample_matches,
+            cache_dir=tmp_path / "cache",
+        )
+        fast.precompute()
+        scorer = fast.create_scorer("log_loss")
+
+        full = scorer.score_folds(features)
+        assert len(full) == scorer.n_folds
+        tail = scorer.score_folds(features, list(range(1, scorer.n_folds)))
+        np.testing.assert_allclose(tail, full[1:])
+        assert scorer(features) == pytest.approx(float(np.nanmean(full)))
+
+    def test_score_cache_skips_known_evaluations(
+        self, discovery_config: Path, sample_matches: Path, tmp_path: Path
+    ):
+        """A second scorer over the same data reads every fold from the cache."""
+        from mvp.model.discovery.score_cache import SubsetScoreCache
+
+        config = DiscoveryConfig.from_file(discovery_config)
+        features = ["player_ranking_points_diff"]
+        cache = SubsetScoreCache(tmp_path / "scores.sqlite")
+
+        fast = FastForwardSelector(
+            config=config,
+            all_feature_specs=features,
+            matches_path=sample_matches,
+            cache_dir=tmp_path / "cache",
+        )
+        fast.precompute()
+        fast.score_cache = cache
+        first = fast.create_scorer("log_loss")(features)
+        assert cache.hits == 0
+
+        # Different thread budget, same model: still the same cache context.
+        second = fast.create_scorer("log_loss", n_jobs=2)(features)
+        assert second == first
+        assert cache.hits == len(fast.folds)
+
+        # A different metric is a different context.
+        fast.create_scorer("brier_score")(features)
+        assert cache.hits == len(fast.folds)
+
     def test_scorer_empty_features(
         self, discovery_config: Path, sample_matches: Path, tmp_path: Path
     ):
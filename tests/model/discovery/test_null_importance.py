@@ -156,6 +156,25 @@ def test_cache_reused_when_only_alpha_changes(patch_fits, tmp_path):
     assert set(r.kept_features) == {"a", "b", "c"}  # alpha=1.0 keeps all
 
 
+def test_process_pool_matches_serial():
+    """Pooled null fits reproduce the sequential screen exactly."""
+    fast = _fast()
+    rng = np.random.default_rng(1)
+    fast.X_wide = rng.normal(size=(200, 3)).astype(np.float32)
+    fast.y = (fast.X_wide[:, 0] + 0.5 * rng.normal(size=200) > 0).astype(int)
+    fast.config.model.params = {"n_estimators": 10, "max_depth": 2}
+    config = NullImportanceConfig(n_runs=4)
+
+    serial = ni.run_null_importance(fast, all_features=["a", "b", "c"], config=config)
+    pooled = ni.run_null_importance(
+        fast, all_features=["a", "b", "c"], config=config, n_workers=2, n_jobs=1,
+    )
+
+    assert pooled.null_mean == serial.null_mean
+    assert pooled.p_value == serial.p_value
+    assert pooled.kept_features == serial.kept_features
+
+
 def test_fingerprint_changes_with_pool_and_nruns():
     cfg = DiscoveryConfig.model_validate(
         {
@@ -192,12 +211,13 @@ def test_run_stability_reduces_pool_via_null_importance(tmp_path, monkeypatch):
 
     monkeypatch.setattr(discovery, "_build_candidate_pool", lambda *a: ["a", "b", "c"])
     monkeypatch.setattr(FastForwardSelector, "precompute", lambda self, **k: None)
+    null_result = ni.NullImportanceResult(
+        real_importance={"a": 0.5}, null_mean={"a": 0.0}, p_value={"a": 0.0},
+        kept_features=["a"], dropped_features=["b", "c"], n_runs=3, alpha=0.05,
+    )
     monkeypatch.setattr(
         disc, "run_null_importance",
-        lambda fast, all_features, config, cache_dir=None: ni.NullImportanceResult(
-            real_importance={"a": 0.5}, null_mean={"a": 0.0}, p_value={"a": 0.0},
-            kept_features=["a"], dropped_features=["b", "c"], n_runs=3, alpha=0.05,
-        ),
+        lambda fast, all_features, config, cache_dir=None, **kw: null_result,
     )
     captured = {}
 
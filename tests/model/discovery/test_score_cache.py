@@ -0,0 +1,49 @@
+"""Tests for the persistent subset-score cache."""
+
+import numpy as np
+
+from mvp.model.discovery.score_cache import SubsetScoreCache, score_context
+
+
+class TestSubsetScoreCache:
+    def test_roundtrip_is_order_insensitive(self, tmp_path):
+        cache = SubsetScoreCache(tmp_path / "scores.sqlite")
+        cache.put("ctx", ["b", "a"], {0: 0.61, 2: 0.59})
+
+        assert cache.get("ctx", ["a", "b"], [0, 1, 2]) == {0: 0.61, 2: 0.59}
+        assert cache.hits == 2 and cache.misses == 1
+
+    def test_context_isolates_entries(self, tmp_path):
+        cache = SubsetScoreCache(tmp_path / "scores.sqlite")
+        cache.put("ctx_a", ["a"], {0: 0.6})
+
+        assert cache.get("ctx_b", ["a"], [0]) == {}
+
+    def test_nan_fold_roundtrips(self, tmp_path):
+        cache = SubsetScoreCache(tmp_path / "scores.sqlite")
+        cache.put("ctx", ["a"], {0: float("nan"), 1: 0.5})
+
+        got = cache.get("ctx", ["a"], [0, 1])
+        assert np.isnan(got[0]) and got[1] == 0.5
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "scores.sqlite"
+        first = SubsetScoreCache(path)
+        first.put("ctx", ["a"], {0: 0.7})
+        first.close()
+
+        assert SubsetScoreCache(path).get("ctx", ["a"], [0]) == {0: 0.7}
+
+
+class TestScoreContext:
+    def test_ignores_n_jobs(self):
+        base = {"metric": "log_loss", "model_params": {"max_depth": 3}}
+        threaded = {"metric": "log_loss", "model_params": {"max_depth": 3, "n_jobs": 8}}
+
+        assert score_context(base) == score_context(threaded)
+
+    def test_model_params_change_key(self):
+        a = score_context({"model_params": {"max_depth": 3}})
+        b = score_context({"model_params": {"max_depth": 4}})
+
+        assert a != b
@@ -1,14 +1,22 @@
 """Tests for feature selection algorithms."""
 
 import json
+import zlib
 from datetime import datetime, timezone
 
+import numpy as np
 import pytest
 
 from mvp.model.discovery.checkpoint import SelectionCheckpoint, save_checkpoint
+from mvp.model.discovery.config import RacingConfig
 from mvp.model.discovery.selection import FeatureSelector, SelectionResult
 
 
+def _stable_hash(features: list[str], fold: int) -> int:
+    """crc32 of the sorted names and fold: unlike hash(), same in every process."""
+    return zlib.crc32(f"{','.join(sorted(features))}|{fold}".encode())
+
+
 class TestForwardSelection:
     """Tests for forward selection."""
 
@@ -704,6 +712,101 @@ class TestBottomCutPersistence:
         assert records[0]["round"] == 2  # literal round 2, not 3
 
 
+class TestFoldRacing:
+    """Fold racing narrows candidates on fold subsets but picks on full folds."""
+
+    N_FOLDS = 8
+
+    @classmethod
+    def _scorer(cls, calls):
+        # 30 candidates with well-separated per-feature gains plus small fold
+        # noise (fixed per feature set and fold, across processes too); lower
+        # is better.
+        feats = [f"f{i:02d}" for i in range(30)]
+        gain = {f: (i + 1) * 0.01 for i, f in enumerate(feats)}  # f29 best
+
+        def score_folds(features, fold_ids=None):
+            fold_ids = list(range(cls.N_FOLDS)) if fold_ids is None else fold_ids
+            calls.append(len(fold_ids))
+            base = 1.0 - sum(gain.get(f, 0.0) for f in features)
+            return np.array([
+                base + 0.001 * ((_stable_hash(features, k) % 7) - 3)
+                for k in fold_ids
+            ])
+
+        def scorer(features):
+            return float(np.mean(score_folds(features)))
+
+        scorer.score_folds = score_folds
+        scorer.n_folds = cls.N_FOLDS
+        return scorer, feats
+
+    def _select(self, racing, calls, **kw):
+        scorer, feats = self._scorer(calls)
+        return FeatureSelector(
+            scorer=scorer,
+            all_features=feats,
+            method="forward",
+            direction="minimize",
+            max_features=3,
+            racing=racing,
+            **kw,
+        ).run()
+
+    def test_matches_exhaustive_with_fewer_fold_fits(self):
+        exhaustive_calls: list[int] = []
+        raced_calls: list[int] = []
+        exhaustive = self._select(None, exhaustive_calls)
+        raced = self._select(
+            RacingConfig(enabled=True, min_survivors=3), raced_calls,
+        )
+
+        assert raced.selected_features == exhaustive.selected_features
+        assert raced.selected_features == ["f29", "f28", "f27"]
+        # The accepted metric is the full-fold score, not a partial mean.
+        assert raced.final_metric == pytest.approx(exhaustive.final_metric)
+        assert sum(raced_calls) < sum(exhaustive_calls) / 2
+
+    def test_parallel_race_matches_serial(self):
+        racing = RacingConfig(enabled=True, min_survivors=3)
+        serial = self._select(racing, [], forward_max_workers=1)
+        pooled = self._select(racing, [], forward_max_workers=4)
+
+        assert serial.selected_features == pooled.selected_features
+        s_ranks = [h["round_ranking"] for h in serial.history if "round_ranking" in h]
+        p_ranks = [h["round_ranking"] for h in pooled.history if "round_ranking" in h]
+        assert s_ranks == p_ranks
+
+    def test_raced_out_logged_to_history(self, tmp_path):
+        scorer, feats = self._scorer([])
+        cp = tmp_path / "discovery_checkpoint_unit.json"
+        FeatureSelector(
+            scorer=scorer, all_features=feats, method="forward",
+            max_features=1, racing=RacingConfig(enabled=True, min_survivors=3),
+        ).forward_selection(checkpoint_path=cp, verbose=False)
+
+        (entry,) = [
+            json.loads(line)
+            for line in (tmp_path / "fs_history_unit.jsonl").read_text().splitlines()
+        ]
+        ranked = {f for f, _ in entry["ranking"]}
+        raced = {f for f, _, _ in entry["raced_out"]}
+        assert ranked.isdisjoint(raced)
+        assert ranked | raced == set(feats)
+        assert all(n < self.N_FOLDS for _, _, n in entry["raced_out"])
+
+    def test_plain_scorer_falls_back_to_exhaustive(self):
+        def scorer(features):
+            return 1.0 - 0.1 * len(features)
+
+        selector = FeatureSelector(
+            scorer=scorer, all_features=["a", "b"], method="forward",
+            racing=RacingConfig(enabled=True),
+        )
+        assert selector.racing is None
+        assert selector.run().selected_features == ["a", "b"]
+
+
 class TestRecordPrunedRound:
     def test_merges_and_dedupes_by_round(self, tmp_path):
         from mvp.model.discovery.selection import _record_pruned_round
@@ -0,0 +1,46 @@
+"""Tests for the error-analysis player-level bootstrap."""
+
+import numpy as np
+import pytest
+
+from mvp.model.error_analysis import analyses
+from mvp.model.error_analysis.analyses import _player_level_bootstrap_ci
+
+
+def _reference_ci(player_ids, values, n_iterations, seed, confidence=0.95):
+    """The original per-iteration concatenate-and-mean bootstrap."""
+    rng = np.random.default_rng(seed)
+    _, idx = np.unique(player_ids, return_inverse=True)
+    n_players = idx.max() + 1
+    picks = {i: np.where(idx == i)[0] for i in range(n_players)}
+    means = []
+    for _ in range(n_iterations):
+        sampled = rng.integers(0, n_players, size=n_players)
+        means.append(np.mean(values[np.concatenate([picks[p] for p in sampled])]))
+    alpha = (1 - confidence) / 2
+    return np.quantile(means, alpha), np.quantile(means, 1 - alpha)
+
+
+@pytest.fixture
+def picks():
+    rng = np.random.default_rng(7)
+    player_ids = rng.choice([f"P{i}" for i in range(40)], size=600)
+    values = rng.normal(size=600) + (player_ids == "P3") * 2.0
+    return player_ids, values
+
+
+class TestPlayerLevelBootstrapCI:
+    def test_agrees_with_per_iteration_resampling(self, picks, monkeypatch):
+        # Force several chunks so the chunk boundaries are exercised too.
+        monkeypatch.setattr(analyses, "_BOOTSTRAP_CHUNK_CELLS", 40 * 37)
+        player_ids, values = picks
+        got = _player_level_bootstrap_ci(
+            player_ids, values, n_iterations=2000, rng=np.random.default_rng(3),
+        )
+        # Independent draws: the two CIs agree up to Monte Carlo error.
+        expected = _reference_ci(player_ids, values, 2000, 11)
+        assert got == pytest.approx(expected, abs=0.03)
+
+    def test_empty_values(self):
+        lo, hi = _player_level_bootstrap_ci(np.array([]), np.array([]))
+        assert np.isnan(lo) and np.isnan(hi)
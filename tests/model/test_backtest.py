@@ -7,6 +7,7 @@ from pathlib import Path
 import polars as pl
 import pytest
 
+from mvp.model import backtest
 from mvp.model.backtest import (
     _apply_present_filters,
     _find_diagnostics_json,
@@ -142,3 +143,139 @@ class TestLoadTierLookup:
         assert lookup[("chal", "QF")] == pytest.approx(0.005)
         assert lookup[("tour", "R64")] == pytest.approx(-0.008)
         assert run_id == "deadbeef"
+
+
+class TestTrainFolds:
+    """Folds lacking artifacts are trained; cached ones are skipped."""
+
+    def _plan(self, tmp_path: Path, tag: str, cached: set[str]):
+        from datetime import date
+
+        def artifact(name: str) -> str:
+            path = tmp_path / f"{name}_{tag}.joblib"
+            if name in cached:
+                path.write_bytes(b"x")
+            return str(path)
+
+        cfg = {"winner": {
+            "active": {"artifact": artifact("lead")},
+            "voters": [
+                {"name": "v1", "artifact": artifact("v1")},
+                {"name": "v2", "artifact": artifact("v2")},
+            ],
+        }}
+        d = date.fromisoformat(tag)
+        return (tag, cfg, tmp_path / f"{tag}.yaml", d, d, d)
+
+    def test_skips_cached_and_keeps_fold_order(self, tmp_path, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            backtest, "_train_fold",
+            lambda path, lead, voters, matches, shared: calls.append(
+                (path.stem, lead, [v["name"] for v in voters], shared)
+            ),
+        )
+        shared = pl.DataFrame({"x": [1]})
+        plans = [
+            self._plan(tmp_path, "2026-01-01", cached={"lead", "v1", "v2"}),
+            self._plan(tmp_path, "2026-02-01", cached={"v1"}),
+            self._plan(tmp_path, "2026-03-01", cached={"lead"}),
+        ]
+        backtest._train_folds(
+            plans, config_stem="lead", retrain=False, shared=shared,
+            matches_path=tmp_path / "m.parquet", workers=1,
+        )
+        assert [(stem, lead, voters) for stem, lead, voters, _ in calls] == [
+            ("2026-02-01", True, ["v2"]),
+            ("2026-03-01", False, ["v1", "v2"]),
+        ]
+        assert all(s is shared for *_, s in calls)
+
+    def test_retrain_trains_everything(self, tmp_path, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            backtest, "_train_fold",
+            lambda path, lead, voters, matches, shared: calls.append(
+                (lead, len(voters))
+            ),
+        )
+        plans = [self._plan(tmp_path, "2026-01-01", cached={"lead", "v1", "v2"})]
+        backtest._train_folds(
+            plans, config_stem="lead", retrain=True, shared=pl.DataFrame(),
+            matches_path=tmp_path / "m.parquet", workers=4,
+        )
+        assert calls == [(True, 2)]
+
+    def test_default_is_serial(self, tmp_path, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            backtest, "_train_fold",
+            lambda path, lead, voters, matches, shared: calls.append(path.stem),
+        )
+        monkeypatch.setattr(
+            backtest, "ProcessPoolExecutor",
+            lambda **kw: pytest.fail("no pool without workers"),
+        )
+        plans = [
+            self._plan(tmp_path, t, cached=set())
+            for t in ("2026-01-01", "2026-02-01")
+        ]
+        backtest._train_folds(
+            plans, config_stem="lead", retrain=False, shared=pl.DataFrame(),
+            matches_path=tmp_path / "m.parquet", workers=None,
+        )
+        assert calls == ["2026-01-01", "2026-02-01"]
+
+    def test_pool_splits_n_jobs_and_carries_overrides(self, tmp_path, monkeypatch):
+        from concurrent.futures import Future
+
+        from mvp.model import engine, models, parallelism
+
+        captured = {}
+
+        class _Pool:
+            def __init__(self, **kwargs):
+                captured.update(kwargs)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def submit(self, fn, *args):
+                future = Future()
+                future.set_result(None)
+                return future
+
+        monkeypatch.setattr(backtest, "ProcessPoolExecutor", _Pool)
+        monkeypatch.setattr(parallelism.os, "cpu_count", lambda: 16)
+        monkeypatch.setattr(models, "_n_jobs_override", 8)
+        monkeypatch.setattr(engine, "_MEMORY_LIMIT_PCT", 60)
+        plans = [
+            self._plan(tmp_path, t, cached=set())
+            for t in ("2026-01-01", "2026-02-01")
+        ]
+        backtest._train_folds(
+            plans, config_stem="lead", retrain=False, shared=pl.DataFrame(),
+            matches_path=tmp_path / "m.parquet", workers=2,
+        )
+
+        assert captured["max_workers"] == 2
+        _features, n_jobs, memory_limit = captured["initargs"]
+        assert (n_jobs, memory_limit) == (4, 60)
+
+    def test_worker_init_applies_overrides(self, tmp_path, monkeypatch):
+        from mvp.model import engine, models
+
+        monkeypatch.setattr(models, "_n_jobs_override", None)
+        monkeypatch.setattr(engine, "_MEMORY_LIMIT_PCT", 75)
+        monkeypatch.setattr(backtest, "_worker_features", None)
+        features = tmp_path / "features.parquet"
+        pl.DataFrame({"x": [1]}).write_parquet(features)
+
+        backtest._fold_worker_init(str(features), 3, 0)
+
+        assert models.get_n_jobs_override() == 3
+        assert engine._MEMORY_LIMIT_PCT == 0
+        assert backtest._worker_features["x"].to_list() == [1]
@@ -0,0 +1,115 @@
+"""Tests for grouped backtest aggregation views."""
+
+import numpy as np
+import polars as pl
+import pytest
+
+from mvp.model import backtest_views as views
+
+
+def _reference_stats(df: pl.DataFrame) -> dict:
+    """Per-slice filter-and-reduce, as the views computed before grouping."""
+    out = {"n": len(df)}
+    won = df["won"].drop_nulls()
+    out["hit"] = float(won.mean()) if len(won) else None
+    for price in ("open", "formed", "close"):
+        priced = df.filter(pl.col(f"pnl_{price}").is_not_null())
+        out[f"n_{price}"] = len(priced)
+        pnl = float(priced[f"pnl_{price}"].sum()) if len(priced) else None
+        out[f"pnl_{price}"] = pnl
+        out[f"roi_{price}"] = pnl / len(priced) if len(priced) else None
+    for pos, avg, col in (
+        ("clv_pos", "avg_clv", "clv"),
+        ("me_open_pos", "avg_me_open", "opening_edge"),
+        ("me_close_pos", "avg_me_close", "closing_edge"),
+    ):
+        vals = df[col].drop_nulls()
+        out[pos] = float((vals > 0).mean()) if len(vals) else None
+        out[avg] = float(vals.mean()) if len(vals) else None
+    return out
+
+
+def _assert_stats(got: dict, want: dict) -> None:
+    for key, value in want.items():
+        if value is None:
+            assert got[key] is None, key
+        else:
+            assert got[key] == pytest.approx(value), key
+
+
+@pytest.fixture
+def bets() -> pl.DataFrame:
+    rng = np.random.default_rng(3)
+    n = 400
+
+    def with_nulls(values, frac=0.15):
+        return [None if rng.random() < frac else float(v) for v in values]
+
+    return pl.DataFrame({
+        "effective_match_date": [
+            f"2024-{m:02d}-{d:02d}"
+            for m, d in zip(rng.integers(1, 13, n), rng.integers(1, 28, n))
+        ],
+        "won": [None if rng.random() < 0.05 else bool(v) for v in rng.random(n) < 0.55],
+        "cal_tier": rng.choice(["Optimal", "Border", "Risky", "UnderC", None], n),
+        "round": rng.choice(["R32", "F", "QF", "Q1", "XX", None], n),
+        "n_agree": rng.choice([5, 4, 3], n),
+        "pnl_open": with_nulls(rng.normal(0, 1, n)),
+        "pnl_formed": with_nulls(rng.normal(0, 1, n), frac=1.0),
+        "pnl_close": with_nulls(rng.normal(0, 1, n)),
+        "clv": with_nulls(rng.normal(0, 0.05, n)),
+        "opening_edge": with_nulls(rng.normal(0.03, 0.05, n)),
+        "closing_edge": with_nulls(rng.normal(0.0, 0.05, n)),
+    })
+
+
+class TestGroupedViews:
+    def test_slice_stats_matches_reference(self, bets):
+        _assert_stats(views.slice_stats(bets), _reference_stats(bets))
+        empty = views.slice_stats(bets.head(0))
+        assert empty["n"] == 0 and empty["hit"] is None and empty["n_open"] == 0
+
+    def test_by_tier(self, bets):
+        rows = dict(views.by_tier(bets))
+        assert list(rows)[:4] == list(views.TIER_ORDER)
+        assert rows["Danger"]["n"] == 0
+        for tier in ("Optimal", "Border", "Risky", "UnderC"):
+            _assert_stats(
+                rows[tier], _reference_stats(bets.filter(pl.col("cal_tier") == tier))
+            )
+        assert "None" not in rows
+        assert rows["ALL"]["n"] == len(bets)
+
+    def test_by_edge_band(self, bets):
+        rows = dict(views.by_edge_band(bets, "opening_edge"))
+        for label, lo, hi in views.EDGE_BANDS:
+            _assert_stats(
+                rows[label],
+                _reference_stats(views.filter_band(bets, "opening_edge", lo, hi)),
+            )
+
+    def test_by_consensus(self, bets):
+        rows = views.by_consensus(bets)
+        assert [label for label, _ in rows] == ["5-0", "4-1", "3-2", "ALL"]
+        _assert_stats(
+            rows[1][1], _reference_stats(bets.filter(pl.col("n_agree") == 4))
+        )
+
+    def test_by_month_and_slices(self, bets):
+        rows = views.by_month(bets)
+        slices = views.month_slices(bets)
+        assert [m for m, _ in rows] == [m for m, _ in slices]
+        assert [m for m, _ in rows] == sorted(m for m, _ in rows)
+        cum = 0.0
+        for (m, stats), (_, sub) in zip(rows, slices):
+            want = _reference_stats(sub)
+            _assert_stats(stats, want)
+            cum += want["pnl_open"] or 0.0
+            assert stats["cum_open"] == pytest.approx(cum)
+
+    def test_by_round_order(self, bets):
+        rows = views.by_round(bets)
+        assert [r for r, _ in rows] == ["Q1", "R32", "QF", "F", "XX"]
+        assert [r for r, _ in views.round_slices(bets)] == [r for r, _ in rows]
+        for r, stats in rows:
+            _assert_stats(stats, _reference_stats(bets.filter(pl.col("round") == r)))
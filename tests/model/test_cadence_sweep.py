@@ -0,0 +1,42 @@
+"""Tests for cadence sweep period breakdowns."""
+
+from datetime import date
+
+import polars as pl
+
+from mvp.model.cadence_sweep import _period_slices, _period_start_expr
+
+
+def _oof(dates: list[date], seed: int) -> pl.DataFrame:
+    n = len(dates)
+    return pl.DataFrame({
+        "match_uid": [f"m{seed}_{i}" for i in range(n)],
+        "effective_match_date": dates,
+        "fold_idx": [0] * n,
+        "y_true": [i % 2 for i in range(n)],
+        "y_prob": [0.3 + 0.4 * ((i * seed) % 5) / 5 for i in range(n)],
+    }).with_columns(pl.col("y_true").cast(pl.Int8))
+
+
+class TestPeriodSlices:
+    def test_matches_per_cadence_filters(self):
+        oof_by_cadence = {
+            12: _oof([date(2023, m, 5) for m in range(1, 13)], seed=1),
+            3: _oof([date(2023, m, 20) for m in range(4, 13)], seed=2),
+        }
+        for gran in (12, 3, 1):
+            slices = _period_slices(oof_by_cadence, gran)
+            for tm, df in oof_by_cadence.items():
+                bucketed = df.with_columns(_period_start_expr(gran).alias("_p"))
+                for period in bucketed["_p"].unique().to_list():
+                    want = bucketed.filter(pl.col("_p") == period)
+                    got = slices[(period, tm)]
+                    assert got["y_prob"].to_list() == want["y_prob"].to_list()
+
+    def test_empty_combinations_absent(self):
+        oof_by_cadence = {
+            12: _oof([date(2023, 1, 5)], seed=1),
+            3: _oof([date(2023, 7, 5)], seed=2),
+        }
+        slices = _period_slices(oof_by_cadence, 3)
+        assert set(slices) == {(date(2023, 1, 1), 12), (date(2023, 7, 1), 3)}
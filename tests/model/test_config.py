@@ -226,6 +226,29 @@ model:
         assert config.data.train_filters == {"circuit": ["chal", "tour", "itf"]}
         assert config.data.eval_filters == {"circuit": ["chal", "tour"]}
 
+    def test_tuning_block(self):
+        """tuning: parses the pruner settings and rejects a bad reduction factor."""
+        base = """
+data:
+  date_range:
+    start: "2020-01-01"
+    end: "2024-12-31"
+features:
+  include:
+    - win_rate(days=30)
+model:
+  type: xgboost
+tuning:
+  pruner: hyperband
+  round_checkpoints: 3
+"""
+        config = ExperimentConfig.from_yaml(base)
+        assert config.tuning.pruner == "hyperband"
+        assert config.tuning.round_checkpoints == 3
+        assert config.tuning.reduction_factor == 3
+        with pytest.raises(ValueError, match="reduction_factor"):
+            ExperimentConfig.from_yaml(base + "  reduction_factor: 1\n")
+
 
 class TestDateValidationSplitterParams:
     """Cross-type validators for date_sliding / date_expanding params."""
@@ -816,3 +816,125 @@ class TestPredictVoters:
 
         with pytest.raises(FileNotFoundError):
             predictor.predict_voters(None, predictions)
+
+    def test_predict_voters_one_feature_pass(
+        self, production_config_with_voters, sample_matches, tmp_path
+    ):
+        from mvp.model.engine import FeatureEngine
+        from mvp.model.predictor import ProductionPredictor
+
+        predictor = ProductionPredictor(
+            production_config_path=production_config_with_voters,
+            matches_path=sample_matches,
+            cache_dir=tmp_path / "cache",
+        )
+        predictor.train()
+        predictor.train_voters()
+        predictions = predictor.predict()
+        match_uids = set(predictions["match_uid"].to_list())
+        per_voter = [
+            predictor._predict_raw(v, None, match_uids)
+            for v in predictor.config["voters"]
+        ]
+
+        with patch.object(
+            FeatureEngine, "compute", autospec=True, side_effect=FeatureEngine.compute,
+        ) as compute:
+            result = predictor.predict_voters(None, predictions)
+
+        assert compute.call_count == 1
+        # Vectorized consensus matches the per-voter dict scoring
+        for row in result.iter_rows(named=True):
+            prod_pick = row["p1_win_prob"] >= 0.5
+            uid = row["match_uid"]
+            votes = [r[uid] >= 0.5 for r in per_voter if uid in r]
+            assert row["voter_count"] == 1 + len(votes)
+            agree = 1 + sum(v == prod_pick for v in votes)
+            assert row["consensus"] == round(agree / row["voter_count"], 2)
+
+
+class TestSharedFeatures:
+    """Backtest folds serve every compute from one precomputed frame."""
+
+    @pytest.fixture(autouse=True)
+    def data_root(self, sample_matches, tmp_path, monkeypatch):
+        # Filter-spec resolution reads the raw schema from the data root.
+        root = tmp_path / "data_root"
+        (root / "aggregate" / "atptour").mkdir(parents=True)
+        pl.read_parquet(sample_matches).write_parquet(
+            root / "aggregate" / "atptour" / "matches.parquet"
+        )
+        monkeypatch.setenv("MVP_DATA_ROOT", str(root))
+
+    def _with_voter(self, production_config: Path, tmp_path: Path) -> Path:
+        voter_config = {
+            "data": {
+                "date_range": {"start": "2024-01-01", "end": "2024-12-31"},
+                "filters": {"circuit": "tour"},
+            },
+            "features": {"include": ["player_elo_surface_diff", "player_elo_diff"]},
+            "model": {"type": "logistic"},
+        }
+        voter_path = tmp_path / "voter.yaml"
+        voter_path.write_text(yaml.dump(voter_config))
+        prod = yaml.safe_load(production_config.read_text())
+        prod["voters"] = [{
+            "config": str(voter_path),
+            "artifact": str(tmp_path / "voter.joblib"),
+            "scoped": True,
+        }]
+        production_config.write_text(yaml.dump(prod))
+        return production_config
+
+    def test_feature_request_is_union_of_lead_and_voters(
+        self, production_config, sample_matches, tmp_path
+    ):
+        from mvp.model.predictor import ProductionPredictor
+
+        predictor = ProductionPredictor(
+            production_config_path=self._with_voter(production_config, tmp_path),
+            matches_path=sample_matches,
+            cache_dir=tmp_path / "cache",
+        )
+        specs, columns = predictor.feature_request()
+        assert specs[:4] == [
+            "player_elo_surface_diff", "player_svc_elo_diff",
+            "player_ret_elo_diff", "player_age_diff",
+        ]
+        assert "player_elo_diff" in specs
+        assert len(specs) == len(set(specs))
+        assert "tournament_id" in columns
+
+    def test_compute_served_from_shared_frame(
+        self, production_config, sample_matches, tmp_path
+    ):
+        from mvp.model.predictor import ProductionPredictor
+
+        shared = pl.read_parquet(sample_matches).with_columns(
+            pl.lit(1.0).alias("player_elo_surface_diff"),
+            pl.lit(2.0).alias("player_svc_elo_diff"),
+            pl.lit(3.0).alias("player_ret_elo_diff"),
+            pl.lit(4.0).alias("player_age_diff"),
+            pl.lit(5.0).alias("player_elo_diff"),
+        )
+        predictor = ProductionPredictor(
+            production_config_path=self._with_voter(production_config, tmp_path),
+            matches_path=sample_matches,
+            cache_dir=tmp_path / "cache",
+            shared_features=shared,
+        )
+        with patch("mvp.model.predictor.FeatureEngine") as engine:
+            lead = predictor._compute_features(*predictor._predict_request())
+            voter_cfg, voter_specs, _ = predictor._resolve_entry_features(
+                predictor.config["voters"][0]
+            )
+            voter = predictor._compute_features(
+                *predictor._raw_request(voter_cfg, voter_specs, scoped=True)
+            )
+        engine.assert_not_called()
+        # Each call sees only its own feature columns, as engine.compute would
+        assert "player_elo_diff" not in lead.columns
+        assert "player_age_diff" in lead.columns
+        assert "player_elo_diff" in voter.columns
+        assert "player_svc_elo_diff" not in voter.columns
+        assert lead.height == voter.height == shared.height
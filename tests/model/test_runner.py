@@ -224,3 +224,76 @@ class TestCalibratedObjectiveMetrics:
         ]
         y_true = np.concatenate([f["y_true"] for f in folds])
         assert _calibrated_objective_metrics(folds, y_true, None) is None
+
+
+class TestSharedRunMemos:
+    """Feature and fit memos shared between sibling runs (cadence sweep)."""
+
+    @pytest.fixture(autouse=True)
+    def ensure_features_registered(self, isolated_registry):
+        import mvp.model.features.ranking
+
+        importlib.reload(mvp.model.features.ranking)
+
+    def _config(self, tmp_path: Path, test_size: int) -> Path:
+        path = tmp_path / f"config_{test_size}.yaml"
+        path.write_text(f"""
+name: test_experiment
+data:
+  date_range:
+    start: "2024-01-01"
+    end: "2024-12-31"
+features:
+  include:
+    - player_ranking_points_diff
+model:
+  type: logistic
+validation:
+  type: walk_forward
+  n_splits: 2
+  min_train_size: 100
+  test_size: {test_size}
+""")
+        return path
+
+    def test_identical_train_window_reuses_fit(self, tmp_path: Path):
+        rng = np.random.default_rng(0)
+        matches = tmp_path / "matches.parquet"
+        pl.DataFrame({
+            "match_uid": [f"M{i}" for i in range(300)],
+            "player_id": [f"P{i % 10}" for i in range(300)],
+            "opp_id": [f"P{(i + 5) % 10}" for i in range(300)],
+            "effective_match_date": [
+                f"2024-{(i // 28) % 12 + 1:02d}-{(i % 28) + 1:02d}" for i in range(300)
+            ],
+            "won": rng.random(300) < 0.5,
+            "player_rankings_points": rng.integers(100, 2000, 300),
+            "opp_rankings_points": rng.integers(100, 2000, 300),
+            "circuit": ["tour"] * 300,
+        }).with_columns(
+            pl.col("effective_match_date").str.to_datetime()
+        ).write_parquet(matches)
+
+        feature_memo: dict = {}
+        fit_memo: dict = {}
+        results = []
+        for test_size in (25, 50):
+            runner = ExperimentRunner(
+                config_path=self._config(tmp_path, test_size),
+                matches_path=matches,
+                cache_dir=tmp_path / "cache",
+                log_to_mlflow=False,
+                feature_memo=feature_memo,
+                fit_memo=fit_memo,
+            )
+            results.append(runner.run())
+
+        assert len(feature_memo) == 1
+        # Both runs open on the same 100-row train window; only the second
+        # folds differ, so three distinct fits serve four folds.
+        assert len(fit_memo) == 3
+        first_a = results[0]["all_predictions"][0]
+        first_b = results[1]["all_predictions"][0]
+        np.testing.assert_allclose(
+            first_b["y_prob"][: len(first_a["y_prob"])], first_a["y_prob"],
+        )
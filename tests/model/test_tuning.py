@@ -933,3 +933,101 @@ validation:
             HyperparamTuner(
                 config_path=cfg, state_dir=tmp_path / "tuning", outer_folds=1
             )
+
+    # --- Pruning / fidelity ----------------------------------------------------
+
+    def _with_tuning_block(self, path: Path, block: str) -> Path:
+        path.write_text(path.read_text() + f"tuning:\n{block}")
+        return path
+
+    def test_default_pruner_is_nop(self, sample_config, tmp_path):
+        """No `tuning:` block keeps pruning off."""
+        tuner = HyperparamTuner(
+            config_path=sample_config, state_dir=tmp_path / "tuning"
+        )
+        assert isinstance(tuner.study.pruner, optuna.pruners.NopPruner)
+
+    @pytest.mark.parametrize(
+        "name,cls",
+        [
+            ("successive_halving", optuna.pruners.SuccessiveHalvingPruner),
+            ("hyperband", optuna.pruners.HyperbandPruner),
+            ("median", optuna.pruners.MedianPruner),
+        ],
+    )
+    def test_tuning_block_selects_pruner(self, sample_config, tmp_path, name, cls):
+        """`tuning.pruner` picks the study's pruner."""
+        self._with_tuning_block(sample_config, f"  pruner: {name}\n")
+        tuner = HyperparamTuner(
+            config_path=sample_config, state_dir=tmp_path / "tuning"
+        )
+        assert isinstance(tuner.study.pruner, cls)
+
+    def test_unknown_pruner_rejected(self, sample_config, tmp_path):
+        """A typo'd pruner fails validation before any study is created."""
+        self._with_tuning_block(sample_config, "  pruner: asha\n")
+        with pytest.raises(ValueError, match="pruner"):
+            HyperparamTuner(config_path=sample_config, state_dir=tmp_path / "tuning")
+        assert not (tmp_path / "tuning" / "test_tune.db").exists()
+
+    def test_pruner_rejected_for_multi_objective(self, sample_config, tmp_path):
+        """Pruning can't fire on a Pareto study, so configuring it is an error."""
+        import yaml
+
+        cfg = yaml.safe_load(sample_config.read_text())
+        cfg["metrics"]["objective"] = ["log_loss", "calibration_error"]
+        cfg["tuning"] = {"pruner": "hyperband"}
+        sample_config.write_text(yaml.safe_dump(cfg))
+        with pytest.raises(ValueError, match="single objective"):
+            HyperparamTuner(config_path=sample_config, state_dir=tmp_path / "tuning")
+
+    def test_round_checkpoints_report_intra_fold_steps(self, sample_matches, tmp_path):
+        """xgboost trials report at each boosting-round checkpoint plus the fold
+        end, as contiguous 1-based fidelity steps."""
+        import mlflow
+        mlflow.set_tracking_uri((tmp_path / "mlruns").as_uri())
+
+        cfg = self._xgb_config(tmp_path, "xgb_ckpt", "    n_estimators: 30")
+        self._with_tuning_block(
+            cfg, "  pruner: successive_halving\n  round_checkpoints: 2\n",
+        )
+        tuner = HyperparamTuner(
+            config_path=cfg,
+            matches_path=sample_matches,
+            cache_dir=tmp_path / "cache",
+            state_dir=tmp_path / "tuning",
+            outer_folds=1,
+            param_overrides={"n_estimators": 30},
+        )
+        tuner.run(n_trials=1)
+
+        trial = tuner.study.trials[0]
+        assert trial.state == optuna.trial.TrialState.COMPLETE
+        # One tuning fold x (2 checkpoints + fold end).
+        assert sorted(trial.intermediate_values) == [1, 2, 3]
+
+    def test_pruned_trial_records_fidelity(self, sample_matches, tmp_path):
+        """A trial pruned at a round checkpoint says which fold and round it
+        reached."""
+        import mlflow
+        mlflow.set_tracking_uri((tmp_path / "mlruns").as_uri())
+
+        cfg = self._xgb_config(tmp_path, "xgb_prune", "    n_estimators: 30")
+        self._with_tuning_block(cfg, "  pruner: median\n  round_checkpoints: 2\n")
+        tuner = HyperparamTuner(
+            config_path=cfg,
+            matches_path=sample_matches,
+            cache_dir=tmp_path / "cache",
+            state_dir=tmp_path / "tuning",
+            outer_folds=1,
+            param_overrides={"n_estimators": 30},
+        )
+        # Every reported value is above the threshold → prune at the first step.
+        tuner.study.pruner = optuna.pruners.ThresholdPruner(upper=-10.0)
+        tuner.run(n_trials=1)
+
+        trial = tuner.study.trials[0]
+        assert trial.state == optuna.trial.TrialState.PRUNED
+        assert trial.user_attrs["pruned_at"] == {
+            "step": 1, "fold": 1, "n_tuning_folds": 1, "round": 10,
+        }
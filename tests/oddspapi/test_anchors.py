@@ -258,3 +258,85 @@ class TestFeedsBoardAt:
         assert b.height == 1
         assert b["is_main_line"][0]
         assert b["quote_age_s"][0] == 0
+
+
+class TestTransitionCache:
+    """The sweep is independent of the threshold and the match subset, so it runs once
+    per (market, book set, prematch flag) and every variant is a filter over it."""
+
+    def _two_books(self, stage):
+        _write(stage, "betrivers", [
+            ("m1", 22.5, "Over", 900, True), ("m1", 22.5, "Under", 900, True),
+            ("m2", 30.5, "Over", 500, True), ("m2", 30.5, "Under", 500, True)])
+        _write(stage, "fanduel", [
+            ("m1", 22.5, "Over", 600, True), ("m1", 22.5, "Under", 600, True)])
+
+    @pytest.fixture
+    def loads(self, monkeypatch):
+        calls = []
+        real = anchors._load
+
+        def _counting(*a, **k):
+            calls.append(a)
+            return real(*a, **k)
+
+        monkeypatch.setattr(anchors, "_load", _counting)
+        monkeypatch.setattr(anchors, "_MEMO", {})
+        return calls
+
+    def test_a_threshold_sweep_loads_once(self, stage, loads):
+        self._two_books(stage)
+        bks = ["betrivers", "fanduel"]
+        one = anchors.formed("total_games", 1, books=bks)
+        two = anchors.formed("total_games", 2, books=bks)
+        three = anchors.formed("total_games", 3, books=bks)
+        assert len(loads) == 1
+        assert one["t"].to_list() == [_at(900), _at(500)]
+        assert two["t"].to_list() == [_at(600)]
+        assert three.is_empty()
+
+    def test_the_cache_survives_the_process(self, stage, loads, monkeypatch):
+        self._two_books(stage)
+        first = anchors.formed("total_games", 2, books=["fanduel", "betrivers"])
+        monkeypatch.setattr(anchors, "_MEMO", {})
+        again = anchors.formed("total_games", 2, books=["betrivers", "fanduel"])
+        assert len(loads) == 1
+        assert again.equals(first)
+        assert list(paths.anchor_cache_dir().glob("total_games_*.parquet"))
+
+    def test_a_subset_reads_the_same_answer(self, stage, loads):
+        self._two_books(stage)
+        full = anchors.open_("total_games", books=["betrivers"])
+        sub = anchors.open_("total_games", books=["betrivers"],
+                            match_uids=pl.Series(["m2"]))
+        assert sub.equals(full.filter(pl.col("match_uid") == "m2"))
+
+    def test_a_subset_on_a_stale_cache_sweeps_only_the_subset(self, stage, loads):
+        self._two_books(stage)
+        sub = anchors.open_("total_games", books=["betrivers"],
+                            match_uids=pl.Series(["m2"]))
+        assert loads[0][2].to_list() == ["m2"]
+        assert not list(paths.anchor_cache_dir().glob("total_games_*.parquet"))
+        assert not anchors._MEMO
+
+        full = anchors.open_("total_games", books=["betrivers"])
+        assert loads[1][2] is None
+        assert sub.equals(full.filter(pl.col("match_uid") == "m2"))
+        # now current, the subset is a filter over the cache
+        anchors.open_("total_games", books=["betrivers"], match_uids=pl.Series(["m1"]))
+        assert len(loads) == 2
+
+    def test_the_memo_is_bounded(self, stage, loads, monkeypatch):
+        self._two_books(stage)
+        monkeypatch.setattr(anchors, "_MEMO_MAX_ENTRIES", 2)
+        for bks in (["betrivers"], ["fanduel"], ["betrivers", "fanduel"]):
+            anchors.open_("total_games", books=bks)
+        assert len(anchors._MEMO) == 2
+
+    def test_a_rewritten_book_invalidates(self, stage, loads):
+        self._two_books(stage)
+        assert anchors.open_("total_games", books=["betrivers"]).height == 2
+        _write(stage, "betrivers", [
+            ("m1", 22.5, "Over", 900, True), ("m1", 22.5, "Under", 900, False)])
+        assert anchors.open_("total_games", books=["betrivers"]).height == 0
+        assert len(loads) == 2
@@ -0,0 +1,67 @@
+"""oddspapi fixtures -> the shared mapper's input, built as frame operations.
+
+The mapper reads two rows per fixture in the feed's participant order, so the
+column-wise build has to reproduce `to_first_last`, `parse_ts` and that order
+exactly — a name converted differently is a player that silently stops resolving.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import polars as pl
+import pytest
+
+from mvp.oddspapi import matcher, tournaments
+
+
+@pytest.mark.parametrize("name", [
+    "Cretu, Cezar (2001)",
+    "Van de Zandschulp,  Botic ",
+    "Djokovic",
+    "Auger-Aliassime, Felix (CAN)",
+    "A, B, C",
+    "Surname,",
+    "Foo (x) Bar (1999)",
+    "",
+])
+def test_first_last_matches_the_scalar_conversion(name):
+    got = pl.DataFrame({"n": [name]}).select(matcher._first_last("n")).item()
+    assert got == matcher.to_first_last(name)
+
+
+class TestEventRows:
+    @pytest.fixture(autouse=True)
+    def _no_tournaments(self, monkeypatch):
+        empty = pl.DataFrame(schema={
+            "tournament_id": pl.Utf8, "tournament_name": pl.Utf8,
+            "city": pl.Utf8, "circuit": pl.Utf8, "year": pl.Int64,
+        })
+        monkeypatch.setattr(
+            tournaments, "build_index", lambda: tournaments.TournamentIndex(empty)
+        )
+        monkeypatch.setattr(
+            tournaments, "_load_aliases", lambda: {"french open": "520"}
+        )
+
+    def _fixture(self, fid, p1, p2, name="French Open Men Singles",
+                 start="2026-05-25T09:00:00Z"):
+        return {"fixtureId": fid, "participant1Name": p1, "participant2Name": p2,
+                "tournamentName": name, "categoryName": "ATP",
+                "startTime": start, "trueStartTime": None, "statusId": 2}
+
+    def test_two_rows_per_fixture_in_feed_order(self):
+        rows = matcher.event_rows([
+            self._fixture("f1", "Sinner, Jannik", "Alcaraz, Carlos (2003)"),
+            self._fixture("f2", "Ruud, Casper", "Fritz, Taylor",
+                          name="Somewhere Open Men Singles"),
+        ])
+        assert rows["oap_event_id"].to_list() == ["f1", "f1", "f2", "f2"]
+        assert rows["player_name"].to_list() == [
+            "Jannik Sinner", "Carlos Alcaraz", "Casper Ruud", "Taylor Fritz",
+        ]
+        assert rows["tournament_ids"].to_list() == [["520"], ["520"], None, None]
+        assert rows["fetched_at"][0] == datetime(2026, 5, 25, 9, tzinfo=UTC)
+
+    def test_no_fixtures_resolves_to_nothing(self):
+        assert matcher.resolve_raw([]) is None
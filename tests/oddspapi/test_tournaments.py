@@ -175,3 +175,66 @@ class TestResolveFixtures:
         assert aliases
         assert all(v.isdigit() for v in aliases.values())
         assert "french open" in aliases
+
+
+class TestResolveFrame:
+    """Resolution runs once per distinct (name, category, year) and is joined back,
+    so it must agree fixture-for-fixture with asking the index directly."""
+
+    def _fixture(self, fid, name, category="Challenger", start="2026-05-01T10:00:00Z",
+                 true_start=None):
+        return {"fixtureId": fid, "tournamentName": name, "categoryName": category,
+                "startTime": start, "trueStartTime": true_start}
+
+    def test_agrees_with_the_per_fixture_lookup(self, index, monkeypatch):
+        monkeypatch.setattr(tournaments, "_load_aliases", lambda: {})
+        fixtures = [
+            self._fixture("f1", "ATP Challenger Oeiras 1, Portugal Men Singles"),
+            self._fixture("f2", "ATP Challenger Oeiras 1, Portugal Men Singles"),
+            self._fixture("f3", "ATP Madrid, Spain Men Singles", category="ATP"),
+            self._fixture("f4", "ATP Madrid, Spain Men Singles", category="ATP",
+                          start="2025-05-01T10:00:00Z"),
+            self._fixture("f5", "ATP Challenger Shymkent II, Kazakhstan Men Singles"),
+            self._fixture("f6", "Wimbledon Men Singles", category="ATP"),
+        ]
+        ids, rep = tournaments.resolve_fixtures(fixtures, index=index)
+        for f in fixtures:
+            want, _ = index.lookup(
+                f["tournamentName"],
+                tournaments.CIRCUIT_OF_CATEGORY[f["categoryName"]],
+                int(f["startTime"][:4]),
+            )
+            assert ids[f["fixtureId"]] == want
+        assert rep.pinned == 6 and rep.by_city == 5 and rep.by_name == 1
+
+    def test_true_start_decides_the_year(self, index, monkeypatch):
+        monkeypatch.setattr(tournaments, "_load_aliases", lambda: {})
+        out, _ = tournaments.resolve_frame(tournaments.fixture_frame([
+            self._fixture("f1", "ATP Madrid, Spain Men Singles", category="ATP",
+                          start="2026-01-01T10:00:00Z",
+                          true_start="2025-12-31T23:00:00Z"),
+        ]), index=index)
+        assert out.row(0) == ("f1", ["9999"])
+
+    def test_an_offbeat_timestamp_falls_back_to_the_scalar_parse(self, index,
+                                                               monkeypatch):
+        monkeypatch.setattr(tournaments, "_load_aliases", lambda: {})
+        out, rep = tournaments.resolve_frame(tournaments.fixture_frame([
+            self._fixture("f1", "ATP Madrid, Spain Men Singles", category="ATP",
+                          start="20260501T100000Z"),
+            self._fixture("f2", "ATP Madrid, Spain Men Singles", category="ATP",
+                          start=""),
+        ]), index=index)
+        assert out.rows() == [("f1", ["1536"])]
+        assert rep.pinned == 1
+
+    def test_each_key_is_looked_up_once(self, index, monkeypatch):
+        monkeypatch.setattr(tournaments, "_load_aliases", lambda: {})
+        calls = []
+        real = index._lookup
+        monkeypatch.setattr(index, "_lookup", lambda *a: calls.append(a) or real(*a))
+        tournaments.resolve_fixtures([
+            self._fixture(f"f{i}", "ATP Challenger Oeiras 1, Portugal Men Singles")
+            for i in range(50)
+        ], index=index)
+        assert len(calls) == 1
@@ -18,6 +18,7 @@ import os
 from datetime import datetime, timedelta, timezone
 
 import polars as pl
+import pyarrow.parquet as pq
 import pytest
 
 from mvp.oddspapi import markets, parser, transformer
@@ -276,6 +277,82 @@ class TestParser:
         assert {t.points for t in ticks} == {21.5}
 
 
+    def test_columns_carry_the_same_ticks_as_the_records(self, data_root):
+        _reference(data_root)
+        _write_raw("f1", {
+            900: {9001: [_tick(SCHED, 1.9, limit=250), _tick(SCHED, None)],
+                  9002: [_tick(SCHED + timedelta(seconds=1.5), 2.0, active=False)]},
+            121: {121: [_tick(SCHED, 1.5)], 122: [_tick(SCHED, 2.6)]},
+        })
+        from mvp.oddspapi import paths
+
+        f = next(paths.historical_dirs()[0].glob("*.json"))
+        index = markets.load_index()
+        _, ticks = parser.parse_file(f, index)
+        fid, cols = parser.parse_columns(f, index)
+        assert fid == "f1"
+        priced = [t for t in ticks if t.odds is not None]
+        assert cols["odds"] == [t.odds for t in priced]
+        assert cols["market"] == [t.stage_name for t in priced]
+        assert cols["points"] == [t.points for t in priced]
+        assert cols["active"] == [t.active for t in priced]
+        assert cols["limit"] == [t.limit for t in priced]
+        assert [parser.parse_ts(v) for v in cols["fetched_at"]] == [
+            t.ts for t in priced
+        ]
+        assert set(cols) == set(transformer.TICK_SCHEMA)
+
+    def test_unreadable_file_has_no_columns(self, data_root):
+        _reference(data_root)
+        from mvp.oddspapi import paths
+
+        p = paths.historical_dirs()[0] / "historical_broken.json"
+        p.write_text("{not json", encoding="utf-8")
+        assert parser.parse_columns(p, markets.load_index()) == (None, {})
+
+    def test_non_finite_literals_still_parse(self, data_root):
+        """NaN/Infinity are not strict JSON, but json.loads has always taken them."""
+        _reference(data_root)
+        _write_raw("f1", {900: {9001: [_tick(SCHED, 1.9, limit=250)]}})
+        from mvp.oddspapi import paths
+
+        f = next(paths.historical_dirs()[0].glob("*.json"))
+        f.write_text(
+            f.read_text(encoding="utf-8").replace('"limit": 250', '"limit": NaN'),
+            encoding="utf-8",
+        )
+        fid, cols = parser.parse_columns(f, markets.load_index())
+        assert fid == "f1"
+        assert cols["odds"] == [1.9]
+
+    def test_offbeat_timestamps_fall_back_to_the_scalar_parse(self):
+        raw = ["2026-06-01T12:00:00Z", "2026-06-01 12:00:00.25+02:00"]
+        got = transformer._fetched_at(raw).to_list()
+        assert got == [parser.parse_ts(v) for v in raw]
+
+
+class TestParallelParse:
+    def test_pool_stages_the_same_ticks_as_in_process(self, data_root, monkeypatch):
+        _reference(data_root)
+        for i, book in enumerate(["pinnacle", "betrivers", "fanduel"]):
+            _write_raw(f"f{i}", {
+                900: {9001: [_tick(SCHED + timedelta(minutes=i), 1.9 + i / 10)],
+                      9002: [_tick(SCHED, 2.0, limit=100.0)]},
+                121: {121: [_tick(SCHED, 1.5)], 122: [_tick(SCHED, 2.6)]},
+            }, book=book)
+        _fake_fixture_map_many(monkeypatch, ["f0", "f1", "f2"])
+
+        transformer.transform(workers=1)
+        serial = _ticks()
+        monkeypatch.setattr(transformer, "PARALLEL_PARSE_MIN_FILES", 1)
+        report = transformer.transform(refresh=True, workers=2)
+        pooled = _ticks()
+
+        assert report.files_parsed == 3
+        key = list(serial.columns)
+        assert serial.sort(key).equals(pooled.sort(key))
+
+
 class TestEventStatus:
     """Derived on the ticks, and it decides what the reduction can see."""
 
@@ -533,6 +610,95 @@ class TestSnapshotLayer:
         assert over.filter(pl.col("odds") == 1.9)["event_status"].item() == "NOT_STARTED"
 
 
+class TestPointInTimeLayout:
+    """Market files come out in TICK_ORDER with match-aligned row groups and an
+    offset index, so board_at reads only the groups holding its matches."""
+
+    def _stage(self, data_root, monkeypatch):
+        _reference(data_root)
+        fids = ["f2", "f0", "f1"]
+        for i, fid in enumerate(fids):
+            _write_raw(fid, {
+                900: {9001: [_tick(SCHED - timedelta(minutes=m), 1.8 + m / 100)
+                             for m in (30, 10, 20)],
+                      9002: [_tick(SCHED - timedelta(minutes=m), 2.0 - m / 100)
+                             for m in (20, 30, 10)]},
+                121: {121: [_tick(SCHED, 1.5 + i / 10)], 122: [_tick(SCHED, 2.6)]},
+            })
+        _fake_fixture_map_many(monkeypatch, fids)
+        monkeypatch.setattr(transformer, "MARKET_ROW_GROUP_ROWS", 2)
+        transformer.transform()
+
+    def test_market_file_is_sorted_and_indexed(self, data_root, monkeypatch):
+        from mvp.oddspapi import paths
+
+        self._stage(data_root, monkeypatch)
+        path = paths.market_path("pinnacle", "total_games")
+        df = pl.read_parquet(path)
+        assert df.equals(df.sort(list(paths.TICK_ORDER), maintain_order=True))
+
+        index = pl.read_parquet(paths.tick_index_path("pinnacle", "total_games"))
+        assert index["n_rows"].sum() == df.height
+        meta = pq.ParquetFile(path).metadata
+        # every match sits in exactly one row group, and the groups cover it
+        for uid, rg, start, n in index.iter_rows():
+            got = pl.from_arrow(pq.ParquetFile(path).read_row_group(rg))
+            assert got.filter(pl.col("match_uid") == uid).height == n
+            assert df.slice(start, n)["match_uid"].unique().to_list() == [uid]
+        assert meta.num_row_groups == index.height
+
+    def test_market_file_and_index_share_a_write_id(self, data_root, monkeypatch):
+        from mvp.oddspapi import paths
+
+        self._stage(data_root, monkeypatch)
+        path = paths.market_path("pinnacle", "total_games")
+        idx = paths.tick_index_path("pinnacle", "total_games")
+        key = paths.TICK_INDEX_WRITE_KEY.encode()
+        first = pq.read_metadata(path).metadata[key]
+        assert pq.read_metadata(idx).metadata[key] == first
+
+        # a rewrite of the same rows is a different write
+        transformer._sort_and_index(path, idx)
+        assert pq.read_metadata(path).metadata[key] != first
+        assert pq.read_metadata(idx).metadata[key] == pq.read_metadata(
+            path
+        ).metadata[key]
+
+    def test_indexed_board_matches_a_full_scan(self, data_root, monkeypatch):
+        from mvp.oddspapi import board, paths
+
+        self._stage(data_root, monkeypatch)
+        times = pl.DataFrame({
+            "match_uid": ["2026_1_SGL_R32_f0", "2026_1_SGL_R32_f2"],
+            "t": [SCHED - timedelta(minutes=15), SCHED],
+        })
+        indexed = board.board_at(times, "total_games", books=["pinnacle"])
+        paths.tick_index_path("pinnacle", "total_games").unlink()
+        scanned = board.board_at(times, "total_games", books=["pinnacle"])
+        assert not indexed.is_empty()
+        assert indexed.equals(scanned)
+
+    def test_stale_index_is_ignored(self, data_root, monkeypatch):
+        from mvp.oddspapi import board, paths
+
+        self._stage(data_root, monkeypatch)
+        path = paths.market_path("pinnacle", "total_games")
+        pl.read_parquet(path).head(3).write_parquet(path)
+        assert board._tick_index("pinnacle", "total_games") is None
+
+    def test_same_row_count_rewrite_still_invalidates(self, data_root, monkeypatch):
+        """A rebuild keeping the row count can still move every match's offsets."""
+        from mvp.oddspapi import board, paths
+
+        self._stage(data_root, monkeypatch)
+        path = paths.market_path("pinnacle", "total_games")
+        assert board._tick_index("pinnacle", "total_games") is not None
+        df = pl.read_parquet(path)
+        df.sort("match_uid", descending=True).write_parquet(path)
+        assert pq.read_metadata(path).num_rows == df.height
+        assert board._tick_index("pinnacle", "total_games") is None
+
+
 class TestIncremental:
     def test_second_run_skips_already_parsed_files(self, data_root, monkeypatch):
         _reference(data_root)
@@ -714,6 +880,99 @@ class TestIncremental:
         assert again.files_parsed == 1 and again.files_skipped == 0
 
 
+class TestIncrementalOrganise:
+    """ORGANISE rewrites only the partitions whose inputs moved, and whatever it
+    does incrementally must land exactly where a full rebuild would."""
+
+    def _raw(self, fid, odds, book="pinnacle"):
+        _write_raw(fid, {
+            900: {9001: [_tick(SCHED, odds)], 9002: [_tick(SCHED, odds + 0.1)]},
+        }, book=book)
+
+    def _full(self):
+        transformer.transform(refresh=True)
+        return _all_books()
+
+    def test_a_new_capture_is_appended(self, data_root, monkeypatch):
+        _reference(data_root)
+        self._raw("f1", 1.9)
+        _fake_fixture_map_many(monkeypatch, ["f1", "f2"])
+        transformer.transform()
+
+        self._raw("f2", 1.5)
+        again = transformer.transform()
+        assert again.partitions_appended == 1 and again.partitions_rebuilt == 0
+        got = _all_books()
+        key = list(got.columns)
+        assert got.sort(key).equals(self._full().sort(key))
+        assert again.rows == got.height == 4
+
+    def test_nothing_changed_rewrites_nothing(self, data_root, monkeypatch):
+        from mvp.oddspapi import paths
+
+        _reference(data_root)
+        self._raw("f1", 1.9)
+        _fake_fixture_map(monkeypatch, "f1", SCHED, TRUE)
+        transformer.transform()
+        before = paths.market_path("pinnacle", "total_games").stat().st_mtime_ns
+
+        again = transformer.transform()
+        assert again.partitions_appended == again.partitions_rebuilt == 0
+        assert again.rows == 2 and again.ticks_parsed == 2
+        assert paths.market_path("pinnacle", "total_games").stat().st_mtime_ns == before
+
+    def test_a_re_resolved_fixture_rebuilds_only_its_partitions(
+        self, data_root, monkeypatch
+    ):
+        _reference(data_root)
+        self._raw("f1", 1.9)
+        self._raw("f2", 1.5, book="betrivers")
+        _fake_fixture_map_many(monkeypatch, ["f1", "f2"])
+        transformer.transform()
+
+        # The matcher learns f2's true start: its ticks are now prematch.
+        xw = transformer.matcher.build().with_columns(
+            pl.when(pl.col("fixture_id") == "f2")
+            .then(pl.lit(SCHED + timedelta(hours=3)))
+            .otherwise(pl.col("true_start_time")).alias("true_start_time")
+        )
+        monkeypatch.setattr(transformer.matcher, "build", lambda *a, **k: xw)
+        again = transformer.transform()
+        assert again.partitions_rebuilt == 1 and again.partitions_appended == 0
+        assert _snapshots("betrivers", "total_games")["event_status"].unique(
+        ).to_list() == [transformer.PREMATCH]
+        got = _all_books()
+        key = list(got.columns)
+        assert got.sort(key).equals(self._full().sort(key))
+
+    def test_a_pruned_capture_drops_its_partition(self, data_root, monkeypatch):
+        from mvp.oddspapi import paths
+
+        _reference(data_root)
+        self._raw("f1", 1.9)
+        self._raw("f2", 1.5, book="betrivers")
+        _fake_fixture_map_many(monkeypatch, ["f1", "f2"])
+        transformer.transform()
+
+        (paths.historical_dirs()[0] / "historical_f2.json").unlink()
+        transformer.transform()
+        assert not paths.market_path("betrivers", "total_games").exists()
+        assert _all_books()["book"].unique().to_list() == ["pinnacle"]
+
+    def test_lost_manifest_rebuilds_in_full(self, data_root, monkeypatch):
+        from mvp.oddspapi import paths
+
+        _reference(data_root)
+        self._raw("f1", 1.9)
+        _fake_fixture_map(monkeypatch, "f1", SCHED, TRUE)
+        transformer.transform()
+        paths.organise_manifest_path().unlink()
+
+        again = transformer.transform()
+        assert again.partitions_rebuilt == 1
+        assert paths.organise_manifest_path().exists()
+
+
 class TestMatchingIsIndependentOfParsing:
     """Parsing is expensive and rare; matching is cheap and improves constantly.
 